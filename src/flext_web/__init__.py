@@ -48,6 +48,7 @@ if TYPE_CHECKING:
     from .services.handlers import FlextWebHandlers as FlextWebHandlers
     from .services.health import FlextWebHealth as FlextWebHealth
     from .services.web import FlextWebServices as FlextWebServices
+    from .services.web_async import FlextWebAsyncServices as FlextWebAsyncServices
 
 _LAZY_MODULES: dict[str, tuple[str, ...]] = {
     "._config": ("FlextWebConfig", "config"),
@@ -65,6 +66,7 @@ _LAZY_MODULES: dict[str, tuple[str, ...]] = {
     ".services.handlers": ("FlextWebHandlers",),
     ".services.health": ("FlextWebHealth",),
     ".services.web": ("FlextWebServices",),
+    ".services.web_async": ("FlextWebAsyncServices",),
     "flext_cli": ("d", "e", "h", "r", "x"),
 }
 
@@ -78,6 +80,7 @@ _LAZY_IMPORTS = build_lazy_import_map(
 
 _PUBLIC_EXPORTS: tuple[str, ...] = (
     "FlextWeb",
+    "FlextWebAsyncServices",
     "FlextWebConfig",
     "FlextWebConstants",
     "FlextWebModels",
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import signal
+import socket
 import sys
+from functools import partial
+from threading import Event
 from typing import Annotated, override
 
 from flext_cli import cli, m as cli_m, p as cli_p, u as cli_u
-from flext_web import FlextWebSettings, p, r, s, settings, t, web
+from flext_web import FlextWebSettings, c, p, r, s, settings, t, u, web
 
 
 class FlextWebRunCommand(s):
@@ -26,6 +30,13 @@ class FlextWebRunCommand(s):
     no_debug: Annotated[
         bool, cli_u.Field(default=False, description="Force disable debug mode.")
     ] = False
+    workers: Annotated[
+        int | None,
+        cli_u.Field(
+            default=None,
+            description="Worker processes sharing the listener (overrides settings).",
+        ),
+    ] = None
 
     @override
     def execute(self) -> p.Result[bool]:
@@ -38,6 +49,8 @@ class FlextWebRunCommand(s):
             web_overrides["host"] = self.host
         if self.port is not None:
             web_overrides["port"] = self.port
+        if self.workers is not None:
+            web_overrides["workers"] = self.workers
         settings_result = r[FlextWebSettings].create_from_callable(
             lambda: settings.clone(Web=web_overrides, debug=debug_value)
         )
@@ -47,10 +60,71 @@ class FlextWebRunCommand(s):
         service_result = web.create_service(web_settings)
         if service_result.failure:
             return r[bool].fail(service_result.error)
+        if web_settings.Web.workers > 1:
+            return self._supervise_workers(
+                web_settings, web_overrides, debug=debug_value
+            )
         return service_result.value.start_service(
             host=web_settings.Web.host, port=web_settings.Web.port, debug=debug_value
         )
 
+    @staticmethod
+    def serve_worker(
+        web_overrides: t.MappingKV[str, str | int],
+        listener: socket.socket,
+        *,
+        debug: bool,
+    ) -> None:
+        """Worker-process body: serve the runtime app on the shared listener."""
+        web_settings = settings.clone(Web=dict(web_overrides), debug=debug)
+        outcome = web.create_service(web_settings).flat_map(
+            lambda service: service.serve_on_socket(
+                listener, host=web_settings.Web.host, port=web_settings.Web.port
+            )
+        )
+        cli.exit(0 if outcome.success else 1)
+
+    def _supervise_workers(
+        self,
+        web_settings: FlextWebSettings,
+        web_overrides: t.MappingKV[str, str | int],
+        *,
+        debug: bool,
+    ) -> p.Result[bool]:
+        """Pre-fork ``workers`` processes on one listener until SIGINT/SIGTERM."""
+        host, port = web_settings.Web.host, web_settings.Web.port
+        try:
+            listener = u.Web.WorkerSupervisor.bind(host, port)
+        except OSError as exc:
+            return r[bool].fail(f"Failed to bind {host}:{port}: {exc}")
+        supervisor = u.Web.WorkerSupervisor(
+            partial(FlextWebRunCommand.serve_worker, web_overrides, debug=debug),
+            listener,
+            web_settings.Web.workers,
+            restart_delay=web_settings.Web.worker_restart_delay,
+        )
+        stop = Event()
+        previous_handlers = {
+            signum: signal.signal(signum, lambda *_: stop.set())
+            for signum in (signal.SIGINT, signal.SIGTERM)
+        }
+        try:
+            _ = supervisor.supervise()
+            self.logger.info("Worker processes started", **supervisor.health())
+            while not stop.wait(c.Web.WORKER_SUPERVISE_POLL_SECONDS):
+                if supervisor.supervise():
+                    self.logger.warning(
+                        "Worker processes restarted", **supervisor.health()
+                    )
+        finally:
+            supervisor.terminate(
+                web_settings.Web.drain_timeout + c.Web.RUNTIME_STOP_GRACE_SECONDS
+            )
+            for signum, handler in previous_handlers.items():
+                _ = signal.signal(signum, handler)
+            listener.close()
+        return r[bool].ok(True)
+
 
 def _build_app() -> cli_p.Cli.Application:
     app = cli.create_app_with_common_params(
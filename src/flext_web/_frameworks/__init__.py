@@ -0,0 +1,98 @@
+"""Web framework and server types for flext-web, imported on first use.
+
+FastAPI, Starlette and uvicorn live behind ``asgi``; Flask and werkzeug
+behind ``wsgi``. Reading an attribute imports only the submodule that
+defines it, so loading flext-web (constants, settings, the CLI) pays for
+no framework, and serving pays only for the framework it runs.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from flext_core.lazy import build_lazy_import_map, install_lazy_exports
+
+if TYPE_CHECKING:
+    from .asgi import (
+        APIRoute as APIRoute,
+        APIRouter as APIRouter,
+        FastAPI as FastAPI,
+        StarletteRequest as StarletteRequest,
+        StarletteResponse as StarletteResponse,
+        TaskServer as TaskServer,
+        UvicornConfig as UvicornConfig,
+        UvicornServer as UvicornServer,
+        get_openapi as get_openapi,
+        get_redoc_html as get_redoc_html,
+        get_swagger_ui_html as get_swagger_ui_html,
+    )
+    from .wsgi import (
+        Flask as Flask,
+        FlaskResponse as FlaskResponse,
+        PooledWSGIServer as PooledWSGIServer,
+        flask_current_app as flask_current_app,
+        flask_g as flask_g,
+        flask_make_response as flask_make_response,
+        flask_request as flask_request,
+    )
+
+_LAZY_MODULES: dict[str, tuple[str, ...]] = {
+    ".asgi": (
+        "APIRoute",
+        "APIRouter",
+        "FastAPI",
+        "StarletteRequest",
+        "StarletteResponse",
+        "TaskServer",
+        "UvicornConfig",
+        "UvicornServer",
+        "get_openapi",
+        "get_redoc_html",
+        "get_swagger_ui_html",
+    ),
+    ".wsgi": (
+        "Flask",
+        "FlaskResponse",
+        "PooledWSGIServer",
+        "flask_current_app",
+        "flask_g",
+        "flask_make_response",
+        "flask_request",
+    ),
+}
+
+
+_LAZY_ALIAS_GROUPS: dict[str, tuple[tuple[str, str], ...]] = {}
+
+
+_LAZY_IMPORTS = build_lazy_import_map(
+    _LAZY_MODULES, alias_groups=_LAZY_ALIAS_GROUPS, sort_keys=False
+)
+
+_PUBLIC_EXPORTS: tuple[str, ...] = (
+    "APIRoute",
+    "APIRouter",
+    "FastAPI",
+    "Flask",
+    "FlaskResponse",
+    "PooledWSGIServer",
+    "StarletteRequest",
+    "StarletteResponse",
+    "TaskServer",
+    "UvicornConfig",
+    "UvicornServer",
+    "flask_current_app",
+    "flask_g",
+    "flask_make_response",
+    "flask_request",
+    "get_openapi",
+    "get_redoc_html",
+    "get_swagger_ui_html",
+)
+
+__all__: tuple[str, ...] = tuple(_PUBLIC_EXPORTS)
+
+install_lazy_exports(__name__, globals(), _LAZY_IMPORTS, public_exports=__all__)
@@ -0,0 +1,68 @@
+"""ASGI framework and server types for flext-web runtimes.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Generator
+from contextlib import contextmanager, suppress
+from socket import socket
+from typing import override
+
+from fastapi import APIRouter, FastAPI
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+from fastapi.openapi.utils import get_openapi
+from fastapi.routing import APIRoute
+from starlette.requests import Request as StarletteRequest
+from starlette.responses import Response as StarletteResponse
+from uvicorn import Config as UvicornConfig, Server as UvicornServer
+
+
+class TaskServer(UvicornServer):
+    """uvicorn server run as a task on a shared event loop.
+
+    Process signals stay with the host loop, a failed startup ends the task
+    instead of raising ``SystemExit`` into the loop, and ``ready`` is set
+    once the sockets listen.
+    """
+
+    def __init__(self, config: UvicornConfig) -> None:
+        """Initialize the server with an unset ``ready`` event."""
+        super().__init__(config)
+        self.ready = asyncio.Event()
+
+    @override
+    @contextmanager
+    def capture_signals(self) -> Generator[None]:
+        """Leave signal handling to the host event loop."""
+        yield
+
+    @override
+    async def serve(self, sockets: list[socket] | None = None) -> None:
+        """Serve until ``should_exit``; a failed startup just returns."""
+        with suppress(SystemExit):
+            await super().serve(sockets=sockets)
+
+    @override
+    async def startup(self, sockets: list[socket] | None = None) -> None:
+        """Bind the sockets, then set ``ready``."""
+        await super().startup(sockets=sockets)
+        self.ready.set()
+
+
+__all__: list[str] = [
+    "APIRoute",
+    "APIRouter",
+    "FastAPI",
+    "StarletteRequest",
+    "StarletteResponse",
+    "TaskServer",
+    "UvicornConfig",
+    "UvicornServer",
+    "get_openapi",
+    "get_redoc_html",
+    "get_swagger_ui_html",
+]
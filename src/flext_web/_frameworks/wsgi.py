@@ -0,0 +1,30 @@
+"""WSGI framework and server types for flext-web runtimes.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+from flask import (
+    Flask,
+    Response as FlaskResponse,
+    current_app as flask_current_app,
+    g as flask_g,
+    make_response as flask_make_response,
+    request as flask_request,
+)
+
+from flext_web._utilities.wsgi import FlextWebUtilitiesWsgi
+
+PooledWSGIServer = FlextWebUtilitiesWsgi.Web.PooledWSGIServer
+
+__all__: list[str] = [
+    "Flask",
+    "FlaskResponse",
+    "PooledWSGIServer",
+    "flask_current_app",
+    "flask_g",
+    "flask_make_response",
+    "flask_request",
+]
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from ._entity import FlextWebModelsEntity as FlextWebModelsEntity
     from ._factory import FlextWebModelsFactory as FlextWebModelsFactory
     from ._http import FlextWebModelsHttp as FlextWebModelsHttp
+    from ._query import FlextWebModelsQuery as FlextWebModelsQuery
     from ._responses import FlextWebModelsResponses as FlextWebModelsResponses
     from ._system import FlextWebModelsSystem as FlextWebModelsSystem
     from ._web_message import FlextWebModelsWebMessage as FlextWebModelsWebMessage
@@ -26,6 +27,7 @@ _LAZY_MODULES: dict[str, tuple[str, ...]] = {
     "._entity": ("FlextWebModelsEntity",),
     "._factory": ("FlextWebModelsFactory",),
     "._http": ("FlextWebModelsHttp",),
+    "._query": ("FlextWebModelsQuery",),
     "._responses": ("FlextWebModelsResponses",),
     "._system": ("FlextWebModelsSystem",),
     "._web_message": ("FlextWebModelsWebMessage",),
@@ -47,6 +49,7 @@ _PUBLIC_EXPORTS: tuple[str, ...] = (
     "FlextWebModelsEntity",
     "FlextWebModelsFactory",
     "FlextWebModelsHttp",
+    "FlextWebModelsQuery",
     "FlextWebModelsResponses",
     "FlextWebModelsSystem",
     "FlextWebModelsWebMessage",
@@ -61,6 +61,12 @@ class FlextWebModelsAuth:
                 t.MutableConfigurationMapping,
                 u.Field(description="Entity data dictionary"),
             ] = u.Field(default_factory=dict)
+            version: Annotated[
+                int,
+                u.Field(
+                    ge=0, description="Optimistic concurrency version; 0 until stored"
+                ),
+            ] = 0
 
 
 __all__: list[str] = ["FlextWebModelsAuth"]
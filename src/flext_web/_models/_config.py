@@ -34,6 +34,7 @@ class FlextWebModelsConfig:
                 docs_url: Swagger UI docs URL
                 redoc_url: ReDoc URL
                 openapi_url: OpenAPI schema URL
+                docs_enabled: Whether the docs and OpenAPI routes are served
 
             """
 
@@ -81,6 +82,15 @@ class FlextWebModelsConfig:
             openapi_url: Annotated[str, u.Field(description="OpenAPI URL")] = (
                 c.Web.API_OPENAPI_URL
             )
+            docs_enabled: Annotated[
+                bool,
+                u.Field(
+                    default_factory=lambda: (
+                        FlextWebSettings.fetch_global().Web.docs_enabled
+                    ),
+                    description="Serve the docs, ReDoc and OpenAPI routes",
+                ),
+            ]
 
 
 __all__: list[str] = ["FlextWebModelsConfig"]
@@ -0,0 +1,86 @@
+"""Query, listing and patch models for flext-web.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from flext_cli import m, u
+from flext_web import c, t
+
+
+class FlextWebModelsQuery:
+    """Query and listing models namespace."""
+
+    class Web:
+        """Listing pages, range conditions and entity patches."""
+
+        class EntityPatch(m.Value):
+            """Partial update of one entity, guarded by its expected version."""
+
+            entity_id: Annotated[
+                str, u.Field(min_length=1, description="Identifier of the entity")
+            ]
+            patch: Annotated[
+                t.MutableConfigurationMapping,
+                u.Field(description="Fields to set on the entity data"),
+            ] = u.Field(default_factory=dict)
+            expected_version: Annotated[
+                int | None,
+                u.Field(ge=1, description="Fail unless the entity is at this version"),
+            ] = None
+
+        class ValueRange(m.Value):
+            """Inclusive range condition for ``FlextWebEntities.query``."""
+
+            low: Annotated[
+                str | int | float | None, u.Field(description="Inclusive lower bound")
+            ] = None
+            high: Annotated[
+                str | int | float | None, u.Field(description="Inclusive upper bound")
+            ] = None
+
+        class ListQuery(m.Value):
+            """Filter, sort and cursor parameters of one listing page."""
+
+            status: Annotated[
+                str | None, u.Field(description="Exact status filter")
+            ] = None
+            host: Annotated[str | None, u.Field(description="Exact host filter")] = None
+            port: Annotated[
+                t.PortNumber | None, u.Field(description="Exact port filter")
+            ] = None
+            name_prefix: Annotated[
+                str | None, u.Field(description="Name prefix filter")
+            ] = None
+            sort_by: Annotated[
+                str | None,
+                u.Field(description="Sort field; insertion order when omitted"),
+            ] = None
+            descending: Annotated[
+                bool, u.Field(description="Sort in descending order")
+            ] = False
+            limit: Annotated[
+                int,
+                u.Field(ge=1, le=c.Web.LIST_MAX_LIMIT, description="Maximum page size"),
+            ] = c.Web.LIST_DEFAULT_LIMIT
+            cursor: Annotated[
+                str | None,
+                u.Field(description="Opaque cursor returned by the previous page"),
+            ] = None
+
+            @property
+            def criteria(self) -> t.Web.RequestDict:
+                """Exact-match filters that were set."""
+                return {
+                    field: value
+                    for field in c.Web.LIST_FILTER_FIELDS
+                    for value in (getattr(self, field),)
+                    if value is not None
+                }
+
+
+__all__: list[str] = ["FlextWebModelsQuery"]
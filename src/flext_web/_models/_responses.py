@@ -10,6 +10,7 @@ from typing import Annotated
 
 from flext_cli import m, u
 from flext_web import c, t
+from flext_web._models._auth import FlextWebModelsAuth
 
 
 class FlextWebModelsResponses:
@@ -49,6 +50,34 @@ class FlextWebModelsResponses:
                 is_running: bool = self.status == c.Web.Status.RUNNING.value
                 return is_running
 
+        class AppPage(m.Value):
+            """One page of a cursor-paginated application listing."""
+
+            items: Annotated[
+                t.SequenceOf[FlextWebModelsResponses.Web.ApplicationResponse],
+                u.Field(description="Applications of this page"),
+            ] = u.Field(default_factory=tuple)
+            total: Annotated[
+                int, u.Field(ge=0, description="Applications matching the filters")
+            ] = 0
+            next_cursor: Annotated[
+                str | None, u.Field(description="Cursor of the next page, if any")
+            ] = None
+
+        class EntityPage(m.Value):
+            """One page of a cursor-paginated entity listing."""
+
+            items: Annotated[
+                t.SequenceOf[FlextWebModelsAuth.Web.EntityData],
+                u.Field(description="Entities of this page"),
+            ] = u.Field(default_factory=tuple)
+            total: Annotated[
+                int, u.Field(ge=0, description="Entities matching the filters")
+            ] = 0
+            next_cursor: Annotated[
+                str | None, u.Field(description="Cursor of the next page, if any")
+            ] = None
+
         class HealthResponse(m.Value):
             """Health check response model."""
 
@@ -82,6 +111,25 @@ class FlextWebModelsResponses:
             ]
             timestamp: Annotated[str, u.Field(description="Timestamp")]
 
+        class BulkOperationResponse(m.Value):
+            """Aggregated outcome of a bulk application start/stop."""
+
+            succeeded: Annotated[
+                t.StrSequence, u.Field(description="Application ids that succeeded")
+            ] = u.Field(default_factory=tuple)
+            failed: Annotated[
+                t.StrMapping, u.Field(description="Error message per failed app id")
+            ] = u.Field(default_factory=dict)
+            pending: Annotated[
+                t.StrSequence,
+                u.Field(description="Application ids unfinished at the deadline"),
+            ] = u.Field(default_factory=tuple)
+
+            @property
+            def complete(self) -> bool:
+                """Whether every requested application succeeded."""
+                return not self.failed and not self.pending
+
         class ServiceResponse(m.Value):
             """Generic service response model."""
 
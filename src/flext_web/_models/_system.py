@@ -6,11 +6,9 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import asyncio
 from threading import Thread
 from typing import Annotated, ClassVar
-from wsgiref.simple_server import WSGIServer
-
-import uvicorn
 
 from flext_cli import m, u
 from flext_web import t
@@ -52,23 +50,50 @@ class FlextWebModelsSystem:
         class AppRuntimeInfo(m.ArbitraryTypesModel):
             """Runtime information for a running web application.
 
-            Tracks the server instance, daemon thread, and runner type
-            for each started application so it can be stopped cleanly.
+            Tracks the server instance, runner type and either the daemon
+            thread or the event-loop task serving each started application
+            so it can be stopped cleanly.
             """
 
             model_config: ClassVar[m.ConfigDict] = m.ConfigDict(
                 arbitrary_types_allowed=True, frozen=True, extra="forbid"
             )
             runner: Annotated[
-                str, u.Field(description="Runtime runner name (uvicorn, werkzeug)")
+                str,
+                u.Field(
+                    description="Runtime runner name (uvicorn, werkzeug, wsgi-pool)"
+                ),
             ]
             server: Annotated[
-                uvicorn.Server | WSGIServer,
-                u.Field(description="Server instance for lifecycle management"),
+                object,
+                u.Field(
+                    description=(
+                        "Server instance for lifecycle management (uvicorn, "
+                        "wsgiref or pooled werkzeug server, narrowed by runner)"
+                    )
+                ),
             ]
             thread: Annotated[
-                Thread, u.Field(description="Daemon thread running the server")
+                Thread | None,
+                u.Field(
+                    default=None,
+                    description="Daemon thread running the server, if threaded",
+                ),
+            ]
+            task: Annotated[
+                asyncio.Task[None] | None,
+                u.Field(
+                    default=None,
+                    description="Event-loop task running the server, if async",
+                ),
             ]
 
+            @property
+            def alive(self) -> bool:
+                """Whether the serving thread or task is still running."""
+                if self.task is not None:
+                    return not self.task.done()
+                return self.thread is not None and self.thread.is_alive()
+
 
 __all__: list[str] = ["FlextWebModelsSystem"]
@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING, Protocol, runtime_checkable
 from flext_cli import p
 
 if TYPE_CHECKING:
-    from flext_web import t
+    from flext_web import m, t
 
 
 class FlextWebProtocolsData:
@@ -26,32 +26,49 @@ class FlextWebProtocolsData:
             """Protocol for web application persistence operations."""
 
             @staticmethod
-            def fetch_by_id(entity_id: str) -> p.Result[t.Web.ResponseDict]:
+            def fetch_by_id(entity_id: str) -> p.Result[t.Web.AppRecord]:
                 """Fetch a single application record by id."""
                 ...
 
             @staticmethod
-            def save(entity: t.Web.ResponseDict) -> p.Result[t.Web.ResponseDict]:
+            def save(entity: t.Web.AppRecord) -> p.Result[t.Web.AppRecord]:
                 """Persist an application record."""
                 ...
 
+            @staticmethod
+            def compare_and_set_status(
+                app_id: str, expected: t.StrSequence | frozenset[str], target: str
+            ) -> p.Result[t.Web.AppRecord]:
+                """Move a record to ``target`` from one of the ``expected`` statuses."""
+                ...
+
             @staticmethod
             def delete(entity_id: str) -> p.Result[bool]:
                 """Delete an application record."""
                 ...
 
             @staticmethod
-            def find_all() -> p.Result[Sequence[t.Web.ResponseDict]]:
+            def find_all() -> p.Result[Sequence[t.Web.AppRecord]]:
                 """Return all application records."""
                 ...
 
             @staticmethod
             def find_by_criteria(
                 criteria: t.Web.RequestDict,
-            ) -> p.Result[Sequence[t.Web.ResponseDict]]:
+            ) -> p.Result[Sequence[t.Web.AppRecord]]:
                 """Return records matching the given criteria."""
                 ...
 
+            @staticmethod
+            def find_page(query: m.Web.ListQuery) -> p.Result[t.Web.AppRecordPage]:
+                """Return one filtered, sorted cursor page of records."""
+                ...
+
+            @staticmethod
+            def count(criteria: t.Web.RequestDict) -> p.Result[int]:
+                """Count records matching the given criteria."""
+                ...
+
         @runtime_checkable
         class WebHandler(Protocol):
             """Protocol for request handling helpers."""
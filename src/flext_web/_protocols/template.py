@@ -6,7 +6,7 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import Protocol, runtime_checkable
 
 from flext_cli import p
@@ -38,6 +38,18 @@ class FlextWebProtocolsTemplate:
                 """Render a template string with context."""
                 ...
 
+            @staticmethod
+            def render_stream(
+                template: str, context: t.Web.RequestDict
+            ) -> p.Result[Iterator[str]]:
+                """Render a template string as a generator of text chunks."""
+                ...
+
+            @staticmethod
+            def render_file(name: str, context: t.Web.RequestDict) -> p.Result[str]:
+                """Render a template file from the template directory."""
+                ...
+
             @staticmethod
             def validate_template_config(settings: t.Web.RequestDict) -> p.Result[bool]:
                 """Validate template configuration."""
@@ -13,7 +13,9 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Annotated
+from collections.abc import Iterator
+from itertools import count
+from typing import TYPE_CHECKING, Annotated, ClassVar, Literal, override
 
 from pydantic_settings import SettingsConfigDict
 
@@ -27,6 +29,23 @@ class FlextWebSettings(FlextCliSettings):
         env_prefix="FLEXT_WEB_", env_nested_delimiter="__", extra="ignore"
     )
 
+    stamps: ClassVar[Iterator[int]] = count(1)
+    """Process-wide, thread-safe source of increasing revision stamps."""
+
+    _revision: int = 0
+
+    @property
+    def revision(self) -> int:
+        """Stamp of the latest public assignment to this object or its ``Web``."""
+        return max(self._revision, self.Web.revision)
+
+    @override
+    def __setattr__(self, name: str, value: object) -> None:
+        """Assign ``name`` and restamp ``revision`` for public fields."""
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self._revision = next(FlextWebSettings.stamps)
+
     class _Web(m.BaseModel):
         """Namespaced web runtime settings (pure declaration)."""
 
@@ -66,6 +85,107 @@ class FlextWebSettings(FlextCliSettings):
         ssl_key_path: Annotated[
             str | None, m.Field(default=None, description="TLS key file path")
         ]
+        startup_timeout: Annotated[
+            float,
+            m.Field(
+                default=5.0,
+                gt=0,
+                description="Seconds to wait for an app runtime to accept connections",
+            ),
+        ]
+        bulk_max_workers: Annotated[
+            int,
+            m.Field(default=16, ge=1, description="Worker threads for bulk start/stop"),
+        ]
+        bulk_timeout: Annotated[
+            float,
+            m.Field(
+                default=30.0,
+                gt=0,
+                description="Global deadline in seconds for one bulk start/stop",
+            ),
+        ]
+        wsgi_runner: Annotated[
+            Literal["werkzeug", "wsgi-pool"],
+            m.Field(
+                default="werkzeug",
+                description="WSGI runner: single-threaded werkzeug or wsgi-pool",
+            ),
+        ]
+        wsgi_workers: Annotated[
+            int, m.Field(default=32, ge=1, description="wsgi-pool worker threads")
+        ]
+        wsgi_backlog: Annotated[
+            int, m.Field(default=128, ge=1, description="wsgi-pool listen backlog")
+        ]
+        wsgi_keep_alive: Annotated[
+            float,
+            m.Field(
+                default=5.0,
+                gt=0,
+                description="wsgi-pool idle keep-alive timeout in seconds",
+            ),
+        ]
+        drain_timeout: Annotated[
+            float,
+            m.Field(
+                default=5.0,
+                ge=0,
+                description="Seconds a stopping app may drain in-flight requests",
+            ),
+        ]
+        docs_enabled: Annotated[
+            bool,
+            m.Field(
+                default=True,
+                description="Serve /docs, /redoc and /openapi.json on runtime apps",
+            ),
+        ]
+        metrics_cache_ttl: Annotated[
+            float,
+            m.Field(
+                default=1.0,
+                ge=0,
+                description="Seconds a rendered /metrics exposition is reused",
+            ),
+        ]
+        workers: Annotated[
+            int,
+            m.Field(
+                default=1,
+                ge=1,
+                description="Worker processes sharing the listener; 1 serves in-process",
+            ),
+        ]
+        worker_restart_delay: Annotated[
+            float,
+            m.Field(
+                default=1.0,
+                ge=0,
+                description="Seconds before a crashed worker process is restarted",
+            ),
+        ]
+        registry_path: Annotated[
+            str | None,
+            m.Field(
+                default=None,
+                description="SQLite file persisting registered apps; memory-only when unset",
+            ),
+        ]
+
+        _revision: int = 0
+
+        @property
+        def revision(self) -> int:
+            """Stamp of the latest public assignment to this namespace."""
+            return self._revision
+
+        @override
+        def __setattr__(self, name: str, value: object) -> None:
+            """Assign ``name`` and restamp ``revision`` for public fields."""
+            super().__setattr__(name, value)
+            if not name.startswith("_"):
+                self._revision = next(FlextWebSettings.stamps)
 
     if TYPE_CHECKING:
         Web: _Web
@@ -0,0 +1,66 @@
+# @generated AUTO-GENERATED FILE — Regenerate with: make gen
+"""Flext Web. Utilities package."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from flext_core.lazy import build_lazy_import_map, install_lazy_exports
+
+if TYPE_CHECKING:
+    from .eviction import FlextWebUtilitiesEviction as FlextWebUtilitiesEviction
+    from .health import FlextWebUtilitiesHealth as FlextWebUtilitiesHealth
+    from .indexes import FlextWebUtilitiesIndexes as FlextWebUtilitiesIndexes
+    from .journal import FlextWebUtilitiesJournal as FlextWebUtilitiesJournal
+    from .metrics import FlextWebUtilitiesMetrics as FlextWebUtilitiesMetrics
+    from .openmetrics import (
+        FlextWebUtilitiesOpenMetrics as FlextWebUtilitiesOpenMetrics,
+    )
+    from .pagination import FlextWebUtilitiesPagination as FlextWebUtilitiesPagination
+    from .registry import FlextWebUtilitiesRegistry as FlextWebUtilitiesRegistry
+    from .storage import FlextWebUtilitiesStorage as FlextWebUtilitiesStorage
+    from .templates import FlextWebUtilitiesTemplates as FlextWebUtilitiesTemplates
+    from .workers import FlextWebUtilitiesWorkers as FlextWebUtilitiesWorkers
+    from .wsgi import FlextWebUtilitiesWsgi as FlextWebUtilitiesWsgi
+
+_LAZY_MODULES: dict[str, tuple[str, ...]] = {
+    ".eviction": ("FlextWebUtilitiesEviction",),
+    ".health": ("FlextWebUtilitiesHealth",),
+    ".indexes": ("FlextWebUtilitiesIndexes",),
+    ".journal": ("FlextWebUtilitiesJournal",),
+    ".metrics": ("FlextWebUtilitiesMetrics",),
+    ".openmetrics": ("FlextWebUtilitiesOpenMetrics",),
+    ".pagination": ("FlextWebUtilitiesPagination",),
+    ".registry": ("FlextWebUtilitiesRegistry",),
+    ".storage": ("FlextWebUtilitiesStorage",),
+    ".templates": ("FlextWebUtilitiesTemplates",),
+    ".workers": ("FlextWebUtilitiesWorkers",),
+    ".wsgi": ("FlextWebUtilitiesWsgi",),
+}
+
+
+_LAZY_ALIAS_GROUPS: dict[str, tuple[tuple[str, str], ...]] = {}
+
+
+_LAZY_IMPORTS = build_lazy_import_map(
+    _LAZY_MODULES, alias_groups=_LAZY_ALIAS_GROUPS, sort_keys=False
+)
+
+_PUBLIC_EXPORTS: tuple[str, ...] = (
+    "FlextWebUtilitiesEviction",
+    "FlextWebUtilitiesHealth",
+    "FlextWebUtilitiesIndexes",
+    "FlextWebUtilitiesJournal",
+    "FlextWebUtilitiesMetrics",
+    "FlextWebUtilitiesOpenMetrics",
+    "FlextWebUtilitiesPagination",
+    "FlextWebUtilitiesRegistry",
+    "FlextWebUtilitiesStorage",
+    "FlextWebUtilitiesTemplates",
+    "FlextWebUtilitiesWorkers",
+    "FlextWebUtilitiesWsgi",
+)
+
+__all__: tuple[str, ...] = tuple(_PUBLIC_EXPORTS)
+
+install_lazy_exports(__name__, globals(), _LAZY_IMPORTS, public_exports=__all__)
@@ -0,0 +1,235 @@
+"""Capacity and expiry shard for memory-bounded flext-web entity storage.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+from collections import OrderedDict
+from collections.abc import Callable
+from threading import Lock
+from time import monotonic
+
+from flext_web import c, t
+
+
+class FlextWebUtilitiesEviction:
+    """Eviction shard: LRU/LFU capacity limits, TTL deadlines and counters."""
+
+    class Web:
+        """Web eviction utilities."""
+
+        class EntityLimits:
+            """Capacity, recency and expiry bookkeeping for stored entity ids.
+
+            The store stays within ``max_entries`` ids and ``max_bytes``
+            approximate bytes (``0`` disables a limit); sizes are the length
+            of the compact JSON encoding and are only computed while a byte
+            limit is set. ``LRU`` evicts the least recently used id; ``LFU``
+            the least frequently used one, oldest first among equals, through
+            frequency buckets so both policies pick a victim in O(1).
+            Deadlines sit in a heap, so ``due`` pops expired ids without
+            scanning live ones; ids forgotten or re-tracked leave stale heap
+            entries that are skipped when they surface. ``clock`` is injectable
+            for tests. Not thread-safe: callers serialize access.
+            """
+
+            __slots__ = (
+                "_buckets",
+                "_clock",
+                "_deadlines",
+                "_expiry",
+                "_frequency",
+                "_min_frequency",
+                "_order",
+                "_sizes",
+                "bytes",
+                "default_ttl",
+                "max_bytes",
+                "max_entries",
+                "policy",
+            )
+
+            def __init__(
+                self,
+                max_entries: int = 0,
+                max_bytes: int = 0,
+                policy: c.Web.EvictionPolicy = c.Web.EvictionPolicy.LRU,
+                default_ttl: float | None = None,
+                clock: Callable[[], float] = monotonic,
+            ) -> None:
+                """Initialize empty bookkeeping for the given limits."""
+                self.max_entries = max(max_entries, 0)
+                self.max_bytes = max(max_bytes, 0)
+                self.policy = policy
+                self.default_ttl = default_ttl
+                self._clock = clock
+                self._order: OrderedDict[str, None] = OrderedDict()
+                self._frequency: dict[str, int] = {}
+                self._buckets: dict[int, OrderedDict[str, None]] = {}
+                self._min_frequency = 0
+                self._sizes: dict[str, int] = {}
+                self._expiry: dict[str, float] = {}
+                self._deadlines: list[tuple[float, str]] = []
+                self.bytes = 0
+
+            def __len__(self) -> int:
+                """Return the number of tracked ids."""
+                return len(self._sizes)
+
+            def deadline(self, ttl: float | None = None) -> float | None:
+                """Return the deadline ``ttl`` (or the default TTL) seconds from now."""
+                lifetime = self.default_ttl if ttl is None else ttl
+                return None if lifetime is None else self._clock() + lifetime
+
+            def expires_at(self, entity_id: str) -> float | None:
+                """Return the deadline of ``entity_id``; ``None`` if it never expires."""
+                return self._expiry.get(entity_id)
+
+            def track(
+                self,
+                entity_id: str,
+                data: t.ConfigurationMapping,
+                expires_at: float | None,
+            ) -> None:
+                """Record a write of ``entity_id``; re-tracking counts as a use."""
+                size = self.size(entity_id, data) if self.max_bytes else 0
+                self.bytes += size - self._sizes.get(entity_id, 0)
+                if entity_id in self._sizes:
+                    self.touch(entity_id)
+                elif self.policy == c.Web.EvictionPolicy.LFU:
+                    self._frequency[entity_id] = 1
+                    self._buckets.setdefault(1, OrderedDict())[entity_id] = None
+                    self._min_frequency = 1
+                else:
+                    self._order[entity_id] = None
+                self._sizes[entity_id] = size
+                if expires_at is None:
+                    _ = self._expiry.pop(entity_id, None)
+                elif self._expiry.get(entity_id) != expires_at:
+                    self._expiry[entity_id] = expires_at
+                    heapq.heappush(self._deadlines, (expires_at, entity_id))
+
+            def touch(self, entity_id: str) -> None:
+                """Record a read of ``entity_id``."""
+                if self.policy != c.Web.EvictionPolicy.LFU:
+                    if entity_id in self._order:
+                        self._order.move_to_end(entity_id)
+                    return
+                frequency = self._frequency.get(entity_id)
+                if frequency is None:
+                    return
+                self._unbucket(entity_id, frequency)
+                self._frequency[entity_id] = frequency + 1
+                self._buckets.setdefault(frequency + 1, OrderedDict())[entity_id] = None
+                if self._min_frequency == frequency and frequency not in self._buckets:
+                    self._min_frequency = frequency + 1
+
+            def forget(self, entity_id: str) -> None:
+                """Stop tracking ``entity_id``."""
+                size = self._sizes.pop(entity_id, None)
+                if size is None:
+                    return
+                self.bytes -= size
+                _ = self._expiry.pop(entity_id, None)
+                _ = self._order.pop(entity_id, None)
+                frequency = self._frequency.pop(entity_id, None)
+                if frequency is not None:
+                    self._unbucket(entity_id, frequency)
+
+            def over_limit(self) -> bool:
+                """Return whether a capacity limit is exceeded."""
+                return bool(
+                    (self.max_entries and len(self._sizes) > self.max_entries)
+                    or (self.max_bytes and self.bytes > self.max_bytes)
+                )
+
+            def victims(self) -> list[tuple[str, float | None]]:
+                """Forget ids, coldest first, until within the limits.
+
+                Returns ``(id, deadline)`` pairs so an eviction can be undone.
+                """
+                evicted: list[tuple[str, float | None]] = []
+                while self._sizes and self.over_limit():
+                    victim = self._coldest()
+                    evicted.append((victim, self._expiry.get(victim)))
+                    self.forget(victim)
+                return evicted
+
+            def due(self, limit: int | None = None) -> list[str]:
+                """Forget and return up to ``limit`` ids whose deadline has passed."""
+                moment = self._clock()
+                deadlines = self._deadlines
+                expired: list[str] = []
+                while deadlines and deadlines[0][0] <= moment:
+                    if limit is not None and len(expired) >= limit:
+                        break
+                    deadline, entity_id = heapq.heappop(deadlines)
+                    if self._expiry.get(entity_id) == deadline:
+                        self.forget(entity_id)
+                        expired.append(entity_id)
+                return expired
+
+            @staticmethod
+            def size(entity_id: str, data: t.ConfigurationMapping) -> int:
+                """Return the approximate stored size of one entity in bytes."""
+                return len(entity_id) + len(
+                    json.dumps(dict(data), default=str, separators=(",", ":"))
+                )
+
+            def _coldest(self) -> str:
+                if self.policy != c.Web.EvictionPolicy.LFU:
+                    return next(iter(self._order))
+                bucket = self._buckets.get(self._min_frequency)
+                if bucket is None:
+                    self._min_frequency = min(self._buckets)
+                    bucket = self._buckets[self._min_frequency]
+                return next(iter(bucket))
+
+            def _unbucket(self, entity_id: str, frequency: int) -> None:
+                bucket = self._buckets[frequency]
+                del bucket[entity_id]
+                if not bucket:
+                    del self._buckets[frequency]
+
+        class EvictionCounters:
+            """Totals of entities evicted for capacity or expiry.
+
+            Each entity store keeps its own counters; ``u.Web.entity_evictions``
+            aggregates every store for the health metrics.
+            """
+
+            __slots__ = ("_lock", "evictions", "expirations")
+
+            def __init__(self) -> None:
+                """Initialize zeroed counters."""
+                self._lock = Lock()
+                self.evictions = 0
+                self.expirations = 0
+
+            def record(self, evictions: int = 0, expirations: int = 0) -> None:
+                """Add evicted and expired entity counts."""
+                if evictions or expirations:
+                    with self._lock:
+                        self.evictions += evictions
+                        self.expirations += expirations
+
+            def reset(self) -> None:
+                """Zero both counters."""
+                with self._lock:
+                    self.evictions = 0
+                    self.expirations = 0
+
+            def snapshot(self) -> dict[str, int]:
+                """Return the counters keyed as published in health metrics."""
+                with self._lock:
+                    return {
+                        "evictions": self.evictions,
+                        "expirations": self.expirations,
+                    }
+
+
+__all__: list[str] = ["FlextWebUtilitiesEviction"]
@@ -0,0 +1,84 @@
+"""Health payload shard for pre-encoded flext-web health responses.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Mapping
+from time import time
+
+from flext_cli import u
+
+
+class FlextWebUtilitiesHealth:
+    """Health shard: JSON health bodies encoded once and served as bytes."""
+
+    class Web:
+        """Web health utilities."""
+
+        class HealthPayload:
+            """Pre-encoded JSON body of a health endpoint.
+
+            The fields are encoded when created and again only when
+            ``update`` changes them. A ``timestamped`` payload appends a
+            ``timestamp`` from ``stamp``, by default the same
+            ``u.generate_iso_timestamp`` format the handlers always served,
+            and is re-encoded at most once per ``clock`` second, so serving
+            it costs one clock read. The body is swapped as one attribute:
+            readers racing on a second boundary may both encode, never see a
+            torn body. ``clock`` and ``stamp`` are injectable for tests.
+            """
+
+            __slots__ = ("_clock", "_encoded", "_fields", "_stamp", "timestamped")
+
+            def __init__(
+                self,
+                fields: Mapping[str, str],
+                *,
+                timestamped: bool = False,
+                clock: Callable[[], float] = time,
+                stamp: Callable[[], str] = u.generate_iso_timestamp,
+            ) -> None:
+                """Encode ``fields`` as the initial body."""
+                self.timestamped = timestamped
+                self._clock = clock
+                self._stamp = stamp
+                self._fields = dict(fields)
+                self._encoded = (-1, self.encode(self._fields))
+
+            @property
+            def fields(self) -> Mapping[str, str]:
+                """Current fields, without the timestamp."""
+                return self._fields
+
+            def body(self) -> bytes:
+                """Return the encoded body, refreshing a stale timestamp."""
+                if not self.timestamped:
+                    return self._encoded[1]
+                second = int(self._clock())
+                encoded = self._encoded
+                if encoded[0] != second:
+                    encoded = (
+                        second,
+                        self.encode({**self._fields, "timestamp": self._stamp()}),
+                    )
+                    self._encoded = encoded
+                return encoded[1]
+
+            def update(self, **fields: str) -> None:
+                """Apply a state change and re-encode the body if it differs."""
+                merged = {**self._fields, **fields}
+                if merged != self._fields:
+                    self._fields = merged
+                    self._encoded = (-1, self.encode(merged))
+
+            @staticmethod
+            def encode(fields: Mapping[str, str]) -> bytes:
+                """Return the compact JSON encoding of ``fields``."""
+                return json.dumps(dict(fields), separators=(",", ":")).encode()
+
+
+__all__: list[str] = ["FlextWebUtilitiesHealth"]
@@ -0,0 +1,232 @@
+"""Secondary index shard for flext-web entity storage.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Hashable
+from operator import itemgetter
+from threading import Lock
+
+from flext_web import c, t
+
+
+class FlextWebUtilitiesIndexes:
+    """Index shard: hash and sorted secondary indexes over entity fields."""
+
+    class Web:
+        """Web index utilities."""
+
+        class HashIndex:
+            """Equality index mapping a field value to the ids holding it.
+
+            Buckets are insertion-ordered, so lookups return ids in the order
+            they were indexed. Unhashable values are not indexed.
+            """
+
+            __slots__ = ("_buckets", "field")
+
+            def __init__(self, field: str) -> None:
+                """Initialize an empty index over ``field``."""
+                self.field = field
+                self._buckets: dict[Hashable, dict[str, None]] = {}
+
+            def __len__(self) -> int:
+                """Return the number of distinct indexed values."""
+                return len(self._buckets)
+
+            def add(self, entity_id: str, value: t.Web.FieldValue) -> None:
+                """Index ``entity_id`` under ``value``."""
+                if isinstance(value, Hashable):
+                    self._buckets.setdefault(value, {})[entity_id] = None
+
+            def equal(self, value: t.Web.FieldValue) -> tuple[str, ...] | None:
+                """Return the ids whose field equals ``value``; ``None`` if unhashable.
+
+                Unhashable values were never indexed, so the caller must
+                scan instead of trusting an empty result.
+                """
+                if not isinstance(value, Hashable):
+                    return None
+                return tuple(self._buckets.get(value, ()))
+
+            def remove(self, entity_id: str, value: t.Web.FieldValue) -> None:
+                """Drop ``entity_id`` from the bucket of ``value``."""
+                if not isinstance(value, Hashable):
+                    return
+                bucket = self._buckets.get(value)
+                if bucket is None:
+                    return
+                _ = bucket.pop(entity_id, None)
+                if not bucket:
+                    del self._buckets[value]
+
+        class SortedIndex:
+            """Ordered index answering equality and inclusive range lookups.
+
+            Entries are ``(rank, value, id)`` tuples where ``rank`` separates
+            numbers from strings, so both kinds can be indexed without being
+            compared to each other; booleans and non-scalar values are not
+            indexed. Entries live in sorted chunks of about
+            ``c.Web.ENTITY_SORTED_INDEX_CHUNK`` entries, each with its last
+            entry in ``_maxes``: an insert or remove bisects ``_maxes`` and
+            shifts one chunk, so writes stay cheap at millions of entries and
+            a lookup never re-sorts, however writes and reads interleave.
+            """
+
+            __slots__ = ("_chunks", "_lock", "_maxes", "_size", "field")
+
+            def __init__(self, field: str) -> None:
+                """Initialize an empty index over ``field``."""
+                self.field = field
+                self._lock = Lock()
+                self._chunks: list[list[tuple[int, str | float, str]]] = []
+                self._maxes: list[tuple[int, str | float, str]] = []
+                self._size = 0
+
+            def __len__(self) -> int:
+                """Return the number of indexed entries."""
+                return self._size
+
+            @staticmethod
+            def sort_value(value: t.Web.FieldValue) -> tuple[int, str | float] | None:
+                """Return the ``(rank, value)`` key of ``value``; ``None`` if unindexable."""
+                match value:
+                    case bool():
+                        return None
+                    case int() | float():
+                        return (0, value)
+                    case str():
+                        return (1, value)
+                    case _:
+                        return None
+
+            @staticmethod
+            def in_range(
+                value: t.Web.FieldValue,
+                low: str | float | None,
+                high: str | float | None,
+            ) -> bool:
+                """Return whether ``value`` lies within the inclusive bounds."""
+                sort_value = FlextWebUtilitiesIndexes.Web.SortedIndex.sort_value
+                key = sort_value(value)
+                if key is None:
+                    return False
+                low_key = None if low is None else sort_value(low)
+                high_key = None if high is None else sort_value(high)
+                if low is not None and (
+                    low_key is None or low_key[0] != key[0] or key < low_key
+                ):
+                    return False
+                return high is None or (
+                    high_key is not None and high_key[0] == key[0] and key <= high_key
+                )
+
+            def add(self, entity_id: str, value: t.Web.FieldValue) -> None:
+                """Index ``entity_id`` under ``value`` when it is sortable."""
+                key = self.sort_value(value)
+                if key is None:
+                    return
+                entry = (*key, entity_id)
+                with self._lock:
+                    chunks, maxes = self._chunks, self._maxes
+                    self._size += 1
+                    if not chunks:
+                        chunks.append([entry])
+                        maxes.append(entry)
+                        return
+                    position = bisect_left(maxes, entry)
+                    if position == len(maxes):
+                        position -= 1
+                        chunks[position].append(entry)
+                        maxes[position] = entry
+                    else:
+                        insort(chunks[position], entry)
+                    chunk = chunks[position]
+                    if len(chunk) > 2 * c.Web.ENTITY_SORTED_INDEX_CHUNK:
+                        half = len(chunk) // 2
+                        chunks.insert(position + 1, chunk[half:])
+                        del chunk[half:]
+                        maxes.insert(position, chunk[-1])
+
+            def equal(self, value: t.Web.FieldValue) -> list[str] | None:
+                """Return the ids whose field equals ``value``; ``None`` if unindexable."""
+                if self.sort_value(value) is None:
+                    return None
+                return self.range(value, value)
+
+            def range(
+                self, low: t.Web.FieldValue, high: t.Web.FieldValue
+            ) -> list[str] | None:
+                """Return ids with ``low <= value <= high`` in ascending value order.
+
+                Either bound may be ``None``; ``None`` is returned when the
+                bounds are unindexable or both missing.
+                """
+                sort_value = self.sort_value
+                low_key = None if low is None else sort_value(low)
+                high_key = None if high is None else sort_value(high)
+                bound = low_key or high_key
+                if (
+                    bound is None
+                    or (low is not None and low_key is None)
+                    or (high is not None and high_key is None)
+                ):
+                    return None
+                if (
+                    low_key is not None
+                    and high_key is not None
+                    and low_key[0] != high_key[0]
+                ):
+                    return []
+                rank = bound[0]
+                start_key = low_key or (rank,)
+                key = itemgetter(0, 1)
+                ids: list[str] = []
+                with self._lock:
+                    chunks = self._chunks
+                    first = bisect_left(self._maxes, start_key, key=key)
+                    for position in range(first, len(chunks)):
+                        chunk = chunks[position]
+                        start = (
+                            bisect_left(chunk, start_key, key=key)
+                            if position == first
+                            else 0
+                        )
+                        stop = (
+                            bisect_right(chunk, high_key, key=key)
+                            if high_key is not None
+                            else bisect_left(chunk, (rank + 1,), key=key)
+                        )
+                        ids.extend(entry[2] for entry in chunk[start:stop])
+                        if stop < len(chunk):
+                            break
+                return ids
+
+            def remove(self, entity_id: str, value: t.Web.FieldValue) -> None:
+                """Drop the entry of ``entity_id`` under ``value``."""
+                key = self.sort_value(value)
+                if key is None:
+                    return
+                entry = (*key, entity_id)
+                with self._lock:
+                    chunks, maxes = self._chunks, self._maxes
+                    position = bisect_left(maxes, entry)
+                    if position == len(maxes):
+                        return
+                    chunk = chunks[position]
+                    index = bisect_left(chunk, entry)
+                    if index == len(chunk) or chunk[index] != entry:
+                        return
+                    del chunk[index]
+                    self._size -= 1
+                    if not chunk:
+                        del chunks[position], maxes[position]
+                    elif index == len(chunk):
+                        maxes[position] = chunk[-1]
+
+
+__all__: list[str] = ["FlextWebUtilitiesIndexes"]
@@ -0,0 +1,328 @@
+"""Write-ahead journal shard for durable flext-web entity storage.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable, Iterable, Iterator
+from io import BufferedWriter
+from itertools import starmap
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from threading import Condition, Event, Thread
+
+from flext_web import c, t
+
+
+class FlextWebUtilitiesJournal:
+    """Journal shard: append-only entity log, group commit and snapshots."""
+
+    class Web:
+        """Web journal utilities."""
+
+        class EntityJournal:
+            """Append-only JSON-lines log of entity writes with snapshots.
+
+            ``append_many`` writes one ``{"op", "id", "data", "version"}``
+            line per entry and returns once they are on disk. With a positive ``group_commit_ms`` a
+            background thread fsyncs every interval and releases all writers
+            covered by that fsync at once (group commit); with ``0`` each
+            append fsyncs inline. ``compact`` atomically replaces the
+            snapshot with the full current state and truncates the log.
+            ``recover`` memory-maps the snapshot, replays the log tail and
+            drops a torn trailing line left by a crash. Replaying is
+            idempotent, so a write applied before its append is safe to be
+            captured by a concurrent compaction.
+            """
+
+            __slots__ = (
+                "_appended",
+                "_condition",
+                "_error",
+                "_flusher",
+                "_handle",
+                "_interval",
+                "_stopping",
+                "_synced",
+                "directory",
+                "records",
+                "syncs",
+            )
+
+            def __init__(
+                self,
+                directory: str | Path,
+                group_commit_ms: float = c.Web.ENTITY_JOURNAL_GROUP_COMMIT_MS,
+            ) -> None:
+                """Prepare a journal in ``directory``; call ``recover`` to open it."""
+                self.directory = Path(directory)
+                self._interval = max(group_commit_ms, 0.0) / 1000
+                self._condition = Condition()
+                self._stopping = Event()
+                self._handle: BufferedWriter | None = None
+                self._flusher: Thread | None = None
+                self._error: OSError | None = None
+                self._appended = 0
+                self._synced = 0
+                self.records = 0
+                self.syncs = 0
+
+            @property
+            def log_path(self) -> Path:
+                """Path of the append-only log."""
+                return self.directory / c.Web.ENTITY_JOURNAL_LOG_NAME
+
+            @property
+            def snapshot_path(self) -> Path:
+                """Path of the compacted snapshot."""
+                return self.directory / c.Web.ENTITY_JOURNAL_SNAPSHOT_NAME
+
+            def recover(self) -> t.Web.JournalState:
+                """Rebuild the state from snapshot and log, then open for appends.
+
+                Returns ``(data, version)`` by entity id in insertion order.
+                Raises ``OSError`` when the files cannot be read or opened.
+                """
+                self.directory.mkdir(parents=True, exist_ok=True)
+                state: t.Web.JournalState = {}
+                for _, entry in self.entries(self.snapshot_path):
+                    self.apply(state, entry)
+                valid_until = 0
+                replayed = 0
+                for end_offset, entry in self.entries(self.log_path):
+                    self.apply(state, entry)
+                    valid_until = end_offset
+                    replayed += 1
+                handle = self.log_path.open("ab")
+                if handle.tell() != valid_until:
+                    _ = handle.truncate(valid_until)
+                self._handle = handle
+                self._error = None
+                self.records = replayed
+                if self._interval > 0:
+                    self._stopping.clear()
+                    self._flusher = Thread(
+                        target=self._flush_loop, name="entity-journal", daemon=True
+                    )
+                    self._flusher.start()
+                return state
+
+            def append(
+                self,
+                op: str,
+                entity_id: str,
+                data: t.ConfigurationMapping | None = None,
+                version: int = 1,
+            ) -> None:
+                """Append one write and wait until it is durable."""
+                self.append_many([(op, entity_id, data, version)])
+
+            def append_many(self, entries: Iterable[t.Web.JournalEntry]) -> None:
+                """Append ``(op, id, data, version)`` writes and wait for one sync.
+
+                Raises ``OSError`` when the journal is closed or the write fails.
+                """
+                self.wait(self.write_many(entries))
+
+            def write_many(self, entries: Iterable[t.Web.JournalEntry]) -> int:
+                """Buffer ``entries`` in call order and return their sync ticket.
+
+                Writers that must keep the log in their own apply order call
+                this under their lock and ``wait`` for the ticket after
+                releasing it. Without group commit the entries are synced
+                before returning. Raises ``OSError`` when the journal is
+                closed or the write fails.
+                """
+                lines = list(starmap(self.encode, entries))
+                if not lines:
+                    return 0
+                with self._condition:
+                    handle = self._writable()
+                    handle.writelines(lines)
+                    self._appended += 1
+                    self.records += len(lines)
+                    ticket = self._appended
+                    if self._interval <= 0:
+                        handle.flush()
+                        os.fsync(handle.fileno())
+                        self._synced = ticket
+                        self.syncs += 1
+                    return ticket
+
+            def wait(self, ticket: int) -> None:
+                """Block until the write holding ``ticket`` is on disk.
+
+                Raises ``OSError`` when the journal failed or closed first.
+                """
+                with self._condition:
+                    while self._synced < ticket:
+                        if self._error is not None:
+                            raise self._error
+                        if self._handle is None:
+                            msg = "Entity journal closed before the write was synced"
+                            raise OSError(msg)
+                        _ = self._condition.wait()
+
+            def compact(
+                self,
+                snapshot: Callable[
+                    [], Iterable[tuple[str, t.ConfigurationMapping, int]]
+                ],
+            ) -> None:
+                """Write ``snapshot()`` as the new snapshot and truncate the log.
+
+                ``snapshot`` is called with appends blocked, so no write can
+                land in the log between the state capture and the truncation.
+                Callers holding their own lock around ``write_many`` must hold
+                it here too, acquired before this call.
+                """
+                with self._condition:
+                    handle = self._writable()
+                    staging = self.snapshot_path.with_suffix(".tmp")
+                    with staging.open("wb") as out:
+                        out.writelines(
+                            self.encode("put", entity_id, data, version)
+                            for entity_id, data, version in snapshot()
+                        )
+                        out.flush()
+                        os.fsync(out.fileno())
+                    _ = staging.replace(self.snapshot_path)
+                    self._fsync_directory()
+                    handle.flush()
+                    _ = handle.truncate(0)
+                    os.fsync(handle.fileno())
+                    self.records = 0
+                    self._synced = self._appended
+                    self._condition.notify_all()
+
+            def close(self) -> None:
+                """Sync pending appends, stop the flusher and close the log."""
+                self._stopping.set()
+                if self._flusher is not None:
+                    self._flusher.join()
+                    self._flusher = None
+                with self._condition:
+                    handle = self._handle
+                    if handle is not None:
+                        handle.flush()
+                        os.fsync(handle.fileno())
+                        handle.close()
+                        self._handle = None
+                    self._synced = self._appended
+                    self._condition.notify_all()
+
+            def sync(self) -> None:
+                """Fsync every append made so far and release their writers."""
+                with self._condition:
+                    handle = self._handle
+                    target = self._appended
+                    if handle is None or self._synced >= target:
+                        return
+                    handle.flush()
+                    descriptor = handle.fileno()
+                os.fsync(descriptor)
+                with self._condition:
+                    self._synced = max(self._synced, target)
+                    self.syncs += 1
+                    self._condition.notify_all()
+
+            @staticmethod
+            def apply(
+                state: t.Web.JournalState, entry: t.MutableConfigurationMapping
+            ) -> None:
+                """Apply one decoded log entry to ``state``."""
+                match entry:
+                    case {
+                        "op": "put",
+                        "id": str() as entity_id,
+                        "data": dict() as data,
+                    }:
+                        version = entry.get("version")
+                        state[entity_id] = (
+                            data,
+                            version if isinstance(version, int) else 1,
+                        )
+                    case {"op": "delete", "id": str() as entity_id}:
+                        _ = state.pop(entity_id, None)
+                    case _:
+                        pass
+
+            @staticmethod
+            def encode(
+                op: str,
+                entity_id: str,
+                data: t.ConfigurationMapping | None,
+                version: int,
+            ) -> bytes:
+                """Return the newline-terminated JSON line of one write."""
+                payload = None if data is None else dict(data)
+                return (
+                    json.dumps(
+                        {
+                            "op": op,
+                            "id": entity_id,
+                            "data": payload,
+                            "version": version,
+                        },
+                        default=str,
+                        separators=(",", ":"),
+                    ).encode()
+                    + b"\n"
+                )
+
+            @staticmethod
+            def entries(
+                path: Path,
+            ) -> Iterator[tuple[int, t.MutableConfigurationMapping]]:
+                """Yield ``(end_offset, entry)`` for each complete line of ``path``.
+
+                The file is read through a read-only memory map; iteration
+                stops at the first incomplete or undecodable line.
+                """
+                if not path.exists() or path.stat().st_size == 0:
+                    return
+                with (
+                    path.open("rb") as handle,
+                    mmap(handle.fileno(), 0, access=ACCESS_READ) as mapped,
+                ):
+                    start = 0
+                    while (end := mapped.find(b"\n", start)) != -1:
+                        try:
+                            entry = json.loads(mapped[start:end])
+                        except ValueError:
+                            return
+                        if not isinstance(entry, dict):
+                            return
+                        start = end + 1
+                        yield start, entry
+
+            def _flush_loop(self) -> None:
+                while not self._stopping.wait(self._interval):
+                    try:
+                        self.sync()
+                    except OSError as exc:
+                        with self._condition:
+                            self._error = exc
+                            self._condition.notify_all()
+                        return
+
+            def _fsync_directory(self) -> None:
+                descriptor = os.open(self.directory, os.O_RDONLY)
+                try:
+                    os.fsync(descriptor)
+                finally:
+                    os.close(descriptor)
+
+            def _writable(self) -> BufferedWriter:
+                handle = self._handle
+                if handle is None:
+                    msg = "Entity journal is not open"
+                    raise OSError(msg)
+                return handle
+
+
+__all__: list[str] = ["FlextWebUtilitiesJournal"]
@@ -0,0 +1,248 @@
+"""Request latency metrics shard for flext-web runtimes.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+from math import ceil
+from threading import Lock, Thread, current_thread, local
+from time import monotonic
+
+from flext_web import c, t
+
+
+class FlextWebUtilitiesMetrics:
+    """Request metrics shard: HDR-style latency histograms per app and route."""
+
+    class Web:
+        """Web request metrics utilities."""
+
+        class LatencySnapshot:
+            """Mergeable latency counts; also the per-thread shard of a histogram."""
+
+            __slots__ = ("counts", "errors", "max_us", "sum_us", "total")
+
+            def __init__(self) -> None:
+                """Initialize an empty snapshot."""
+                self.counts: dict[int, int] = {}
+                self.total = 0
+                self.errors = 0
+                self.sum_us = 0
+                self.max_us = 0
+
+            def merge(
+                self, other: FlextWebUtilitiesMetrics.Web.LatencySnapshot
+            ) -> None:
+                """Add ``other`` into this snapshot; safe while ``other`` is written."""
+                counts = self.counts
+                for index, count in tuple(other.counts.items()):
+                    counts[index] = counts.get(index, 0) + count
+                self.total += other.total
+                self.errors += other.errors
+                self.sum_us += other.sum_us
+                self.max_us = max(self.max_us, other.max_us)
+
+            def percentile(self, percent: float) -> int:
+                """Return the latency in microseconds at ``percent`` (0-100]."""
+                if not self.total:
+                    return 0
+                target = max(ceil(self.total * percent / 100.0), 1)
+                seen = 0
+                for index in sorted(self.counts):
+                    seen += self.counts[index]
+                    if seen >= target:
+                        return min(
+                            FlextWebUtilitiesMetrics.Web.LatencyHistogram.bucket_value(
+                                index
+                            ),
+                            self.max_us,
+                        )
+                return self.max_us
+
+            def summary(self, elapsed: float) -> t.Web.ResponseDict:
+                """Project the snapshot into counters, rates and percentiles."""
+                total = self.total
+                summary: t.Web.ResponseDict = {
+                    "requests": total,
+                    "errors": self.errors,
+                    "error_rate": self.errors / total if total else 0.0,
+                    "throughput_rps": total / elapsed if elapsed > 0 else 0.0,
+                    "avg_response_time_ms": self.sum_us / total / 1000
+                    if total
+                    else 0.0,
+                    "max_ms": self.max_us / 1000,
+                }
+                for label, percent in c.Web.METRICS_PERCENTILES:
+                    summary[label] = self.percentile(percent) / 1000
+                return summary
+
+        class LatencyHistogram:
+            """Log-linear latency histogram with per-thread shards.
+
+            Values are bucketed HDR-style: exact below ``2**SUB_BUCKET_BITS``
+            microseconds, then ``2**(SUB_BUCKET_BITS - 1)`` linear buckets per
+            power of two, for a bounded relative error of under 2 %. Each
+            recording thread writes to its own shard, so ``record`` never takes
+            a lock; ``snapshot`` merges the shards. Shards of exited threads
+            are folded into one retired snapshot whenever a shard is added or
+            a snapshot taken, so thread churn never grows the shard list past
+            the live recording threads.
+            """
+
+            __slots__ = ("_local", "_lock", "_retired", "_shards")
+
+            def __init__(self) -> None:
+                """Initialize a histogram without shards."""
+                self._local = local()
+                self._lock = Lock()
+                self._retired = FlextWebUtilitiesMetrics.Web.LatencySnapshot()
+                self._shards: list[
+                    tuple[Thread, FlextWebUtilitiesMetrics.Web.LatencySnapshot]
+                ] = []
+
+            @staticmethod
+            def bucket_index(value_us: int) -> int:
+                """Return the bucket index for a latency in microseconds."""
+                bits = c.Web.METRICS_SUB_BUCKET_BITS
+                if value_us < 1 << bits:
+                    return max(value_us, 0)
+                shift = value_us.bit_length() - bits
+                return (shift << (bits - 1)) + (value_us >> shift)
+
+            @staticmethod
+            def bucket_value(index: int) -> int:
+                """Return the highest latency in microseconds mapped to ``index``."""
+                bits = c.Web.METRICS_SUB_BUCKET_BITS
+                if index < 1 << bits:
+                    return index
+                half = 1 << (bits - 1)
+                shift = index // half - 1
+                return ((index - shift * half + 1) << shift) - 1
+
+            @property
+            def shard_count(self) -> int:
+                """Number of per-thread shards not yet folded into the retired snapshot."""
+                with self._lock:
+                    return len(self._shards)
+
+            def record(self, value_us: int, *, error: bool) -> None:
+                """Record one observation into the calling thread's shard."""
+                try:
+                    shard = self._local.shard
+                except AttributeError:
+                    shard = self._new_shard()
+                value_us = min(value_us, c.Web.METRICS_MAX_LATENCY_US)
+                index = self.bucket_index(value_us)
+                counts = shard.counts
+                counts[index] = counts.get(index, 0) + 1
+                shard.total += 1
+                shard.sum_us += value_us
+                shard.max_us = max(shard.max_us, value_us)
+                if error:
+                    shard.errors += 1
+
+            def snapshot(self) -> FlextWebUtilitiesMetrics.Web.LatencySnapshot:
+                """Merge the retired snapshot and every live shard into a new one."""
+                snapshot = FlextWebUtilitiesMetrics.Web.LatencySnapshot()
+                with self._lock:
+                    self._reap()
+                    snapshot.merge(self._retired)
+                    for _, shard in self._shards:
+                        snapshot.merge(shard)
+                return snapshot
+
+            def _new_shard(self) -> FlextWebUtilitiesMetrics.Web.LatencySnapshot:
+                shard = FlextWebUtilitiesMetrics.Web.LatencySnapshot()
+                with self._lock:
+                    self._reap()
+                    self._shards.append((current_thread(), shard))
+                self._local.shard = shard
+                return shard
+
+            def _reap(self) -> None:
+                """Fold shards of exited threads into ``_retired``; caller holds the lock."""
+                live: list[
+                    tuple[Thread, FlextWebUtilitiesMetrics.Web.LatencySnapshot]
+                ] = []
+                for owner, shard in self._shards:
+                    if owner.is_alive():
+                        live.append((owner, shard))
+                    else:
+                        self._retired.merge(shard)
+                if len(live) != len(self._shards):
+                    self._shards = live
+
+        class RequestMetrics:
+            """Latency histograms keyed by ``(app_id, route)``.
+
+            Recording only touches the route histogram; per-app and global
+            views are merged from route snapshots when ``summary`` is read.
+            """
+
+            __slots__ = ("_histograms", "_lock", "_started")
+
+            def __init__(self) -> None:
+                """Initialize an empty metrics registry."""
+                self._lock = Lock()
+                self._histograms: dict[
+                    tuple[str, str], FlextWebUtilitiesMetrics.Web.LatencyHistogram
+                ] = {}
+                self._started = monotonic()
+
+            def clear(self) -> None:
+                """Drop every histogram and restart the throughput window."""
+                with self._lock:
+                    self._histograms = {}
+                    self._started = monotonic()
+
+            def record(
+                self, app_id: str, route: str, status_code: int, elapsed_ns: int
+            ) -> None:
+                """Record one request that took ``elapsed_ns`` nanoseconds."""
+                key = (app_id, route)
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    with self._lock:
+                        histogram = self._histograms.setdefault(
+                            key, FlextWebUtilitiesMetrics.Web.LatencyHistogram()
+                        )
+                histogram.record(
+                    elapsed_ns // 1000, error=status_code >= c.Web.ERROR_MIN
+                )
+
+            def snapshots(
+                self,
+            ) -> tuple[
+                tuple[str, str, FlextWebUtilitiesMetrics.Web.LatencySnapshot], ...
+            ]:
+                """Return ``(app_id, route, snapshot)`` for every histogram."""
+                with self._lock:
+                    histograms = tuple(self._histograms.items())
+                return tuple(
+                    (app_id, route, histogram.snapshot())
+                    for (app_id, route), histogram in histograms
+                )
+
+            def summary(self) -> t.Web.ResponseDict:
+                """Return global, per-app and per-route latency summaries."""
+                elapsed = monotonic() - self._started
+                overall = FlextWebUtilitiesMetrics.Web.LatencySnapshot()
+                per_app: dict[str, FlextWebUtilitiesMetrics.Web.LatencySnapshot] = {}
+                routes: dict[str, dict[str, t.Web.ResponseDict]] = {}
+                for app_id, route, snapshot in self.snapshots():
+                    overall.merge(snapshot)
+                    per_app.setdefault(
+                        app_id, FlextWebUtilitiesMetrics.Web.LatencySnapshot()
+                    ).merge(snapshot)
+                    routes.setdefault(app_id, {})[route] = snapshot.summary(elapsed)
+                summary = overall.summary(elapsed)
+                summary["apps"] = {
+                    app_id: {**snapshot.summary(elapsed), "routes": routes[app_id]}
+                    for app_id, snapshot in per_app.items()
+                }
+                return summary
+
+
+__all__: list[str] = ["FlextWebUtilitiesMetrics"]
@@ -0,0 +1,155 @@
+"""OpenMetrics exposition shard for flext-web runtimes.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from threading import Lock
+from time import monotonic
+
+from flext_web import c, t
+from flext_web._utilities.metrics import FlextWebUtilitiesMetrics
+
+
+class FlextWebUtilitiesOpenMetrics:
+    """Exposition shard: OpenMetrics text rendering and scrape caching."""
+
+    class Web:
+        """Web OpenMetrics utilities."""
+
+        class OpenMetricsWriter:
+            """Accumulate metric families and render OpenMetrics text.
+
+            Histograms are exported from ``LatencySnapshot`` counts folded into
+            the cumulative ``le`` buckets of
+            ``c.Web.METRICS_EXPOSITION_BUCKETS_SECONDS``.
+            """
+
+            __slots__ = ("_lines",)
+
+            def __init__(self) -> None:
+                """Start an empty exposition."""
+                self._lines: list[str] = []
+
+            @staticmethod
+            def labels(values: t.StrMapping) -> str:
+                """Render a ``{name="value",...}`` label set with escaping."""
+                if not values:
+                    return ""
+                pairs = ",".join(
+                    f'{name}="{FlextWebUtilitiesOpenMetrics.Web.OpenMetricsWriter.escape(value)}"'
+                    for name, value in values.items()
+                )
+                return f"{{{pairs}}}"
+
+            @staticmethod
+            def escape(value: str) -> str:
+                """Escape a label value per the OpenMetrics text format."""
+                return (
+                    value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+                )
+
+            def counter(
+                self,
+                name: str,
+                help_text: str,
+                samples: Iterable[tuple[t.StrMapping, int]],
+            ) -> None:
+                """Add a counter family; sample names get the ``_total`` suffix."""
+                self._family(name, "counter", help_text)
+                self._lines.extend(
+                    f"{name}_total{self.labels(labels)} {value}"
+                    for labels, value in samples
+                )
+
+            def gauge(
+                self,
+                name: str,
+                help_text: str,
+                samples: Iterable[tuple[t.StrMapping, float]],
+            ) -> None:
+                """Add a gauge family."""
+                self._family(name, "gauge", help_text)
+                self._lines.extend(
+                    f"{name}{self.labels(labels)} {value}" for labels, value in samples
+                )
+
+            def histogram(
+                self,
+                name: str,
+                help_text: str,
+                series: Iterable[
+                    tuple[t.StrMapping, FlextWebUtilitiesMetrics.Web.LatencySnapshot]
+                ],
+            ) -> None:
+                """Add a histogram family in seconds from latency snapshots."""
+                self._family(name, "histogram", help_text)
+                bounds = c.Web.METRICS_EXPOSITION_BUCKETS_SECONDS
+                bounds_us = [round(bound * 1_000_000) for bound in bounds]
+                bucket_value = (
+                    FlextWebUtilitiesMetrics.Web.LatencyHistogram.bucket_value
+                )
+                for labels, snapshot in series:
+                    per_bound = [0] * (len(bounds) + 1)
+                    for index, count in snapshot.counts.items():
+                        per_bound[bisect_left(bounds_us, bucket_value(index))] += count
+                    cumulative = 0
+                    for bound, count in zip(bounds, per_bound, strict=False):
+                        cumulative += count
+                        self._lines.append(
+                            f"{name}_bucket{self.labels({**labels, 'le': str(bound)})} {cumulative}"
+                        )
+                    self._lines.extend((
+                        f"{name}_bucket{self.labels({**labels, 'le': '+Inf'})} {snapshot.total}",
+                        f"{name}_count{self.labels(labels)} {snapshot.total}",
+                        f"{name}_sum{self.labels(labels)} {snapshot.sum_us / 1_000_000}",
+                    ))
+
+            def render(self) -> bytes:
+                """Return the exposition terminated by ``# EOF``."""
+                return "\n".join((*self._lines, "# EOF", "")).encode()
+
+            def _family(self, name: str, kind: str, help_text: str) -> None:
+                self._lines.extend((
+                    f"# TYPE {name} {kind}",
+                    f"# HELP {name} {help_text}",
+                ))
+
+        class ExpositionCache:
+            """Serve one pre-rendered exposition to every scrape within ``ttl``.
+
+            Concurrent scrapers of a stale cache wait for a single render
+            instead of each rendering the whole registry.
+            """
+
+            __slots__ = ("_body", "_lock", "_rendered_at")
+
+            def __init__(self) -> None:
+                """Initialize an empty cache."""
+                self._lock = Lock()
+                self._body = b""
+                self._rendered_at: float | None = None
+
+            def clear(self) -> None:
+                """Force the next scrape to render."""
+                with self._lock:
+                    self._rendered_at = None
+
+            def fetch(self, render: Callable[[], bytes], ttl: float) -> bytes:
+                """Return the cached body, rendering it when older than ``ttl``."""
+                rendered_at = self._rendered_at
+                if rendered_at is not None and monotonic() - rendered_at < ttl:
+                    return self._body
+                with self._lock:
+                    rendered_at = self._rendered_at
+                    if rendered_at is None or monotonic() - rendered_at >= ttl:
+                        self._body = render()
+                        self._rendered_at = monotonic()
+                    return self._body
+
+
+__all__: list[str] = ["FlextWebUtilitiesOpenMetrics"]
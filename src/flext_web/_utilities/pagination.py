@@ -0,0 +1,108 @@
+"""Keyset pagination shard for flext-web listings.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as Base64Error
+from collections.abc import Iterable, Iterator
+from heapq import nlargest, nsmallest
+from operator import itemgetter
+
+from flext_web import t
+
+
+class FlextWebUtilitiesPagination:
+    """Pagination shard: opaque keyset cursors and bounded page selection."""
+
+    class Web:
+        """Web pagination utilities.
+
+        Pages are ordered by a sort key ``(missing, value, sequence)``: the
+        sort field value (missing values last) with the insertion sequence as
+        a unique tie-breaker. A cursor encodes the key of the last item of a
+        page, so the next page stays stable while items are added or removed.
+        """
+
+        @staticmethod
+        def sort_key(
+            value: t.Scalar | t.StrSequence | t.ConfigurationMapping | None,
+            sequence: int,
+        ) -> t.Web.SortKey:
+            """Return the sort key of one item; non-scalar values sort as missing."""
+            if isinstance(value, (str, int, float)):
+                return (False, value, sequence)
+            return (True, "", sequence)
+
+        @staticmethod
+        def encode_cursor(key: t.Web.SortKey) -> str:
+            """Return the opaque URL-safe cursor for ``key``."""
+            payload = json.dumps(key, separators=(",", ":")).encode()
+            return urlsafe_b64encode(payload).decode().rstrip("=")
+
+        @staticmethod
+        def decode_cursor(cursor: str) -> t.Web.SortKey:
+            """Return the sort key of ``cursor``, raising ``ValueError`` if invalid."""
+            try:
+                decoded = json.loads(
+                    urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+                )
+            except (Base64Error, UnicodeDecodeError) as exc:
+                msg = f"Invalid cursor: {cursor}"
+                raise ValueError(msg) from exc
+            match decoded:
+                case [
+                    bool() as missing,
+                    str() | int() | float() as value,
+                    int() as seq,
+                ]:
+                    return (missing, value, seq)
+                case _:
+                    msg = f"Invalid cursor: {cursor}"
+                    raise ValueError(msg)
+
+        @staticmethod
+        def select_page[T](
+            entries: Iterable[tuple[t.Web.SortKey, T]],
+            *,
+            after: t.Web.SortKey | None,
+            limit: int | None,
+            descending: bool,
+        ) -> tuple[list[T], int, str | None]:
+            """Return ``(items, total, next_cursor)`` for one page of ``entries``.
+
+            ``total`` counts every entry; only the ``limit`` items past
+            ``after`` are kept, through a bounded heap instead of a full sort.
+            ``limit=None`` sorts and returns every item past ``after``.
+            Raises ``TypeError`` when sort values are not mutually comparable.
+            """
+            total = 0
+
+            def remaining() -> Iterator[tuple[t.Web.SortKey, T]]:
+                nonlocal total
+                for entry in entries:
+                    total += 1
+                    if after is None or (
+                        entry[0] < after if descending else entry[0] > after
+                    ):
+                        yield entry
+
+            if limit is None:
+                ordered = sorted(remaining(), key=itemgetter(0), reverse=descending)
+                return [item for _, item in ordered], total, None
+            select = nlargest if descending else nsmallest
+            chosen = select(limit + 1, remaining(), key=itemgetter(0))
+            page = chosen[:limit]
+            next_cursor = (
+                FlextWebUtilitiesPagination.Web.encode_cursor(page[-1][0])
+                if len(chosen) > limit
+                else None
+            )
+            return [item for _, item in page], total, next_cursor
+
+
+__all__: list[str] = ["FlextWebUtilitiesPagination"]
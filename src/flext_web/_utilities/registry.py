@@ -0,0 +1,497 @@
+"""Application registry shard for flext-web runtime state.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Hashable, Iterator, Mapping
+from threading import Lock, RLock
+from types import MappingProxyType
+from typing import ClassVar, override
+
+from flext_web import c, t
+from flext_web._utilities.pagination import FlextWebUtilitiesPagination
+
+
+class FlextWebUtilitiesRegistry:
+    """Application registry shard: copy-on-write records, indexes and locks."""
+
+    class Web:
+        """Web registry utilities."""
+
+        class LockStripes:
+            """Fixed pool of re-entrant locks striped by application id.
+
+            Operations on the same application always map to the same lock,
+            while unrelated applications spread over ``size`` locks and do not
+            serialize on a single global mutex.
+            """
+
+            __slots__ = ("_locks",)
+
+            def __init__(self, size: int = c.Web.REGISTRY_LOCK_STRIPES) -> None:
+                """Allocate ``size`` stripe locks."""
+                self._locks: tuple[RLock, ...] = tuple(
+                    RLock() for _ in range(max(size, 1))
+                )
+
+            def __len__(self) -> int:
+                """Return the number of stripes."""
+                return len(self._locks)
+
+            def lock_for(self, key: str) -> RLock:
+                """Return the stripe lock guarding ``key``."""
+                return self._locks[hash(key) % len(self._locks)]
+
+        class AppEntry(Mapping[str, t.Scalar | t.StrSequence | t.ConfigurationMapping]):
+            """Compact read-only application record.
+
+            The standard record fields live in slots instead of a per-app
+            dict: ``status`` is held as a ``c.Web.AppState`` ordinal and
+            ``host``/``framework``/``interface`` strings are interned, so all
+            applications share one copy of each. Other keys, and statuses
+            outside ``c.Web.Status``, go to an extra dict that is only
+            allocated when needed. Lists and mappings are frozen on the way in.
+            Entries are ``Mapping`` views, so readers keep using ``get`` and
+            ``[]``; ``as_dict`` converts one at API boundaries.
+            """
+
+            FIELDS: ClassVar[tuple[str, ...]] = (
+                "id",
+                "name",
+                "port",
+                "host",
+                "status",
+                "created_at",
+                "framework",
+                "interface",
+            )
+            INTERNED: ClassVar[frozenset[str]] = frozenset({
+                "host",
+                "framework",
+                "interface",
+            })
+            STATES: ClassVar[t.MappingKV[str, c.Web.AppState]] = {
+                c.Web.Status[state.name].value: state for state in c.Web.AppState
+            }
+            STATUSES: ClassVar[tuple[str, ...]] = tuple(
+                c.Web.Status[state.name].value for state in c.Web.AppState
+            )
+            MISSING: ClassVar[object] = object()
+
+            __slots__ = (
+                "_extra",
+                "created_at",
+                "framework",
+                "host",
+                "id",
+                "interface",
+                "name",
+                "port",
+                "status",
+            )
+
+            def __init__(self, record: t.Web.AppRecord) -> None:
+                """Pack ``record`` into slots."""
+                missing = self.MISSING
+                for field in self.FIELDS:
+                    setattr(self, field, missing)
+                self._extra: (
+                    dict[str, t.Scalar | t.StrSequence | t.ConfigurationMapping] | None
+                ) = None
+                for key, value in record.items():
+                    self._set(key, value)
+
+            @override
+            def __getitem__(
+                self, key: str
+            ) -> t.Scalar | t.StrSequence | t.ConfigurationMapping:
+                """Return the value of ``key``; ``KeyError`` when absent."""
+                value = self.get(key, self.MISSING)
+                if value is self.MISSING:
+                    raise KeyError(key)
+                return value
+
+            @override
+            def __iter__(self) -> Iterator[str]:
+                """Iterate over the present standard fields, then extra keys."""
+                missing = self.MISSING
+                for field in self.FIELDS:
+                    if getattr(self, field) is not missing:
+                        yield field
+                if self._extra is not None:
+                    yield from tuple(self._extra)
+
+            @override
+            def __len__(self) -> int:
+                """Return the number of present keys."""
+                missing = self.MISSING
+                present = sum(
+                    1 for field in self.FIELDS if getattr(self, field) is not missing
+                )
+                return present + (0 if self._extra is None else len(self._extra))
+
+            @override
+            def __repr__(self) -> str:
+                """Return the record as a dict literal."""
+                return f"AppEntry({self.as_dict()!r})"
+
+            @property
+            def state(self) -> c.Web.AppState | None:
+                """Lifecycle ordinal; ``None`` for missing or non-standard statuses."""
+                status = self.status
+                return status if isinstance(status, c.Web.AppState) else None
+
+            def as_dict(
+                self,
+            ) -> dict[str, t.Scalar | t.StrSequence | t.ConfigurationMapping]:
+                """Return a plain dict copy for serialization and response models."""
+                return {key: self[key] for key in self}
+
+            def evolve(
+                self, changes: t.Web.AppRecord
+            ) -> FlextWebUtilitiesRegistry.Web.AppEntry:
+                """Return a new entry with ``changes`` applied."""
+                entry = object.__new__(type(self))
+                for field in self.__slots__:
+                    setattr(entry, field, getattr(self, field))
+                if self._extra is not None:
+                    entry._extra = dict(self._extra)
+                for key, value in changes.items():
+                    entry._set(key, value)
+                return entry
+
+            @override
+            def get(
+                self, key: str, default: object = None
+            ) -> t.Scalar | t.StrSequence | t.ConfigurationMapping:
+                """Return the value of ``key`` or ``default``."""
+                if key in self.FIELDS:
+                    value = getattr(self, key)
+                    if isinstance(value, c.Web.AppState):
+                        return self.STATUSES[value]
+                    if value is not self.MISSING:
+                        return value
+                extra = self._extra
+                if extra is not None and key in extra:
+                    return extra[key]
+                return default
+
+            def _set(
+                self, key: str, value: t.Scalar | t.StrSequence | t.ConfigurationMapping
+            ) -> None:
+                """Store one key; callers own ``self`` until it is published."""
+                match value:
+                    case list() | tuple():
+                        value = tuple(value)
+                    case Mapping():
+                        value = MappingProxyType(dict(value))
+                    case str() if key in self.INTERNED:
+                        value = sys.intern(value)
+                    case _:
+                        pass
+                extra = self._extra
+                if key == "status":
+                    state = self.STATES.get(value) if isinstance(value, str) else None
+                    self.status = self.MISSING if state is None else state
+                    if state is not None:
+                        if extra is not None:
+                            _ = extra.pop(key, None)
+                        return
+                elif key in self.FIELDS:
+                    setattr(self, key, value)
+                    return
+                if extra is None:
+                    extra = {}
+                    self._extra = extra
+                extra[key] = value
+
+        class AppRegistry:
+            """Copy-on-write registry of application records.
+
+            Records are stored as read-only ``AppEntry`` snapshots, so readers
+            get them without copying or locking. Writes to one application are
+            serialized by its stripe lock (``lock_for``), which covers the
+            read-check-evolve of a compare-and-set; only publishing the new
+            snapshot, bumping ``version`` and keeping the secondary indexes
+            declared in ``c.Web.REGISTRY_INDEXED_FIELDS`` in sync run under a
+            short global lock. Each application also gets an insertion
+            sequence number that orders ``page`` results.
+            """
+
+            __slots__ = (
+                "_indexes",
+                "_lock",
+                "_next_sequence",
+                "_records",
+                "_sequence",
+                "_stripes",
+                "_values",
+                "_version",
+            )
+
+            def __init__(self, stripes: int = c.Web.REGISTRY_LOCK_STRIPES) -> None:
+                """Initialize an empty registry with ``stripes`` per-app locks."""
+                self._lock = Lock()
+                self._stripes = FlextWebUtilitiesRegistry.Web.LockStripes(stripes)
+                self._records: dict[str, FlextWebUtilitiesRegistry.Web.AppEntry] = {}
+                self._indexes: dict[str, dict[Hashable, dict[str, None]]] = {
+                    field: {} for field in c.Web.REGISTRY_INDEXED_FIELDS
+                }
+                self._sequence: dict[str, int] = {}
+                self._next_sequence = 0
+                self._values: tuple[t.Web.AppRecord, ...] | None = None
+                self._version = 0
+
+            def __contains__(self, app_id: object) -> bool:
+                """Return whether an application id is registered."""
+                return app_id in self._records
+
+            def __getitem__(self, app_id: str) -> t.Web.AppRecord:
+                """Return the snapshot registered for ``app_id``."""
+                return self._records[app_id]
+
+            def __iter__(self) -> Iterator[str]:
+                """Iterate over registered application ids."""
+                return iter(tuple(self._records))
+
+            def __len__(self) -> int:
+                """Return the number of registered applications."""
+                return len(self._records)
+
+            @property
+            def version(self) -> int:
+                """Monotonic counter bumped on every registry write."""
+                return self._version
+
+            def clear(self) -> None:
+                """Drop every record and index entry."""
+                with self._lock:
+                    self._records = {}
+                    self._sequence = {}
+                    for index in self._indexes.values():
+                        index.clear()
+                    self._touch()
+
+            def compare_and_set_status(
+                self, app_id: str, expected: t.StrSequence | frozenset[str], target: str
+            ) -> t.Web.AppRecord | None:
+                """Atomically move ``app_id`` to ``target`` from an ``expected`` status.
+
+                Returns the new snapshot, or ``None`` when the application is
+                missing or its current status is not one of ``expected``.
+                """
+                with self.lock_for(app_id):
+                    previous = self._records.get(app_id)
+                    if previous is None or previous.get("status") not in expected:
+                        return None
+                    return self._replace(
+                        app_id, previous, previous.evolve({"status": target})
+                    )
+
+            def count(self, field: str, value: Hashable) -> int:
+                """Return how many records have ``field == value``.
+
+                Answered from the secondary index for indexed fields.
+                """
+                index = self._indexes.get(field)
+                if index is not None:
+                    return len(index.get(value, ()))
+                return sum(
+                    1 for record in self._records.values() if record.get(field) == value
+                )
+
+            def find(self, criteria: t.Web.RequestDict) -> tuple[t.Web.AppRecord, ...]:
+                """Return the snapshots whose fields equal every criteria value.
+
+                Indexed fields narrow the candidates to the smallest matching
+                bucket; remaining fields are checked on those candidates only.
+                """
+                candidates: t.SequenceOf[str] | None = None
+                for field, expected in criteria.items():
+                    index = self._indexes.get(field)
+                    if index is None or not isinstance(expected, Hashable):
+                        continue
+                    bucket = index.get(expected)
+                    if bucket is None:
+                        return ()
+                    if candidates is None or len(bucket) < len(candidates):
+                        candidates = tuple(bucket)
+                if candidates is None:
+                    candidates = tuple(self._records)
+                return tuple(
+                    record
+                    for app_id in candidates
+                    for record in (self._records.get(app_id),)
+                    if record is not None
+                    and all(
+                        record.get(field) == expected
+                        for field, expected in criteria.items()
+                    )
+                )
+
+            def get(self, app_id: str) -> t.Web.AppRecord | None:
+                """Return the snapshot for ``app_id`` or ``None``."""
+                return self._records.get(app_id)
+
+            def lock_for(self, app_id: str) -> RLock:
+                """Return the re-entrant stripe lock serializing writes to ``app_id``.
+
+                Holding it makes several changes to one application, such as
+                a compare-and-set plus its runtime table entry, atomic with
+                respect to every other writer of that application.
+                """
+                return self._stripes.lock_for(app_id)
+
+            def page(
+                self,
+                criteria: t.Web.RequestDict,
+                *,
+                name_prefix: str | None,
+                sort_by: str | None,
+                descending: bool,
+                after: t.Web.SortKey | None,
+                limit: int | None,
+            ) -> t.Web.AppRecordPage:
+                """Return ``(records, total, next_cursor)`` for one keyset page.
+
+                Candidates come from ``find``; records are ordered by
+                ``sort_by`` or, without it, by insertion. Only the page itself
+                is materialized; ``limit=None`` returns every match. Raises
+                ``TypeError`` for incomparable values.
+                """
+                pagination = FlextWebUtilitiesPagination.Web
+                sequence = self._sequence
+                records = self.find(criteria) if criteria else self.values()
+
+                def entries() -> Iterator[tuple[t.Web.SortKey, t.Web.AppRecord]]:
+                    for record in records:
+                        name = str(record.get("name", ""))
+                        if name_prefix is not None and not name.startswith(name_prefix):
+                            continue
+                        seq = sequence.get(str(record.get("id")), 0)
+                        value = seq if sort_by is None else record.get(sort_by)
+                        yield pagination.sort_key(value, seq), record
+
+                items, total, next_cursor = pagination.select_page(
+                    entries(), after=after, limit=limit, descending=descending
+                )
+                return tuple(items), total, next_cursor
+
+            def pop(self, app_id: str) -> t.Web.AppRecord | None:
+                """Remove and return the snapshot for ``app_id``."""
+                with self.lock_for(app_id), self._lock:
+                    record = self._records.pop(app_id, None)
+                    if record is not None:
+                        _ = self._sequence.pop(app_id, None)
+                        self._unindex(app_id, record)
+                        self._touch()
+                return record
+
+            def put(self, record: t.Web.AppRecord) -> t.Web.AppRecord:
+                """Store a frozen snapshot of ``record`` under its ``id``."""
+                app_id = record.get("id")
+                if not isinstance(app_id, str):
+                    msg = "Application record id(str) is required"
+                    raise TypeError(msg)
+                entry = FlextWebUtilitiesRegistry.Web.AppEntry(record)
+                with self.lock_for(app_id), self._lock:
+                    return self._store(app_id, entry)
+
+            def put_many(
+                self, records: t.SequenceOf[t.Web.AppRecord]
+            ) -> tuple[t.Web.AppRecord, ...]:
+                """Store frozen snapshots of ``records``, each under its stripe lock."""
+                if not all(isinstance(record.get("id"), str) for record in records):
+                    msg = "Application record id(str) is required"
+                    raise TypeError(msg)
+                entries = [
+                    FlextWebUtilitiesRegistry.Web.AppEntry(record) for record in records
+                ]
+                stored: list[t.Web.AppRecord] = []
+                for entry in entries:
+                    app_id = str(entry["id"])
+                    with self.lock_for(app_id), self._lock:
+                        stored.append(self._store(app_id, entry))
+                return tuple(stored)
+
+            def update(
+                self, app_id: str, changes: t.Web.RequestDict
+            ) -> t.Web.AppRecord | None:
+                """Replace the snapshot for ``app_id`` with ``changes`` applied."""
+                with self.lock_for(app_id):
+                    previous = self._records.get(app_id)
+                    if previous is None:
+                        return None
+                    return self._replace(
+                        app_id, previous, previous.evolve({**changes, "id": app_id})
+                    )
+
+            def values(self) -> tuple[t.Web.AppRecord, ...]:
+                """Return every snapshot; cached until the next write."""
+                cached = self._values
+                if cached is not None:
+                    return cached
+                with self._lock:
+                    if self._values is None:
+                        self._values = tuple(self._records.values())
+                    return self._values
+
+            def _index(self, app_id: str, record: t.Web.AppRecord) -> None:
+                for field, index in self._indexes.items():
+                    value = record.get(field)
+                    if isinstance(value, Hashable):
+                        index.setdefault(value, {})[app_id] = None
+
+            def _replace(
+                self,
+                app_id: str,
+                previous: FlextWebUtilitiesRegistry.Web.AppEntry,
+                snapshot: FlextWebUtilitiesRegistry.Web.AppEntry,
+            ) -> t.Web.AppRecord | None:
+                """Publish ``snapshot`` unless ``previous`` was dropped meanwhile.
+
+                The caller holds the stripe lock of ``app_id``; only ``clear``
+                can change the record without it.
+                """
+                with self._lock:
+                    if self._records.get(app_id) is not previous:
+                        return None
+                    return self._store(app_id, snapshot)
+
+            def _store(
+                self, app_id: str, snapshot: FlextWebUtilitiesRegistry.Web.AppEntry
+            ) -> t.Web.AppRecord:
+                """Replace the snapshot of ``app_id``; caller holds ``_lock``."""
+                previous = self._records.get(app_id)
+                if previous is not None:
+                    self._unindex(app_id, previous)
+                else:
+                    self._sequence[app_id] = self._next_sequence
+                    self._next_sequence += 1
+                self._records[app_id] = snapshot
+                self._index(app_id, snapshot)
+                self._touch()
+                return snapshot
+
+            def _touch(self) -> None:
+                self._values = None
+                self._version += 1
+
+            def _unindex(self, app_id: str, record: t.Web.AppRecord) -> None:
+                for field, index in self._indexes.items():
+                    value = record.get(field)
+                    if not isinstance(value, Hashable):
+                        continue
+                    bucket = index.get(value)
+                    if bucket is None:
+                        continue
+                    _ = bucket.pop(app_id, None)
+                    if not bucket:
+                        del index[value]
+
+
+__all__: list[str] = ["FlextWebUtilitiesRegistry"]
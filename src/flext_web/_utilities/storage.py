@@ -0,0 +1,197 @@
+"""SQLite persistence shard for the flext-web application registry.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+from threading import Lock
+from typing import ClassVar
+
+from flext_web import c, t
+
+
+class FlextWebUtilitiesStorage:
+    """Storage shard: durable application records in SQLite (WAL mode)."""
+
+    class Web:
+        """Web storage utilities."""
+
+        class SqliteAppStore:
+            """Application records persisted in one SQLite table.
+
+            The database runs in WAL mode, so readers in other processes never
+            block the writer. Each record is stored as compact JSON next to
+            its ``status``, ``host`` and ``port`` columns, which carry the
+            indexes used by single-field lookups. Every statement is a fixed
+            SQL text, so the connection's statement cache prepares each one
+            once. ``write`` applies upserts and deletes in a single
+            transaction; rows keep their ``rowid`` on update, so ``load_all``
+            returns records in insertion order.
+            """
+
+            SCHEMA: ClassVar[tuple[str, ...]] = (
+                (
+                    "CREATE TABLE IF NOT EXISTS apps ("
+                    "id TEXT PRIMARY KEY, status TEXT, host TEXT, port INTEGER, "
+                    "record TEXT NOT NULL)"
+                ),
+                "CREATE INDEX IF NOT EXISTS apps_status ON apps(status)",
+                "CREATE INDEX IF NOT EXISTS apps_host ON apps(host)",
+                "CREATE INDEX IF NOT EXISTS apps_port ON apps(port)",
+            )
+            UPSERT: ClassVar[str] = (
+                "INSERT INTO apps (id, status, host, port, record) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT(id) DO UPDATE SET "
+                "status = excluded.status, host = excluded.host, "
+                "port = excluded.port, record = excluded.record"
+            )
+            DELETE: ClassVar[str] = "DELETE FROM apps WHERE id = ?"
+            SELECT_ALL: ClassVar[str] = "SELECT record FROM apps ORDER BY rowid"
+            SELECT_ONE: ClassVar[str] = "SELECT record FROM apps WHERE id = ?"
+            COUNT_ALL: ClassVar[str] = "SELECT COUNT(*) FROM apps"
+            SELECT_BY: ClassVar[t.StrMapping] = {
+                "status": "SELECT record FROM apps WHERE status = ? ORDER BY rowid",
+                "host": "SELECT record FROM apps WHERE host = ? ORDER BY rowid",
+                "port": "SELECT record FROM apps WHERE port = ? ORDER BY rowid",
+            }
+            COUNT_BY: ClassVar[t.StrMapping] = {
+                "status": "SELECT COUNT(*) FROM apps WHERE status = ?",
+                "host": "SELECT COUNT(*) FROM apps WHERE host = ?",
+                "port": "SELECT COUNT(*) FROM apps WHERE port = ?",
+            }
+
+            __slots__ = ("_connection", "_lock", "path")
+
+            def __init__(self, path: str | Path) -> None:
+                """Open (or create) the database at ``path`` in WAL mode."""
+                self.path = Path(path)
+                self._lock = Lock()
+                self._connection = sqlite3.connect(
+                    self.path,
+                    timeout=c.Web.REGISTRY_SQLITE_TIMEOUT_SECONDS,
+                    isolation_level=None,
+                    check_same_thread=False,
+                    cached_statements=c.Web.REGISTRY_SQLITE_STATEMENT_CACHE,
+                )
+                with self._lock:
+                    _ = self._connection.execute("PRAGMA journal_mode=WAL")
+                    _ = self._connection.execute("PRAGMA synchronous=NORMAL")
+                    for statement in self.SCHEMA:
+                        _ = self._connection.execute(statement)
+
+            @property
+            def journal_mode(self) -> str:
+                """Active SQLite journal mode."""
+                with self._lock:
+                    row = self._connection.execute("PRAGMA journal_mode").fetchone()
+                return str(row[0])
+
+            def close(self) -> None:
+                """Close the underlying connection."""
+                with self._lock:
+                    self._connection.close()
+
+            def count(self, field: str | None = None, value: t.Scalar = None) -> int:
+                """Count every record, or those whose indexed ``field`` equals ``value``."""
+                statement = self.COUNT_ALL if field is None else self.COUNT_BY[field]
+                params = () if field is None else (value,)
+                with self._lock:
+                    row = self._connection.execute(statement, params).fetchone()
+                return int(row[0])
+
+            def fetch(self, app_id: str) -> t.Web.AppRecord | None:
+                """Return the record stored under ``app_id`` or ``None``."""
+                with self._lock:
+                    row = self._connection.execute(
+                        self.SELECT_ONE, (app_id,)
+                    ).fetchone()
+                return None if row is None else self.decode(row[0])
+
+            def find(self, field: str, value: t.Scalar) -> list[t.Web.AppRecord]:
+                """Return the records whose indexed ``field`` equals ``value``."""
+                with self._lock:
+                    rows = self._connection.execute(
+                        self.SELECT_BY[field], (value,)
+                    ).fetchall()
+                return [self.decode(row[0]) for row in rows]
+
+            def load_all(self) -> list[t.Web.AppRecord]:
+                """Return every record in insertion order with one query."""
+                with self._lock:
+                    rows = self._connection.execute(self.SELECT_ALL).fetchall()
+                return [self.decode(row[0]) for row in rows]
+
+            def write(
+                self,
+                upserts: Iterable[t.Web.AppRecord] = (),
+                deletes: Iterable[str] = (),
+            ) -> int:
+                """Apply ``upserts`` then ``deletes`` in one transaction.
+
+                Returns the number of deleted rows. Raises ``sqlite3.Error``
+                after rolling back when any statement fails.
+                """
+                rows = [self.row(record) for record in upserts]
+                ids = [(app_id,) for app_id in deletes]
+                with self._lock:
+                    connection = self._connection
+                    _ = connection.execute("BEGIN IMMEDIATE")
+                    try:
+                        if rows:
+                            _ = connection.executemany(self.UPSERT, rows)
+                        deleted = (
+                            connection.executemany(self.DELETE, ids).rowcount
+                            if ids
+                            else 0
+                        )
+                    except sqlite3.Error:
+                        _ = connection.execute("ROLLBACK")
+                        raise
+                    _ = connection.execute("COMMIT")
+                return deleted
+
+            @staticmethod
+            def decode(payload: str) -> t.Web.AppRecord:
+                """Return the record stored as JSON ``payload``.
+
+                Raises ``sqlite3.DataError`` when the payload is not a JSON object.
+                """
+                try:
+                    decoded = json.loads(payload)
+                except ValueError as exc:
+                    msg = "Stored application record is not valid JSON"
+                    raise sqlite3.DataError(msg) from exc
+                match decoded:
+                    case dict() as record:
+                        return record
+                    case _:
+                        msg = "Stored application record is not an object"
+                        raise sqlite3.DataError(msg)
+
+            @staticmethod
+            def row(
+                record: t.Web.AppRecord,
+            ) -> tuple[str, str | None, str | None, int | None, str]:
+                """Return the ``UPSERT`` parameters of ``record``."""
+                app_id, status, host, port = (
+                    record.get(field) for field in ("id", "status", "host", "port")
+                )
+                if not isinstance(app_id, str):
+                    msg = "Application record id(str) is required"
+                    raise TypeError(msg)
+                return (
+                    app_id,
+                    status if isinstance(status, str) else None,
+                    host if isinstance(host, str) else None,
+                    port if isinstance(port, int) else None,
+                    json.dumps(dict(record), default=dict, separators=(",", ":")),
+                )
+
+
+__all__: list[str] = ["FlextWebUtilitiesStorage"]
@@ -0,0 +1,274 @@
+"""Compiled template shard for flext-web rendering.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import html
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from mmap import ACCESS_READ, mmap
+from os import fstat
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+
+from flext_web import c, t
+
+
+class FlextWebUtilitiesTemplates:
+    """Template shard: compile-once templates, their LRU and the file loader."""
+
+    class Web:
+        """Web template utilities."""
+
+        class CompiledTemplate:
+            """Template parsed once into literal pieces and placeholder slots.
+
+            ``{{name}}`` and ``{{name|filter|...}}`` placeholders become slots;
+            everything else is kept as literal text. Rendering copies the piece
+            list, fills each slot and joins once, so its cost is linear in the
+            output size regardless of the number of variables; ``stream``
+            yields the same output in bounded chunks instead. Placeholders
+            whose variable or filters are unknown render verbatim. Each
+            distinct placeholder is resolved once per render, and an
+            ``escape`` function, when given, is applied to resolved values
+            only, never to the literal template text.
+            """
+
+            __slots__ = ("pieces", "slots", "source")
+
+            def __init__(self, source: str) -> None:
+                """Parse ``source`` into pieces and slots."""
+                pieces: list[str] = []
+                slots: list[tuple[int, str, tuple[str, ...]]] = []
+                position = 0
+                for match in c.Web.TEMPLATE_PLACEHOLDER_RE.finditer(source):
+                    name, *filters = (
+                        part.strip()
+                        for part in match.group(1).split(
+                            c.Web.TEMPLATE_FILTER_SEPARATOR
+                        )
+                    )
+                    if not name:
+                        continue
+                    slots.append((len(pieces) + 1, name, tuple(filters)))
+                    pieces.extend((source[position : match.start()], match.group(0)))
+                    position = match.end()
+                pieces.append(source[position:])
+                self.source = source
+                self.pieces: tuple[str, ...] = tuple(pieces)
+                self.slots: tuple[tuple[int, str, tuple[str, ...]], ...] = tuple(slots)
+
+            def render(
+                self,
+                values: t.Web.TemplateValues,
+                filters: t.MappingKV[str, t.Web.TemplateFilter],
+                escape: t.Web.TemplateFilter | None = None,
+            ) -> str:
+                """Fill every slot from ``values`` through ``filters`` and join."""
+                output = list(self.pieces)
+                resolved: dict[tuple[str, tuple[str, ...]], str | None] = {}
+                for index, name, names in self.slots:
+                    try:
+                        text = resolved[name, names]
+                    except KeyError:
+                        text = resolved[name, names] = self.resolve(
+                            values, filters, name, names, escape
+                        )
+                    if text is not None:
+                        output[index] = text
+                return "".join(output)
+
+            def stream(
+                self,
+                values: t.Web.TemplateValues,
+                filters: t.MappingKV[str, t.Web.TemplateFilter],
+                escape: t.Web.TemplateFilter | None = None,
+                chunk_size: int = c.Web.TEMPLATE_STREAM_CHUNK_CHARS,
+            ) -> Iterator[str]:
+                """Yield the rendered output in chunks of about ``chunk_size`` chars.
+
+                Slots are resolved lazily as the output is consumed, so the
+                first chunk is available before later variables are rendered.
+                """
+                pieces = self.pieces
+                buffer: list[str] = []
+                buffered = 0
+                resolved: dict[tuple[str, tuple[str, ...]], str | None] = {}
+                for index, name, names in self.slots:
+                    try:
+                        text = resolved[name, names]
+                    except KeyError:
+                        text = resolved[name, names] = self.resolve(
+                            values, filters, name, names, escape
+                        )
+                    literal = pieces[index - 1]
+                    text = pieces[index] if text is None else text
+                    buffer.extend((literal, text))
+                    buffered += len(literal) + len(text)
+                    if buffered >= chunk_size:
+                        yield "".join(buffer)
+                        buffer = []
+                        buffered = 0
+                buffer.append(pieces[-1])
+                yield "".join(buffer)
+
+            @staticmethod
+            def escape_html(text: str) -> str:
+                """HTML-escape ``text``, returning it as-is when nothing needs it."""
+                if c.Web.TEMPLATE_ESCAPE_RE.search(text) is None:
+                    return text
+                return html.escape(text)
+
+            @staticmethod
+            def resolve(
+                values: t.Web.TemplateValues,
+                filters: t.MappingKV[str, t.Web.TemplateFilter],
+                name: str,
+                names: tuple[str, ...],
+                escape: t.Web.TemplateFilter | None = None,
+            ) -> str | None:
+                """Return the filtered text of one slot, ``None`` when unresolved."""
+                if name not in values:
+                    return None
+                value = values[name]
+                text = value if isinstance(value, str) else str(value)
+                for filter_name in names:
+                    filter_fn = filters.get(filter_name)
+                    if filter_fn is None:
+                        return None
+                    text = filter_fn(text)
+                return text if escape is None else escape(text)
+
+        class TemplateCache:
+            """Bounded LRU of compiled templates.
+
+            Keys are the template text for inline templates and
+            ``(path, mtime_ns, size)`` for file templates. Compilation runs outside the lock, so two
+            threads missing the same key may both compile it once.
+            """
+
+            __slots__ = ("_entries", "_lock", "_maxsize")
+
+            def __init__(self, maxsize: int = c.Web.TEMPLATE_CACHE_SIZE) -> None:
+                """Initialize an empty cache holding at most ``maxsize`` templates."""
+                self._lock = Lock()
+                self._maxsize = max(maxsize, 1)
+                self._entries: OrderedDict[
+                    Hashable, FlextWebUtilitiesTemplates.Web.CompiledTemplate
+                ] = OrderedDict()
+
+            def __len__(self) -> int:
+                """Return the number of cached templates."""
+                return len(self._entries)
+
+            def clear(self) -> None:
+                """Drop every compiled template."""
+                with self._lock:
+                    self._entries.clear()
+
+            def discard(self, key: Hashable) -> None:
+                """Drop the template cached under ``key``, if any."""
+                with self._lock:
+                    _ = self._entries.pop(key, None)
+
+            def fetch(
+                self,
+                key: Hashable,
+                compile_template: Callable[
+                    [], FlextWebUtilitiesTemplates.Web.CompiledTemplate
+                ],
+            ) -> FlextWebUtilitiesTemplates.Web.CompiledTemplate:
+                """Return the template cached under ``key``, compiling on a miss."""
+                with self._lock:
+                    compiled = self._entries.get(key)
+                    if compiled is not None:
+                        self._entries.move_to_end(key)
+                        return compiled
+                compiled = compile_template()
+                with self._lock:
+                    self._entries[key] = compiled
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self._maxsize:
+                        _ = self._entries.popitem(last=False)
+                return compiled
+
+        class TemplateLoader:
+            """Load compiled templates from files with stat-based invalidation.
+
+            File templates are cached under ``(path, mtime_ns, size)``: a
+            changed file gets a new key and its previous entry is discarded.
+            Within ``reload_interval`` seconds of the last ``stat`` the known
+            stamp is reused, so hot templates cost no system call per render.
+            Files of ``c.Web.TEMPLATE_MMAP_THRESHOLD_BYTES`` or more are
+            decoded straight from a read-only memory map.
+            """
+
+            __slots__ = ("_lock", "_stamps")
+
+            def __init__(self) -> None:
+                """Initialize a loader without known files."""
+                self._lock = Lock()
+                self._stamps: dict[Path, tuple[float, int, int]] = {}
+
+            def clear(self) -> None:
+                """Forget every known file stamp."""
+                with self._lock:
+                    self._stamps.clear()
+
+            @staticmethod
+            def read(path: Path) -> str:
+                """Return the UTF-8 text of ``path``, memory-mapping large files."""
+                with path.open("rb") as handle:
+                    if (
+                        fstat(handle.fileno()).st_size
+                        < c.Web.TEMPLATE_MMAP_THRESHOLD_BYTES
+                    ):
+                        return handle.read().decode()
+                    with (
+                        mmap(handle.fileno(), 0, access=ACCESS_READ) as mapped,
+                        memoryview(mapped) as view,
+                    ):
+                        return str(view, "utf-8")
+
+            @staticmethod
+            def resolve(template_dir: str, name: str) -> Path | None:
+                """Return ``name`` resolved under ``template_dir``; ``None`` if outside."""
+                root = Path(template_dir).resolve()
+                path = (root / name).resolve()
+                return path if path.is_relative_to(root) else None
+
+            def load(
+                self,
+                path: Path,
+                cache: FlextWebUtilitiesTemplates.Web.TemplateCache | None,
+                reload_interval: float,
+            ) -> FlextWebUtilitiesTemplates.Web.CompiledTemplate:
+                """Return the compiled ``path``, raising ``OSError`` when unreadable."""
+                if cache is None:
+                    return FlextWebUtilitiesTemplates.Web.CompiledTemplate(
+                        self.read(path)
+                    )
+                now = monotonic()
+                known = self._stamps.get(path)
+                if known is not None and now - known[0] < reload_interval:
+                    _, mtime_ns, size = known
+                else:
+                    stat = path.stat()
+                    mtime_ns, size = stat.st_mtime_ns, stat.st_size
+                    with self._lock:
+                        self._stamps[path] = (now, mtime_ns, size)
+                    if known is not None and known[1:] != (mtime_ns, size):
+                        cache.discard((path, *known[1:]))
+                return cache.fetch(
+                    (path, mtime_ns, size),
+                    lambda: FlextWebUtilitiesTemplates.Web.CompiledTemplate(
+                        self.read(path)
+                    ),
+                )
+
+
+__all__: list[str] = ["FlextWebUtilitiesTemplates"]
@@ -0,0 +1,145 @@
+"""Pre-fork worker supervisor shard for flext-web.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import socket
+from collections.abc import Callable
+from multiprocessing import get_context
+from multiprocessing.process import BaseProcess
+from threading import Lock
+from time import monotonic
+
+from flext_web import c, t
+
+
+class FlextWebUtilitiesWorkers:
+    """Worker process shard: shared listener and crash-restarting supervisor."""
+
+    class Web:
+        """Web worker-process utilities."""
+
+        class WorkerSupervisor:
+            """Run ``workers`` processes serving one inherited listener.
+
+            The supervisor owns the bound listening socket and hands it to every
+            spawned worker as an inherited file descriptor, so the kernel
+            balances accepted connections across them. ``target`` is called
+            with the listener in each worker and must be picklable. Workers
+            that exit are restarted after ``restart_delay`` seconds; ``health``
+            aggregates their state.
+            """
+
+            __slots__ = (
+                "_listener",
+                "_lock",
+                "_processes",
+                "_restart_delay",
+                "_restarts",
+                "_retry_at",
+                "_target",
+            )
+
+            def __init__(
+                self,
+                target: Callable[[socket.socket], None],
+                listener: socket.socket,
+                workers: int,
+                *,
+                restart_delay: float,
+            ) -> None:
+                """Prepare ``workers`` slots; ``target`` must serve ``listener``."""
+                self._target = target
+                self._listener = listener
+                self._lock = Lock()
+                self._processes: list[BaseProcess | None] = [None] * max(workers, 1)
+                self._retry_at: list[float] = [0.0] * len(self._processes)
+                self._restart_delay = restart_delay
+                self._restarts = 0
+
+            @staticmethod
+            def bind(host: str, port: int) -> socket.socket:
+                """Bind the shared listener, raising ``OSError`` on failure."""
+                return socket.create_server(
+                    (host, port), backlog=c.Web.WORKER_LISTEN_BACKLOG
+                )
+
+            @property
+            def restarts(self) -> int:
+                """Number of worker exits that scheduled a restart."""
+                return self._restarts
+
+            def health(self) -> t.Web.ResponseDict:
+                """Aggregate worker liveness into one health payload."""
+                with self._lock:
+                    pids = [
+                        str(process.pid)
+                        for process in self._processes
+                        if process is not None and process.is_alive()
+                    ]
+                    restarts = self._restarts
+                total = len(self._processes)
+                if len(pids) == total:
+                    status = c.Web.ResponseStatus.HEALTHY.value
+                elif pids:
+                    status = c.Web.ResponseStatus.DEGRADED.value
+                else:
+                    status = c.Web.ResponseStatus.ERROR.value
+                return {
+                    "status": status,
+                    "service": c.Web.SERVICE_NAME,
+                    "workers": total,
+                    "alive": len(pids),
+                    "restarts": restarts,
+                    "pids": pids,
+                }
+
+            def supervise(self) -> int:
+                """Reap exited workers and (re)spawn due slots; return spawn count."""
+                spawned = 0
+                now = monotonic()
+                context = get_context("spawn")
+                with self._lock:
+                    for slot, process in enumerate(self._processes):
+                        if process is not None:
+                            if process.is_alive():
+                                continue
+                            process.close()
+                            self._processes[slot] = None
+                            self._retry_at[slot] = now + self._restart_delay
+                            self._restarts += 1
+                        if now < self._retry_at[slot]:
+                            continue
+                        worker = context.Process(
+                            target=self._target,
+                            args=(self._listener,),
+                            name=f"flext-web-worker-{slot}",
+                        )
+                        worker.start()
+                        self._processes[slot] = worker
+                        spawned += 1
+                return spawned
+
+            def terminate(self, timeout: float) -> None:
+                """Ask every worker to exit, killing those still alive at ``timeout``."""
+                with self._lock:
+                    processes = [
+                        process for process in self._processes if process is not None
+                    ]
+                    self._processes = [None] * len(self._processes)
+                for process in processes:
+                    if process.is_alive():
+                        process.terminate()
+                deadline = monotonic() + timeout
+                for process in processes:
+                    process.join(max(deadline - monotonic(), 0))
+                    if process.is_alive():
+                        process.kill()
+                        process.join()
+                    process.close()
+
+
+__all__: list[str] = ["FlextWebUtilitiesWorkers"]
@@ -0,0 +1,142 @@
+"""Pooled WSGI server shard for flext-web runtimes.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from threading import Condition
+from typing import Self, override
+
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler, select_address_family
+
+from flext_web import t
+
+
+class FlextWebUtilitiesWsgi:
+    """WSGI runtime shard: thread-pool backed server."""
+
+    class Web:
+        """Web WSGI utilities."""
+
+        class PooledWSGIServer(BaseWSGIServer):
+            """Multi-threaded WSGI server dispatching connections to a worker pool.
+
+            Speaks HTTP/1.1 with keep-alive, bounds concurrency to ``workers``
+            threads and tracks in-flight connections so ``drain`` can wait for
+            them before the listener is closed.
+            """
+
+            multithread = True
+
+            def __init__(
+                self,
+                host: str,
+                port: int,
+                app: t.Web.WsgiApplication,
+                *,
+                workers: int,
+                keep_alive: float,
+                fd: int | None = None,
+            ) -> None:
+                """Create the server around an already listening ``fd``."""
+                handler = type(
+                    "FlextWebPooledRequestHandler",
+                    (WSGIRequestHandler,),
+                    {"protocol_version": "HTTP/1.1", "timeout": keep_alive},
+                )
+                self._idle = Condition()
+                self._inflight = 0
+                self._pool: ThreadPoolExecutor | None = None
+                super().__init__(host, port, app, handler=handler, fd=fd)
+                # Created after the base init: with ``fd`` set it calls
+                # ``server_close`` to drop its own placeholder socket.
+                self._pool = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="flext-web-wsgi"
+                )
+
+            @classmethod
+            def listen(
+                cls,
+                host: str,
+                port: int,
+                app: t.Web.WsgiApplication,
+                *,
+                workers: int,
+                backlog: int,
+                keep_alive: float,
+            ) -> Self:
+                """Bind and listen with ``backlog``, raising ``OSError`` on failure."""
+                family = select_address_family(host, port)
+                with socket.create_server(
+                    (host, port), family=family, backlog=backlog
+                ) as listener:
+                    return cls(
+                        host,
+                        port,
+                        app,
+                        workers=workers,
+                        keep_alive=keep_alive,
+                        fd=listener.fileno(),
+                    )
+
+            def drain(self, timeout: float) -> bool:
+                """Wait until no connection is in flight; ``False`` on timeout."""
+                with self._idle:
+                    return self._idle.wait_for(lambda: self._inflight == 0, timeout)
+
+            @override
+            def process_request(
+                self, request: socket.socket, client_address: t.Web.SocketAddress
+            ) -> None:
+                """Hand the accepted connection to the worker pool."""
+                if self._pool is None:
+                    self.shutdown_request(request)
+                    return
+                with self._idle:
+                    self._inflight += 1
+                try:
+                    future = self._pool.submit(
+                        self._serve_connection, request, client_address
+                    )
+                except RuntimeError:
+                    # The pool was shut down by ``server_close`` meanwhile.
+                    self._release(request)
+                    return
+                future.add_done_callback(
+                    lambda done: self._release(request) if done.cancelled() else None
+                )
+
+            @override
+            def server_close(self) -> None:
+                """Close the listener and release idle pool workers.
+
+                Queued connections that never reached a worker are cancelled;
+                their sockets are closed and they stop counting as in flight.
+                """
+                super().server_close()
+                if self._pool is not None:
+                    self._pool.shutdown(wait=False, cancel_futures=True)
+
+            def _serve_connection(
+                self, request: socket.socket, client_address: t.Web.SocketAddress
+            ) -> None:
+                try:
+                    self.finish_request(request, client_address)
+                except (OSError, RuntimeError, ValueError):
+                    self.handle_error(request, client_address)
+                finally:
+                    self._release(request)
+
+            def _release(self, request: socket.socket) -> None:
+                self.shutdown_request(request)
+                with self._idle:
+                    self._inflight -= 1
+                    if self._inflight == 0:
+                        self._idle.notify_all()
+
+
+__all__: list[str] = ["FlextWebUtilitiesWsgi"]
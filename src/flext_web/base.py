@@ -13,22 +13,42 @@ from abc import ABC
 from typing import ClassVar, override
 
 from flext_core import FlextService
-from flext_web import FlextWebSettings
+from flext_web import FlextWebSettings, u
 
 
 class FlextWebServiceBase(FlextService[bool], ABC):
     """Base class for flext-web services with typed `web` settings access."""
 
     _settings_type: ClassVar[type[FlextWebSettings]] = FlextWebSettings
+    _settings_snapshot: tuple[object, int, FlextWebSettings, int] | None = (
+        u.PrivateAttr(default=None)
+    )
 
     @property
     @override
     def settings(self) -> FlextWebSettings:
-        """Typed web settings bound to this runtime (falls back to the global)."""
+        """Typed web settings bound to this runtime (falls back to the global).
+
+        The validated snapshot is cached per runtime settings object and its
+        ``revision``. A public assignment to the runtime, or to the returned
+        snapshot, restamps that object only, so the next read of the services
+        bound to it rebuilds the snapshot while other services keep theirs.
+        """
         runtime = self.runtime_settings
-        if runtime is not None:
-            return FlextWebSettings.model_validate(runtime)
-        return FlextWebSettings.fetch_global()
+        if runtime is None:
+            return FlextWebSettings.fetch_global()
+        revision = runtime.revision if isinstance(runtime, FlextWebSettings) else 0
+        snapshot = self._settings_snapshot
+        if (
+            snapshot is not None
+            and snapshot[0] is runtime
+            and snapshot[1] == revision
+            and snapshot[3] == snapshot[2].revision
+        ):
+            return snapshot[2]
+        validated = FlextWebSettings.model_validate(runtime)
+        self._settings_snapshot = (runtime, revision, validated, validated.revision)
+        return validated
 
 
 s = FlextWebServiceBase
@@ -24,6 +24,10 @@ class FlextWebConstants(c):
         # === Regex authority for the Web domain ===
         SLUG_NON_WORD_RE: ClassVar[t.RegexPattern] = re.compile(r"[^\w\s-]+")
         SLUG_SPLIT_RE: ClassVar[t.RegexPattern] = re.compile(r"[-\s]+")
+        TEMPLATE_PLACEHOLDER_RE: ClassVar[t.RegexPattern] = re.compile(
+            r"\{\{([^{}]+)\}\}"
+        )
+        TEMPLATE_ESCAPE_RE: ClassVar[t.RegexPattern] = re.compile(r"[&<>\"']")
 
         # ===== Enums (keep these) =====
         @unique
@@ -51,10 +55,12 @@ class FlextWebConstants(c):
             OK = 200
             CREATED = 201
             FOUND = 302
+            NOT_MODIFIED = 304
             BAD_REQUEST = 400
             FORBIDDEN = 403
             NOT_FOUND = 404
             CONFLICT = 409
+            INTERNAL_SERVER_ERROR = 500
             GATEWAY_TIMEOUT = 504
 
         @unique
@@ -102,6 +108,18 @@ class FlextWebConstants(c):
             MAINTENANCE = "maintenance"
             DEPLOYING = "deploying"
 
+        @unique
+        class AppState(IntEnum):
+            """Compact ordinal of each ``Status``, as stored by the registry."""
+
+            STOPPED = 0
+            STARTING = 1
+            RUNNING = 2
+            STOPPING = 3
+            ERROR = 4
+            MAINTENANCE = 5
+            DEPLOYING = 6
+
         @unique
         class ResponseStatus(StrEnum):
             """Canonical response status tokens for web service payloads."""
@@ -110,6 +128,21 @@ class FlextWebConstants(c):
             ERROR = "error"
             OPERATIONAL = "operational"
             HEALTHY = "healthy"
+            DEGRADED = "degraded"
+
+        @unique
+        class IndexKind(StrEnum):
+            """Secondary index kinds for entity data fields."""
+
+            HASH = "hash"
+            SORTED = "sorted"
+
+        @unique
+        class EvictionPolicy(StrEnum):
+            """Victim selection of a capacity-bounded entity store."""
+
+            LRU = "lru"
+            LFU = "lfu"
 
         # ===== Status/Code mappings =====
         SUCCESS_RANGE: Final[tuple[int, int]] = (200, 299)
@@ -212,9 +245,96 @@ class FlextWebConstants(c):
         FRAMEWORK_INTERFACE_ASGI: Final[str] = "asgi"
         FRAMEWORK_INTERFACE_WSGI: Final[str] = "wsgi"
         FRAMEWORK_RUNNER_UVICORN: Final[str] = "uvicorn"
+        FRAMEWORK_RUNNER_UVICORN_TASK: Final[str] = "uvicorn-task"
         FRAMEWORK_RUNNER_WERKZEUG: Final[str] = "werkzeug"
+        FRAMEWORK_RUNNER_WSGI_POOL: Final[str] = "wsgi-pool"
         FRAMEWORK_FASTAPI: Final[str] = "fastapi"
         FRAMEWORK_FLASK: Final[str] = "flask"
+        RUNTIME_READY_POLL_SECONDS: Final[float] = 0.002
+        RUNTIME_STOP_GRACE_SECONDS: Final[float] = 2.0
+        WORKER_SUPERVISE_POLL_SECONDS: Final[float] = 0.2
+        WORKER_LISTEN_BACKLOG: Final[int] = 2048
+
+        # ===== Request metrics =====
+        METRICS_SUB_BUCKET_BITS: Final[int] = 7
+        METRICS_MAX_LATENCY_US: Final[int] = 3_600_000_000
+        METRICS_PERCENTILES: Final[tuple[tuple[str, float], ...]] = (
+            ("p50_ms", 50.0),
+            ("p90_ms", 90.0),
+            ("p99_ms", 99.0),
+            ("p999_ms", 99.9),
+        )
+        METRICS_UNMATCHED_ROUTE: Final[str] = "<unmatched>"
+        METRICS_UNKNOWN_APP: Final[str] = "<unknown>"
+        FLASK_APP_ID_CONFIG_KEY: Final[str] = "FLEXT_WEB_APP_ID"
+        FLASK_HEALTH_CONFIG_KEY: Final[str] = "FLEXT_WEB_HEALTH"
+        METRICS_ROUTE: Final[str] = "/metrics"
+        METRICS_CONTENT_TYPE: Final[str] = (
+            "application/openmetrics-text; version=1.0.0; charset=utf-8"
+        )
+        METRICS_EXPOSITION_BUCKETS_SECONDS: Final[tuple[float, ...]] = (
+            0.001,
+            0.0025,
+            0.005,
+            0.01,
+            0.025,
+            0.05,
+            0.1,
+            0.25,
+            0.5,
+            1.0,
+            2.5,
+            5.0,
+            10.0,
+        )
+
+        # ===== Templates =====
+        TEMPLATE_CACHE_SIZE: Final[int] = 256
+        TEMPLATE_FILTER_SEPARATOR: Final[str] = "|"
+        TEMPLATE_MMAP_THRESHOLD_BYTES: Final[int] = 256 * 1024
+        TEMPLATE_STREAM_CHUNK_CHARS: Final[int] = 64 * 1024
+        TEMPLATE_CONFIG_KEYS: Final[frozenset[str]] = frozenset({
+            "template_dir",
+            "autoescape",
+            "cache_enabled",
+            "reload_interval",
+        })
+
+        # ===== Entity journal =====
+        ENTITY_JOURNAL_GROUP_COMMIT_MS: Final[float] = 2.0
+        ENTITY_JOURNAL_COMPACT_EVERY: Final[int] = 10_000
+        ENTITY_JOURNAL_LOG_NAME: Final[str] = "entities.log"
+        ENTITY_JOURNAL_SNAPSHOT_NAME: Final[str] = "entities.snapshot"
+
+        # ===== Entity limits =====
+        ENTITY_SWEEP_INTERVAL_SECONDS: Final[float] = 1.0
+        ENTITY_SWEEP_BATCH: Final[int] = 256
+        ENTITY_SORTED_INDEX_CHUNK: Final[int] = 512
+
+        # ===== Application registry =====
+        REGISTRY_INDEXED_FIELDS: Final[tuple[str, ...]] = (
+            "status",
+            "host",
+            "port",
+            "name",
+        )
+        REGISTRY_LOCK_STRIPES: Final[int] = 64
+        REGISTRY_SQLITE_TIMEOUT_SECONDS: Final[float] = 5.0
+        REGISTRY_SQLITE_STATEMENT_CACHE: Final[int] = 64
+        LIST_DEFAULT_LIMIT: Final[int] = 100
+        LIST_MAX_LIMIT: Final[int] = 1000
+        LIST_FILTER_FIELDS: Final[tuple[str, ...]] = ("status", "host", "port")
+        STARTABLE_STATUSES: Final[frozenset[str]] = frozenset({
+            Status.STOPPED.value,
+            Status.ERROR.value,
+        })
+        HEALTH_STATUS_BY_APP_STATUS: Final[t.StrMapping] = MappingProxyType({
+            Status.RUNNING.value: ResponseStatus.HEALTHY.value,
+            Status.STARTING.value: ResponseStatus.DEGRADED.value,
+            Status.STOPPING.value: ResponseStatus.DEGRADED.value,
+            Status.STOPPED.value: ResponseStatus.DEGRADED.value,
+            Status.ERROR.value: ResponseStatus.ERROR.value,
+        })
 
         # ===== Flattened from WebActions =====
         ACTION_CREATE: Final[str] = "create"
@@ -230,6 +350,25 @@ class FlextWebConstants(c):
         API_DOCS_URL: Final[str] = "/docs"
         API_REDOC_URL: Final[str] = "/redoc"
         API_OPENAPI_URL: Final[str] = "/openapi.json"
+        API_OPENAPI_ROUTE_FIELDS: Final[tuple[str, ...]] = (
+            "path",
+            "methods",
+            "name",
+            "summary",
+            "description",
+            "response_description",
+            "responses",
+            "response_model",
+            "response_class",
+            "status_code",
+            "tags",
+            "dependencies",
+            "deprecated",
+            "operation_id",
+            "include_in_schema",
+            "callbacks",
+            "openapi_extra",
+        )
         API_DEFAULT_DESCRIPTION: Final[str] = "Generic HTTP Service"
 
 
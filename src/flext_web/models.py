@@ -15,6 +15,7 @@ from flext_web._models import (
     FlextWebModelsEntity,
     FlextWebModelsFactory,
     FlextWebModelsHttp,
+    FlextWebModelsQuery,
     FlextWebModelsResponses,
     FlextWebModelsSystem,
     FlextWebModelsWebMessage,
@@ -33,6 +34,7 @@ class FlextWebModels(m):
         FlextWebModelsWebMessage.Web,
         FlextWebModelsEntity.Web,
         FlextWebModelsAuth.Web,
+        FlextWebModelsQuery.Web,
         FlextWebModelsResponses.Web,
         FlextWebModelsWebRequest.Web,
         FlextWebModelsConfig.Web,
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from .handlers import FlextWebHandlers as FlextWebHandlers
     from .health import FlextWebHealth as FlextWebHealth
     from .web import FlextWebServices as FlextWebServices
+    from .web_async import FlextWebAsyncServices as FlextWebAsyncServices
 
 _LAZY_MODULES: dict[str, tuple[str, ...]] = {
     ".app": ("FlextWebApp",),
@@ -22,6 +23,7 @@ _LAZY_MODULES: dict[str, tuple[str, ...]] = {
     ".handlers": ("FlextWebHandlers",),
     ".health": ("FlextWebHealth",),
     ".web": ("FlextWebServices",),
+    ".web_async": ("FlextWebAsyncServices",),
 }
 
 
@@ -34,6 +36,7 @@ _LAZY_IMPORTS = build_lazy_import_map(
 
 _PUBLIC_EXPORTS: tuple[str, ...] = (
     "FlextWebApp",
+    "FlextWebAsyncServices",
     "FlextWebAuth",
     "FlextWebEntities",
     "FlextWebHandlers",
@@ -9,14 +9,11 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-import json as _json
+import json
 from collections.abc import Callable
-from typing import override
+from typing import ClassVar, override
 
-import flask
-from fastapi import FastAPI
-
-from flext_web import FlextWebSettings, c, m, p, r, s, t, u
+from flext_web import FlextWebSettings, _frameworks as fw, c, m, p, r, s, t, u
 
 
 class FlextWebApp(s):
@@ -53,7 +50,7 @@ class FlextWebApp(s):
         @staticmethod
         def create_instance(
             settings: m.Web.FastAPIAppConfig | None = None,
-        ) -> p.Result[FastAPI]:
+        ) -> p.Result[fw.FastAPI]:
             """Create FastAPI application instance with validated configuration.
 
             Args:
@@ -81,27 +78,34 @@ class FlextWebApp(s):
             redoc_url: str = final_config.redoc_url or c.Web.API_REDOC_URL
             openapi_url: str = final_config.openapi_url or c.Web.API_OPENAPI_URL
             try:
-                app = FastAPI(
+                app = fw.FastAPI(
                     title=title,
                     version=version,
                     description=description,
-                    docs_url=docs_url,
-                    redoc_url=redoc_url,
-                    openapi_url=openapi_url,
+                    docs_url=None,
+                    redoc_url=None,
+                    openapi_url=None,
                 )
+                if final_config.docs_enabled:
+                    u.Web.configure_openapi_routes(
+                        app, openapi_url, docs_url, redoc_url
+                    )
             except c.EXC_OS_RUNTIME_TYPE as exc:
                 error_msg = f"Failed to create FastAPI application: {exc}"
-                return r[FastAPI].fail(error_msg)
-            return r[FastAPI].ok(app)
+                return r[fw.FastAPI].fail(error_msg)
+            return r[fw.FastAPI].ok(app)
 
     @staticmethod
     def _configure_fastapi_endpoints(
-        app: FastAPI, settings: m.Web.FastAPIAppConfig
-    ) -> FastAPI:
+        app: fw.FastAPI, settings: m.Web.FastAPIAppConfig
+    ) -> fw.FastAPI:
         """Configure FastAPI endpoints."""
+        health = FlextWebApp.HealthHandler.payload(c.Web.SERVICE_NAME)
 
-        def health_check() -> t.Web.FastApiEndpointPayload:
-            return FlextWebApp.HealthHandler.create_handler()()
+        def health_check() -> fw.StarletteResponse:
+            return fw.StarletteResponse(
+                content=health.body(), media_type=c.Web.HTTP_CONTENT_TYPE_JSON
+            )
 
         def info_endpoint() -> t.Web.FastApiEndpointPayload:
             return FlextWebApp.InfoHandler.create_handler(settings)()
@@ -114,7 +118,7 @@ class FlextWebApp(s):
         self,
         settings: m.Web.FastAPIAppConfig | None = None,
         factory_config: m.Web.FastAPIAppConfig | None = None,
-    ) -> p.Result[FastAPI]:
+    ) -> p.Result[fw.FastAPI]:
         """Create FastAPI app with flext-core integration and Pydantic validation.
 
         Single Responsibility: Creates and configures FastAPI application only.
@@ -146,6 +150,7 @@ class FlextWebApp(s):
                 docs_url=fastapi_config.docs_url,
                 redoc_url=fastapi_config.redoc_url,
                 openapi_url=fastapi_config.openapi_url,
+                docs_enabled=fastapi_config.docs_enabled,
             )
         )
         result = self.FastAPIFactory.create_instance(factory_payload).map(
@@ -161,7 +166,7 @@ class FlextWebApp(s):
 
     def create_flask_app(
         self, settings: FlextWebSettings | None = None
-    ) -> p.Result[flask.Flask]:
+    ) -> p.Result[fw.Flask]:
         """Create Flask app with flext-core integration and configuration.
 
         Single Responsibility: Creates and configures Flask application only.
@@ -177,41 +182,63 @@ class FlextWebApp(s):
 
         """
         web_settings = settings or self.settings
-        app = flask.Flask(web_settings.Web.app_name)
+        app = fw.Flask(web_settings.Web.app_name)
         app.config["SECRET_KEY"] = web_settings.Web.secret_key
         app.config["DEBUG"] = web_settings.debug
         app.config["TESTING"] = web_settings.Web.testing
 
-        def health_check() -> flask.Response:
-            body: str = _json.dumps({
-                "status": c.Web.ResponseStatus.HEALTHY.value,
-                "service": c.Web.SERVICE_NAME_FLASK,
-                "timestamp": u.generate_iso_timestamp(),
-            })
-            response = flask.make_response(body, 200)
-            response.content_type = "application/json"
-            return response
+        health = FlextWebApp.HealthHandler.payload(c.Web.SERVICE_NAME_FLASK)
+
+        def health_check() -> fw.FlaskResponse:
+            return fw.FlaskResponse(
+                health.body(), content_type=c.Web.HTTP_CONTENT_TYPE_JSON
+            )
 
         app.add_url_rule("/health", "health_check", health_check)
 
         self.logger.info(
             "Flask application created", app_name=web_settings.Web.app_name
         )
-        return r[flask.Flask].ok(app)
+        return r[fw.Flask].ok(app)
 
     class HealthHandler:
         """Health check handler with single responsibility for system health monitoring."""
 
-        @staticmethod
-        def create_handler() -> Callable[[], t.Web.FastApiEndpointPayload]:
-            """Create FastAPI health check handler function."""
+        payloads: ClassVar[dict[str, u.Web.HealthPayload]] = {}
+
+        @classmethod
+        def payload(cls, service: str) -> u.Web.HealthPayload:
+            """Return the shared pre-encoded ``/health`` body of ``service``.
+
+            The body carries a timestamp refreshed at most once per second,
+            so every app of a service serves the same cached bytes.
+            """
+            health = cls.payloads.get(service)
+            if health is None:
+                health = cls.payloads.setdefault(
+                    service,
+                    u.Web.HealthPayload(
+                        {
+                            "status": c.Web.ResponseStatus.HEALTHY.value,
+                            "service": service,
+                        },
+                        timestamped=True,
+                    ),
+                )
+            return health
+
+        @classmethod
+        def create_handler(cls) -> Callable[[], t.Web.FastApiEndpointPayload]:
+            """Create FastAPI health check handler function.
+
+            The handler decodes the shared ``/health`` payload of
+            ``c.Web.SERVICE_NAME``, so it reports what the endpoint serves.
+            """
+            health = cls.payload(c.Web.SERVICE_NAME)
 
             def health_check() -> t.Web.FastApiEndpointPayload:
-                return {
-                    "status": c.Web.ResponseStatus.HEALTHY.value,
-                    "service": c.Web.SERVICE_NAME,
-                    "timestamp": u.generate_iso_timestamp(),
-                }
+                payload: t.Web.FastApiEndpointPayload = json.loads(health.body())
+                return payload
 
             return health_check
 
@@ -236,7 +263,7 @@ class FlextWebApp(s):
 
             return info_handler
 
-    def configure_fastapi_error_handlers(self, app: FastAPI) -> p.Result[bool]:
+    def configure_fastapi_error_handlers(self, app: fw.FastAPI) -> p.Result[bool]:
         """Configure FastAPI error handlers (extensible for future needs).
 
         Args:
@@ -250,7 +277,7 @@ class FlextWebApp(s):
         _ = app
         return r[bool].ok(value=True)
 
-    def configure_fastapi_middleware(self, app: FastAPI) -> p.Result[bool]:
+    def configure_fastapi_middleware(self, app: fw.FastAPI) -> p.Result[bool]:
         """Configure FastAPI middleware (extensible for future needs).
 
         Args:
@@ -264,7 +291,7 @@ class FlextWebApp(s):
         _ = app
         return r[bool].ok(value=True)
 
-    def configure_fastapi_routes(self, app: FastAPI) -> p.Result[bool]:
+    def configure_fastapi_routes(self, app: fw.FastAPI) -> p.Result[bool]:
         """Configure FastAPI routes (extensible for future needs).
 
         Args:
@@ -3,25 +3,273 @@
 from __future__ import annotations
 
 import uuid
-from collections.abc import MutableMapping, Sequence
-from typing import override
+import weakref
+from contextlib import suppress
+from collections.abc import Callable, Collection, Iterator, MutableMapping, Sequence
+from itertools import count
+from pathlib import Path
+from threading import Event, RLock, Thread
+from time import monotonic
+from typing import ClassVar, override
 
-from flext_web import e, m, p, r, s, u
+from pydantic import TypeAdapter
+
+from flext_web import c, e, m, p, r, s, t, u
 
 
 class FlextWebEntities(s):
-    """In-memory entity CRUD support for flext-web."""
+    """In-memory entity CRUD support for flext-web.
+
+    Storage is volatile unless ``open_journal`` attaches a
+    ``u.Web.EntityJournal``: writes are then appended to a group-committed
+    log before they are acknowledged, and the log is compacted into a
+    snapshot every ``c.Web.ENTITY_JOURNAL_COMPACT_EVERY`` records.
+    Fields declared with ``create_index`` get a hash or sorted secondary
+    index that ``query`` uses instead of scanning every entity. Every stored
+    entity carries a ``version``, starting at 1 and bumped by each update,
+    which ``update`` and ``delete`` can require for optimistic concurrency.
+    Writes are journaled in the order they are applied; a write the journal
+    rejects is rolled back, while a failed sync is reported but kept in
+    memory. ``configure_limits`` bounds the store by entity count and
+    approximate bytes, evicting LRU or LFU entities, and enables per-entity
+    TTLs; expired entities are dropped when the store is next accessed and
+    by a background sweep. Evictions and expirations are journaled as
+    deletes and counted per store in ``evictions`` and process-wide in
+    ``u.Web.entity_evictions``.
+    """
+
+    _entities_adapter: ClassVar[TypeAdapter[list[m.Web.EntityData]]] = TypeAdapter(
+        list[m.Web.EntityData]
+    )
 
     _storage: MutableMapping[str, m.Web.EntityData] = u.PrivateAttr(
         default_factory=dict[str, m.Web.EntityData]
     )
+    _sequence: MutableMapping[str, int] = u.PrivateAttr(default_factory=dict[str, int])
+    _next_sequence: Iterator[int] = u.PrivateAttr(default_factory=count)
+    _journal: u.Web.EntityJournal | None = u.PrivateAttr(default=None)
+    _indexes: MutableMapping[str, u.Web.HashIndex | u.Web.SortedIndex] = u.PrivateAttr(
+        default_factory=dict[str, u.Web.HashIndex | u.Web.SortedIndex]
+    )
+    _lock: RLock = u.PrivateAttr(default_factory=RLock)
+    _limits: u.Web.EntityLimits | None = u.PrivateAttr(default=None)
+    _evictions: u.Web.EvictionCounters = u.PrivateAttr(
+        default_factory=u.Web.EvictionCounters
+    )
+    _sweeper: Thread | None = u.PrivateAttr(default=None)
+    _sweeper_stop: Event = u.PrivateAttr(default_factory=Event)
 
-    def create(self, data: m.Web.EntityData) -> p.Result[m.Web.EntityData]:
-        """Create an entity with generated identifier."""
-        entity_id = str(uuid.uuid4())
-        entity = m.Web.EntityData(data={"id": entity_id, **data.data})
-        self._storage[entity_id] = entity
-        return r[m.Web.EntityData].ok(entity)
+    @property
+    def journal(self) -> u.Web.EntityJournal | None:
+        """Attached write-ahead journal; ``None`` while storage is volatile."""
+        return self._journal
+
+    @property
+    def limits(self) -> u.Web.EntityLimits | None:
+        """Active capacity and expiry limits; ``None`` while unbounded."""
+        return self._limits
+
+    @property
+    def evictions(self) -> u.Web.EvictionCounters:
+        """Entities this store evicted for capacity or dropped on expiry."""
+        return self._evictions
+
+    def configure_limits(
+        self,
+        *,
+        max_entries: int = 0,
+        max_bytes: int = 0,
+        policy: c.Web.EvictionPolicy = c.Web.EvictionPolicy.LRU,
+        default_ttl: float | None = None,
+        clock: Callable[[], float] = monotonic,
+        sweep_interval: float = c.Web.ENTITY_SWEEP_INTERVAL_SECONDS,
+    ) -> p.Result[int]:
+        """Bound the store and enable TTLs, replacing any previous limits.
+
+        ``0`` disables a capacity limit and ``default_ttl`` applies to
+        entities created without their own ``ttl``, including the ones
+        already stored. A positive ``sweep_interval`` starts a daemon thread
+        that expires at most ``c.Web.ENTITY_SWEEP_BATCH`` entities per tick.
+        Returns the number of entities evicted to fit the new limits.
+        """
+        if max_entries < 0:
+            return e.fail_validation("max_entries", error="cannot be negative")
+        if max_bytes < 0:
+            return e.fail_validation("max_bytes", error="cannot be negative")
+        if default_ttl is not None and default_ttl <= 0:
+            return e.fail_validation("default_ttl", error="must be positive")
+        if sweep_interval < 0:
+            return e.fail_validation("sweep_interval", error="cannot be negative")
+        self.remove_limits()
+        limits = u.Web.EntityLimits(max_entries, max_bytes, policy, default_ttl, clock)
+        with self._lock:
+            deadline = limits.deadline()
+            for entity_id, entity in self._storage.items():
+                limits.track(entity_id, entity.data, deadline)
+            self._limits = limits
+            evicted = self._evict()
+            try:
+                ticket = self._journal_write(self._deletes(evicted))
+            except OSError as exc:
+                self._restore(evicted)
+                return r[int].fail(f"Entity journal write failed: {exc}")
+        self._record_evictions(evictions=len(evicted))
+        if sweep_interval > 0:
+            self._sweeper_stop = Event()
+            self._sweeper = Thread(
+                target=self._sweep_loop,
+                args=(weakref.ref(self), self._sweeper_stop, sweep_interval),
+                name="entity-sweeper",
+                daemon=True,
+            )
+            self._sweeper.start()
+        failure = self._journal_sync(ticket)
+        if failure is not None:
+            return r[int].fail(failure)
+        return r[int].ok(len(evicted))
+
+    def create(
+        self, data: m.Web.EntityData, ttl: float | None = None
+    ) -> p.Result[m.Web.EntityData]:
+        """Create an entity with generated identifier, expiring after ``ttl`` seconds."""
+        created = self.create_many([data], ttl)
+        if created.failure:
+            return r[m.Web.EntityData].fail(created.error)
+        return r[m.Web.EntityData].ok(created.value[0])
+
+    def create_many(
+        self, items: Sequence[m.Web.EntityData], ttl: float | None = None
+    ) -> p.Result[Sequence[m.Web.EntityData]]:
+        """Create entities in one validation pass and one journal sync.
+
+        ``ttl`` overrides the default TTL of ``configure_limits``, which must
+        have been called first. Entities evicted to make room are journaled
+        in the same write; the created entities are returned even when the
+        batch itself does not fit.
+        """
+        if ttl is not None:
+            if ttl <= 0:
+                return e.fail_validation("ttl", error="must be positive")
+            if self._limits is None:
+                return e.fail_validation("ttl", error="requires configure_limits")
+        entity_ids = [str(uuid.uuid4()) for _ in items]
+        try:
+            entities = self._entities_adapter.validate_python([
+                {"data": {"id": entity_id, **item.data}, "version": 1}
+                for entity_id, item in zip(entity_ids, items, strict=True)
+            ])
+        except c.ValidationError as exc:
+            return r[Sequence[m.Web.EntityData]].fail(f"Invalid entities: {exc}")
+        created = list(zip(entity_ids, entities, strict=True))
+        with self._lock:
+            expired = self._expire_due()
+            limits = self._limits
+            deadline = None if limits is None else limits.deadline(ttl)
+            for entity_id, entity in created:
+                self._put(entity_id, entity, deadline)
+            evicted = self._evict()
+            try:
+                ticket = self._journal_write([
+                    *expired,
+                    *(
+                        ("put", entity_id, entity.data, 1)
+                        for entity_id, entity in created
+                    ),
+                    *self._deletes(evicted),
+                ])
+            except OSError as exc:
+                for entity_id in entity_ids:
+                    _ = self._discard(entity_id)
+                created_ids = set(entity_ids)
+                self._restore([
+                    removed for removed in evicted if removed[0] not in created_ids
+                ])
+                return r[Sequence[m.Web.EntityData]].fail(
+                    f"Entity journal write failed: {exc}"
+                )
+        self._record_evictions(evictions=len(evicted))
+        failure = self._journal_sync(ticket)
+        if failure is not None:
+            return r[Sequence[m.Web.EntityData]].fail(failure)
+        return r[Sequence[m.Web.EntityData]].ok(entities)
+
+    def create_index(
+        self, field: str, kind: c.Web.IndexKind = c.Web.IndexKind.HASH
+    ) -> p.Result[bool]:
+        """Declare a secondary index on ``field`` and build it from storage.
+
+        ``HASH`` indexes answer equality lookups; ``SORTED`` indexes also
+        answer ``m.Web.ValueRange`` conditions.
+        """
+        if not u.to_str(field):
+            return e.fail_validation("field", error="cannot be empty")
+        if field in self._indexes:
+            return r[bool].fail(f"Field {field} is already indexed")
+        index = (
+            u.Web.SortedIndex(field)
+            if kind == c.Web.IndexKind.SORTED
+            else u.Web.HashIndex(field)
+        )
+        with self._lock:
+            for entity_id, entity in self._storage.items():
+                index.add(entity_id, entity.data.get(field))
+            self._indexes[field] = index
+        return r[bool].ok(True)
+
+    def close_journal(self) -> None:
+        """Sync and detach the journal; storage becomes volatile again."""
+        journal, self._journal = self._journal, None
+        if journal is not None:
+            journal.close()
+
+    def compact_journal(self) -> p.Result[bool]:
+        """Snapshot the current entities and truncate the journal log."""
+        journal = self._journal
+        if journal is None:
+            return r[bool].fail("Entity journal is not open")
+
+        try:
+            with self._lock:
+                journal.compact(
+                    lambda: [
+                        (entity_id, entity.data, entity.version)
+                        for entity_id, entity in self._storage.items()
+                    ]
+                )
+        except OSError as exc:
+            return r[bool].fail(f"Entity journal compaction failed: {exc}")
+        return r[bool].ok(True)
+
+    def delete(
+        self, entity_id: str, expected_version: int | None = None
+    ) -> p.Result[bool]:
+        """Delete an entity, optionally only at ``expected_version``."""
+        if not u.to_str(entity_id):
+            return e.fail_validation("entity_id", error="cannot be empty")
+        with self._lock:
+            expired = self._expire_due()
+            current = self._storage.get(entity_id)
+            if current is None:
+                self._journal_dropped(expired)
+                return e.fail_not_found("entity", entity_id, result_type=r[bool])
+            if expected_version is not None and current.version != expected_version:
+                self._journal_dropped(expired)
+                return r[bool].fail(
+                    self._conflict(entity_id, expected_version, current.version)
+                )
+            removed = self._remove(entity_id)
+            try:
+                ticket = self._journal_write([
+                    *expired,
+                    ("delete", entity_id, None, current.version),
+                ])
+            except OSError as exc:
+                self._restore(removed)
+                return r[bool].fail(f"Entity journal write failed: {exc}")
+        failure = self._journal_sync(ticket)
+        if failure is not None:
+            return r[bool].fail(failure)
+        return r[bool].ok(True)
 
     @override
     def execute(self) -> p.Result[bool]:
@@ -32,18 +280,447 @@ class FlextWebEntities(s):
         """Fetch an entity by identifier."""
         if not u.to_str(entity_id):
             return e.fail_validation("entity_id", error="cannot be empty")
-        entity = self._storage.get(entity_id)
+        limits = self._limits
+        if limits is None:
+            entity = self._storage.get(entity_id)
+        else:
+            with self._lock:
+                self._journal_dropped(self._expire_due())
+                entity = self._storage.get(entity_id)
+                if entity is not None:
+                    limits.touch(entity_id)
         if entity is None:
             return e.fail_not_found("entity", entity_id)
         return r[m.Web.EntityData].ok(entity)
 
     def list_all(self) -> p.Result[Sequence[m.Web.EntityData]]:
         """List all registered entities."""
+        self._reap()
         return r[Sequence[m.Web.EntityData]].ok(list(self._storage.values()))
 
+    def list_page(self, query: m.Web.ListQuery) -> p.Result[m.Web.EntityPage]:
+        """Return one filtered, sorted keyset page of entities.
+
+        ``status``/``host``/``port`` match entity data fields exactly and
+        ``name_prefix`` matches the ``name`` field. The entries and their
+        sequence numbers are snapshotted under the store lock, so concurrent
+        writes and sweeps cannot change them while the page is selected.
+        """
+        self._reap()
+        criteria = query.criteria
+        with self._lock:
+            stored = tuple(self._storage.items())
+            sequence = dict(self._sequence)
+
+        def entries() -> Iterator[tuple[t.Web.SortKey, m.Web.EntityData]]:
+            for entity_id, entity in stored:
+                data = entity.data
+                if any(data.get(field) != value for field, value in criteria.items()):
+                    continue
+                if query.name_prefix is not None and not str(
+                    data.get("name", "")
+                ).startswith(query.name_prefix):
+                    continue
+                seq = sequence.get(entity_id, 0)
+                value = seq if query.sort_by is None else data.get(query.sort_by)
+                yield u.Web.sort_key(value, seq), entity
+
+        try:
+            after = None if query.cursor is None else u.Web.decode_cursor(query.cursor)
+            items, total, next_cursor = u.Web.select_page(
+                entries(), after=after, limit=query.limit, descending=query.descending
+            )
+        except (TypeError, ValueError) as exc:
+            return r[m.Web.EntityPage].fail(f"Invalid list query: {exc}")
+        return r[m.Web.EntityPage].ok(
+            m.Web.EntityPage(items=items, total=total, next_cursor=next_cursor)
+        )
+
+    def open_journal(
+        self,
+        directory: str | Path,
+        group_commit_ms: float = c.Web.ENTITY_JOURNAL_GROUP_COMMIT_MS,
+    ) -> p.Result[int]:
+        """Recover entities from ``directory`` and journal every later write.
+
+        Returns the number of recovered entities. ``group_commit_ms=0``
+        fsyncs each write instead of batching them.
+        """
+        if self._journal is not None:
+            return r[int].fail("Entity journal is already open")
+        journal = u.Web.EntityJournal(directory, group_commit_ms)
+        try:
+            recovered = journal.recover()
+        except OSError as exc:
+            return r[int].fail(f"Entity journal recovery failed: {exc}")
+        try:
+            entities = self._entities_adapter.validate_python([
+                {"data": data, "version": version}
+                for data, version in recovered.values()
+            ])
+        except c.ValidationError as exc:
+            journal.close()
+            return r[int].fail(f"Entity journal holds invalid entities: {exc}")
+        with self._lock:
+            limits = self._limits
+            deadline = None if limits is None else limits.deadline()
+            for entity_id, entity in zip(recovered, entities, strict=True):
+                self._put(entity_id, entity, deadline)
+            self._journal = journal
+            evicted = self._evict()
+            self._journal_dropped(self._deletes(evicted))
+        self._record_evictions(evictions=len(evicted))
+        return r[int].ok(len(recovered))
+
+    def query(
+        self, **criteria: t.Web.FieldValue | m.Web.ValueRange
+    ) -> p.Result[Sequence[m.Web.EntityData]]:
+        """Return entities whose data match every ``field=value`` condition.
+
+        Values match exactly and ``m.Web.ValueRange`` values inclusively;
+        ranges can only use sorted indexes. The most selective indexed
+        condition picks the candidates, which are then checked against the
+        remaining conditions; without any usable index every entity is
+        scanned. Results follow that index order, or insertion order for
+        scans. Candidates are selected and filtered under the store lock,
+        so concurrent writes and sweeps never change them mid-iteration.
+        """
+        self._reap()
+        with self._lock:
+            candidates: Collection[str] | None = None
+            for field, expected in criteria.items():
+                index = self._indexes.get(field)
+                match index, expected:
+                    case u.Web.SortedIndex(), m.Web.ValueRange(low=low, high=high):
+                        ids = index.range(low, high)
+                    case _, m.Web.ValueRange():
+                        ids = None
+                    case u.Web.SortedIndex() | u.Web.HashIndex(), _:
+                        ids = index.equal(expected)
+                    case _:
+                        ids = None
+                if ids is not None and (
+                    candidates is None or len(ids) < len(candidates)
+                ):
+                    candidates = ids
+            storage = self._storage
+            entities = (
+                storage.values()
+                if candidates is None
+                else (
+                    entity
+                    for entity_id in candidates
+                    for entity in (storage.get(entity_id),)
+                    if entity is not None
+                )
+            )
+            matched = [
+                entity
+                for entity in entities
+                if all(
+                    self._matches(entity.data.get(field), expected)
+                    for field, expected in criteria.items()
+                )
+            ]
+        return r[Sequence[m.Web.EntityData]].ok(matched)
+
+    def update(
+        self,
+        entity_id: str,
+        patch: t.ConfigurationMapping,
+        expected_version: int | None = None,
+    ) -> p.Result[m.Web.EntityData]:
+        """Merge ``patch`` into an entity, optionally only at ``expected_version``."""
+        if not u.to_str(entity_id):
+            return e.fail_validation("entity_id", error="cannot be empty")
+        updated = self.update_many([
+            m.Web.EntityPatch(
+                entity_id=entity_id,
+                patch=dict(patch),
+                expected_version=expected_version,
+            )
+        ])
+        if updated.failure:
+            return r[m.Web.EntityData].fail(updated.error)
+        return r[m.Web.EntityData].ok(updated.value[0])
+
+    def update_many(
+        self, patches: Sequence[m.Web.EntityPatch]
+    ) -> p.Result[Sequence[m.Web.EntityData]]:
+        """Apply ``patches`` all-or-nothing in one validation pass.
+
+        Every expected version is checked before anything is written; a
+        missing entity or a version conflict fails the whole batch.
+        Patches to the same entity apply in order and bump its version
+        once each. Returns the updated entities in first-patched order.
+        Updates keep each entity's expiry deadline.
+        """
+        with self._lock:
+            expired = self._expire_due()
+            originals: dict[str, m.Web.EntityData] = {}
+            staged: dict[str, tuple[t.MutableConfigurationMapping, int]] = {}
+            for item in patches:
+                entity_id = item.entity_id
+                current = staged.get(entity_id)
+                if current is None:
+                    stored = self._storage.get(entity_id)
+                    if stored is None:
+                        self._journal_dropped(expired)
+                        return e.fail_not_found(
+                            "entity",
+                            entity_id,
+                            result_type=r[Sequence[m.Web.EntityData]],
+                        )
+                    originals[entity_id] = stored
+                    current = (stored.data, stored.version)
+                data, version = current
+                if (
+                    item.expected_version is not None
+                    and item.expected_version != version
+                ):
+                    self._journal_dropped(expired)
+                    return r[Sequence[m.Web.EntityData]].fail(
+                        self._conflict(entity_id, item.expected_version, version)
+                    )
+                staged[entity_id] = (
+                    {**data, **item.patch, "id": data.get("id", entity_id)},
+                    version + 1,
+                )
+            try:
+                entities = self._entities_adapter.validate_python([
+                    {"data": data, "version": version}
+                    for data, version in staged.values()
+                ])
+            except c.ValidationError as exc:
+                self._journal_dropped(expired)
+                return r[Sequence[m.Web.EntityData]].fail(f"Invalid patch: {exc}")
+            updated = list(zip(staged, entities, strict=True))
+            for entity_id, entity in updated:
+                self._put(entity_id, entity)
+            evicted = self._evict()
+            try:
+                ticket = self._journal_write([
+                    *expired,
+                    *(
+                        ("put", entity_id, entity.data, entity.version)
+                        for entity_id, entity in updated
+                    ),
+                    *self._deletes(evicted),
+                ])
+            except OSError as exc:
+                self._restore(evicted)
+                for entity_id, original in originals.items():
+                    self._put(entity_id, original)
+                return r[Sequence[m.Web.EntityData]].fail(
+                    f"Entity journal write failed: {exc}"
+                )
+        self._record_evictions(evictions=len(evicted))
+        failure = self._journal_sync(ticket)
+        if failure is not None:
+            return r[Sequence[m.Web.EntityData]].fail(failure)
+        return r[Sequence[m.Web.EntityData]].ok(entities)
+
+    def remove_limits(self) -> None:
+        """Stop the background sweep and make the store unbounded again."""
+        self._sweeper_stop.set()
+        sweeper, self._sweeper = self._sweeper, None
+        if sweeper is not None:
+            sweeper.join()
+        with self._lock:
+            self._limits = None
+
+    def sweep(self, limit: int | None = c.Web.ENTITY_SWEEP_BATCH) -> p.Result[int]:
+        """Expire at most ``limit`` due entities; return how many were dropped."""
+        if self._limits is None:
+            return r[int].ok(0)
+        with self._lock:
+            expired = self._expire_due(limit)
+            try:
+                ticket = self._journal_write(expired)
+            except OSError as exc:
+                return r[int].fail(f"Entity journal write failed: {exc}")
+        failure = self._journal_sync(ticket)
+        if failure is not None:
+            return r[int].fail(failure)
+        return r[int].ok(len(expired))
+
     def validate_business_rules(self) -> p.Result[bool]:
         """Validate entity namespace invariants."""
         return r[bool].ok(True)
 
+    @staticmethod
+    def _conflict(entity_id: str, expected: int, found: int) -> str:
+        """Return the optimistic concurrency failure message."""
+        return f"Version conflict for entity {entity_id}: expected {expected}, found {found}"
+
+    @staticmethod
+    def _deletes(
+        removed: Sequence[tuple[str, m.Web.EntityData, float | None, int | None]],
+    ) -> list[t.Web.JournalEntry]:
+        """Return the journal deletes of removed entities."""
+        return [
+            ("delete", entity_id, None, entity.version)
+            for entity_id, entity, _, _ in removed
+        ]
+
+    @staticmethod
+    def _matches(
+        value: t.Web.FieldValue, expected: t.Web.FieldValue | m.Web.ValueRange
+    ) -> bool:
+        """Return whether one data value satisfies one query condition."""
+        if isinstance(expected, m.Web.ValueRange):
+            return u.Web.SortedIndex.in_range(value, expected.low, expected.high)
+        return value == expected
+
+    def _discard(self, entity_id: str) -> m.Web.EntityData | None:
+        """Remove ``entity_id`` from storage, sequence, indexes and limits."""
+        entity = self._storage.pop(entity_id, None)
+        if entity is not None:
+            if self._limits is not None:
+                self._limits.forget(entity_id)
+            _ = self._sequence.pop(entity_id, None)
+            for field, index in self._indexes.items():
+                index.remove(entity_id, entity.data.get(field))
+        return entity
+
+    def _evict(self) -> list[tuple[str, m.Web.EntityData, float | None, int | None]]:
+        """Remove the coldest entities until within limits; callers hold ``_lock``.
+
+        Returns ``(id, entity, deadline, sequence)`` for ``_restore``.
+        """
+        limits = self._limits
+        if limits is None:
+            return []
+        evicted: list[tuple[str, m.Web.EntityData, float | None, int | None]] = []
+        for entity_id, deadline in limits.victims():
+            sequence = self._sequence.get(entity_id)
+            entity = self._discard(entity_id)
+            if entity is not None:
+                evicted.append((entity_id, entity, deadline, sequence))
+        return evicted
+
+    def _record_evictions(self, evictions: int = 0, expirations: int = 0) -> None:
+        """Count evicted and expired entities for this store and process-wide."""
+        self._evictions.record(evictions, expirations)
+        u.Web.entity_evictions.record(evictions, expirations)
+
+    def _expire_due(self, limit: int | None = None) -> list[t.Web.JournalEntry]:
+        """Drop due entities and return their journal deletes.
+
+        Callers hold ``_lock``.
+        """
+        limits = self._limits
+        if limits is None:
+            return []
+        expired: list[t.Web.JournalEntry] = []
+        for entity_id in limits.due(limit):
+            entity = self._discard(entity_id)
+            if entity is not None:
+                expired.append(("delete", entity_id, None, entity.version))
+        self._record_evictions(expirations=len(expired))
+        return expired
+
+    def _journal_dropped(self, deletes: Sequence[t.Web.JournalEntry]) -> None:
+        """Journal deletes of expired or evicted entities without waiting.
+
+        The entities stay dropped when the journal rejects the write.
+        Callers hold ``_lock``.
+        """
+        if deletes:
+            with suppress(OSError):
+                _ = self._journal_write(deletes)
+
+    def _journal_sync(self, ticket: int) -> str | None:
+        """Wait for ``ticket`` to be durable; return the failure message, if any.
+
+        Compacts the journal once it holds enough records.
+        """
+        journal = self._journal
+        if journal is None or not ticket:
+            return None
+        try:
+            journal.wait(ticket)
+        except OSError as exc:
+            return f"Entity journal sync failed: {exc}"
+        if journal.records >= c.Web.ENTITY_JOURNAL_COMPACT_EVERY:
+            _ = self.compact_journal()
+        return None
+
+    def _journal_write(self, entries: Sequence[t.Web.JournalEntry]) -> int:
+        """Buffer applied writes in apply order; callers hold ``_lock``.
+
+        Returns the sync ticket, ``0`` without a journal. Raises ``OSError``
+        when the journal rejects the write.
+        """
+        journal = self._journal
+        return 0 if journal is None else journal.write_many(entries)
+
+    def _put(
+        self, entity_id: str, entity: m.Web.EntityData, expires_at: float | None = None
+    ) -> None:
+        """Store ``entity`` and keep the sequence, indexes and limits in sync.
+
+        ``expires_at`` applies to new entities; replacing one keeps its
+        deadline. Callers hold ``_lock``.
+        """
+        previous = self._storage.get(entity_id)
+        for field, index in self._indexes.items():
+            if previous is not None:
+                index.remove(entity_id, previous.data.get(field))
+            index.add(entity_id, entity.data.get(field))
+        if previous is None:
+            self._sequence[entity_id] = next(self._next_sequence)
+        self._storage[entity_id] = entity
+        limits = self._limits
+        if limits is not None:
+            limits.track(
+                entity_id,
+                entity.data,
+                expires_at if previous is None else limits.expires_at(entity_id),
+            )
+
+    def _reap(self) -> None:
+        """Drop every due entity before a listing reads storage."""
+        if self._limits is not None:
+            with self._lock:
+                self._journal_dropped(self._expire_due())
+
+    def _remove(
+        self, entity_id: str
+    ) -> list[tuple[str, m.Web.EntityData, float | None, int | None]]:
+        """Remove one entity, returning what ``_restore`` needs to undo it.
+
+        Callers hold ``_lock``.
+        """
+        limits = self._limits
+        deadline = None if limits is None else limits.expires_at(entity_id)
+        sequence = self._sequence.get(entity_id)
+        entity = self._discard(entity_id)
+        return [] if entity is None else [(entity_id, entity, deadline, sequence)]
+
+    def _restore(
+        self, removed: Sequence[tuple[str, m.Web.EntityData, float | None, int | None]]
+    ) -> None:
+        """Put removed entities back with their deadline and sequence.
+
+        Callers hold ``_lock``.
+        """
+        for entity_id, entity, deadline, sequence in removed:
+            self._put(entity_id, entity, deadline)
+            if sequence is not None:
+                self._sequence[entity_id] = sequence
+
+    @staticmethod
+    def _sweep_loop(
+        service: weakref.ReferenceType[FlextWebEntities], stop: Event, interval: float
+    ) -> None:
+        """Sweep due entities every ``interval`` until stopped or collected."""
+        while not stop.wait(interval):
+            entities = service()
+            if entities is None:
+                return
+            _ = entities.sweep()
+            del entities
+
 
 __all__: list[str] = ["FlextWebEntities"]
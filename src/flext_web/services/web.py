@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from typing import Self, override
+from socket import socket
+from typing import ClassVar, Self, override
+
+from pydantic import TypeAdapter
 
 from flext_web import (
     FlextWebAuth,
@@ -30,6 +33,9 @@ class FlextWebServices(s):
         default_factory=lambda: None
     )
     _health_service: FlextWebHealth | None = u.PrivateAttr(default_factory=lambda: None)
+    _application_responses_adapter: ClassVar[
+        TypeAdapter[list[m.Web.ApplicationResponse]]
+    ] = TypeAdapter(list[m.Web.ApplicationResponse])
 
     @classmethod
     def create_service(cls, settings: FlextWebSettings | None = None) -> p.Result[Self]:
@@ -39,8 +45,12 @@ class FlextWebServices(s):
         return ok_result
 
     def _runtime_settings_clone(self) -> FlextWebSettings:
-        """Return a clone of the bound runtime settings for child services."""
-        return FlextWebSettings.model_validate(self.settings.clone())
+        """Return an independent copy of the cached settings for a child service.
+
+        The snapshot is already validated, so a deep copy replaces the
+        clone-and-revalidate round trip.
+        """
+        return self.settings.model_copy(deep=True)
 
     def authenticate(
         self, credentials: m.Web.Credentials
@@ -65,14 +75,19 @@ class FlextWebServices(s):
         return self._entities().create(data)
 
     def dashboard(self) -> p.Result[m.Web.DashboardResponse]:
-        """Return dashboard data projected from the protocol runtime state."""
+        """Return dashboard data projected from the protocol runtime state.
+
+        Application totals come from the repository counters, so the cost
+        does not grow with the number of registered applications.
+        """
         state = u.Web.service_state
-        return self.list_apps().map(
-            lambda apps: m.Web.DashboardResponse(
-                total_applications=len(apps),
-                running_applications=sum(
-                    1 for app in apps if app.status == c.Web.Status.RUNNING.value
-                ),
+        total_result = u.Web.WebRepository.count({})
+        if total_result.failure:
+            return r[m.Web.DashboardResponse].fail(total_result.error)
+        return u.Web.WebRepository.count({"status": c.Web.Status.RUNNING.value}).map(
+            lambda running: m.Web.DashboardResponse(
+                total_applications=total_result.value,
+                running_applications=running,
                 service_status=self._service_status_label(),
                 routes_initialized=state["routes_initialized"],
                 middleware_configured=state["middleware_configured"],
@@ -92,9 +107,19 @@ class FlextWebServices(s):
     def api_capabilities(self) -> p.Result[t.Web.ResponseDict]:
         """Expose the canonical capabilities of the public web facade."""
         return r[t.Web.ResponseDict].ok({
-            "application_management": ["create_app", "fetch_app", "list_apps"],
+            "application_management": [
+                "create_app",
+                "fetch_app",
+                "list_apps",
+                "list_apps_page",
+            ],
             "framework_management": ["create_fastapi_app", "create_flask_app"],
-            "service_management": ["start_service", "stop_service"],
+            "service_management": [
+                "start_service",
+                "stop_service",
+                "start_apps",
+                "stop_apps",
+            ],
             "configuration_management": ["settings", "create_service"],
             "monitoring": ["health_check", "health_status", "dashboard"],
         })
@@ -152,14 +177,60 @@ class FlextWebServices(s):
             self._application_responses_from_payloads
         )
 
+    def list_apps_page(self, query: m.Web.ListQuery) -> p.Result[m.Web.AppPage]:
+        """List one filtered, sorted cursor page of applications.
+
+        Filtering, ordering and paging run in the repository, so only the
+        returned page is projected into response models.
+        """
+        return u.Web.WebRepository.find_page(query).flat_map(
+            lambda page: self._application_responses_from_payloads(page[0]).map(
+                lambda items: m.Web.AppPage(
+                    items=items, total=page[1], next_cursor=page[2]
+                )
+            )
+        )
+
     def list_entities(self) -> p.Result[Sequence[m.Web.EntityData]]:
         """List all generic entities."""
         return self._entities().list_all()
 
+    def list_entities_page(self, query: m.Web.ListQuery) -> p.Result[m.Web.EntityPage]:
+        """List one filtered, sorted cursor page of generic entities."""
+        return self._entities().list_page(query)
+
     def register_user(self, user_data: m.Web.UserData) -> p.Result[m.Web.UserResponse]:
         """Delegate registration to the canonical auth service."""
         return self._auth().register_user(user_data)
 
+    def serve_on_socket(
+        self, listener: socket, host: str | None = None, port: int | None = None
+    ) -> p.Result[bool]:
+        """Serve the runtime application on an inherited listener until shutdown.
+
+        Worker-process counterpart of ``start_service``: the supervisor owns
+        the bound socket, so this call blocks instead of starting a thread.
+        """
+        init_result = self.initialize_routes()
+        if init_result.failure:
+            return init_result
+        middleware_result = self.configure_middleware()
+        if middleware_result.failure:
+            return middleware_result
+        restored = u.Web.WebService.restore_registry()
+        if restored.failure:
+            return r[bool].fail(restored.error)
+        app_result = self._get_or_create_runtime_application(host=host, port=port)
+        if app_result.failure:
+            return r[bool].fail(app_result.error)
+        started = u.Web.WebService.start_service()
+        if started.failure:
+            return started
+        try:
+            return u.Web.serve_app_on_socket(app_result.value.id, listener)
+        finally:
+            _ = u.Web.WebService.stop_service()
+
     def start_app(self, app_id: str) -> p.Result[m.Web.ApplicationResponse]:
         """Start a registered application and project its payload into a model."""
         app_id_result = self._validated_app_id(app_id)
@@ -169,6 +240,14 @@ class FlextWebServices(s):
             self._application_response_from_payload
         )
 
+    def start_apps(
+        self, app_ids: t.StrSequence
+    ) -> p.Result[m.Web.BulkOperationResponse]:
+        """Start many applications in parallel and aggregate their outcomes."""
+        return u.Web.WebAppManager.start_apps(app_ids).map(
+            m.Web.BulkOperationResponse.model_validate
+        )
+
     def start_service(
         self,
         host: str | None = None,
@@ -184,6 +263,9 @@ class FlextWebServices(s):
         middleware_result = self.configure_middleware()
         if middleware_result.failure:
             return middleware_result
+        restored = u.Web.WebService.restore_registry()
+        if restored.failure:
+            return r[bool].fail(restored.error)
         app_result = self._get_or_create_runtime_application(host=host, port=port)
         if app_result.failure:
             return r[bool].fail(app_result.error)
@@ -201,17 +283,20 @@ class FlextWebServices(s):
             self._application_response_from_payload
         )
 
+    def stop_apps(
+        self, app_ids: t.StrSequence
+    ) -> p.Result[m.Web.BulkOperationResponse]:
+        """Stop and drain many applications in parallel."""
+        return u.Web.WebAppManager.stop_apps(app_ids).map(
+            m.Web.BulkOperationResponse.model_validate
+        )
+
     def stop_service(self) -> p.Result[bool]:
-        """Stop the service and all running applications."""
-        apps_result = self.list_apps()
-        if apps_result.failure:
-            return r[bool].fail(apps_result.error)
-        for app in apps_result.value:
-            if app.status == c.Web.Status.RUNNING.value:
-                stop_result = self.stop_app(app.id)
-                if stop_result.failure:
-                    return r[bool].fail(stop_result.error)
-        return u.Web.WebService.stop_service()
+        """Stop the service and, in parallel, every running application."""
+        running_result = self._running_app_ids()
+        if running_result.failure:
+            return r[bool].fail(running_result.error)
+        return self._finish_stop_service(self.stop_apps(running_result.value))
 
     def validate_business_rules(self) -> p.Result[bool]:
         """Validate protocol-backed service state invariants."""
@@ -226,26 +311,37 @@ class FlextWebServices(s):
             )
         return r[bool].ok(True)
 
+    @staticmethod
+    def _running_app_ids() -> p.Result[t.StrSequence]:
+        """Return the ids of every running application."""
+        return u.Web.WebRepository.find_by_criteria({
+            "status": c.Web.Status.RUNNING.value
+        }).map(lambda records: [str(record.get("id")) for record in records])
+
+    @staticmethod
+    def _finish_stop_service(
+        bulk_result: p.Result[m.Web.BulkOperationResponse],
+    ) -> p.Result[bool]:
+        """Stop the service once every app stopped, or report those that did not."""
+        if bulk_result.failure:
+            return r[bool].fail(bulk_result.error)
+        outcome = bulk_result.value
+        if not outcome.complete:
+            problems = [
+                *(f"{app_id}: {error}" for app_id, error in outcome.failed.items()),
+                *(f"{app_id}: deadline exceeded" for app_id in outcome.pending),
+            ]
+            return r[bool].fail(f"Failed to stop applications: {'; '.join(problems)}")
+        return u.Web.WebService.stop_service()
+
     def _application_response_from_payload(
-        self, payload: t.Web.ResponseDict
+        self, payload: t.Web.AppRecord
     ) -> p.Result[m.Web.ApplicationResponse]:
         """Project a protocol payload into the canonical application response model."""
-        created_at_raw = payload.get("created_at")
-        created_at = (
-            created_at_raw
-            if isinstance(created_at_raw, str)
-            else u.generate_iso_timestamp()
-        )
-        response_payload = {
-            "id": payload.get("id"),
-            "name": payload.get("name"),
-            "host": payload.get("host"),
-            "port": payload.get("port"),
-            "status": payload.get("status"),
-            "created_at": created_at,
-        }
         try:
-            response = m.Web.ApplicationResponse.model_validate(response_payload)
+            response = m.Web.ApplicationResponse.model_validate(
+                self._application_response_payload(payload)
+            )
         except c.ValidationError as exc:
             return r[m.Web.ApplicationResponse].fail(
                 f"Invalid application payload: {exc}"
@@ -253,19 +349,34 @@ class FlextWebServices(s):
         return r[m.Web.ApplicationResponse].ok(response)
 
     def _application_responses_from_payloads(
-        self, payloads: t.SequenceOf[t.Web.ResponseDict]
+        self, payloads: t.SequenceOf[t.Web.AppRecord]
     ) -> p.Result[Sequence[m.Web.ApplicationResponse]]:
-        """Project a sequence of payloads into response models."""
-        responses: list[m.Web.ApplicationResponse] = []
-        for payload in payloads:
-            response_result = self._application_response_from_payload(payload)
-            if response_result.failure:
-                return r[Sequence[m.Web.ApplicationResponse]].fail(
-                    response_result.error
-                )
-            responses.append(response_result.value)
+        """Project a sequence of payloads into response models in one validation."""
+        try:
+            responses = self._application_responses_adapter.validate_python([
+                self._application_response_payload(payload) for payload in payloads
+            ])
+        except c.ValidationError as exc:
+            return r[Sequence[m.Web.ApplicationResponse]].fail(
+                f"Invalid application payload: {exc}"
+            )
         return r[Sequence[m.Web.ApplicationResponse]].ok(responses)
 
+    @staticmethod
+    def _application_response_payload(payload: t.Web.AppRecord) -> t.Web.ResponseDict:
+        """Select the response fields of a protocol payload."""
+        created_at = payload.get("created_at")
+        return {
+            "id": payload.get("id"),
+            "name": payload.get("name"),
+            "host": payload.get("host"),
+            "port": payload.get("port"),
+            "status": payload.get("status"),
+            "created_at": created_at
+            if isinstance(created_at, str)
+            else u.generate_iso_timestamp(),
+        }
+
     @staticmethod
     def _service_status_label() -> str:
         """Return the canonical service status label from runtime state."""
@@ -308,16 +419,15 @@ class FlextWebServices(s):
         target_name = settings.Web.app_name
         target_host = host if host is not None else settings.Web.host
         target_port = port if port is not None else settings.Web.port
-        apps_result = self.list_apps()
-        if apps_result.failure:
-            return r[m.Web.ApplicationResponse].fail(apps_result.error)
-        for app in apps_result.value:
-            if (
-                app.name == target_name
-                and app.host == target_host
-                and app.port == target_port
-            ):
-                return r[m.Web.ApplicationResponse].ok(app)
+        matches_result = u.Web.WebRepository.find_by_criteria({
+            "name": target_name,
+            "host": target_host,
+            "port": target_port,
+        })
+        if matches_result.failure:
+            return r[m.Web.ApplicationResponse].fail(matches_result.error)
+        if matches_result.value:
+            return self._application_response_from_payload(matches_result.value[0])
         return self.create_app(
             m.Web.AppData(name=target_name, host=target_host, port=target_port)
         )
@@ -0,0 +1,55 @@
+"""Asyncio service facade for flext-web."""
+
+from __future__ import annotations
+
+from flext_web import FlextWebServices, m, p, r, t, u
+
+
+class FlextWebAsyncServices(FlextWebServices):
+    """Service facade whose lifecycle calls never block the running event loop.
+
+    FastAPI applications run as uvicorn tasks on the caller's loop, so
+    readiness and shutdown are awaited instead of polled from threads; other
+    runtimes are started and joined in the default executor. Registry reads
+    and writes do not block and stay on the synchronous methods.
+    """
+
+    async def astart_app(self, app_id: str) -> p.Result[m.Web.ApplicationResponse]:
+        """Start a registered application and await its readiness."""
+        app_id_result = self._validated_app_id(app_id)
+        if app_id_result.failure:
+            return r[m.Web.ApplicationResponse].fail(app_id_result.error)
+        started = await u.Web.WebAppManager.astart_app(app_id_result.value)
+        return started.flat_map(self._application_response_from_payload)
+
+    async def astart_apps(
+        self, app_ids: t.StrSequence
+    ) -> p.Result[m.Web.BulkOperationResponse]:
+        """Start many applications concurrently on the running loop."""
+        started = await u.Web.WebAppManager.astart_apps(app_ids)
+        return started.map(m.Web.BulkOperationResponse.model_validate)
+
+    async def astop_app(self, app_id: str) -> p.Result[m.Web.ApplicationResponse]:
+        """Stop a registered application and await its drain."""
+        app_id_result = self._validated_app_id(app_id)
+        if app_id_result.failure:
+            return r[m.Web.ApplicationResponse].fail(app_id_result.error)
+        stopped = await u.Web.WebAppManager.astop_app(app_id_result.value)
+        return stopped.flat_map(self._application_response_from_payload)
+
+    async def astop_apps(
+        self, app_ids: t.StrSequence
+    ) -> p.Result[m.Web.BulkOperationResponse]:
+        """Stop and drain many applications concurrently on the running loop."""
+        stopped = await u.Web.WebAppManager.astop_apps(app_ids)
+        return stopped.map(m.Web.BulkOperationResponse.model_validate)
+
+    async def astop_service(self) -> p.Result[bool]:
+        """Stop the service and, concurrently, every running application."""
+        running_result = self._running_app_ids()
+        if running_result.failure:
+            return r[bool].fail(running_result.error)
+        return self._finish_stop_service(await self.astop_apps(running_result.value))
+
+
+__all__: list[str] = ["FlextWebAsyncServices"]
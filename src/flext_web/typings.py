@@ -7,8 +7,15 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
+
 from flext_cli import t
 
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+    from flask import Flask
+
 
 class FlextWebTypes(t):
     """Web-specific type definitions extending t via MRO."""
@@ -19,6 +26,21 @@ class FlextWebTypes(t):
         type RequestDict = dict[str, t.Scalar | t.StrSequence | t.ConfigurationMapping]
         type ResponseDict = dict[str, t.Scalar | t.StrSequence | t.ConfigurationMapping]
         type FastApiEndpointPayload = t.MappingKV[str, str | bool]
+        type WsgiApplication = Callable[..., Iterable[bytes]]
+        type FrameworkApp = Flask | FastAPI
+        type SocketAddress = tuple[str, int]
+        type AppRecord = t.MappingKV[
+            str, t.Scalar | t.StrSequence | t.ConfigurationMapping
+        ]
+        type TemplateFilter = Callable[[str], str]
+        type FieldValue = t.Scalar | t.StrSequence | t.ConfigurationMapping | None
+        type JournalEntry = tuple[str, str, t.ConfigurationMapping | None, int]
+        type JournalState = dict[str, tuple[t.MutableConfigurationMapping, int]]
+        type SortKey = tuple[bool, t.Scalar, int]
+        type AppRecordPage = tuple[t.SequenceOf[AppRecord], int, str | None]
+        type TemplateValues = t.MappingKV[
+            str, t.JsonValue | t.Scalar | t.StrSequence | t.ConfigurationMapping
+        ]
 
 
 t = FlextWebTypes
@@ -10,25 +10,39 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable, Sequence
+import asyncio
+import json
+import signal
+import sqlite3
+from collections.abc import Awaitable, Callable, Hashable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor, wait
 from copy import deepcopy
+from hashlib import blake2b
+from socket import socket
 from importlib import import_module
-from threading import Thread
-from time import sleep
+from threading import Event, Thread, current_thread, main_thread
+from math import ceil
+from pathlib import Path
+from time import monotonic, perf_counter_ns
 from typing import cast, ClassVar, override
 from uuid import uuid4
+from weakref import WeakKeyDictionary
 from wsgiref.simple_server import WSGIServer, make_server
 
-import flask
-import uvicorn
-from fastapi import FastAPI
-from starlette.requests import Request as StarletteRequest
-from starlette.responses import Response as StarletteResponse
-from werkzeug.serving import BaseWSGIServer
-
 from flext_cli import e, p, r, u
-from flext_web import c, m, settings, t
+from flext_web import _frameworks as fw, c, m, settings, t
 from flext_web._settings import FlextWebSettings
+from flext_web._utilities.eviction import FlextWebUtilitiesEviction
+from flext_web._utilities.health import FlextWebUtilitiesHealth
+from flext_web._utilities.indexes import FlextWebUtilitiesIndexes
+from flext_web._utilities.journal import FlextWebUtilitiesJournal
+from flext_web._utilities.metrics import FlextWebUtilitiesMetrics
+from flext_web._utilities.openmetrics import FlextWebUtilitiesOpenMetrics
+from flext_web._utilities.pagination import FlextWebUtilitiesPagination
+from flext_web._utilities.registry import FlextWebUtilitiesRegistry
+from flext_web._utilities.storage import FlextWebUtilitiesStorage
+from flext_web._utilities.templates import FlextWebUtilitiesTemplates
+from flext_web._utilities.workers import FlextWebUtilitiesWorkers
 
 
 class FlextWebUtilities(u):
@@ -40,22 +54,65 @@ class FlextWebUtilities(u):
     Uses advanced builder/DSL patterns for composition.
     """
 
-    class Web(u):
+    class Web(
+        FlextWebUtilitiesEviction.Web,
+        FlextWebUtilitiesHealth.Web,
+        FlextWebUtilitiesIndexes.Web,
+        FlextWebUtilitiesJournal.Web,
+        FlextWebUtilitiesMetrics.Web,
+        FlextWebUtilitiesOpenMetrics.Web,
+        FlextWebUtilitiesPagination.Web,
+        FlextWebUtilitiesRegistry.Web,
+        FlextWebUtilitiesStorage.Web,
+        FlextWebUtilitiesTemplates.Web,
+        FlextWebUtilitiesWorkers.Web,
+        u,
+    ):
         """Web domain-specific protocols."""
 
-        apps_registry: ClassVar[dict[str, t.Web.ResponseDict]] = {}
+        apps_registry: ClassVar[FlextWebUtilitiesRegistry.Web.AppRegistry] = (
+            FlextWebUtilitiesRegistry.Web.AppRegistry()
+        )
+
+        app_store: ClassVar[FlextWebUtilities.Web.SqliteWebRepository | None] = None
+
+        framework_instances: ClassVar[dict[str, t.Web.FrameworkApp]] = {}
 
-        framework_instances: ClassVar[dict[str, flask.Flask | FastAPI]] = {}
+        shared_routers: ClassVar[dict[str, fw.APIRouter]] = {}
+
+        openapi_documents: ClassVar[dict[tuple[Hashable, ...], tuple[bytes, str]]] = {}
+
+        openapi_keys: ClassVar[
+            WeakKeyDictionary[
+                fw.FastAPI, tuple[tuple[object, ...], tuple[Hashable, ...]]
+            ]
+        ] = WeakKeyDictionary()
 
         app_runtimes: ClassVar[dict[str, m.Web.AppRuntimeInfo]] = {}
 
+        bulk_tasks: ClassVar[set[asyncio.Task[p.Result[t.Web.AppRecord]]]] = set()
+
         service_state: ClassVar[dict[str, bool]] = {
             "routes_initialized": False,
             "middleware_configured": False,
             "service_running": False,
         }
 
-        web_metrics: ClassVar[dict[str, int | str]] = {}
+        request_metrics: ClassVar[FlextWebUtilitiesMetrics.Web.RequestMetrics] = (
+            FlextWebUtilitiesMetrics.Web.RequestMetrics()
+        )
+
+        runtime_metrics: ClassVar[FlextWebUtilitiesMetrics.Web.RequestMetrics] = (
+            FlextWebUtilitiesMetrics.Web.RequestMetrics()
+        )
+
+        entity_evictions: ClassVar[FlextWebUtilitiesEviction.Web.EvictionCounters] = (
+            FlextWebUtilitiesEviction.Web.EvictionCounters()
+        )
+
+        metrics_cache: ClassVar[FlextWebUtilitiesOpenMetrics.Web.ExpositionCache] = (
+            FlextWebUtilitiesOpenMetrics.Web.ExpositionCache()
+        )
 
         template_config: ClassVar[t.Web.RequestDict] = {}
 
@@ -63,6 +120,14 @@ class FlextWebUtilities(u):
 
         template_filters: ClassVar[dict[str, Callable[[str], str]]] = {}
 
+        template_cache: ClassVar[FlextWebUtilitiesTemplates.Web.TemplateCache] = (
+            FlextWebUtilitiesTemplates.Web.TemplateCache()
+        )
+
+        template_loader: ClassVar[FlextWebUtilitiesTemplates.Web.TemplateLoader] = (
+            FlextWebUtilitiesTemplates.Web.TemplateLoader()
+        )
+
         @staticmethod
         def validate_port(port: int) -> bool:
             """Return whether the port is within the permitted range."""
@@ -114,36 +179,38 @@ class FlextWebUtilities(u):
         @classmethod
         def _create_framework_app(
             cls, name: str
-        ) -> p.Result[tuple[flask.Flask | FastAPI, str, str]]:
+        ) -> p.Result[tuple[t.Web.FrameworkApp, str, str]]:
             try:
-                fastapi_app = FastAPI(
+                fastapi_app = fw.FastAPI(
                     title=name,
                     version=settings.Web.version,
                     description=c.Web.API_DEFAULT_DESCRIPTION,
-                    docs_url=c.Web.API_DOCS_URL,
-                    redoc_url=c.Web.API_REDOC_URL,
-                    openapi_url=c.Web.API_OPENAPI_URL,
+                    docs_url=None,
+                    redoc_url=None,
+                    openapi_url=None,
                 )
+                if settings.Web.docs_enabled:
+                    cls.configure_openapi_routes(fastapi_app)
             except c.EXC_OS_RUNTIME_TYPE as exc:
                 fastapi_error = f"Failed to create FastAPI application: {exc}"
             else:
-                return r[tuple[flask.Flask | FastAPI, str, str]].ok((
+                return r[tuple[t.Web.FrameworkApp, str, str]].ok((
                     fastapi_app,
                     c.Web.FRAMEWORK_FASTAPI,
                     c.Web.FRAMEWORK_INTERFACE_ASGI,
                 ))
 
             try:
-                flask_app = flask.Flask(name)
+                flask_app = fw.Flask(name)
                 flask_app.config["SECRET_KEY"] = settings.Web.secret_key
                 flask_app.config["DEBUG"] = settings.debug
                 flask_app.config["TESTING"] = False
             except c.EXC_OS_RUNTIME_TYPE as exc:
-                return r[tuple[flask.Flask | FastAPI, str, str]].fail(
+                return r[tuple[t.Web.FrameworkApp, str, str]].fail(
                     f"{fastapi_error}; Failed to create Flask application: {exc}"
                 )
 
-            return r[tuple[flask.Flask | FastAPI, str, str]].ok((
+            return r[tuple[t.Web.FrameworkApp, str, str]].ok((
                 flask_app,
                 c.Web.FRAMEWORK_FLASK,
                 c.Web.FRAMEWORK_INTERFACE_WSGI,
@@ -151,103 +218,490 @@ class FlextWebUtilities(u):
 
         @staticmethod
         def _configure_framework_app_middleware(
-            app_instance: flask.Flask | FastAPI,
+            app_instance: t.Web.FrameworkApp, app_id: str = c.Web.METRICS_UNKNOWN_APP
         ) -> None:
-            if isinstance(app_instance, FastAPI):
+            """Time every request and record its status into ``request_metrics``.
+
+            Routes are labelled with their template (``/items/{item_id}``) so
+            the per-route histograms stay bounded; unmatched paths share one
+            label. The hooks are shared by every app and read the app id
+            stored on the app, so attaching them allocates nothing per app.
+            """
+            web = FlextWebUtilities.Web
+            if isinstance(app_instance, fw.FastAPI):
+                if app_id != c.Web.METRICS_UNKNOWN_APP:
+                    app_instance.state.flext_web_app_id = app_id
+                app_instance.middleware("http")(web.fastapi_metrics_middleware)
+            else:
+                # app_instance is flask.Flask (from the if/elif chain above)
+                if app_id != c.Web.METRICS_UNKNOWN_APP:
+                    app_instance.config[c.Web.FLASK_APP_ID_CONFIG_KEY] = app_id
+                app_instance.before_request(web.flask_metrics_start)
+                app_instance.after_request(web.flask_metrics_finish)
 
-                async def fastapi_metrics_middleware(
-                    request: StarletteRequest,
-                    call_next: Callable[
-                        [StarletteRequest], Awaitable[StarletteResponse]
-                    ],
-                ) -> StarletteResponse:
-                    response = await call_next(request)
-                    FlextWebUtilities.Web.record_request_metric(
-                        c.Web.ResponseStatus.SUCCESS.value, 0
+        @classmethod
+        def _configure_framework_app_routes(
+            cls, app_instance: t.Web.FrameworkApp, app_id: str
+        ) -> None:
+            """Attach the protocol routes, built once per framework, to an app.
+
+            FastAPI apps reference the ``APIRoute`` objects of one shared
+            router, so endpoint signatures and response models are analysed
+            once per process instead of once per app; Flask apps register
+            the shared view functions. The per-app state is the app id and
+            its pre-encoded ``/protocol/health`` body.
+            """
+            if isinstance(app_instance, fw.FastAPI):
+                app_instance.state.flext_web_app_id = app_id
+                app_instance.state.flext_web_health = cls.HealthPayload(
+                    cls.protocol_health_fields(c.Web.SERVICE_NAME, app_id)
+                )
+                app_instance.router.routes.extend(cls.protocol_router().routes)
+            else:
+                # app_instance is flask.Flask (from the if/elif chain above)
+                app_instance.config[c.Web.FLASK_APP_ID_CONFIG_KEY] = app_id
+                app_instance.config[c.Web.FLASK_HEALTH_CONFIG_KEY] = cls.HealthPayload(
+                    cls.protocol_health_fields(c.Web.SERVICE_NAME_FLASK, app_id)
+                )
+                app_instance.add_url_rule(
+                    "/protocol/health", "flask_health", cls.flask_health
+                )
+                app_instance.add_url_rule(
+                    c.Web.METRICS_ROUTE, "flask_metrics", cls.flask_metrics
+                )
+
+        @classmethod
+        def _protocol_router(cls) -> fw.APIRouter:
+            """Return the shared FastAPI router of the protocol routes."""
+            router = cls.shared_routers.get(c.Web.FRAMEWORK_FASTAPI)
+            if router is None:
+                router = fw.APIRouter()
+                router.add_api_route(
+                    "/protocol/health", cls.fastapi_health, methods=["GET"]
+                )
+                router.add_api_route(
+                    c.Web.METRICS_ROUTE,
+                    cls.fastapi_metrics,
+                    methods=["GET"],
+                    include_in_schema=False,
+                )
+                router = cls.shared_routers.setdefault(c.Web.FRAMEWORK_FASTAPI, router)
+            return router
+
+        @staticmethod
+        def _fastapi_health(request: fw.StarletteRequest) -> fw.StarletteResponse:
+            payload = getattr(request.app.state, "flext_web_health", None)
+            if not isinstance(payload, FlextWebUtilities.Web.HealthPayload):
+                payload = FlextWebUtilities.Web.HealthPayload(
+                    FlextWebUtilities.Web.protocol_health_fields(
+                        c.Web.SERVICE_NAME, c.Web.METRICS_UNKNOWN_APP
                     )
-                    return response
+                )
+            return fw.StarletteResponse(
+                content=payload.body(), media_type=c.Web.HTTP_CONTENT_TYPE_JSON
+            )
 
-                app_instance.middleware("http")(fastapi_metrics_middleware)
+        @staticmethod
+        def _fastapi_metrics() -> fw.StarletteResponse:
+            return fw.StarletteResponse(
+                content=FlextWebUtilities.Web.metrics_exposition(),
+                media_type=c.Web.METRICS_CONTENT_TYPE,
+            )
 
-            else:
-                # app_instance is flask.Flask (from the if/elif chain above)
-                def flask_metrics_middleware() -> None:
-                    FlextWebUtilities.Web.record_request_metric(
-                        c.Web.ResponseStatus.SUCCESS.value, 0
+        @staticmethod
+        async def _fastapi_metrics_middleware(
+            request: fw.StarletteRequest,
+            call_next: Callable[[fw.StarletteRequest], Awaitable[fw.StarletteResponse]],
+        ) -> fw.StarletteResponse:
+            started = perf_counter_ns()
+            status_code = c.Web.StatusCode.INTERNAL_SERVER_ERROR.value
+            try:
+                response = await call_next(request)
+                status_code = response.status_code
+            finally:
+                route = request.scope.get("route")
+                FlextWebUtilities.Web.record_request_metric(
+                    getattr(
+                        request.app.state, "flext_web_app_id", c.Web.METRICS_UNKNOWN_APP
+                    ),
+                    getattr(route, "path", c.Web.METRICS_UNMATCHED_ROUTE),
+                    status_code,
+                    perf_counter_ns() - started,
+                )
+            return response
+
+        @staticmethod
+        def _flask_app_id() -> str:
+            app_id = fw.flask_current_app.config.get(c.Web.FLASK_APP_ID_CONFIG_KEY)
+            return app_id if isinstance(app_id, str) else c.Web.METRICS_UNKNOWN_APP
+
+        @staticmethod
+        def _flask_health() -> fw.FlaskResponse:
+            payload = fw.flask_current_app.config.get(c.Web.FLASK_HEALTH_CONFIG_KEY)
+            if not isinstance(payload, FlextWebUtilities.Web.HealthPayload):
+                payload = FlextWebUtilities.Web.HealthPayload(
+                    FlextWebUtilities.Web.protocol_health_fields(
+                        c.Web.SERVICE_NAME_FLASK, FlextWebUtilities.Web.flask_app_id()
                     )
+                )
+            return fw.FlaskResponse(
+                payload.body(), content_type=c.Web.HTTP_CONTENT_TYPE_JSON
+            )
 
-                app_instance.before_request(flask_metrics_middleware)
+        @staticmethod
+        def _flask_metrics() -> fw.FlaskResponse:
+            return fw.FlaskResponse(
+                FlextWebUtilities.Web.metrics_exposition(),
+                content_type=c.Web.METRICS_CONTENT_TYPE,
+            )
 
         @staticmethod
-        def _configure_framework_app_routes(
-            app_instance: flask.Flask | FastAPI, app_id: str
+        def _flask_metrics_start() -> None:
+            fw.flask_g.flext_web_started_ns = perf_counter_ns()
+
+        @staticmethod
+        def _flask_metrics_finish(response: fw.FlaskResponse) -> fw.FlaskResponse:
+            started = fw.flask_g.get("flext_web_started_ns")
+            if isinstance(started, int):
+                rule = fw.flask_request.url_rule
+                FlextWebUtilities.Web.record_request_metric(
+                    FlextWebUtilities.Web.flask_app_id(),
+                    rule.rule if rule is not None else c.Web.METRICS_UNMATCHED_ROUTE,
+                    response.status_code,
+                    perf_counter_ns() - started,
+                )
+            return response
+
+        @classmethod
+        def _configure_openapi_routes(
+            cls,
+            app_instance: fw.FastAPI,
+            openapi_url: str = c.Web.API_OPENAPI_URL,
+            docs_url: str = c.Web.API_DOCS_URL,
+            redoc_url: str = c.Web.API_REDOC_URL,
         ) -> None:
-            if isinstance(app_instance, FastAPI):
+            """Serve the OpenAPI document and docs pages from shared routes.
+
+            Replaces FastAPI's own docs routes, so the app must be built with
+            ``openapi_url=None``. The routes are plain Starlette routes shared
+            by every app with the same URLs; the document is served from
+            ``openapi_document`` with an ``ETag`` and answers a matching
+            ``If-None-Match`` with ``304``.
+            """
+            key = f"{c.Web.FRAMEWORK_FASTAPI}:{openapi_url}:{docs_url}:{redoc_url}"
+            router = cls.shared_routers.get(key)
+            if router is None:
+
+                def swagger_ui(request: fw.StarletteRequest) -> fw.StarletteResponse:
+                    return fw.get_swagger_ui_html(
+                        openapi_url=request.scope.get("root_path", "") + openapi_url,
+                        title=f"{request.app.title} - Swagger UI",
+                    )
 
-                def fastapi_health() -> t.Web.ResponseDict:
-                    return {
-                        "status": c.Web.ResponseStatus.HEALTHY.value,
-                        "service": c.Web.SERVICE_NAME,
-                        "app_id": app_id,
-                    }
+                def redoc(request: fw.StarletteRequest) -> fw.StarletteResponse:
+                    return fw.get_redoc_html(
+                        openapi_url=request.scope.get("root_path", "") + openapi_url,
+                        title=f"{request.app.title} - ReDoc",
+                    )
 
-                app_instance.add_api_route(
-                    "/protocol/health", fastapi_health, methods=["GET"]
+                router = fw.APIRouter()
+                router.add_route(
+                    openapi_url, cls.openapi_response, include_in_schema=False
                 )
+                router.add_route(docs_url, swagger_ui, include_in_schema=False)
+                router.add_route(redoc_url, redoc, include_in_schema=False)
+                router = cls.shared_routers.setdefault(key, router)
+            app_instance.router.routes.extend(router.routes)
+
+        @staticmethod
+        def _openapi_document(app_instance: fw.FastAPI) -> tuple[bytes, str]:
+            """Return the serialized OpenAPI document of an app and its ETag.
+
+            ``paths``, ``components`` and the app-level ``servers``, ``tags``,
+            ``webhooks`` and ``externalDocs`` are generated and serialized once
+            per shape and shared by every app with the same shape; only the
+            small ``info`` header is encoded per request. The shape covers every
+            ``c.Web.API_OPENAPI_ROUTE_FIELDS`` attribute plus the endpoint code,
+            so routes differing in response model, dependencies, tags, summary
+            or status code never share a document. The shape key is kept per
+            app in ``openapi_keys`` and rebuilt only when its routes or
+            app-level fields change. Apps overriding ``openapi`` are served
+            their own generator's document.
+            """
+            if (
+                "openapi" in vars(app_instance)
+                or type(app_instance).openapi is not fw.FastAPI.openapi
+            ):
+                document = json.dumps(
+                    app_instance.openapi(), separators=(",", ":")
+                ).encode()
+                return (document, f'"{blake2b(document, digest_size=8).hexdigest()}"')
+
+            def frozen(value: object) -> Hashable:
+                match value:
+                    case Mapping():
+                        return tuple(
+                            sorted(
+                                (
+                                    (repr(item), frozen(entry))
+                                    for item, entry in value.items()
+                                ),
+                                key=repr,
+                            )
+                        )
+                    case set() | frozenset():
+                        return tuple(sorted((frozen(item) for item in value), key=repr))
+                    case list() | tuple():
+                        return tuple(frozen(item) for item in value)
+                    case Hashable():
+                        return value
+                    case _:
+                        return repr(value)
+
+            routes = app_instance.routes
+            webhooks = app_instance.webhooks.routes
+            layout: tuple[object, ...] = (
+                app_instance.openapi_version,
+                app_instance.servers,
+                app_instance.openapi_tags,
+                app_instance.openapi_external_docs,
+                app_instance.separate_input_output_schemas,
+                tuple(routes),
+                tuple(webhooks),
+            )
+            cached = FlextWebUtilities.Web.openapi_keys.get(app_instance)
+            if cached is not None and cached[0] == layout:
+                key = cached[1]
             else:
-                # app_instance is flask.Flask (from the if/elif chain above)
-                def flask_health() -> t.Web.ResponseDict:
-                    return {
-                        "status": c.Web.ResponseStatus.HEALTHY.value,
-                        "service": c.Web.SERVICE_NAME_FLASK,
-                        "app_id": app_id,
-                    }
+                key = (
+                    frozen(layout[:5]),
+                    *(
+                        tuple(
+                            (
+                                route.endpoint.__code__,
+                                *(
+                                    frozen(getattr(route, field, None))
+                                    for field in c.Web.API_OPENAPI_ROUTE_FIELDS
+                                ),
+                            )
+                            for route in group
+                            if isinstance(route, fw.APIRoute)
+                        )
+                        for group in (routes, webhooks)
+                    ),
+                )
+                FlextWebUtilities.Web.openapi_keys[app_instance] = (layout, key)
+            documents = FlextWebUtilities.Web.openapi_documents
+            shared = documents.get(key)
+            if shared is None:
+                schema = fw.get_openapi(
+                    title="",
+                    version="",
+                    openapi_version=app_instance.openapi_version,
+                    routes=routes,
+                    webhooks=webhooks,
+                    tags=app_instance.openapi_tags,
+                    servers=app_instance.servers,
+                    separate_input_output_schemas=(
+                        app_instance.separate_input_output_schemas
+                    ),
+                    external_docs=app_instance.openapi_external_docs,
+                )
+                body = {
+                    field: value
+                    for field, value in schema.items()
+                    if field not in {"openapi", "info"}
+                }
+                fragment = json.dumps(body, separators=(",", ":")).encode()[1:-1]
+                shared = documents.setdefault(
+                    key, (fragment, blake2b(fragment, digest_size=8).hexdigest())
+                )
+            fragment, digest = shared
+            optional: tuple[tuple[str, object], ...] = (
+                ("summary", app_instance.summary),
+                ("description", app_instance.description),
+                ("termsOfService", app_instance.terms_of_service),
+                ("contact", app_instance.contact),
+                ("license", app_instance.license_info),
+            )
+            info: dict[str, object] = {
+                "title": app_instance.title,
+                "version": app_instance.version,
+                **{field: value for field, value in optional if value},
+            }
+            head = json.dumps(
+                {"openapi": app_instance.openapi_version, "info": info},
+                separators=(",", ":"),
+            ).encode()[:-1]
+            document = head + b"," + fragment + b"}" if fragment else head + b"}"
+            return (document, f'"{digest}-{blake2b(head, digest_size=4).hexdigest()}"')
 
-                app_instance.add_url_rule(
-                    "/protocol/health", "flask_health", flask_health
+        @staticmethod
+        def _openapi_response(request: fw.StarletteRequest) -> fw.StarletteResponse:
+            document, etag = FlextWebUtilities.Web.openapi_document(request.app)
+            if request.headers.get("if-none-match") == etag:
+                return fw.StarletteResponse(
+                    status_code=c.Web.StatusCode.NOT_MODIFIED.value,
+                    headers={"ETag": etag},
+                )
+            return fw.StarletteResponse(
+                content=document,
+                media_type=c.Web.HTTP_CONTENT_TYPE_JSON,
+                headers={"ETag": etag},
+            )
+
+        @staticmethod
+        def _publish_health_status(app_id: str, status: str) -> None:
+            """Reflect the lifecycle ``status`` of ``app_id`` in its health body.
+
+            ``running`` reads ``healthy``, ``error`` reads ``error`` and every
+            other status reads ``degraded``; the body is re-encoded only when
+            that changes.
+            """
+            match FlextWebUtilities.Web.framework_instances.get(app_id):
+                case None:
+                    return
+                case fw.FastAPI() as app_instance:
+                    payload = getattr(app_instance.state, "flext_web_health", None)
+                case app_instance:
+                    payload = app_instance.config.get(c.Web.FLASK_HEALTH_CONFIG_KEY)
+            if isinstance(payload, FlextWebUtilities.Web.HealthPayload):
+                payload.update(
+                    status=c.Web.HEALTH_STATUS_BY_APP_STATUS.get(
+                        status, c.Web.ResponseStatus.DEGRADED.value
+                    )
                 )
 
         @staticmethod
-        def _record_request_metric(status: str | None, response_time_ms: int) -> None:
-            request_count_value = FlextWebUtilities.Web.web_metrics.get("requests", 0)
-            request_count = (
-                request_count_value if isinstance(request_count_value, int) else 0
+        def _protocol_health_fields(service: str, app_id: str) -> dict[str, str]:
+            return {
+                "status": c.Web.ResponseStatus.HEALTHY.value,
+                "service": service,
+                "app_id": app_id,
+            }
+
+        @staticmethod
+        def _metrics_exposition() -> bytes:
+            """Return the OpenMetrics exposition, re-rendered at most once per TTL."""
+            return FlextWebUtilities.Web.metrics_cache.fetch(
+                FlextWebUtilities.Web.render_openmetrics,
+                FlextWebSettings.fetch_global().Web.metrics_cache_ttl,
             )
-            next_count = request_count + 1
-            FlextWebUtilities.Web.web_metrics["requests"] = next_count
-            avg_value = FlextWebUtilities.Web.web_metrics.get("avg_response_time_ms", 0)
-            previous_avg = avg_value if isinstance(avg_value, int) else 0
-            average_response_time_ms = (
-                previous_avg * request_count + response_time_ms
-            ) / next_count
-            FlextWebUtilities.Web.web_metrics["avg_response_time_ms"] = int(
-                average_response_time_ms
+
+        @staticmethod
+        def _render_openmetrics() -> bytes:
+            """Render request, registry and runtime metrics as OpenMetrics text."""
+            web = FlextWebUtilities.Web
+            writer = web.OpenMetricsWriter()
+            requests = [
+                ({"app": app_id, "route": route}, snapshot)
+                for app_id, route, snapshot in web.request_metrics.snapshots()
+            ]
+            writer.counter(
+                "flext_web_http_requests",
+                "HTTP requests handled.",
+                ((labels, snapshot.total) for labels, snapshot in requests),
             )
-            if (
-                isinstance(status, str)
-                and status.lower() == c.Web.ResponseStatus.ERROR.value
-            ):
-                error_count_value = FlextWebUtilities.Web.web_metrics.get("errors", 0)
-                error_count = (
-                    error_count_value if isinstance(error_count_value, int) else 0
-                )
-                FlextWebUtilities.Web.web_metrics["errors"] = error_count + 1
+            writer.counter(
+                "flext_web_http_request_errors",
+                "HTTP requests answered with an error status.",
+                ((labels, snapshot.errors) for labels, snapshot in requests),
+            )
+            writer.histogram(
+                "flext_web_http_request_duration_seconds",
+                "HTTP request latency.",
+                requests,
+            )
+            writer.gauge(
+                "flext_web_apps",
+                "Registered applications by lifecycle status.",
+                (
+                    (
+                        {"status": status.value},
+                        web.apps_registry.count("status", status),
+                    )
+                    for status in c.Web.Status
+                ),
+            )
+            runtimes = tuple(web.app_runtimes.values())
+            writer.gauge(
+                "flext_web_runtime_threads",
+                "Live application runtime threads.",
+                [
+                    (
+                        {},
+                        sum(
+                            1
+                            for runtime in runtimes
+                            if runtime.thread is not None and runtime.thread.is_alive()
+                        ),
+                    )
+                ],
+            )
+            writer.gauge(
+                "flext_web_runtime_tasks",
+                "Live application runtime event-loop tasks.",
+                [
+                    (
+                        {},
+                        sum(
+                            1
+                            for runtime in runtimes
+                            if runtime.task is not None and not runtime.task.done()
+                        ),
+                    )
+                ],
+            )
+            operations = [
+                ({"app": app_id, "operation": operation}, snapshot)
+                for app_id, operation, snapshot in web.runtime_metrics.snapshots()
+            ]
+            writer.counter(
+                "flext_web_runtime_operation_errors",
+                "Failed application runtime start/stop operations.",
+                ((labels, snapshot.errors) for labels, snapshot in operations),
+            )
+            writer.histogram(
+                "flext_web_runtime_operation_duration_seconds",
+                "Application runtime start/stop duration.",
+                operations,
+            )
+            return writer.render()
+
+        @staticmethod
+        def _record_request_metric(
+            app_id: str, route: str, status_code: int, elapsed_ns: int
+        ) -> None:
+            FlextWebUtilities.Web.request_metrics.record(
+                app_id, route, status_code, elapsed_ns
+            )
+
+        @staticmethod
+        def _await_runtime_ready(thread: Thread, ready: Callable[[], bool]) -> bool:
+            """Wait until ``ready()`` holds, the thread exits or the deadline passes.
+
+            Polls through ``thread.join`` so a runtime that dies while binding
+            is detected immediately instead of after a fixed sleep.
+            """
+            timeout = FlextWebSettings.fetch_global().Web.startup_timeout
+            deadline = monotonic() + timeout
+            while not ready():
+                remaining = deadline - monotonic()
+                if remaining <= 0 or not thread.is_alive():
+                    return False
+                thread.join(min(c.Web.RUNTIME_READY_POLL_SECONDS, remaining))
+            return True
 
         @staticmethod
         def _start_uvicorn_runtime(
-            app_id: str, app_instance: FastAPI, host: str, port: int
+            app_id: str, app_instance: fw.FastAPI, host: str, port: int
         ) -> p.Result[m.Web.AppRuntimeInfo]:
-            """Start an ASGI runtime using uvicorn."""
+            """Start an ASGI runtime using uvicorn and wait for ``server.started``."""
             app_runtime_model = FlextWebUtilities.Web.app_runtime_info_model()
             try:
-                settings = uvicorn.Config(
-                    app=app_instance,
-                    host=host,
-                    port=port,
-                    log_level="warning",
-                    ws="none",
-                )
-                server = uvicorn.Server(settings)
+                server = fw.UvicornServer(
+                    FlextWebUtilities.Web.uvicorn_config(app_instance, host, port)
+                )
             except c.EXC_OS_RUNTIME_TYPE as exc:
                 return r[app_runtime_model].fail(
                     f"Failed to start ASGI runtime for app {app_id}: {exc}"
@@ -257,30 +711,123 @@ class FlextWebUtilities(u):
                     target=server.run, daemon=True, name=f"flext-web-{app_id}"
                 )
                 thread.start()
-                sleep(0.05)
-                if thread.is_alive():
-                    runtime_info = app_runtime_model(
+            except c.EXC_OS_RUNTIME_TYPE as exc:
+                return r[app_runtime_model].fail(
+                    f"Failed to start ASGI runtime for app {app_id}: {exc}"
+                )
+            if FlextWebUtilities.Web.await_runtime_ready(
+                thread, lambda: server.started
+            ):
+                return r[app_runtime_model].ok(
+                    app_runtime_model(
                         runner=c.Web.FRAMEWORK_RUNNER_UVICORN,
                         server=server,
                         thread=thread,
                     )
-                    return r[app_runtime_model].ok(runtime_info)
+                )
+            if not thread.is_alive():
                 return r[app_runtime_model].fail(
-                    f"ASGI runtime exited immediately for app: {app_id}"
+                    f"ASGI runtime exited before accepting connections for app: {app_id}"
                 )
+            server.should_exit = True
+            thread.join(c.Web.RUNTIME_READY_POLL_SECONDS)
+            return r[app_runtime_model].fail(
+                f"ASGI runtime did not become ready in time for app: {app_id}"
+            )
+
+        @staticmethod
+        async def _start_uvicorn_task_runtime(
+            app_id: str, app_instance: fw.FastAPI, host: str, port: int
+        ) -> p.Result[m.Web.AppRuntimeInfo]:
+            """Serve an ASGI app as a task on the running loop and await readiness.
+
+            Readiness is awaited on the server's ``ready`` event, so the loop
+            keeps serving other tasks while the sockets bind. A task that
+            ends while still registered, rather than through ``stop_app``,
+            drops its runtime entry and moves the app to ``stopped`` after a
+            clean exit or ``error`` after a crash or cancellation.
+            """
+            web = FlextWebUtilities.Web
+            app_runtime_model = web.app_runtime_info_model()
+
+            def settle_exit(finished: asyncio.Task[None]) -> None:
+                crashed = finished.cancelled() or finished.exception() is not None
+                with web.apps_registry.lock_for(app_id):
+                    runtime = web.app_runtimes.get(app_id)
+                    if runtime is None or runtime.task is not finished:
+                        return
+                    _ = web.app_runtimes.pop(app_id)
+                    _ = web.WebRepository.compare_and_set_status(
+                        app_id,
+                        {c.Web.Status.RUNNING.value},
+                        c.Web.Status.ERROR.value
+                        if crashed
+                        else c.Web.Status.STOPPED.value,
+                    )
+
+            try:
+                server = fw.TaskServer(web.uvicorn_config(app_instance, host, port))
+                task = asyncio.create_task(server.serve(), name=f"flext-web-{app_id}")
             except c.EXC_OS_RUNTIME_TYPE as exc:
                 return r[app_runtime_model].fail(
                     f"Failed to start ASGI runtime for app {app_id}: {exc}"
                 )
+            task.add_done_callback(settle_exit)
+            ready = asyncio.create_task(server.ready.wait())
+            _ = await asyncio.wait(
+                {ready, task},
+                timeout=FlextWebSettings.fetch_global().Web.startup_timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            _ = ready.cancel()
+            if server.started:
+                return r[app_runtime_model].ok(
+                    app_runtime_model(
+                        runner=c.Web.FRAMEWORK_RUNNER_UVICORN_TASK,
+                        server=server,
+                        task=task,
+                    )
+                )
+            if task.done():
+                return r[app_runtime_model].fail(
+                    f"ASGI runtime exited before accepting connections for app: {app_id}"
+                )
+            server.should_exit = True
+            return r[app_runtime_model].fail(
+                f"ASGI runtime did not become ready in time for app: {app_id}"
+            )
 
         @staticmethod
         def _start_werkzeug_runtime(
-            app_id: str, app_instance: flask.Flask, host: str, port: int
+            app_id: str, app_instance: fw.Flask, host: str, port: int
         ) -> p.Result[m.Web.AppRuntimeInfo]:
-            """Start a WSGI runtime using werkzeug."""
+            """Start a WSGI runtime and wait for its serving loop to begin.
+
+            ``settings.Web.wsgi_runner`` selects the single-threaded
+            ``make_server`` runner or the thread-pool backed ``wsgi-pool``.
+            Both bind and listen synchronously, so bind failures surface here;
+            the serving thread then signals once it enters ``serve_forever``.
+            """
             app_runtime_model = FlextWebUtilities.Web.app_runtime_info_model()
+            web_settings = FlextWebSettings.fetch_global().Web
+            runner = (
+                c.Web.FRAMEWORK_RUNNER_WSGI_POOL
+                if web_settings.wsgi_runner == c.Web.FRAMEWORK_RUNNER_WSGI_POOL
+                else c.Web.FRAMEWORK_RUNNER_WERKZEUG
+            )
             try:
-                wsgi_server: WSGIServer = make_server(host, port, app_instance)
+                wsgi_server: WSGIServer | fw.PooledWSGIServer = (
+                    fw.PooledWSGIServer.listen(
+                        host,
+                        port,
+                        app_instance,
+                        workers=web_settings.wsgi_workers,
+                        backlog=web_settings.wsgi_backlog,
+                        keep_alive=web_settings.wsgi_keep_alive,
+                    )
+                    if runner == c.Web.FRAMEWORK_RUNNER_WSGI_POOL
+                    else make_server(host, port, app_instance)
+                )
             except (
                 RuntimeError,
                 OSError,
@@ -291,23 +838,23 @@ class FlextWebUtilities(u):
                 return r[app_runtime_model].fail(
                     f"Failed to start WSGI runtime for app {app_id}: {exc}"
                 )
+            serving = Event()
+
+            def serve() -> None:
+                serving.set()
+                wsgi_server.serve_forever()
+
             try:
-                thread = Thread(
-                    target=wsgi_server.serve_forever,
-                    daemon=True,
-                    name=f"flext-web-{app_id}",
-                )
+                thread = Thread(target=serve, daemon=True, name=f"flext-web-{app_id}")
                 thread.start()
-                sleep(0.05)
-                if thread.is_alive():
+                if FlextWebUtilities.Web.await_runtime_ready(thread, serving.is_set):
                     runtime_info = app_runtime_model(
-                        runner=c.Web.FRAMEWORK_RUNNER_WERKZEUG,
-                        server=wsgi_server,
-                        thread=thread,
+                        runner=runner, server=wsgi_server, thread=thread
                     )
                     return r[app_runtime_model].ok(runtime_info)
+                wsgi_server.server_close()
                 return r[app_runtime_model].fail(
-                    f"WSGI runtime exited immediately for app: {app_id}"
+                    f"WSGI runtime did not start serving for app: {app_id}"
                 )
             except (
                 RuntimeError,
@@ -324,68 +871,210 @@ class FlextWebUtilities(u):
         def _start_app_runtime(
             cls,
             app_id: str,
-            app_data: t.Web.ResponseDict,
-            app_instance: flask.Flask | FastAPI,
+            app_data: t.Web.AppRecord,
+            app_instance: t.Web.FrameworkApp,
         ) -> p.Result[m.Web.AppRuntimeInfo]:
             app_runtime_model = cls.app_runtime_info_model()
-            host = app_data.get("host")
-            port = app_data.get("port")
-            interface = app_data.get("interface")
-            if (
-                not isinstance(host, str)
-                or not isinstance(port, int)
-                or not isinstance(interface, str)
-            ):
-                return r[app_runtime_model].fail(
-                    f"Invalid runtime configuration for app: {app_id}"
-                )
+            target = cls.runtime_target(app_id, app_data)
+            if target.failure:
+                return r[app_runtime_model].fail(target.error)
+            host, port, interface = target.value
             if interface == c.Web.FRAMEWORK_INTERFACE_ASGI:
-                if isinstance(app_instance, FastAPI):
+                if isinstance(app_instance, fw.FastAPI):
                     return cls._start_uvicorn_runtime(app_id, app_instance, host, port)
                 return r[app_runtime_model].fail(
                     f"ASGI runtime requires a FastAPI app: {app_id}"
                 )
             if interface == c.Web.FRAMEWORK_INTERFACE_WSGI and isinstance(
-                app_instance, flask.Flask
+                app_instance, fw.Flask
             ):
                 return cls._start_werkzeug_runtime(app_id, app_instance, host, port)
             return r[app_runtime_model].fail(
                 f"Unsupported app interface for runtime start: {interface}"
             )
 
+        @classmethod
+        async def _start_app_runtime_async(
+            cls,
+            app_id: str,
+            app_data: t.Web.AppRecord,
+            app_instance: t.Web.FrameworkApp,
+        ) -> p.Result[m.Web.AppRuntimeInfo]:
+            """Start a runtime without blocking the running event loop.
+
+            ASGI apps are served as tasks on that loop; WSGI servers need a
+            thread, so their blocking start runs in the default executor.
+            """
+            target = cls.runtime_target(app_id, app_data)
+            if target.failure:
+                return r[cls.app_runtime_info_model()].fail(target.error)
+            host, port, interface = target.value
+            if interface == c.Web.FRAMEWORK_INTERFACE_ASGI and isinstance(
+                app_instance, fw.FastAPI
+            ):
+                return await cls._start_uvicorn_task_runtime(
+                    app_id, app_instance, host, port
+                )
+            return await asyncio.to_thread(
+                cls.start_app_runtime, app_id, app_data, app_instance
+            )
+
         @staticmethod
-        def _stop_runner(
-            runner: str, server: uvicorn.Server | WSGIServer, app_id: str
-        ) -> p.Result[bool]:
+        def _runtime_target(
+            app_id: str, app_data: t.Web.AppRecord
+        ) -> p.Result[tuple[str, int, str]]:
+            """Return the ``(host, port, interface)`` a runtime binds to."""
+            host = app_data.get("host")
+            port = app_data.get("port")
+            interface = app_data.get("interface")
+            if (
+                not isinstance(host, str)
+                or not isinstance(port, int)
+                or not isinstance(interface, str)
+            ):
+                return r[tuple[str, int, str]].fail(
+                    f"Invalid runtime configuration for app: {app_id}"
+                )
+            return r[tuple[str, int, str]].ok((host, port, interface))
+
+        @staticmethod
+        def _uvicorn_config(
+            app_instance: fw.FastAPI, host: str, port: int
+        ) -> fw.UvicornConfig:
+            """Return the uvicorn configuration shared by every ASGI runtime."""
+            return fw.UvicornConfig(
+                app=app_instance,
+                host=host,
+                port=port,
+                log_level="warning",
+                ws="none",
+                # uvicorn takes whole seconds; 0 cancels in-flight requests
+                # at once, like the WSGI runners' zero drain.
+                timeout_graceful_shutdown=ceil(
+                    FlextWebSettings.fetch_global().Web.drain_timeout
+                ),
+            )
+
+        @staticmethod
+        def _stop_runner(runner: str, server: object, app_id: str) -> p.Result[bool]:
             """Stop the underlying server runner."""
             match runner:
-                case c.Web.FRAMEWORK_RUNNER_UVICORN:
-                    if not isinstance(server, uvicorn.Server):
+                case (
+                    c.Web.FRAMEWORK_RUNNER_UVICORN | c.Web.FRAMEWORK_RUNNER_UVICORN_TASK
+                ):
+                    if not isinstance(server, fw.UvicornServer):
                         return r[bool].fail(
                             f"Missing ASGI server instance for app: {app_id}"
                         )
                     server.should_exit = True
                 case c.Web.FRAMEWORK_RUNNER_WERKZEUG:
-                    if not isinstance(server, BaseWSGIServer):
+                    if not isinstance(server, WSGIServer):
                         return r[bool].fail(
                             f"Missing WSGI server instance for app: {app_id}"
                         )
                     server.shutdown()
                     server.server_close()
+                case c.Web.FRAMEWORK_RUNNER_WSGI_POOL:
+                    if not isinstance(server, fw.PooledWSGIServer):
+                        return r[bool].fail(
+                            f"Missing WSGI pool server instance for app: {app_id}"
+                        )
+                    server.shutdown()
+                    _ = server.drain(FlextWebSettings.fetch_global().Web.drain_timeout)
+                    server.server_close()
                 case _:
                     return r[bool].fail(f"Unsupported runtime runner for app: {app_id}")
             return r[bool].ok(True)
 
+        @classmethod
+        def _serve_app_on_socket(cls, app_id: str, listener: socket) -> p.Result[bool]:
+            """Serve a registered app on an inherited listener until shutdown.
+
+            Blocks the calling thread: this is the body of a worker process
+            spawned by ``WorkerSupervisor``, which owns the bound socket.
+            SIGTERM drains in-flight requests for up to ``drain_timeout``
+            before the worker exits, on both the uvicorn and WSGI paths.
+            """
+            app_instance = cls.framework_instances.get(app_id)
+            web_settings = FlextWebSettings.fetch_global().Web
+            match app_instance:
+                case fw.FastAPI():
+                    config = fw.UvicornConfig(
+                        app=app_instance,
+                        log_level="warning",
+                        ws="none",
+                        timeout_graceful_shutdown=ceil(web_settings.drain_timeout),
+                    )
+
+                    def serve() -> None:
+                        fw.UvicornServer(config).run(sockets=[listener])
+
+                case fw.Flask():
+                    host, port = listener.getsockname()[:2]
+                    wsgi_app = app_instance
+
+                    def serve() -> None:
+                        server = fw.PooledWSGIServer(
+                            host,
+                            port,
+                            wsgi_app,
+                            workers=web_settings.wsgi_workers,
+                            keep_alive=web_settings.wsgi_keep_alive,
+                            fd=listener.fileno(),
+                        )
+                        # Like uvicorn, SIGINT/SIGTERM stop accepting and drain
+                        # in-flight requests; ``shutdown`` blocks until the
+                        # serve loop exits, so it cannot run in the handler.
+                        handlers = (
+                            {
+                                signum: signal.signal(
+                                    signum,
+                                    lambda *_: Thread(
+                                        target=server.shutdown, daemon=True
+                                    ).start(),
+                                )
+                                for signum in (signal.SIGINT, signal.SIGTERM)
+                            }
+                            if current_thread() is main_thread()
+                            else {}
+                        )
+                        try:
+                            server.serve_forever()
+                            _ = server.drain(web_settings.drain_timeout)
+                        finally:
+                            for signum, handler in handlers.items():
+                                _ = signal.signal(signum, handler)
+                            server.server_close()
+
+                case _:
+                    return e.fail_not_found(
+                        "Application instance", app_id, result_type=r[bool]
+                    )
+            try:
+                serve()
+            except c.EXC_OS_RUNTIME_TYPE as exc:
+                return r[bool].fail(f"Failed to serve app {app_id}: {exc}")
+            return r[bool].ok(True)
+
         @classmethod
         def _stop_app_runtime(
             cls, app_id: str, runtime: m.Web.AppRuntimeInfo
         ) -> p.Result[bool]:
+            """Stop a runtime and join its thread.
+
+            Task runtimes are only signalled: their task finishes on its own
+            loop, which ``stop_app_runtime_async`` awaits instead.
+            """
+            thread = runtime.thread
             try:
                 stop_result = cls._stop_runner(runtime.runner, runtime.server, app_id)
-                if stop_result.failure:
+                if stop_result.failure or thread is None:
                     return stop_result
-                runtime.thread.join(timeout=2.0)
-                if runtime.thread.is_alive():
+                thread.join(
+                    timeout=FlextWebSettings.fetch_global().Web.drain_timeout
+                    + c.Web.RUNTIME_STOP_GRACE_SECONDS
+                )
+                if thread.is_alive():
                     return r[bool].fail(
                         f"Runtime thread did not stop cleanly for app: {app_id}"
                     )
@@ -393,10 +1082,44 @@ class FlextWebUtilities(u):
                 return r[bool].fail(f"Failed to stop app runtime {app_id}: {exc}")
             return r[bool].ok(True)
 
+        @classmethod
+        async def _stop_app_runtime_async(
+            cls, app_id: str, runtime: m.Web.AppRuntimeInfo
+        ) -> p.Result[bool]:
+            """Stop a runtime without blocking the running event loop.
+
+            Task runtimes are signalled and their task awaited for the drain
+            timeout; thread runtimes are joined in the default executor.
+            """
+            task = runtime.task
+            if task is None:
+                return await asyncio.to_thread(cls.stop_app_runtime, app_id, runtime)
+            stop_result = cls._stop_runner(runtime.runner, runtime.server, app_id)
+            if stop_result.failure:
+                return stop_result
+            _ = await asyncio.wait(
+                {task},
+                timeout=FlextWebSettings.fetch_global().Web.drain_timeout
+                + c.Web.RUNTIME_STOP_GRACE_SECONDS,
+            )
+            if not task.done():
+                return r[bool].fail(
+                    f"Runtime task did not stop cleanly for app: {app_id}"
+                )
+            return r[bool].ok(True)
+
         record_request_metric: ClassVar[Callable[..., None]] = _record_request_metric
 
+        metrics_exposition: ClassVar[Callable[[], bytes]] = _metrics_exposition
+
+        render_openmetrics: ClassVar[Callable[[], bytes]] = _render_openmetrics
+
+        await_runtime_ready: ClassVar[Callable[[Thread, Callable[[], bool]], bool]] = (
+            _await_runtime_ready
+        )
+
         create_framework_app: ClassVar[
-            Callable[..., p.Result[tuple[flask.Flask | FastAPI, str, str]]]
+            Callable[..., p.Result[tuple[t.Web.FrameworkApp, str, str]]]
         ] = _create_framework_app
 
         configure_framework_app_routes: ClassVar[Callable[..., None]] = (
@@ -407,19 +1130,81 @@ class FlextWebUtilities(u):
             _configure_framework_app_middleware
         )
 
+        protocol_router: ClassVar[Callable[[], fw.APIRouter]] = _protocol_router
+
+        configure_openapi_routes: ClassVar[Callable[..., None]] = (
+            _configure_openapi_routes
+        )
+
+        openapi_document: ClassVar[Callable[[fw.FastAPI], tuple[bytes, str]]] = (
+            _openapi_document
+        )
+
+        openapi_response: ClassVar[
+            Callable[[fw.StarletteRequest], fw.StarletteResponse]
+        ] = _openapi_response
+
+        fastapi_health: ClassVar[Callable[..., fw.StarletteResponse]] = _fastapi_health
+
+        fastapi_metrics: ClassVar[Callable[[], fw.StarletteResponse]] = _fastapi_metrics
+
+        fastapi_metrics_middleware: ClassVar[
+            Callable[..., Awaitable[fw.StarletteResponse]]
+        ] = _fastapi_metrics_middleware
+
+        flask_app_id: ClassVar[Callable[[], str]] = _flask_app_id
+
+        flask_health: ClassVar[Callable[[], fw.FlaskResponse]] = _flask_health
+
+        flask_metrics: ClassVar[Callable[[], fw.FlaskResponse]] = _flask_metrics
+
+        protocol_health_fields: ClassVar[Callable[[str, str], dict[str, str]]] = (
+            _protocol_health_fields
+        )
+
+        publish_health_status: ClassVar[Callable[[str, str], None]] = (
+            _publish_health_status
+        )
+
+        flask_metrics_start: ClassVar[Callable[[], None]] = _flask_metrics_start
+
+        flask_metrics_finish: ClassVar[
+            Callable[[fw.FlaskResponse], fw.FlaskResponse]
+        ] = _flask_metrics_finish
+
         start_app_runtime: ClassVar[Callable[..., p.Result[m.Web.AppRuntimeInfo]]] = (
             _start_app_runtime
         )
 
         stop_app_runtime: ClassVar[Callable[..., p.Result[bool]]] = _stop_app_runtime
 
+        start_app_runtime_async: ClassVar[
+            Callable[..., Awaitable[p.Result[m.Web.AppRuntimeInfo]]]
+        ] = _start_app_runtime_async
+
+        stop_app_runtime_async: ClassVar[Callable[..., Awaitable[p.Result[bool]]]] = (
+            _stop_app_runtime_async
+        )
+
+        runtime_target: ClassVar[
+            Callable[[str, t.Web.AppRecord], p.Result[tuple[str, int, str]]]
+        ] = _runtime_target
+
+        uvicorn_config: ClassVar[Callable[[fw.FastAPI, str, int], fw.UvicornConfig]] = (
+            _uvicorn_config
+        )
+
+        serve_app_on_socket: ClassVar[Callable[..., p.Result[bool]]] = (
+            _serve_app_on_socket
+        )
+
         class WebAppManager:
             """Protocol for web application lifecycle management."""
 
             @staticmethod
             def create_app(
                 name: str, port: int, host: str
-            ) -> p.Result[t.Web.ResponseDict]:
+            ) -> p.Result[t.Web.AppRecord]:
                 """Create a new web application."""
                 normalized_name = name.strip()
                 normalized_host = host.strip()
@@ -442,18 +1227,14 @@ class FlextWebUtilities(u):
                 ]
                 for failed, msg in validations:
                     if failed:
-                        return r[t.Web.ResponseDict].fail(msg)
-                framework_result = FlextWebUtilities.Web.create_framework_app(
-                    normalized_name
+                        return r[t.Web.AppRecord].fail(msg)
+                app_id = str(uuid4())
+                framework_result = FlextWebUtilities.Web.WebAppManager.framework_app(
+                    normalized_name, app_id
                 )
                 if framework_result.failure:
-                    return r[t.Web.ResponseDict].fail(framework_result.error)
+                    return r[t.Web.AppRecord].fail(framework_result.error)
                 app_instance, framework_name, interface_type = framework_result.value
-                app_id = str(uuid4())
-                FlextWebUtilities.Web.configure_framework_app_routes(
-                    app_instance, app_id
-                )
-                FlextWebUtilities.Web.configure_framework_app_middleware(app_instance)
                 app_data: t.Web.ResponseDict = {
                     "id": app_id,
                     "name": normalized_name,
@@ -464,76 +1245,414 @@ class FlextWebUtilities(u):
                     "framework": framework_name,
                     "interface": interface_type,
                 }
-                FlextWebUtilities.Web.apps_registry[app_id] = app_data
-                FlextWebUtilities.Web.framework_instances[app_id] = app_instance
-                return r[t.Web.ResponseDict].ok(app_data)
+                with FlextWebUtilities.Web.apps_registry.lock_for(app_id):
+                    saved = FlextWebUtilities.Web.WebRepository.save(app_data)
+                    if saved.success:
+                        FlextWebUtilities.Web.framework_instances[app_id] = app_instance
+                return saved
 
             @staticmethod
-            def list_apps() -> p.Result[Sequence[t.Web.ResponseDict]]:
-                """List all web applications."""
-                apps = [
-                    deepcopy(app)
-                    for app in FlextWebUtilities.Web.apps_registry.values()
-                ]
-                return r[Sequence[t.Web.ResponseDict]].ok(apps)
+            def framework_app(
+                name: str, app_id: str
+            ) -> p.Result[tuple[t.Web.FrameworkApp, str, str]]:
+                """Build the framework app of ``app_id`` with routes and middleware."""
+                framework_result = FlextWebUtilities.Web.create_framework_app(name)
+                if framework_result.success:
+                    app_instance = framework_result.value[0]
+                    FlextWebUtilities.Web.configure_framework_app_routes(
+                        app_instance, app_id
+                    )
+                    FlextWebUtilities.Web.configure_framework_app_middleware(
+                        app_instance, app_id
+                    )
+                return framework_result
 
             @staticmethod
-            def start_app(app_id: str) -> p.Result[t.Web.ResponseDict]:
-                """Start a web application."""
-                app_data = FlextWebUtilities.Web.apps_registry.get(app_id)
-                if app_data is None:
-                    return e.fail_not_found(
-                        "Application", app_id, result_type=r[t.Web.ResponseDict]
+            def list_apps() -> p.Result[Sequence[t.Web.AppRecord]]:
+                """List all web applications as read-only snapshots."""
+                return r[Sequence[t.Web.AppRecord]].ok(
+                    FlextWebUtilities.Web.apps_registry.values()
+                )
+
+            @staticmethod
+            def start_app(app_id: str) -> p.Result[t.Web.AppRecord]:
+                """Start a web application.
+
+                The ``stopped -> starting`` compare-and-set claims the app, so
+                concurrent callers fail fast instead of double-starting it.
+                Claim and settle each hold the app's registry stripe lock
+                while its status and runtime entry change together; the
+                blocking bind in between holds no lock.
+                """
+                web = FlextWebUtilities.Web
+                claimed = web.WebAppManager.claim_start(app_id)
+                if claimed.failure:
+                    return r[t.Web.AppRecord].fail(claimed.error)
+                starting, app_instance, previous_status = claimed.value
+                started_ns = perf_counter_ns()
+                return web.WebAppManager.settle_start(
+                    app_id,
+                    web.start_app_runtime(app_id, starting, app_instance),
+                    started_ns,
+                    previous_status,
+                )
+
+            @staticmethod
+            async def astart_app(app_id: str) -> p.Result[t.Web.AppRecord]:
+                """Start a web application without blocking the running loop.
+
+                Same transitions as ``start_app``; ASGI apps are served as
+                tasks on the running event loop instead of one thread each.
+                """
+                web = FlextWebUtilities.Web
+                claimed = web.WebAppManager.claim_start(app_id)
+                if claimed.failure:
+                    return r[t.Web.AppRecord].fail(claimed.error)
+                starting, app_instance, previous_status = claimed.value
+                started_ns = perf_counter_ns()
+                return web.WebAppManager.settle_start(
+                    app_id,
+                    await web.start_app_runtime_async(app_id, starting, app_instance),
+                    started_ns,
+                    previous_status,
+                )
+
+            @staticmethod
+            def claim_start(
+                app_id: str,
+            ) -> p.Result[tuple[t.Web.AppRecord, t.Web.FrameworkApp, str]]:
+                """Move ``app_id`` to ``starting``.
+
+                Returns the new snapshot, the app instance and the status it
+                left, which a failed start restores.
+                """
+                web = FlextWebUtilities.Web
+                with web.apps_registry.lock_for(app_id):
+                    current = web.apps_registry.get(app_id)
+                    starting = web.WebRepository.compare_and_set_status(
+                        app_id, c.Web.STARTABLE_STATUSES, c.Web.Status.STARTING.value
                     )
-                if app_data.get("status") == c.Web.Status.RUNNING.value:
-                    return r[t.Web.ResponseDict].fail(
-                        f"Application already running: {app_id}"
+                    previous_status = (
+                        c.Web.Status.STOPPED.value
+                        if current is None
+                        else str(current.get("status"))
+                    )
+                    app_instance = web.framework_instances.get(app_id)
+                    if starting.success and app_instance is None:
+                        _ = web.WebRepository.compare_and_set_status(
+                            app_id, {c.Web.Status.STARTING.value}, previous_status
+                        )
+                if starting.failure:
+                    failure = (
+                        starting
+                        if previous_status in c.Web.STARTABLE_STATUSES
+                        else web.WebAppManager.transition_failure(
+                            app_id, c.Web.Status.RUNNING.value, "already running"
+                        )
+                    )
+                    return r[tuple[t.Web.AppRecord, t.Web.FrameworkApp, str]].fail(
+                        failure.error
                     )
-                app_instance = FlextWebUtilities.Web.framework_instances.get(app_id)
                 if app_instance is None:
                     return e.fail_not_found(
                         "Application runtime instance",
                         app_id,
-                        result_type=r[t.Web.ResponseDict],
+                        result_type=r[tuple[t.Web.AppRecord, t.Web.FrameworkApp, str]],
                     )
-                runtime_result = FlextWebUtilities.Web.start_app_runtime(
-                    app_id, app_data, app_instance
+                return r[tuple[t.Web.AppRecord, t.Web.FrameworkApp, str]].ok((
+                    starting.value,
+                    app_instance,
+                    previous_status,
+                ))
+
+            @staticmethod
+            def settle_start(
+                app_id: str,
+                runtime_result: p.Result[m.Web.AppRuntimeInfo],
+                started_ns: int,
+                previous_status: str = c.Web.Status.STOPPED.value,
+            ) -> p.Result[t.Web.AppRecord]:
+                """Record a start attempt and move the app to its outcome status.
+
+                A failed start returns the app to ``previous_status``, so an
+                app retried from ``error`` stays in ``error``.
+                """
+                web = FlextWebUtilities.Web
+                web.runtime_metrics.record(
+                    app_id,
+                    c.Web.ACTION_START,
+                    c.Web.StatusCode.INTERNAL_SERVER_ERROR.value
+                    if runtime_result.failure
+                    else c.Web.StatusCode.OK.value,
+                    perf_counter_ns() - started_ns,
                 )
                 if runtime_result.failure:
-                    return r[t.Web.ResponseDict].fail(runtime_result.error)
-                updated_app = deepcopy(app_data)
-                updated_app["status"] = c.Web.Status.RUNNING.value
-                FlextWebUtilities.Web.apps_registry[app_id] = updated_app
-                FlextWebUtilities.Web.app_runtimes[app_id] = runtime_result.value
-                return r[t.Web.ResponseDict].ok(updated_app)
+                    _ = web.WebRepository.compare_and_set_status(
+                        app_id, {c.Web.Status.STARTING.value}, previous_status
+                    )
+                    return r[t.Web.AppRecord].fail(runtime_result.error)
+                with web.apps_registry.lock_for(app_id):
+                    web.app_runtimes[app_id] = runtime_result.value
+                    return web.WebRepository.compare_and_set_status(
+                        app_id,
+                        {c.Web.Status.STARTING.value},
+                        c.Web.Status.RUNNING.value,
+                    )
 
             @staticmethod
-            def stop_app(app_id: str) -> p.Result[t.Web.ResponseDict]:
-                """Stop a running web application."""
-                app_data = FlextWebUtilities.Web.apps_registry.get(app_id)
-                if app_data is None:
-                    return e.fail_not_found(
-                        "Application", app_id, result_type=r[t.Web.ResponseDict]
+            def stop_app(app_id: str) -> p.Result[t.Web.AppRecord]:
+                """Stop a running web application.
+
+                Mirrors ``start_app`` with a ``running -> stopping -> stopped``
+                transition; a failed stop restores the runtime and the
+                ``running`` status.
+                """
+                web = FlextWebUtilities.Web
+                claimed = web.WebAppManager.claim_stop(app_id)
+                if claimed.failure:
+                    return r[t.Web.AppRecord].fail(claimed.error)
+                runtime = claimed.value
+                started_ns = perf_counter_ns()
+                return web.WebAppManager.settle_stop(
+                    app_id, runtime, web.stop_app_runtime(app_id, runtime), started_ns
+                )
+
+            @staticmethod
+            async def astop_app(app_id: str) -> p.Result[t.Web.AppRecord]:
+                """Stop a running web application without blocking the running loop."""
+                web = FlextWebUtilities.Web
+                claimed = web.WebAppManager.claim_stop(app_id)
+                if claimed.failure:
+                    return r[t.Web.AppRecord].fail(claimed.error)
+                runtime = claimed.value
+                started_ns = perf_counter_ns()
+                return web.WebAppManager.settle_stop(
+                    app_id,
+                    runtime,
+                    await web.stop_app_runtime_async(app_id, runtime),
+                    started_ns,
+                )
+
+            @staticmethod
+            def claim_stop(app_id: str) -> p.Result[m.Web.AppRuntimeInfo]:
+                """Move ``app_id`` to ``stopping`` and detach its runtime."""
+                web = FlextWebUtilities.Web
+                app_runtime_model = web.app_runtime_info_model()
+                with web.apps_registry.lock_for(app_id):
+                    current = web.apps_registry.get(app_id)
+                    stopping = web.WebRepository.compare_and_set_status(
+                        app_id,
+                        {c.Web.Status.RUNNING.value},
+                        c.Web.Status.STOPPING.value,
                     )
-                if app_data.get("status") != c.Web.Status.RUNNING.value:
-                    return r[t.Web.ResponseDict].fail(
-                        f"Application not running: {app_id}"
+                    runtime = (
+                        web.app_runtimes.pop(app_id, None) if stopping.success else None
+                    )
+                    if stopping.success and runtime is None:
+                        _ = web.WebRepository.compare_and_set_status(
+                            app_id,
+                            {c.Web.Status.STOPPING.value},
+                            c.Web.Status.RUNNING.value,
+                        )
+                if stopping.failure:
+                    failure = (
+                        stopping
+                        if current is not None
+                        and current.get("status") == c.Web.Status.RUNNING.value
+                        else web.WebAppManager.transition_failure(
+                            app_id, c.Web.Status.STOPPED.value, "not running"
+                        )
                     )
-                runtime = FlextWebUtilities.Web.app_runtimes.get(app_id)
+                    return r[app_runtime_model].fail(failure.error)
                 if runtime is None:
-                    return r[t.Web.ResponseDict].fail(
+                    return r[app_runtime_model].fail(
                         f"Application runtime not found for stop: {app_id}"
                     )
-                stop_runtime_result = FlextWebUtilities.Web.stop_app_runtime(
-                    app_id, runtime
+                return r[app_runtime_model].ok(runtime)
+
+            @staticmethod
+            def settle_stop(
+                app_id: str,
+                runtime: m.Web.AppRuntimeInfo,
+                stop_runtime_result: p.Result[bool],
+                started_ns: int,
+            ) -> p.Result[t.Web.AppRecord]:
+                """Record a stop attempt and move the app to its outcome status."""
+                web = FlextWebUtilities.Web
+                web.runtime_metrics.record(
+                    app_id,
+                    c.Web.ACTION_STOP,
+                    c.Web.StatusCode.INTERNAL_SERVER_ERROR.value
+                    if stop_runtime_result.failure
+                    else c.Web.StatusCode.OK.value,
+                    perf_counter_ns() - started_ns,
                 )
                 if stop_runtime_result.failure:
-                    return r[t.Web.ResponseDict].fail(stop_runtime_result.error)
-                updated_app = deepcopy(app_data)
-                updated_app["status"] = c.Web.Status.STOPPED.value
-                FlextWebUtilities.Web.apps_registry[app_id] = updated_app
-                _ = FlextWebUtilities.Web.app_runtimes.pop(app_id, None)
-                return r[t.Web.ResponseDict].ok(updated_app)
+                    with web.apps_registry.lock_for(app_id):
+                        web.app_runtimes[app_id] = runtime
+                        _ = web.WebRepository.compare_and_set_status(
+                            app_id,
+                            {c.Web.Status.STOPPING.value},
+                            c.Web.Status.RUNNING.value,
+                        )
+                    return r[t.Web.AppRecord].fail(stop_runtime_result.error)
+                return web.WebRepository.compare_and_set_status(
+                    app_id, {c.Web.Status.STOPPING.value}, c.Web.Status.STOPPED.value
+                )
+
+            @staticmethod
+            def start_apps(app_ids: t.StrSequence) -> p.Result[t.Web.ResponseDict]:
+                """Start many applications in parallel; see ``run_bulk``."""
+                manager = FlextWebUtilities.Web.WebAppManager
+                return manager.run_bulk(manager.start_app, app_ids)
+
+            @staticmethod
+            def stop_apps(app_ids: t.StrSequence) -> p.Result[t.Web.ResponseDict]:
+                """Stop and drain many applications in parallel; see ``run_bulk``."""
+                manager = FlextWebUtilities.Web.WebAppManager
+                return manager.run_bulk(manager.stop_app, app_ids)
+
+            @staticmethod
+            def run_bulk(
+                operation: Callable[[str], p.Result[t.Web.AppRecord]],
+                app_ids: t.StrSequence,
+            ) -> p.Result[t.Web.ResponseDict]:
+                """Fan ``operation`` out over a bounded worker pool.
+
+                Waits at most ``settings.Web.bulk_timeout`` seconds overall
+                and does not block the caller further. Operations still in
+                flight at the deadline are reported as ``pending`` and may
+                still complete; queued operations are cancelled, never run,
+                and are reported under ``failed``.
+                """
+                unique_ids = tuple(dict.fromkeys(app_ids))
+                succeeded: list[str] = []
+                failed: dict[str, str] = {}
+                pending: list[str] = []
+                if unique_ids:
+                    web_settings = FlextWebSettings.fetch_global().Web
+                    pool = ThreadPoolExecutor(
+                        max_workers=min(web_settings.bulk_max_workers, len(unique_ids)),
+                        thread_name_prefix="flext-web-bulk",
+                    )
+                    futures = {
+                        app_id: pool.submit(operation, app_id) for app_id in unique_ids
+                    }
+                    _ = wait(futures.values(), timeout=web_settings.bulk_timeout)
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    for app_id, future in futures.items():
+                        if future.cancelled():
+                            failed[app_id] = (
+                                f"Operation cancelled at deadline for app: {app_id}"
+                            )
+                            continue
+                        if not future.done():
+                            pending.append(app_id)
+                            continue
+                        error = future.exception()
+                        if error is not None:
+                            failed[app_id] = str(error) or type(error).__name__
+                            continue
+                        result = future.result()
+                        if result.success:
+                            succeeded.append(app_id)
+                        else:
+                            failed[app_id] = result.error or "unknown error"
+                return r[t.Web.ResponseDict].ok({
+                    "succeeded": succeeded,
+                    "failed": failed,
+                    "pending": pending,
+                })
+
+            @staticmethod
+            async def astart_apps(
+                app_ids: t.StrSequence,
+            ) -> p.Result[t.Web.ResponseDict]:
+                """Start many applications concurrently; see ``arun_bulk``."""
+                manager = FlextWebUtilities.Web.WebAppManager
+                return await manager.arun_bulk(manager.astart_app, app_ids)
+
+            @staticmethod
+            async def astop_apps(
+                app_ids: t.StrSequence,
+            ) -> p.Result[t.Web.ResponseDict]:
+                """Stop and drain many applications concurrently; see ``arun_bulk``."""
+                manager = FlextWebUtilities.Web.WebAppManager
+                return await manager.arun_bulk(manager.astop_app, app_ids)
+
+            @staticmethod
+            async def arun_bulk(
+                operation: Callable[[str], Awaitable[p.Result[t.Web.AppRecord]]],
+                app_ids: t.StrSequence,
+            ) -> p.Result[t.Web.ResponseDict]:
+                """Run ``operation`` for every app as tasks on the running loop.
+
+                Same outcome shape and deadline as ``run_bulk``; operations
+                still in flight at the deadline are reported as ``pending``
+                and keep running in ``u.Web.bulk_tasks``. Operations that raise
+                or are cancelled are reported under ``failed``.
+                """
+                tasks = {
+                    app_id: asyncio.create_task(
+                        operation(app_id), name=f"flext-web-bulk-{app_id}"
+                    )
+                    for app_id in dict.fromkeys(app_ids)
+                }
+                if tasks:
+                    _ = await asyncio.wait(
+                        tasks.values(),
+                        timeout=FlextWebSettings.fetch_global().Web.bulk_timeout,
+                    )
+                succeeded: list[str] = []
+                failed: dict[str, str] = {}
+                pending: list[str] = []
+                background = FlextWebUtilities.Web.bulk_tasks
+                for app_id, task in tasks.items():
+                    if not task.done():
+                        pending.append(app_id)
+                        background.add(task)
+                        task.add_done_callback(background.discard)
+                        continue
+                    if task.cancelled():
+                        failed[app_id] = f"Operation cancelled for app: {app_id}"
+                        continue
+                    error = task.exception()
+                    if error is not None:
+                        failed[app_id] = str(error) or type(error).__name__
+                        continue
+                    result = task.result()
+                    if result.success:
+                        succeeded.append(app_id)
+                    else:
+                        failed[app_id] = result.error or "unknown error"
+                return r[t.Web.ResponseDict].ok({
+                    "succeeded": succeeded,
+                    "failed": failed,
+                    "pending": pending,
+                })
+
+            @staticmethod
+            def transition_failure(
+                app_id: str, settled_status: str, settled_reason: str
+            ) -> p.Result[t.Web.AppRecord]:
+                """Explain why a lifecycle compare-and-set did not apply."""
+                current = FlextWebUtilities.Web.apps_registry.get(app_id)
+                if current is None:
+                    return e.fail_not_found(
+                        "Application", app_id, result_type=r[t.Web.AppRecord]
+                    )
+                status = current.get("status")
+                if status == settled_status:
+                    return r[t.Web.AppRecord].fail(
+                        f"Application {settled_reason}: {app_id}"
+                    )
+                if status in {c.Web.Status.STARTING.value, c.Web.Status.STOPPING.value}:
+                    return r[t.Web.AppRecord].fail(
+                        f"Application transition in progress ({status}): {app_id}"
+                    )
+                return r[t.Web.AppRecord].fail(
+                    f"Application cannot transition from {status}: {app_id}"
+                )
 
         class WebService:
             """Base web service protocol."""
@@ -564,9 +1683,28 @@ class FlextWebUtilities(u):
                     )
                 if state["service_running"]:
                     return r[bool].fail("Service is already running")
+                restored = FlextWebUtilities.Web.WebService.restore_registry()
+                if restored.failure:
+                    return r[bool].fail(restored.error)
                 state["service_running"] = True
                 return r[bool].ok(value=True)
 
+            @staticmethod
+            def restore_registry() -> p.Result[int]:
+                """Open the ``registry_path`` store and restore its apps.
+
+                A no-op without ``registry_path`` or when that store is
+                already open; returns the number of registered apps.
+                """
+                web = FlextWebUtilities.Web
+                path = FlextWebSettings.fetch_global().Web.registry_path
+                store = web.app_store
+                if path is None or (
+                    store is not None and store.store.path == Path(path)
+                ):
+                    return r[int].ok(len(web.apps_registry))
+                return web.WebRepository.open_store(path)
+
             @staticmethod
             def stop_service() -> p.Result[bool]:
                 """Stop the web service."""
@@ -577,31 +1715,84 @@ class FlextWebUtilities(u):
                 return r[bool].ok(value=True)
 
         class WebRepository:
-            """Base web repository protocol for data access."""
+            """Base web repository protocol for data access.
+
+            Reads are served from ``u.Web.apps_registry``. Writes go to
+            ``u.Web.app_store`` when ``open_store`` configured one, which
+            persists them in SQLite before publishing them to the registry,
+            and to the registry alone otherwise.
+            """
 
             @staticmethod
-            def fetch_by_id(entity_id: str) -> p.Result[t.Web.ResponseDict]:
-                """Return a single app by ID or failure when not found."""
+            def fetch_by_id(entity_id: str) -> p.Result[t.Web.AppRecord]:
+                """Return a single app snapshot by ID or failure when not found."""
                 app_data = FlextWebUtilities.Web.apps_registry.get(entity_id)
                 if app_data is None:
                     return e.fail_not_found(
-                        "Application", entity_id, result_type=r[t.Web.ResponseDict]
+                        "Application", entity_id, result_type=r[t.Web.AppRecord]
                     )
-                return r[t.Web.ResponseDict].ok(deepcopy(app_data))
+                return r[t.Web.AppRecord].ok(app_data)
 
             @staticmethod
-            def save(entity: t.Web.ResponseDict) -> p.Result[t.Web.ResponseDict]:
-                """Persist an app entity and return a defensive copy."""
-                entity_id = entity.get("id")
-                if not isinstance(entity_id, str):
-                    return r[t.Web.ResponseDict].fail("Entity id(str) is required")
-                FlextWebUtilities.Web.apps_registry[entity_id] = deepcopy(entity)
-                return r[t.Web.ResponseDict].ok(deepcopy(entity))
+            def save(entity: t.Web.AppRecord) -> p.Result[t.Web.AppRecord]:
+                """Persist an app entity and return its read-only snapshot."""
+                if not isinstance(entity.get("id"), str):
+                    return r[t.Web.AppRecord].fail("Entity id(str) is required")
+                store = FlextWebUtilities.Web.app_store
+                if store is not None:
+                    return store.save(entity)
+                return r[t.Web.AppRecord].ok(
+                    FlextWebUtilities.Web.apps_registry.put(entity)
+                )
+
+            @staticmethod
+            def compare_and_set_status(
+                app_id: str, expected: t.StrSequence | frozenset[str], target: str
+            ) -> p.Result[t.Web.AppRecord]:
+                """Move ``app_id`` to ``target`` from an ``expected`` status.
+
+                Fails without changing anything when the application is
+                missing, its status is not one of ``expected`` or the store
+                write fails. A successful move is published to the app's
+                ``/protocol/health`` body.
+                """
+                web = FlextWebUtilities.Web
+                store = web.app_store
+                if store is not None:
+                    moved = store.compare_and_set_status(app_id, expected, target)
+                else:
+                    registry = web.apps_registry
+                    updated = registry.compare_and_set_status(app_id, expected, target)
+                    moved = (
+                        web.WebRepository.status_conflict(app_id, registry.get(app_id))
+                        if updated is None
+                        else r[t.Web.AppRecord].ok(updated)
+                    )
+                if moved.success:
+                    web.publish_health_status(app_id, target)
+                return moved
+
+            @staticmethod
+            def status_conflict(
+                app_id: str, current: t.Web.AppRecord | None
+            ) -> p.Result[t.Web.AppRecord]:
+                """Explain a compare-and-set that did not apply to ``current``."""
+                if current is None:
+                    return e.fail_not_found(
+                        "Application", app_id, result_type=r[t.Web.AppRecord]
+                    )
+                return r[t.Web.AppRecord].fail(
+                    f"Application status changed concurrently "
+                    f"({current.get('status')}): {app_id}"
+                )
 
             @staticmethod
             def delete(entity_id: str) -> p.Result[bool]:
                 """Delete an app entity by ID."""
-                removed = FlextWebUtilities.Web.apps_registry.pop(entity_id, None)
+                store = FlextWebUtilities.Web.app_store
+                if store is not None:
+                    return store.delete(entity_id)
+                removed = FlextWebUtilities.Web.apps_registry.pop(entity_id)
                 if removed is None:
                     return e.fail_not_found(
                         "Application", entity_id, result_type=r[bool]
@@ -609,27 +1800,349 @@ class FlextWebUtilities(u):
                 return r[bool].ok(True)
 
             @staticmethod
-            def find_all() -> p.Result[Sequence[t.Web.ResponseDict]]:
-                """Return all registered app entities as defensive copies."""
-                return r[Sequence[t.Web.ResponseDict]].ok([
-                    deepcopy(app)
-                    for app in FlextWebUtilities.Web.apps_registry.values()
-                ])
+            def find_all() -> p.Result[Sequence[t.Web.AppRecord]]:
+                """Return all registered app entities as read-only snapshots."""
+                return r[Sequence[t.Web.AppRecord]].ok(
+                    FlextWebUtilities.Web.apps_registry.values()
+                )
 
             @staticmethod
             def find_by_criteria(
                 criteria: t.Web.RequestDict,
-            ) -> p.Result[Sequence[t.Web.ResponseDict]]:
-                """Find entities by criteria."""
-                matches: t.SequenceOf[t.Web.ResponseDict] = [
-                    deepcopy(app_data)
-                    for app_data in FlextWebUtilities.Web.apps_registry.values()
-                    if all(
-                        app_data.get(key) == expected_value
-                        for key, expected_value in criteria.items()
+            ) -> p.Result[Sequence[t.Web.AppRecord]]:
+                """Find entities by criteria using the registry indexes."""
+                return r[Sequence[t.Web.AppRecord]].ok(
+                    FlextWebUtilities.Web.apps_registry.find(criteria)
+                )
+
+            @staticmethod
+            def find_page(query: m.Web.ListQuery) -> p.Result[t.Web.AppRecordPage]:
+                """Return one filtered, sorted keyset page of app snapshots."""
+                return FlextWebUtilities.Web.WebRepository.registry_page(
+                    FlextWebUtilities.Web.apps_registry, query
+                )
+
+            @staticmethod
+            def count(criteria: t.Web.RequestDict) -> p.Result[int]:
+                """Count entities matching ``criteria`` without materializing them."""
+                return FlextWebUtilities.Web.WebRepository.registry_count(
+                    FlextWebUtilities.Web.apps_registry, criteria
+                )
+
+            @staticmethod
+            def open_store(path: str | Path) -> p.Result[int]:
+                """Persist ``u.Web.apps_registry`` in SQLite at ``path`` and restore it.
+
+                Stored apps are loaded into the registry with a new framework
+                instance under their stored id. Their runtimes did not survive
+                the restart, so any status other than ``stopped`` or ``error``
+                comes back as ``stopped``. Apps already in memory win over
+                their stored copy and are written to the store too. Returns
+                the number of registered apps.
+                """
+                web = FlextWebUtilities.Web
+                web.WebRepository.close_store()
+                try:
+                    store = web.SqliteWebRepository(
+                        path, web.apps_registry, warm_load=False
                     )
-                ]
-                return r[Sequence[t.Web.ResponseDict]].ok(matches)
+                    stored = store.store.load_all()
+                except sqlite3.Error as exc:
+                    return r[int].fail(f"Application store load failed: {exc}")
+                restored: list[t.Web.AppRecord] = []
+                for record in stored:
+                    app_id = str(record.get("id"))
+                    if app_id in web.framework_instances:
+                        continue
+                    built = web.WebAppManager.framework_app(
+                        str(record.get("name", app_id)), app_id
+                    )
+                    if built.failure:
+                        store.close()
+                        return r[int].fail(built.error)
+                    app_instance, framework_name, interface_type = built.value
+                    web.framework_instances[app_id] = app_instance
+                    status = record.get("status")
+                    restored.append({
+                        **record,
+                        "framework": framework_name,
+                        "interface": interface_type,
+                        "status": status
+                        if status in c.Web.STARTABLE_STATUSES
+                        else c.Web.Status.STOPPED.value,
+                    })
+                saved = store.save_many([*restored, *web.apps_registry.values()])
+                if saved.failure:
+                    store.close()
+                    return r[int].fail(saved.error)
+                web.app_store = store
+                return store.warm_load().map(lambda _: len(web.apps_registry))
+
+            @staticmethod
+            def close_store() -> None:
+                """Close the configured store; the registry stays in memory."""
+                store = FlextWebUtilities.Web.app_store
+                if store is not None:
+                    FlextWebUtilities.Web.app_store = None
+                    store.close()
+
+            @staticmethod
+            def registry_page(
+                registry: FlextWebUtilitiesRegistry.Web.AppRegistry,
+                query: m.Web.ListQuery,
+                *,
+                unbounded: bool = False,
+            ) -> p.Result[t.Web.AppRecordPage]:
+                """Return one keyset page of ``registry`` for ``query``.
+
+                ``unbounded`` ignores ``query.limit`` and returns every
+                matching record in one page.
+                """
+                try:
+                    after = (
+                        None
+                        if query.cursor is None
+                        else FlextWebUtilities.Web.decode_cursor(query.cursor)
+                    )
+                    page = registry.page(
+                        query.criteria,
+                        name_prefix=query.name_prefix,
+                        sort_by=query.sort_by,
+                        descending=query.descending,
+                        after=after,
+                        limit=None if unbounded else query.limit,
+                    )
+                except (TypeError, ValueError) as exc:
+                    return r[t.Web.AppRecordPage].fail(f"Invalid list query: {exc}")
+                return r[t.Web.AppRecordPage].ok(page)
+
+            @staticmethod
+            def registry_count(
+                registry: FlextWebUtilitiesRegistry.Web.AppRegistry,
+                criteria: t.Web.RequestDict,
+            ) -> p.Result[int]:
+                """Count ``registry`` records matching ``criteria``.
+
+                No criteria or a single indexed field is answered from the
+                registry's incrementally maintained index buckets.
+                """
+                match list(criteria.items()):
+                    case []:
+                        return r[int].ok(len(registry))
+                    case [(field, Hashable() as value)]:
+                        return r[int].ok(registry.count(field, value))
+                    case _:
+                        return r[int].ok(len(registry.find(criteria)))
+
+        class SqliteWebRepository:
+            """Persistent ``p.Web.WebRepository`` backed by SQLite in WAL mode.
+
+            Records are written through ``SqliteAppStore`` and served from an
+            ``AppRegistry`` read-through cache: by default the repository
+            warm-loads the cache with one bulk query, after which lists,
+            pages and counts never touch the database. A cold repository
+            (``warm_load=False``) answers single-field lookups from the
+            SQLite indexes, caches what it reads, and bulk-loads on the first
+            full listing. ``WebRepository.open_store`` wraps
+            ``u.Web.apps_registry`` in one to persist the process-wide
+            registry; the ``registry_path`` setting opens it at startup.
+            """
+
+            __slots__ = ("_cache", "_store", "_warm")
+
+            def __init__(
+                self,
+                path: str | Path,
+                registry: FlextWebUtilitiesRegistry.Web.AppRegistry | None = None,
+                *,
+                warm_load: bool = True,
+            ) -> None:
+                """Open the database at ``path`` and optionally warm the cache."""
+                self._store = FlextWebUtilitiesStorage.Web.SqliteAppStore(path)
+                self._cache = (
+                    registry
+                    if registry is not None
+                    else FlextWebUtilitiesRegistry.Web.AppRegistry()
+                )
+                self._warm = False
+                if warm_load:
+                    _ = self.warm_load()
+
+            @property
+            def cache(self) -> FlextWebUtilitiesRegistry.Web.AppRegistry:
+                """In-memory read-through cache of stored records."""
+                return self._cache
+
+            @property
+            def store(self) -> FlextWebUtilitiesStorage.Web.SqliteAppStore:
+                """Underlying SQLite store."""
+                return self._store
+
+            def close(self) -> None:
+                """Close the database connection; the cache is kept."""
+                self._store.close()
+
+            def warm_load(self) -> p.Result[int]:
+                """Load every stored record into the cache with one query."""
+                try:
+                    records = self._store.load_all()
+                except sqlite3.Error as exc:
+                    return r[int].fail(f"Application store load failed: {exc}")
+                _ = self._cache.put_many(records)
+                self._warm = True
+                return r[int].ok(len(records))
+
+            def fetch_by_id(self, entity_id: str) -> p.Result[t.Web.AppRecord]:
+                """Return the cached snapshot, reading through to SQLite on a miss."""
+                cached = self._cache.get(entity_id)
+                if cached is not None:
+                    return r[t.Web.AppRecord].ok(cached)
+                try:
+                    stored = self._store.fetch(entity_id)
+                except sqlite3.Error as exc:
+                    return r[t.Web.AppRecord].fail(
+                        f"Application store read failed: {exc}"
+                    )
+                if stored is None:
+                    return e.fail_not_found(
+                        "Application", entity_id, result_type=r[t.Web.AppRecord]
+                    )
+                return r[t.Web.AppRecord].ok(self._cache.put(stored))
+
+            def save(self, entity: t.Web.AppRecord) -> p.Result[t.Web.AppRecord]:
+                """Persist one record and return its cached snapshot."""
+                saved = self.save_many([entity])
+                if saved.failure:
+                    return r[t.Web.AppRecord].fail(saved.error)
+                return r[t.Web.AppRecord].ok(saved.value[0])
+
+            def save_many(
+                self, entities: t.SequenceOf[t.Web.AppRecord]
+            ) -> p.Result[Sequence[t.Web.AppRecord]]:
+                """Persist ``entities`` in a single transaction, then cache them."""
+                if not all(isinstance(entity.get("id"), str) for entity in entities):
+                    return r[Sequence[t.Web.AppRecord]].fail(
+                        "Entity id(str) is required"
+                    )
+                try:
+                    _ = self._store.write(entities)
+                except sqlite3.Error as exc:
+                    return r[Sequence[t.Web.AppRecord]].fail(
+                        f"Application store write failed: {exc}"
+                    )
+                return r[Sequence[t.Web.AppRecord]].ok(self._cache.put_many(entities))
+
+            def compare_and_set_status(
+                self, app_id: str, expected: t.StrSequence | frozenset[str], target: str
+            ) -> p.Result[t.Web.AppRecord]:
+                """Persist, then publish, a status compare-and-set of ``app_id``.
+
+                Runs under the app's stripe lock in the cache, so the status
+                checked is the one replaced; a failed write changes nothing.
+                """
+                with self._cache.lock_for(app_id):
+                    current = self._cache.get(app_id)
+                    if current is None or current.get("status") not in expected:
+                        return FlextWebUtilities.Web.WebRepository.status_conflict(
+                            app_id, current
+                        )
+                    try:
+                        _ = self._store.write(({**current, "status": target},))
+                    except sqlite3.Error as exc:
+                        return r[t.Web.AppRecord].fail(
+                            f"Application store write failed: {exc}"
+                        )
+                    updated = self._cache.compare_and_set_status(
+                        app_id, expected, target
+                    )
+                if updated is None:
+                    return FlextWebUtilities.Web.WebRepository.status_conflict(
+                        app_id, self._cache.get(app_id)
+                    )
+                return r[t.Web.AppRecord].ok(updated)
+
+            def delete(self, entity_id: str) -> p.Result[bool]:
+                """Delete one record from SQLite and the cache."""
+                try:
+                    deleted = self._store.write(deletes=(entity_id,))
+                except sqlite3.Error as exc:
+                    return r[bool].fail(f"Application store write failed: {exc}")
+                removed = self._cache.pop(entity_id)
+                if not deleted and removed is None:
+                    return e.fail_not_found(
+                        "Application", entity_id, result_type=r[bool]
+                    )
+                return r[bool].ok(True)
+
+            def find_all(self) -> p.Result[Sequence[t.Web.AppRecord]]:
+                """Return every record, warm-loading the cache when cold."""
+                return self._warmed().map(lambda _: self._cache.values())
+
+            def find_by_criteria(
+                self, criteria: t.Web.RequestDict
+            ) -> p.Result[Sequence[t.Web.AppRecord]]:
+                """Find records by criteria, from SQLite indexes while cold."""
+                if self._warm:
+                    return r[Sequence[t.Web.AppRecord]].ok(self._cache.find(criteria))
+                lookup = self._indexed_lookup(criteria)
+                if lookup is None:
+                    return self.find_all().map(lambda _: self._cache.find(criteria))
+                try:
+                    stored = self._store.find(*lookup)
+                except sqlite3.Error as exc:
+                    return r[Sequence[t.Web.AppRecord]].fail(
+                        f"Application store read failed: {exc}"
+                    )
+                return r[Sequence[t.Web.AppRecord]].ok(
+                    tuple(
+                        snapshot
+                        for snapshot in self._cache.put_many(stored)
+                        if all(
+                            snapshot.get(field) == expected
+                            for field, expected in criteria.items()
+                        )
+                    )
+                )
+
+            def find_page(
+                self, query: m.Web.ListQuery
+            ) -> p.Result[t.Web.AppRecordPage]:
+                """Return one keyset page from the warm cache."""
+                return self._warmed().flat_map(
+                    lambda _: FlextWebUtilities.Web.WebRepository.registry_page(
+                        self._cache, query
+                    )
+                )
+
+            def count(self, criteria: t.Web.RequestDict) -> p.Result[int]:
+                """Count records, with one indexed ``COUNT`` query while cold."""
+                if self._warm:
+                    return FlextWebUtilities.Web.WebRepository.registry_count(
+                        self._cache, criteria
+                    )
+                lookup = self._indexed_lookup(criteria)
+                if criteria and (lookup is None or len(criteria) > 1):
+                    return self.find_by_criteria(criteria).map(len)
+                try:
+                    return r[int].ok(
+                        self._store.count()
+                        if lookup is None
+                        else self._store.count(*lookup)
+                    )
+                except sqlite3.Error as exc:
+                    return r[int].fail(f"Application store read failed: {exc}")
+
+            def _indexed_lookup(
+                self, criteria: t.Web.RequestDict
+            ) -> tuple[str, t.Scalar] | None:
+                """Return the first ``(field, value)`` answerable by a SQLite index."""
+                for field, value in criteria.items():
+                    if field in self._store.SELECT_BY and isinstance(value, (str, int)):
+                        return field, value
+                return None
+
+            def _warmed(self) -> p.Result[int]:
+                return r[int].ok(len(self._cache)) if self._warm else self.warm_load()
 
         class WebHandler:
             """Web handler protocol for request/response patterns."""
@@ -657,7 +2170,7 @@ class FlextWebUtilities(u):
                         else:
                             result = FlextWebUtilities.Web.WebAppManager.create_app(
                                 name=name, port=port, host=host
-                            )
+                            ).map(dict)
                     case c.Web.ACTION_START:
                         app_id = request.get("app_id")
                         if not isinstance(app_id, str):
@@ -667,7 +2180,7 @@ class FlextWebUtilities(u):
                         else:
                             result = FlextWebUtilities.Web.WebAppManager.start_app(
                                 app_id
-                            )
+                            ).map(dict)
                     case c.Web.ACTION_STOP:
                         app_id = request.get("app_id")
                         if not isinstance(app_id, str):
@@ -677,23 +2190,51 @@ class FlextWebUtilities(u):
                         else:
                             result = FlextWebUtilities.Web.WebAppManager.stop_app(
                                 app_id
-                            )
+                            ).map(dict)
                     case c.Web.ACTION_LIST:
-                        result = FlextWebUtilities.Web.WebAppManager.list_apps().map(
-                            lambda apps: {
-                                "count": len(apps),
-                                "app_ids": [
-                                    app_id
-                                    for app in apps
-                                    for app_id in [app.get("id")]
-                                    if isinstance(app_id, str)
-                                ],
-                            }
-                        )
+                        result = FlextWebUtilities.Web.WebHandler.list_page(request)
                     case _:
                         result = r[t.Web.ResponseDict].ok(deepcopy(request))
                 return result
 
+            @staticmethod
+            def list_page(request: t.Web.RequestDict) -> p.Result[t.Web.ResponseDict]:
+                """Serve the ``list`` action with ``m.Web.ListQuery`` parameters.
+
+                Without ``limit`` or ``cursor`` every matching app is returned
+                in one page, as before pagination existed; either key opts in
+                to bounded pages.
+                """
+                try:
+                    query = m.Web.ListQuery.model_validate({
+                        key: value
+                        for key, value in request.items()
+                        if key in m.Web.ListQuery.model_fields
+                    })
+                except c.ValidationError as exc:
+                    return r[t.Web.ResponseDict].fail(f"Invalid list query: {exc}")
+                repository = FlextWebUtilities.Web.WebRepository
+                listed = (
+                    repository.find_page(query)
+                    if "limit" in request or "cursor" in request
+                    else repository.registry_page(
+                        FlextWebUtilities.Web.apps_registry, query, unbounded=True
+                    )
+                )
+                return listed.map(
+                    lambda page: {
+                        "count": len(page[0]),
+                        "total": page[1],
+                        "next_cursor": page[2],
+                        "app_ids": [
+                            app_id
+                            for app in page[0]
+                            for app_id in [app.get("id")]
+                            if isinstance(app_id, str)
+                        ],
+                    }
+                )
+
             def execute(
                 self, command: t.Web.RequestDict
             ) -> p.Result[t.Web.ResponseDict]:
@@ -712,38 +2253,133 @@ class FlextWebUtilities(u):
 
             @staticmethod
             def load_template_config(settings: t.Web.RequestDict) -> p.Result[bool]:
-                """Load template engine configuration."""
+                """Load template engine configuration and drop compiled templates."""
                 FlextWebUtilities.Web.template_config = deepcopy(settings)
+                FlextWebUtilities.Web.template_cache.clear()
+                FlextWebUtilities.Web.template_loader.clear()
                 return r[bool].ok(value=True)
 
             @staticmethod
             def render(template: str, context: t.Web.RequestDict) -> p.Result[str]:
-                """Render template string with context."""
-                full_context = deepcopy(FlextWebUtilities.Web.template_globals)
+                """Render template string with context.
+
+                ``{{name}}`` and ``{{name|filter}}`` placeholders resolve from
+                ``context`` over ``template_globals``; unknown names or filters
+                are left verbatim. With ``autoescape`` on, each resolved value
+                is HTML-escaped.
+                """
+                compiled = FlextWebUtilities.Web.WebTemplateEngine.compiled(template)
+                return r[str].ok(
+                    compiled.render(
+                        FlextWebUtilities.Web.WebTemplateEngine.template_values(
+                            context
+                        ),
+                        FlextWebUtilities.Web.template_filters,
+                        FlextWebUtilities.Web.WebTemplateEngine.template_escape(),
+                    )
+                )
+
+            @staticmethod
+            def render_stream(
+                template: str, context: t.Web.RequestDict
+            ) -> p.Result[Iterator[str]]:
+                """Render ``template`` as a generator of text chunks.
+
+                The chunks concatenate to the ``render`` output and can feed
+                a FastAPI ``StreamingResponse`` or a Flask streamed response,
+                which start sending before the page is complete.
+                """
+                compiled = FlextWebUtilities.Web.WebTemplateEngine.compiled(template)
+                return r[Iterator[str]].ok(
+                    compiled.stream(
+                        FlextWebUtilities.Web.WebTemplateEngine.template_values(
+                            context
+                        ),
+                        FlextWebUtilities.Web.template_filters,
+                        FlextWebUtilities.Web.WebTemplateEngine.template_escape(),
+                    )
+                )
+
+            @staticmethod
+            def render_file(name: str, context: t.Web.RequestDict) -> p.Result[str]:
+                """Render the template file ``name`` under ``template_dir``.
+
+                Compiled files are cached by path, mtime and size; with
+                ``reload_interval`` set, files are re-stat'ed at most once per
+                that many seconds.
+                """
+                config = FlextWebUtilities.Web.template_config
+                template_dir = config.get("template_dir")
+                if not isinstance(template_dir, str) or not template_dir:
+                    return r[str].fail("Template rendering requires template_dir(str)")
+                loader = FlextWebUtilities.Web.template_loader
+                path = loader.resolve(template_dir, name)
+                if path is None:
+                    return r[str].fail(f"Template outside template_dir: {name}")
+                reload_interval = config.get("reload_interval", 0.0)
+                try:
+                    compiled = loader.load(
+                        path,
+                        FlextWebUtilities.Web.template_cache
+                        if config.get("cache_enabled", True)
+                        else None,
+                        float(reload_interval)
+                        if isinstance(reload_interval, (int, float))
+                        else 0.0,
+                    )
+                except FileNotFoundError:
+                    return e.fail_not_found("Template", name, result_type=r[str])
+                except (OSError, UnicodeDecodeError) as exc:
+                    return r[str].fail(f"Failed to load template {name}: {exc}")
+                return r[str].ok(
+                    compiled.render(
+                        FlextWebUtilities.Web.WebTemplateEngine.template_values(
+                            context
+                        ),
+                        FlextWebUtilities.Web.template_filters,
+                        FlextWebUtilities.Web.WebTemplateEngine.template_escape(),
+                    )
+                )
+
+            @staticmethod
+            def compiled(
+                template: str,
+            ) -> FlextWebUtilitiesTemplates.Web.CompiledTemplate:
+                """Return the compiled ``template``, cached unless ``cache_enabled`` is off."""
+                if not FlextWebUtilities.Web.template_config.get("cache_enabled", True):
+                    return FlextWebUtilitiesTemplates.Web.CompiledTemplate(template)
+                return FlextWebUtilities.Web.template_cache.fetch(
+                    template,
+                    lambda: FlextWebUtilitiesTemplates.Web.CompiledTemplate(template),
+                )
+
+            @staticmethod
+            def template_escape() -> t.Web.TemplateFilter | None:
+                """Return the per-variable escape function when ``autoescape`` is on."""
+                if FlextWebUtilities.Web.template_config.get("autoescape", False):
+                    return FlextWebUtilitiesTemplates.Web.CompiledTemplate.escape_html
+                return None
+
+            @staticmethod
+            def template_values(context: t.Web.RequestDict) -> t.Web.TemplateValues:
+                """Overlay ``context`` on a shallow copy of the template globals."""
+                values: dict[
+                    str, t.JsonValue | t.Scalar | t.StrSequence | t.ConfigurationMapping
+                ] = dict(FlextWebUtilities.Web.template_globals)
                 for context_key, context_value in context.items():
-                    full_context[context_key] = (
+                    values[context_key] = (
                         context_value
                         if FlextWebUtilities.primitive(context_value)
                         else str(context_value)
                     )
-                rendered = template
-                for key, value in full_context.items():
-                    if isinstance(value, (str, int, bool)):
-                        rendered = rendered.replace(f"{{{{{key}}}}}", str(value))
-                for (
-                    filter_name,
-                    filter_fn,
-                ) in FlextWebUtilities.Web.template_filters.items():
-                    marker = f"|{filter_name}"
-                    if marker in rendered:
-                        rendered = filter_fn(rendered.replace(marker, ""))
-                return r[str].ok(rendered)
+                return values
 
             @staticmethod
             def validate_template_config(settings: t.Web.RequestDict) -> p.Result[bool]:
                 """Validate template engine configuration."""
-                allowed_keys = {"template_dir", "autoescape", "cache_enabled"}
-                invalid_keys = [key for key in settings if key not in allowed_keys]
+                invalid_keys = [
+                    key for key in settings if key not in c.Web.TEMPLATE_CONFIG_KEYS
+                ]
                 if invalid_keys:
                     return r[bool].fail(
                         f"Invalid template settings keys: {', '.join(invalid_keys)}"
@@ -780,22 +2416,38 @@ class FlextWebUtilities(u):
 
             @staticmethod
             def web_metrics() -> t.Web.ResponseDict:
-                """Get web application metrics."""
-                metrics: t.Web.ResponseDict = {}
-                for key, val in FlextWebUtilities.Web.web_metrics.items():
-                    metrics[key] = (
-                        FlextWebUtilities.to_int(val) if isinstance(val, float) else val
-                    )
+                """Get request latency summaries and entity eviction totals.
+
+                Request counters, error rate, throughput and p50/p90/p99/p999
+                latencies are merged from the per-route histograms, globally
+                and under ``apps``; entity eviction and expiry totals are
+                under ``entities``.
+                """
+                metrics = FlextWebUtilities.Web.request_metrics.summary()
+                metrics["entities"] = FlextWebUtilities.Web.entity_evictions.snapshot()
                 return metrics
 
             def record_web_request(
                 self, request: t.Web.RequestDict, response_time: float
             ) -> None:
-                """Record web request metrics."""
+                """Record an externally timed request (``response_time`` in seconds)."""
                 status_value = request.get("status")
-                status = status_value if isinstance(status_value, str) else None
-                response_time_ms = int(max(response_time, 0) * 1000)
-                FlextWebUtilities.Web.record_request_metric(status, response_time_ms)
+                status_code = request.get("status_code")
+                if not isinstance(status_code, int):
+                    status_code = (
+                        c.Web.StatusCode.INTERNAL_SERVER_ERROR.value
+                        if isinstance(status_value, str)
+                        and status_value.lower() == c.Web.ResponseStatus.ERROR.value
+                        else c.Web.StatusCode.OK.value
+                    )
+                app_id = request.get("app_id")
+                route = request.get("route")
+                FlextWebUtilities.Web.record_request_metric(
+                    app_id if isinstance(app_id, str) else c.Web.METRICS_UNKNOWN_APP,
+                    route if isinstance(route, str) else c.Web.METRICS_UNMATCHED_ROUTE,
+                    status_code,
+                    int(max(response_time, 0) * 1_000_000_000),
+                )
 
         class ConfigValue:
             """Protocol for configuration values."""
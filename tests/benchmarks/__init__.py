@@ -0,0 +1,44 @@
+# AUTO-GENERATED FILE — Regenerate with: make gen
+"""Benchmarks package."""
+
+from __future__ import annotations
+
+from flext_core.lazy import build_lazy_import_map, install_lazy_exports
+
+_LAZY_IMPORTS = build_lazy_import_map({
+    ".test_async_runtime_benchmark": ("TestsFlextWebAsyncRuntimeBenchmark",),
+    ".test_create_app_benchmark": ("TestsFlextWebCreateAppBenchmark",),
+    ".test_entity_journal_benchmark": ("TestsFlextWebEntityJournalBenchmark",),
+    ".test_entity_query_benchmark": ("TestsFlextWebEntityQueryBenchmark",),
+    ".test_health_benchmark": ("TestsFlextWebHealthBenchmark",),
+    ".test_import_time_benchmark": ("TestsFlextWebImportTimeBenchmark",),
+    ".test_metrics_benchmark": ("TestsFlextWebMetricsBenchmark",),
+    ".test_openapi_benchmark": ("TestsFlextWebOpenApiBenchmark",),
+    ".test_registry_benchmark": ("TestsFlextWebRegistryBenchmark",),
+    ".test_registry_memory_benchmark": ("TestsFlextWebRegistryMemoryBenchmark",),
+    ".test_runtime_benchmark": ("TestsFlextWebRuntimeBenchmark",),
+    ".test_settings_benchmark": ("TestsFlextWebSettingsBenchmark",),
+    ".test_template_benchmark": ("TestsFlextWebTemplateBenchmark",),
+    ".test_wsgi_benchmark": ("TestsFlextWebWsgiBenchmark",),
+    "flext_tests": (
+        "c",
+        "d",
+        "e",
+        "h",
+        "m",
+        "p",
+        "r",
+        "s",
+        "t",
+        "td",
+        "tf",
+        "tk",
+        "tm",
+        "tv",
+        "u",
+        "x",
+    ),
+})
+
+
+install_lazy_exports(__name__, globals(), _LAZY_IMPORTS, publish_all=False)
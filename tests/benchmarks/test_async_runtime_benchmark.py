@@ -0,0 +1,89 @@
+"""Event-loop responsiveness while many applications start as tasks.
+
+A probe sleeps 1 ms in a loop and records how late each wake-up is, first
+on an idle loop and then while the apps start; task runtimes keep the
+startup lag within the bind cost of one server of the idle baseline instead
+of growing with the number of apps starting. Run with ``--benchmark-enable`` to record
+timings.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_tests import tm
+from flext_web import FlextWebAsyncServices
+from tests import m, p, u
+
+APP_COUNT = 100
+PROBE_INTERVAL_SECONDS = 0.001
+BASELINE_SECONDS = 0.25
+MAX_EXTRA_LAG_SECONDS = 0.05
+
+
+@pytest.mark.performance
+class TestsFlextWebAsyncRuntimeBenchmark:
+    """Loop lag observed by a concurrent probe during a bulk async start."""
+
+    def test_loop_latency_during_bulk_start(self, benchmark: BenchmarkFixture) -> None:
+        """Starting 100 apps as tasks keeps the loop responsive."""
+        service = FlextWebAsyncServices()
+        manager = u.Web.WebAppManager
+        ports = [u.Web.Tests.TestPortManager.allocate_port() for _ in range(APP_COUNT)]
+        app_ids: list[str] = []
+        idle_lags: list[float] = []
+        lags: list[float] = []
+        try:
+            for index, port in enumerate(ports):
+                created = manager.create_app(f"async-bench-{index}", port, "localhost")
+                tm.ok(created)
+                app_ids.append(str(created.value["id"]))
+
+            async def probe(done: asyncio.Event, samples: list[float]) -> None:
+                while not done.is_set():
+                    before = perf_counter()
+                    await asyncio.sleep(PROBE_INTERVAL_SECONDS)
+                    samples.append(perf_counter() - before - PROBE_INTERVAL_SECONDS)
+
+            async def idle() -> None:
+                done = asyncio.Event()
+                probing = asyncio.create_task(probe(done, idle_lags))
+                await asyncio.sleep(BASELINE_SECONDS)
+                done.set()
+                await probing
+
+            async def start_all() -> p.Result[m.Web.BulkOperationResponse]:
+                done = asyncio.Event()
+                probing = asyncio.create_task(probe(done, lags))
+                try:
+                    return await service.astart_apps(app_ids)
+                finally:
+                    done.set()
+                    await probing
+                    _ = await service.astop_apps(app_ids)
+
+            asyncio.run(idle())
+            result = benchmark.pedantic(
+                lambda: asyncio.run(start_all()), rounds=1, iterations=1
+            )
+            tm.ok(result)
+            tm.that(result.value.succeeded, length=APP_COUNT)
+            idle_lags.sort()
+            lags.sort()
+            idle_p99 = idle_lags[int(len(idle_lags) * 0.99)]
+            startup_p99 = lags[int(len(lags) * 0.99)]
+            benchmark.extra_info["idle_lag_p99_ms"] = idle_p99 * 1000
+            benchmark.extra_info["loop_lag_p50_ms"] = lags[len(lags) // 2] * 1000
+            benchmark.extra_info["loop_lag_p99_ms"] = startup_p99 * 1000
+            benchmark.extra_info["loop_lag_max_ms"] = lags[-1] * 1000
+            tm.that(startup_p99 < idle_p99 + MAX_EXTRA_LAG_SECONDS, eq=True)
+        finally:
+            for app_id in app_ids:
+                if app_id in u.Web.app_runtimes:
+                    _ = manager.stop_app(app_id)
+            for port in ports:
+                u.Web.Tests.TestPortManager.release_port(port)
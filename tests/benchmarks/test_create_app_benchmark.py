@@ -0,0 +1,49 @@
+"""Application provisioning throughput benchmark.
+
+Every FastAPI app references the protocol and docs routes of shared routers,
+so ``create_app`` costs the framework constructor plus a registry write
+rather than re-analysing endpoints per app. Run with ``--benchmark-enable``
+to record timings.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_tests import tm
+from tests import p, t, u
+
+APP_COUNT = 1_000
+
+
+@pytest.mark.performance
+class TestsFlextWebCreateAppBenchmark:
+    """Throughput of creating 1k registered applications."""
+
+    def test_create_app_throughput(self, benchmark: BenchmarkFixture) -> None:
+        """1k apps are created, all sharing one set of protocol routes."""
+        manager = u.Web.WebAppManager
+        results: list[p.Result[t.Web.AppRecord]] = []
+
+        def create_all() -> float:
+            started = perf_counter()
+            results.extend(
+                manager.create_app(f"provisioned-{index}", 20_000 + index, "localhost")
+                for index in range(APP_COUNT)
+            )
+            return perf_counter() - started
+
+        try:
+            elapsed = benchmark.pedantic(create_all, rounds=1, iterations=1)
+            tm.that(all(result.success for result in results), eq=True)
+            benchmark.extra_info["apps_per_second"] = APP_COUNT / elapsed
+            tm.that(len(u.Web.shared_routers), eq=2)
+        finally:
+            for result in results:
+                if result.success:
+                    app_id = str(result.value["id"])
+                    _ = u.Web.apps_registry.pop(app_id)
+                    _ = u.Web.framework_instances.pop(app_id, None)
@@ -0,0 +1,75 @@
+"""Journaled entity create throughput: group commit vs per-write fsync.
+
+Concurrent writers create entities through a journaled ``FlextWebEntities``
+once with group commit and once with an fsync per write. Group commit must
+need far fewer fsyncs; the create rates of both modes are recorded. The
+default run creates ``SMOKE_CREATES`` entities per mode; run with
+``--benchmark-enable`` for the full workload and timings.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from time import perf_counter
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_tests import tm
+from flext_web import FlextWebEntities
+from tests import m, u
+
+WRITERS = 16
+CREATES = 2_000
+SMOKE_CREATES = 200
+
+
+@pytest.mark.performance
+class TestsFlextWebEntityJournalBenchmark:
+    """Create throughput of journaled entity storage."""
+
+    @staticmethod
+    def _create_all(
+        directory: Path, group_commit_ms: float, creates: int
+    ) -> tuple[float, int]:
+        service = FlextWebEntities()
+        tm.ok(service.open_journal(directory, group_commit_ms=group_commit_ms))
+        started = perf_counter()
+        with ThreadPoolExecutor(max_workers=WRITERS) as pool:
+            results = list(
+                pool.map(
+                    lambda index: service.create(
+                        m.Web.EntityData(data={"name": f"entity-{index}"})
+                    ),
+                    range(creates),
+                )
+            )
+        elapsed = perf_counter() - started
+        tm.that(all(result.success for result in results), eq=True)
+        journal = service.journal
+        syncs = 0 if journal is None else journal.syncs
+        service.close_journal()
+        return creates / elapsed, syncs
+
+    def test_group_commit_vs_per_write_fsync(
+        self, benchmark: BenchmarkFixture, tmp_path: Path
+    ) -> None:
+        """Group commit batches fsyncs across concurrent creates."""
+        creates = u.Web.Tests.benchmark_size(benchmark, CREATES, SMOKE_CREATES)
+        per_write_rate, per_write_syncs = self._create_all(
+            tmp_path / "fsync", 0, creates
+        )
+
+        def group_commit() -> tuple[float, int]:
+            return self._create_all(tmp_path / "group", 2.0, creates)
+
+        group_rate, group_syncs = benchmark.pedantic(
+            group_commit, rounds=1, iterations=1
+        )
+        benchmark.extra_info["per_write_creates_per_s"] = per_write_rate
+        benchmark.extra_info["per_write_fsyncs"] = per_write_syncs
+        benchmark.extra_info["group_commit_creates_per_s"] = group_rate
+        benchmark.extra_info["group_commit_fsyncs"] = group_syncs
+        tm.that(per_write_syncs, eq=creates)
+        tm.that(group_syncs < creates // 4, eq=True)
@@ -0,0 +1,91 @@
+"""Indexed entity lookup latency against a full scan.
+
+Entities keyed by an external id are queried through a hash index and
+through the unindexed scan; indexed lookups must stay in the millisecond
+range while the scan grows with the store. Run with ``--benchmark-enable``
+to record timings.
+
+A sorted index is also driven with interleaved creates and range queries,
+so every lookup follows a write; lookups must stay far below a re-sort of
+the whole index.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_tests import tm
+from flext_web import FlextWebEntities
+from tests import c, m, u
+
+ENTITIES = 100_000
+LOOKUPS = 1_000
+INTERLEAVED = 20_000
+SMOKE_INTERLEAVED = 2_000
+
+
+@pytest.mark.performance
+class TestsFlextWebEntityQueryBenchmark:
+    """Latency of `FlextWebEntities.query` with and without indexes."""
+
+    def test_hash_and_sorted_lookups_beat_scan(
+        self, benchmark: BenchmarkFixture
+    ) -> None:
+        """External-key and range lookups use indexes instead of scanning."""
+        service = FlextWebEntities()
+        for index in range(ENTITIES):
+            _ = service.create(
+                m.Web.EntityData(data={"external_key": f"ext-{index}", "rank": index})
+            )
+        started = perf_counter()
+        scanned = service.query(external_key=f"ext-{ENTITIES - 1}")
+        scan_seconds = perf_counter() - started
+        tm.that(scanned.value, length=1)
+        tm.ok(service.create_index("external_key"))
+        tm.ok(service.create_index("rank", c.Web.IndexKind.SORTED))
+
+        def lookups() -> float:
+            lookup_started = perf_counter()
+            for index in range(LOOKUPS):
+                found = service.query(external_key=f"ext-{index * 97}")
+                tm.that(found.value, length=1)
+            return (perf_counter() - lookup_started) / LOOKUPS
+
+        hash_seconds = benchmark.pedantic(lookups, rounds=1, iterations=1)
+        started = perf_counter()
+        ranged = service.query(rank=m.Web.ValueRange(low=500, high=599))
+        range_seconds = perf_counter() - started
+        tm.that(ranged.value, length=100)
+        benchmark.extra_info["entities"] = ENTITIES
+        benchmark.extra_info["scan_ms"] = scan_seconds * 1000
+        benchmark.extra_info["hash_lookup_us"] = hash_seconds * 1_000_000
+        benchmark.extra_info["range_100_ms"] = range_seconds * 1000
+        tm.that(hash_seconds < scan_seconds / 10, eq=True)
+        tm.that(hash_seconds < 0.001, eq=True)
+
+    def test_sorted_lookups_after_each_write_stay_cheap(
+        self, benchmark: BenchmarkFixture
+    ) -> None:
+        """Range lookups interleaved with creates never re-sort the index."""
+        service = FlextWebEntities()
+        for index in range(ENTITIES):
+            _ = service.create(m.Web.EntityData(data={"rank": index}))
+        tm.ok(service.create_index("rank", c.Web.IndexKind.SORTED))
+        rounds = u.Web.Tests.benchmark_size(benchmark, INTERLEAVED, SMOKE_INTERLEAVED)
+
+        def interleaved() -> float:
+            started = perf_counter()
+            for index in range(rounds):
+                rank = (index * 7919) % ENTITIES
+                _ = service.create(m.Web.EntityData(data={"rank": rank}))
+                found = service.query(rank=m.Web.ValueRange(low=rank, high=rank))
+                tm.that(len(found.value) >= 2, eq=True)
+            return (perf_counter() - started) / rounds
+
+        pair_seconds = benchmark.pedantic(interleaved, rounds=1, iterations=1)
+        benchmark.extra_info["entities"] = ENTITIES + rounds
+        benchmark.extra_info["write_then_range_us"] = pair_seconds * 1_000_000
+        tm.that(pair_seconds < 0.001, eq=True)
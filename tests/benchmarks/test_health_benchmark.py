@@ -0,0 +1,88 @@
+"""Health endpoint throughput under a wrk-style local load.
+
+Keep-alive connections issue ``GET /protocol/health`` back to back for a
+fixed duration against a running app, like ``wrk -c 16 -d 2s``; the
+endpoint serves pre-encoded bytes, so the rate measures the framework and
+server rather than JSON encoding. Run with ``--benchmark-enable`` to record
+timings.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_tests import tm
+from tests import c, u
+
+CONNECTIONS = 16
+DURATION_SECONDS = 2.0
+MIN_REQUESTS_PER_SECOND = 200
+
+
+@pytest.mark.performance
+class TestsFlextWebHealthBenchmark:
+    """Requests per second and latency of ``/protocol/health``."""
+
+    def test_protocol_health_requests_per_second(
+        self, benchmark: BenchmarkFixture
+    ) -> None:
+        """16 keep-alive connections sustain the health RPS floor."""
+        manager = u.Web.WebAppManager
+        port = u.Web.Tests.TestPortManager.allocate_port()
+        created = manager.create_app("health-bench", port, "localhost")
+        tm.ok(created)
+        app_id = str(created.value["id"])
+        request = b"GET /protocol/health HTTP/1.1\r\nHost: localhost\r\n\r\n"
+        latencies: list[float] = []
+        statuses: set[bytes] = set()
+
+        async def connection(deadline: float) -> None:
+            reader, writer = await asyncio.open_connection("localhost", port)
+            try:
+                while perf_counter() < deadline:
+                    sent = perf_counter()
+                    writer.write(request)
+                    head = await reader.readuntil(b"\r\n\r\n")
+                    length = next(
+                        int(line.split(b":", 1)[1])
+                        for line in head.split(b"\r\n")
+                        if line.lower().startswith(b"content-length:")
+                    )
+                    _ = await reader.readexactly(length)
+                    latencies.append(perf_counter() - sent)
+                    statuses.add(head.split(b" ", 2)[1])
+            finally:
+                writer.close()
+                await writer.wait_closed()
+
+        async def load() -> float:
+            started = perf_counter()
+            deadline = started + DURATION_SECONDS
+            _ = await asyncio.gather(
+                *(connection(deadline) for _ in range(CONNECTIONS))
+            )
+            return perf_counter() - started
+
+        try:
+            tm.ok(manager.start_app(app_id))
+            elapsed = benchmark.pedantic(
+                lambda: asyncio.run(load()), rounds=1, iterations=1
+            )
+            requests_per_second = len(latencies) / elapsed
+            latencies.sort()
+            benchmark.extra_info["requests_per_second"] = requests_per_second
+            benchmark.extra_info["latency_p50_ms"] = (
+                latencies[len(latencies) // 2] * 1000
+            )
+            benchmark.extra_info["latency_p99_ms"] = (
+                latencies[int(len(latencies) * 0.99)] * 1000
+            )
+            tm.that(statuses, eq={str(c.Web.StatusCode.OK.value).encode()})
+            tm.that(requests_per_second > MIN_REQUESTS_PER_SECOND, eq=True)
+        finally:
+            _ = manager.stop_app(app_id)
+            u.Web.Tests.TestPortManager.release_port(port)
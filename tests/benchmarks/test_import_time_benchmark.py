@@ -0,0 +1,65 @@
+"""Cold import benchmark with a regression budget.
+
+Importing flext-web and touching its facades, settings and CLI-facing API
+must not import any web framework: FastAPI, Starlette, uvicorn, Flask and
+werkzeug load on first use through ``flext_web._frameworks``. The
+``-X importtime`` report of a fresh interpreter is parsed for the modules
+imported and the cumulative cost of ``flext_web``. Run with
+``--benchmark-enable`` to record timings.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_tests import tm
+
+FRAMEWORKS = frozenset({"fastapi", "flask", "starlette", "uvicorn", "werkzeug"})
+IMPORT_BUDGET_US = 1_500_000
+COLD_IMPORT = (
+    "import flext_web; flext_web.c; flext_web.settings; flext_web.u; flext_web.web"
+)
+
+
+@pytest.mark.performance
+class TestsFlextWebImportTimeBenchmark:
+    """Cumulative import cost of flext-web without any framework loaded."""
+
+    def test_cold_import_stays_within_budget(self, benchmark: BenchmarkFixture) -> None:
+        """No framework is imported and ``flext_web`` stays under budget."""
+
+        async def run_interpreter() -> str:
+            process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-X",
+                "importtime",
+                "-c",
+                COLD_IMPORT,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            _, stderr = await process.communicate()
+            tm.that(process.returncode, eq=0)
+            return stderr.decode()
+
+        def import_report() -> str:
+            return asyncio.run(run_interpreter())
+
+        report = benchmark.pedantic(import_report, rounds=1, iterations=1)
+        cumulative: dict[str, int] = {}
+        for line in report.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, total, name = (part.strip() for part in line.split("|"))
+            if total.isdigit():
+                cumulative[name] = int(total)
+        imported = {name.split(".")[0] for name in cumulative}
+        flext_web_us = cumulative.get("flext_web", 0)
+        benchmark.extra_info["flext_web_cumulative_us"] = flext_web_us
+        benchmark.extra_info["modules_imported"] = len(cumulative)
+        tm.that(sorted(imported & FRAMEWORKS), eq=[])
+        tm.that(flext_web_us <= IMPORT_BUDGET_US, eq=True)
@@ -0,0 +1,68 @@
+"""Request metrics recording and scrape benchmarks.
+
+Recording sits on every request path, so its cost per record is reported
+next to a no-op call of the same shape; wall-clock budgets are not asserted,
+since they flake on loaded machines. Scrapes within the cache TTL must not
+re-render. Run with ``--benchmark-enable`` to record timings.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from time import perf_counter
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_tests import tm
+from tests import u
+
+SAMPLES = 100_000
+SCRAPE_ROUTES = 1_000
+
+
+@pytest.mark.performance
+class TestsFlextWebMetricsBenchmark:
+    """Per-request cost of recording into the latency histograms."""
+
+    def test_record_overhead(self, benchmark: BenchmarkFixture) -> None:
+        """Record every sample and report the per-record cost over a no-op."""
+        metrics = u.Web.RequestMetrics()
+        routes = [f"/route/{index}" for index in range(16)]
+
+        def noop(app_id: str, route: str, status_code: int, elapsed_ns: int) -> None:
+            del app_id, route, status_code, elapsed_ns
+
+        def per_call_us(record: Callable[[str, str, int, int], None]) -> float:
+            started = perf_counter()
+            for index in range(SAMPLES):
+                record("bench", routes[index & 15], 200, (index % 5_000) * 1_000)
+            return (perf_counter() - started) / SAMPLES * 1_000_000
+
+        baseline_us = per_call_us(noop)
+        per_record_us = benchmark.pedantic(
+            per_call_us, args=(metrics.record,), rounds=1, iterations=1
+        )
+        benchmark.extra_info["per_record_us"] = per_record_us
+        benchmark.extra_info["noop_call_us"] = baseline_us
+        benchmark.extra_info["record_overhead_us"] = per_record_us - baseline_us
+        tm.that(metrics.summary()["requests"], eq=SAMPLES)
+
+    def test_cached_scrape_skips_rendering(self, benchmark: BenchmarkFixture) -> None:
+        """Scrapes within the TTL return the pre-rendered body."""
+        for index in range(SCRAPE_ROUTES):
+            u.Web.request_metrics.record("bench", f"/route/{index}", 200, 1_000_000)
+        cold_started = perf_counter()
+        body = u.Web.metrics_exposition()
+        cold_seconds = perf_counter() - cold_started
+
+        def scrape() -> float:
+            started = perf_counter()
+            for _ in range(100):
+                tm.that(u.Web.metrics_exposition() is body, eq=True)
+            return (perf_counter() - started) / 100
+
+        cached_seconds = benchmark.pedantic(scrape, rounds=1, iterations=1)
+        benchmark.extra_info["cold_render_ms"] = cold_seconds * 1000
+        benchmark.extra_info["cached_scrape_us"] = cached_seconds * 1_000_000
+        tm.that(cached_seconds < cold_seconds, eq=True)
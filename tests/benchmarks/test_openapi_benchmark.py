@@ -0,0 +1,51 @@
+"""OpenAPI first-hit cost across apps with identical routes.
+
+The schema of a route shape is generated and serialized once, so the first
+``/openapi.json`` of every further app only encodes its ``info`` header.
+Run with ``--benchmark-enable`` to record timings.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_tests import tm
+from tests import u
+
+APP_COUNT = 200
+
+
+@pytest.mark.performance
+class TestsFlextWebOpenApiBenchmark:
+    """First-hit OpenAPI document cost of 200 registered applications."""
+
+    def test_openapi_first_hit_per_app(self, benchmark: BenchmarkFixture) -> None:
+        """Every app's first document reuses the one shared serialization."""
+        manager = u.Web.WebAppManager
+        app_ids: list[str] = []
+        try:
+            for index in range(APP_COUNT):
+                created = manager.create_app(
+                    f"openapi-bench-{index}", 21_000 + index, "localhost"
+                )
+                tm.ok(created)
+                app_ids.append(str(created.value["id"]))
+            apps = [u.Web.framework_instances[app_id] for app_id in app_ids]
+            before = len(u.Web.openapi_documents)
+
+            def first_hits() -> float:
+                started = perf_counter()
+                for app in apps:
+                    _ = u.Web.openapi_document(app)
+                return perf_counter() - started
+
+            elapsed = benchmark.pedantic(first_hits, rounds=1, iterations=1)
+            benchmark.extra_info["first_hit_us"] = elapsed / APP_COUNT * 1_000_000
+            tm.that(len(u.Web.openapi_documents) - before <= 1, eq=True)
+        finally:
+            for app_id in app_ids:
+                _ = u.Web.apps_registry.pop(app_id)
+                _ = u.Web.framework_instances.pop(app_id, None)
@@ -0,0 +1,92 @@
+"""Registry list/fetch latency benchmarks at increasing application counts.
+
+Run with ``pytest tests/benchmarks --benchmark-enable`` to collect timings;
+under the default ``--benchmark-disable`` each case executes once as a test
+and sizes above ``SMOKE_SIZE`` are skipped to stay within ``--timeout``.
+"""
+
+from __future__ import annotations
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_tests import tm
+from flext_web import FlextWebServices
+from tests import c, u
+
+SIZES: tuple[int, ...] = (100, 10_000, 100_000)
+SMOKE_SIZE = 10_000
+
+
+@pytest.mark.performance
+class TestsFlextWebRegistryBenchmark:
+    """Latency of registry-backed list, fetch, count and dashboard reads."""
+
+    @staticmethod
+    def _populate(benchmark: BenchmarkFixture, size: int) -> None:
+        if u.Web.Tests.benchmark_size(benchmark, size, SMOKE_SIZE) < size:
+            pytest.skip("large registry sizes run only with --benchmark-enable")
+        registry = u.Web.apps_registry
+        registry.clear()
+        for index in range(size):
+            _ = registry.put({
+                "id": f"bench-{index}",
+                "name": f"bench-app-{index}",
+                "host": f"10.0.{index % 256}.1",
+                "port": 10_000 + index % 50_000,
+                "status": c.Web.Status.STOPPED.value,
+                "created_at": "2025-01-01T00:00:00Z",
+                "framework": c.Web.FRAMEWORK_FASTAPI,
+                "interface": c.Web.FRAMEWORK_INTERFACE_ASGI,
+            })
+
+    @pytest.mark.parametrize("size", SIZES)
+    def test_list_apps_latency(self, benchmark: BenchmarkFixture, size: int) -> None:
+        """list_apps returns the cached snapshot tuple without copying."""
+        self._populate(benchmark, size)
+        result = benchmark(u.Web.WebAppManager.list_apps)
+        tm.ok(result)
+        tm.that(len(result.value), eq=size)
+
+    @pytest.mark.parametrize("size", SIZES)
+    def test_fetch_by_id_latency(self, benchmark: BenchmarkFixture, size: int) -> None:
+        """fetch_by_id is a constant-time lookup regardless of registry size."""
+        self._populate(benchmark, size)
+        result = benchmark(u.Web.WebRepository.fetch_by_id, f"bench-{size // 2}")
+        tm.ok(result)
+        tm.that(result.value["id"], eq=f"bench-{size // 2}")
+
+    @pytest.mark.parametrize("size", SIZES)
+    def test_find_by_criteria_latency(
+        self, benchmark: BenchmarkFixture, size: int
+    ) -> None:
+        """Indexed criteria lookups only visit the matching bucket."""
+        self._populate(benchmark, size)
+        target = size - 1
+        result = benchmark(
+            u.Web.WebRepository.find_by_criteria,
+            {"name": f"bench-app-{target}", "port": 10_000 + target % 50_000},
+        )
+        tm.ok(result)
+        tm.that(len(result.value), eq=1)
+
+    @pytest.mark.parametrize("size", SIZES)
+    def test_dashboard_latency(self, benchmark: BenchmarkFixture, size: int) -> None:
+        """Dashboard totals are read from counters, independent of app count."""
+        self._populate(benchmark, size)
+        service = FlextWebServices()
+        result = benchmark(service.dashboard)
+        tm.ok(result)
+        tm.that(result.value.total_applications, eq=size)
+        tm.that(result.value.running_applications, eq=0)
+
+    @pytest.mark.parametrize("size", SIZES[:2])
+    def test_list_apps_projection_latency(
+        self, benchmark: BenchmarkFixture, size: int
+    ) -> None:
+        """Service listing validates every record in one batched call."""
+        self._populate(benchmark, size)
+        service = FlextWebServices()
+        result = benchmark(service.list_apps)
+        tm.ok(result)
+        tm.that(len(result.value), eq=size)
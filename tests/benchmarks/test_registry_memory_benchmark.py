@@ -0,0 +1,69 @@
+"""Registry memory footprint: compact entries vs dict snapshots.
+
+Allocations are traced with ``tracemalloc`` while 100k application records
+are stored, once as the read-only dict snapshots the registry used to keep
+and once as ``u.Web.AppEntry`` records. Compact entries must need well
+under the dict footprint; both per-app sizes are recorded. Run with
+``--benchmark-enable`` to record timings.
+"""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from collections.abc import Callable
+from types import MappingProxyType
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_tests import tm
+from tests import c, t, u
+
+APPS = 100_000
+
+
+@pytest.mark.performance
+class TestsFlextWebRegistryMemoryBenchmark:
+    """Traced bytes per registered application."""
+
+    @staticmethod
+    def _record(index: int) -> t.Web.ResponseDict:
+        return {
+            "id": f"bench-{index}",
+            "name": f"bench-app-{index}",
+            "host": f"10.0.{index % 256}.1",
+            "port": 10_000 + index % 50_000,
+            "status": c.Web.Status.STOPPED.value,
+            "created_at": "2025-01-01T00:00:00Z",
+            "framework": c.Web.FRAMEWORK_FASTAPI,
+            "interface": c.Web.FRAMEWORK_INTERFACE_ASGI,
+        }
+
+    @classmethod
+    def _traced_bytes_per_app(
+        cls, build: Callable[[t.Web.ResponseDict], t.Web.AppRecord]
+    ) -> float:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            records = [build(cls._record(index)) for index in range(APPS)]
+            traced, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        tm.that(len(records), eq=APPS)
+        return traced / APPS
+
+    def test_compact_entries_halve_registry_memory(
+        self, benchmark: BenchmarkFixture
+    ) -> None:
+        """``AppEntry`` stores a record in about half the bytes of a dict."""
+        dict_bytes = self._traced_bytes_per_app(
+            lambda record: MappingProxyType(dict(record))
+        )
+        entry_bytes = benchmark.pedantic(
+            self._traced_bytes_per_app, args=(u.Web.AppEntry,), rounds=1, iterations=1
+        )
+        benchmark.extra_info["dict_bytes_per_app"] = dict_bytes
+        benchmark.extra_info["entry_bytes_per_app"] = entry_bytes
+        tm.that(entry_bytes < dict_bytes * 0.6, eq=True)
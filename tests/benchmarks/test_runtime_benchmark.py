@@ -0,0 +1,47 @@
+"""Bulk runtime start benchmark.
+
+Start latency is bounded by socket bind and server startup, not by a fixed
+per-app sleep; run with ``--benchmark-enable`` to record timings. The
+default run starts ``SMOKE_APP_COUNT`` apps to stay within ``--timeout``.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_tests import tm
+from tests import p, t, u
+
+APP_COUNT = 200
+SMOKE_APP_COUNT = 10
+
+
+@pytest.mark.performance
+class TestsFlextWebRuntimeBenchmark:
+    """Wall time to start many registered applications sequentially."""
+
+    def test_bulk_start_latency(self, benchmark: BenchmarkFixture) -> None:
+        """Starting 200 apps completes at bind speed."""
+        manager = u.Web.WebAppManager
+        app_count = u.Web.Tests.benchmark_size(benchmark, APP_COUNT, SMOKE_APP_COUNT)
+        ports = [u.Web.Tests.TestPortManager.allocate_port() for _ in range(app_count)]
+        app_ids: list[str] = []
+        try:
+            for index, port in enumerate(ports):
+                created = manager.create_app(f"bench-{index}", port, "localhost")
+                tm.ok(created)
+                app_ids.append(str(created.value["id"]))
+
+            def start_all() -> list[p.Result[t.Web.AppRecord]]:
+                return [manager.start_app(app_id) for app_id in app_ids]
+
+            results = benchmark.pedantic(start_all, rounds=1, iterations=1)
+            tm.that(all(result.success for result in results), eq=True)
+        finally:
+            with ThreadPoolExecutor(max_workers=32) as pool:
+                _ = list(pool.map(manager.stop_app, app_ids))
+            for port in ports:
+                u.Web.Tests.TestPortManager.release_port(port)
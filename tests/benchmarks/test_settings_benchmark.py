@@ -0,0 +1,49 @@
+"""Settings access benchmark.
+
+``service.settings`` used to re-validate the bound runtime settings on every
+read; the cached snapshot turns repeated reads into an identity and
+revision check. The uncached baseline reconfigures the settings in place
+before every read. Run
+with ``--benchmark-enable`` to record timings.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter_ns
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_tests import tm
+from flext_web import FlextWebServices, FlextWebSettings
+
+READS = 2_000
+
+
+@pytest.mark.performance
+class TestsFlextWebSettingsBenchmark:
+    """Cost of ``service.settings`` with and without the snapshot cache."""
+
+    def test_settings_read_cost(self, benchmark: BenchmarkFixture) -> None:
+        """Cached reads are far cheaper than re-validating each time."""
+        settings = FlextWebSettings().clone(Web={"app_name": "bench"})
+        service = FlextWebServices.create_service(settings).value
+
+        def uncached() -> None:
+            for _ in range(READS):
+                settings.Web.app_name = "bench"
+                _ = service.settings
+
+        def cached() -> None:
+            for _ in range(READS):
+                _ = service.settings
+
+        started = perf_counter_ns()
+        uncached()
+        uncached_ns = (perf_counter_ns() - started) / READS
+        started = perf_counter_ns()
+        benchmark.pedantic(cached, rounds=1, iterations=1)
+        cached_ns = (perf_counter_ns() - started) / READS
+        benchmark.extra_info["uncached_ns_per_read"] = uncached_ns
+        benchmark.extra_info["cached_ns_per_read"] = cached_ns
+        tm.that(cached_ns * 10 < uncached_ns, eq=True)
@@ -0,0 +1,111 @@
+"""Compiled template rendering benchmarks.
+
+A 50 KB page with 200 variables is rendered through the compiled engine and
+through the per-key ``str.replace`` loop it replaced; the compiled render must
+produce the same page faster. A 5 MB page is streamed to measure the time to
+the first chunk and the peak memory against a full render. Run with
+``--benchmark-enable`` to record timings.
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+from time import perf_counter
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_tests import tm
+from tests import u
+
+VARIABLES = 200
+TEMPLATE_BYTES = 50 * 1024
+RENDERS = 200
+STREAM_PAGE_BYTES = 5 * 1024 * 1024
+
+
+@pytest.mark.performance
+class TestsFlextWebTemplateBenchmark:
+    """Render cost of a large template with many variables."""
+
+    @staticmethod
+    def _template() -> str:
+        filler = "<p>lorem ipsum dolor sit amet</p>\n"
+        block = TEMPLATE_BYTES // VARIABLES
+        parts = [
+            f"<div>{{{{var_{index}}}}}</div>{filler * (block // len(filler))}"
+            for index in range(VARIABLES)
+        ]
+        return "".join(parts)
+
+    def test_compiled_render_beats_replace_loop(
+        self, benchmark: BenchmarkFixture
+    ) -> None:
+        """One join over compiled pieces outruns one replace pass per key."""
+        u.Web.template_config.clear()
+        u.Web.template_globals.clear()
+        template = self._template()
+        context = {f"var_{index}": f"value {index}" for index in range(VARIABLES)}
+
+        started = perf_counter()
+        for _ in range(RENDERS):
+            expected = template
+            for key, value in context.items():
+                expected = expected.replace(f"{{{{{key}}}}}", value)
+        replace_seconds = (perf_counter() - started) / RENDERS
+
+        def render_all() -> float:
+            render_started = perf_counter()
+            for _ in range(RENDERS):
+                rendered = u.Web.WebTemplateEngine.render(template, context)
+            tm.that(rendered.value, eq=expected)
+            return (perf_counter() - render_started) / RENDERS
+
+        compiled_seconds = benchmark.pedantic(render_all, rounds=1, iterations=1)
+        benchmark.extra_info["template_bytes"] = len(template)
+        benchmark.extra_info["compiled_render_us"] = compiled_seconds * 1_000_000
+        benchmark.extra_info["replace_loop_us"] = replace_seconds * 1_000_000
+        tm.that(len(template) >= TEMPLATE_BYTES * 0.9, eq=True)
+        tm.that(compiled_seconds < replace_seconds, eq=True)
+
+    def test_stream_first_chunk_and_peak_memory(
+        self, benchmark: BenchmarkFixture
+    ) -> None:
+        """Streaming a 5 MB page starts early and never holds the whole page."""
+        u.Web.template_config.clear()
+        u.Web.template_globals.clear()
+        row = "<tr><td>{{name}}</td><td>{{email}}</td><td>{{note}}</td></tr>\n"
+        template = row * (STREAM_PAGE_BYTES // len(row))
+        context = {"name": "Ana", "email": "ana@example.com", "note": "a < b & c"}
+        tm.ok(u.Web.WebTemplateEngine.load_template_config({"autoescape": True}))
+        _ = u.Web.WebTemplateEngine.compiled(template)
+
+        tracemalloc.start()
+        started = perf_counter()
+        page = u.Web.WebTemplateEngine.render(template, context).value
+        full_seconds = perf_counter() - started
+        _, full_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        page_size = len(page)
+        del page
+
+        def stream() -> float:
+            tracemalloc.start()
+            stream_started = perf_counter()
+            chunks = u.Web.WebTemplateEngine.render_stream(template, context).value
+            first_chunk = next(chunks)
+            first_seconds = perf_counter() - stream_started
+            streamed = len(first_chunk) + sum(len(chunk) for chunk in chunks)
+            _, stream_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            tm.that(streamed, eq=page_size)
+            benchmark.extra_info["stream_peak_kib"] = stream_peak / 1024
+            tm.that(stream_peak < full_peak / 4, eq=True)
+            return first_seconds
+
+        first_seconds = benchmark.pedantic(stream, rounds=1, iterations=1)
+        benchmark.extra_info["page_bytes"] = page_size
+        benchmark.extra_info["full_render_ms"] = full_seconds * 1000
+        benchmark.extra_info["stream_first_chunk_ms"] = first_seconds * 1000
+        benchmark.extra_info["full_peak_kib"] = full_peak / 1024
+        tm.that(first_seconds < full_seconds, eq=True)
@@ -0,0 +1,79 @@
+"""WSGI runner throughput benchmark.
+
+Compares requests/sec of the single-threaded ``werkzeug`` runner against the
+thread-pool ``wsgi-pool`` runner under concurrent clients hitting a route that
+waits on I/O; run with ``--benchmark-enable`` to record timings.
+"""
+
+from __future__ import annotations
+
+import http.client
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import flask
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_tests import tm
+from flext_web import FlextWebSettings
+from tests import c, u
+
+CLIENTS = 8
+REQUESTS_PER_CLIENT = 50
+IO_WAIT_SECONDS = 0.005
+
+
+@pytest.mark.performance
+class TestsFlextWebWsgiBenchmark:
+    """Requests/sec of each WSGI runner with concurrent keep-alive clients."""
+
+    @staticmethod
+    def _client(port: int) -> int:
+        conn = http.client.HTTPConnection("localhost", port, timeout=5.0)
+        served = 0
+        try:
+            for _ in range(REQUESTS_PER_CLIENT):
+                conn.request("GET", "/io")
+                response = conn.getresponse()
+                served += int(response.read() == b"ok")
+                if response.will_close:
+                    conn.close()
+                    conn = http.client.HTTPConnection("localhost", port, timeout=5.0)
+        finally:
+            conn.close()
+        return served
+
+    @pytest.mark.parametrize(
+        "runner", [c.Web.FRAMEWORK_RUNNER_WERKZEUG, c.Web.FRAMEWORK_RUNNER_WSGI_POOL]
+    )
+    def test_runner_requests_per_second(
+        self, benchmark: BenchmarkFixture, runner: str
+    ) -> None:
+        """Both runners serve every request; the pool overlaps I/O waits."""
+        flask_app = flask.Flask(f"bench-{runner}")
+
+        def io_route() -> str:
+            time.sleep(IO_WAIT_SECONDS)
+            return "ok"
+
+        flask_app.add_url_rule("/io", "io", io_route)
+        port = u.Web.Tests.TestPortManager.allocate_port()
+        app_data = {"host": "localhost", "port": port, "interface": "wsgi"}
+        with u.Tests.env_vars_context({"FLEXT_WEB_WEB__WSGI_RUNNER": runner}):
+            FlextWebSettings.reset_for_testing()
+            started = u.Web.start_app_runtime(f"bench-{runner}", app_data, flask_app)
+            tm.ok(started)
+            try:
+
+                def load() -> int:
+                    with ThreadPoolExecutor(max_workers=CLIENTS) as pool:
+                        return sum(pool.map(self._client, [port] * CLIENTS))
+
+                served = benchmark.pedantic(load, rounds=1, iterations=1)
+                tm.that(served, eq=CLIENTS * REQUESTS_PER_CLIENT)
+                benchmark.extra_info["requests"] = served
+            finally:
+                _ = u.Web.stop_app_runtime(f"bench-{runner}", started.value)
+                FlextWebSettings.reset_for_testing()
+                u.Web.Tests.TestPortManager.release_port(port)
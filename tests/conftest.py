@@ -22,9 +22,16 @@ def pytest_runtest_setup(item: pytest.Item) -> None:
     """Reset the web settings singleton before each test for isolation."""
     _ = item
     FlextWebSettings.reset_for_testing()
+    u.Web.WebRepository.close_store()
     u.Web.apps_registry.clear()
     u.Web.app_runtimes.clear()
     u.Web.framework_instances.clear()
+    u.Web.request_metrics.clear()
+    u.Web.entity_evictions.reset()
+    u.Web.runtime_metrics.clear()
+    u.Web.metrics_cache.clear()
+    u.Web.template_cache.clear()
+    u.Web.template_loader.clear()
     u.Web.service_state.update({
         "routes_initialized": False,
         "middleware_configured": False,
@@ -35,9 +42,16 @@ def pytest_runtest_setup(item: pytest.Item) -> None:
 def pytest_runtest_teardown(item: pytest.Item, nextitem: pytest.Item | None) -> None:
     """Reset the web settings singleton after each test to prevent leaks."""
     _ = item, nextitem
+    u.Web.WebRepository.close_store()
     u.Web.apps_registry.clear()
     u.Web.app_runtimes.clear()
     u.Web.framework_instances.clear()
+    u.Web.request_metrics.clear()
+    u.Web.entity_evictions.reset()
+    u.Web.runtime_metrics.clear()
+    u.Web.metrics_cache.clear()
+    u.Web.template_cache.clear()
+    u.Web.template_loader.clear()
     u.Web.service_state.update({
         "routes_initialized": False,
         "middleware_configured": False,
@@ -10,23 +10,32 @@ _LAZY_IMPORTS = build_lazy_import_map({
     ".test___main__": ("TestsFlextWebMain",),
     ".test_api": ("TestsFlextWebApi",),
     ".test_app": ("TestsFlextWebApp",),
+    ".test_async_services": ("TestsFlextWebAsyncServices",),
     ".test_auth_service": ("TestsFlextWebAuth",),
     ".test_config": ("TestsFlextWebConfig",),
     ".test_constants": ("TestsFlextWebConstantsUnit",),
     ".test_entities_service": ("TestsFlextWebEntities",),
+    ".test_entity_journal": ("TestsFlextWebEntityJournal",),
     ".test_factory": ("TestsFlextWebFactory",),
     ".test_fields": ("TestsFlextWebFields",),
     ".test_handlers": ("TestsFlextWebHandlers",),
     ".test_handlers_direct": ("TestsFlextWebHandlersDirect",),
     ".test_health": ("TestsFlextWebHealth",),
     ".test_models": ("TestsFlextWebModelsUnit",),
+    ".test_openmetrics": ("TestsFlextWebOpenMetrics",),
     ".test_protocols": ("TestsFlextWebProtocolsUnit",),
+    ".test_registry": ("TestsFlextWebRegistry",),
+    ".test_request_metrics": ("TestsFlextWebRequestMetrics",),
+    ".test_runtime_concurrency": ("TestsFlextWebRuntimeConcurrency",),
     ".test_services": ("TestsFlextWebService",),
     ".test_settings": ("TestsFlextWebSettings",),
+    ".test_sqlite_repository": ("TestsFlextWebSqliteRepository",),
+    ".test_templates": ("TestsFlextWebTemplates",),
     ".test_typings": ("TestsFlextWebTypesUnit",),
     ".test_utilities": ("TestsFlextWebUtilitiesUnit",),
     ".test_version": ("TestsFlextWebVersion",),
     ".test_web_services_direct": ("TestsFlextWebServicesDirect",),
+    ".test_workers": ("TestsFlextWebWorkers",),
     "flext_tests": (
         "c",
         "d",
@@ -36,3 +36,8 @@ class TestsFlextWebMain:
         result = cmd.execute()
         tm.fail(result)
         tm.that(result.error, none=False)
+
+    def test_run_command_rejects_zero_workers(self) -> None:
+        """``--workers`` is validated through the settings SSOT."""
+        cmd = __main__.FlextWebRunCommand(host="127.0.0.1", workers=0, no_debug=True)
+        tm.fail(cmd.execute())
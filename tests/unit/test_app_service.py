@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import json
+
 from flext_tests import tm
-from flext_web import FlextWebApp, FlextWebSettings, c, m
+from flext_web import FlextWebApp, FlextWebSettings, c, m, u
 
 
 class TestsFlextWebApp:
@@ -40,6 +42,76 @@ class TestsFlextWebApp:
         tm.ok(result)
         tm.that(result.value.title, eq="Custom App")
 
+    def test_openapi_document_is_shared_between_apps(self) -> None:
+        """Apps with the same routes share one pre-serialized schema."""
+        service = FlextWebApp()
+        before = len(u.Web.openapi_documents)
+        apps = [
+            service.create_fastapi_app(
+                settings=m.Web.FastAPIAppConfig(title=title, version="1.0.0")
+            ).value
+            for title in ("Docs One", "Docs Two")
+        ]
+        documents = [u.Web.openapi_document(app) for app in apps]
+        for app, (body, _) in zip(apps, documents, strict=True):
+            tm.that(json.loads(body), eq=app.openapi())
+        tm.that(len(u.Web.openapi_documents) - before <= 1, eq=True)
+        tm.that(documents[0][1] != documents[1][1], eq=True)
+        tm.that(u.Web.openapi_document(apps[0])[1], eq=documents[0][1])
+
+    def test_openapi_document_tracks_route_schema_fields(self) -> None:
+        """Routes with the same endpoint but other schema fields never share."""
+        service = FlextWebApp()
+
+        def endpoint() -> dict[str, str]:
+            return {}
+
+        apps = []
+        for tags, status_code in ((["one"], 200), (["two"], 200), (["one"], 201)):
+            app = service.create_fastapi_app(
+                settings=m.Web.FastAPIAppConfig(title="Routes", version="1.0.0")
+            ).value
+            app.add_api_route("/items", endpoint, tags=tags, status_code=status_code)
+            apps.append(app)
+        for app in apps:
+            tm.that(json.loads(u.Web.openapi_document(app)[0]), eq=app.openapi())
+        tm.that(len({u.Web.openapi_document(app)[1] for app in apps}), eq=3)
+
+    def test_openapi_document_tracks_app_fields_and_overrides(self) -> None:
+        """App-level fields, later routes and ``openapi`` overrides are honoured."""
+        service = FlextWebApp()
+        apps = [
+            service.create_fastapi_app(
+                settings=m.Web.FastAPIAppConfig(title="Fields", version="1.0.0")
+            ).value
+            for _ in range(3)
+        ]
+        etag = u.Web.openapi_document(apps[0])[1]
+        apps[0].servers = [{"url": "https://api.example.com"}]
+        apps[0].openapi_tags = [{"name": "apps"}]
+        apps[0].summary = "Managed apps"
+
+        def endpoint() -> dict[str, str]:
+            return {}
+
+        apps[1].add_api_route("/later", endpoint)
+        for app in apps[:2]:
+            tm.that(json.loads(u.Web.openapi_document(app)[0]), eq=app.openapi())
+            app.openapi_schema = None
+        tm.that(u.Web.openapi_document(apps[0])[1] != etag, eq=True)
+        apps[2].openapi = lambda: {"openapi": "3.1.0", "custom": True}
+        tm.that(json.loads(u.Web.openapi_document(apps[2])[0]), has="custom")
+
+    def test_create_fastapi_app_without_docs(self) -> None:
+        """Disabling docs leaves no schema or docs routes on the app."""
+        service = FlextWebApp()
+        config = m.Web.FastAPIAppConfig(title="No Docs", docs_enabled=False)
+        result = service.create_fastapi_app(settings=config)
+        tm.ok(result)
+        paths = {getattr(route, "path", None) for route in result.value.routes}
+        for url in (c.Web.API_OPENAPI_URL, c.Web.API_DOCS_URL, c.Web.API_REDOC_URL):
+            tm.that(url in paths, eq=False)
+
     def test_create_flask_app(self) -> None:
         """Service creates a Flask app."""
         service = FlextWebApp()
@@ -81,6 +153,7 @@ class TestsFlextWebApp:
         payload = handler()
         tm.that(payload, has="status")
         tm.that(payload["status"], eq=c.Web.ResponseStatus.HEALTHY.value)
+        tm.that(payload, has="timestamp")
 
     def test_info_handler(self) -> None:
         """Info handler returns metadata payload."""
@@ -0,0 +1,110 @@
+"""Unit tests for the asyncio service facade and task-backed runtimes."""
+
+from __future__ import annotations
+
+import asyncio
+
+from flext_tests import tm
+from flext_web import FlextWebAsyncServices
+from tests import c, p, t, u
+
+
+class TestsFlextWebAsyncServices:
+    """Start and stop applications as uvicorn tasks on one event loop."""
+
+    def test_start_and_stop_run_uvicorn_as_task(self) -> None:
+        """A FastAPI app runs as a loop task and drains on ``astop_app``."""
+        service = FlextWebAsyncServices()
+        port = u.Web.Tests.TestPortManager.allocate_port()
+        created = u.Web.WebAppManager.create_app("async-app", port, "localhost")
+        tm.ok(created)
+        app_id = str(created.value["id"])
+
+        async def lifecycle() -> None:
+            started = await service.astart_app(app_id)
+            tm.ok(started)
+            tm.that(started.value.status, eq=c.Web.Status.RUNNING.value)
+            runtime = u.Web.app_runtimes[app_id]
+            tm.that(runtime.runner, eq=c.Web.FRAMEWORK_RUNNER_UVICORN_TASK)
+            tm.that(runtime.thread, none=True)
+            tm.that(runtime.alive, eq=True)
+            tm.fail(await service.astart_app(app_id))
+            stopped = await service.astop_app(app_id)
+            tm.ok(stopped)
+            tm.that(stopped.value.status, eq=c.Web.Status.STOPPED.value)
+            tm.that(runtime.alive, eq=False)
+
+        try:
+            asyncio.run(lifecycle())
+            tm.that(app_id in u.Web.app_runtimes, eq=False)
+        finally:
+            u.Web.Tests.TestPortManager.release_port(port)
+
+    def test_bulk_operations_report_every_outcome(self) -> None:
+        """``astart_apps``/``astop_apps`` aggregate successes and failures."""
+        service = FlextWebAsyncServices()
+        ports = [u.Web.Tests.TestPortManager.allocate_port() for _ in range(3)]
+        app_ids = [
+            str(
+                u.Web.WebAppManager.create_app(
+                    f"async-bulk-{index}", port, "localhost"
+                ).value["id"]
+            )
+            for index, port in enumerate(ports)
+        ]
+
+        async def bulk() -> None:
+            started = await service.astart_apps([*app_ids, "missing"])
+            tm.ok(started)
+            tm.that(sorted(started.value.succeeded), eq=sorted(app_ids))
+            tm.that(list(started.value.failed), eq=["missing"])
+            tm.that(started.value.pending, length=0)
+            tm.ok(await service.astop_service())
+
+        try:
+            asyncio.run(bulk())
+            for app_id in app_ids:
+                tm.that(
+                    u.Web.apps_registry[app_id]["status"], eq=c.Web.Status.STOPPED.value
+                )
+        finally:
+            for port in ports:
+                u.Web.Tests.TestPortManager.release_port(port)
+
+    def test_dead_serving_task_moves_app_to_error(self) -> None:
+        """A serving task that dies unstopped drops its runtime and errors."""
+        service = FlextWebAsyncServices()
+        port = u.Web.Tests.TestPortManager.allocate_port()
+        created = u.Web.WebAppManager.create_app("async-crash", port, "localhost")
+        tm.ok(created)
+        app_id = str(created.value["id"])
+
+        async def crash() -> None:
+            tm.ok(await service.astart_app(app_id))
+            task = u.Web.app_runtimes[app_id].task
+            tm.that(task, none=False)
+            if task is not None:
+                _ = task.cancel()
+                _ = await asyncio.wait({task})
+            await asyncio.sleep(0)
+
+        try:
+            asyncio.run(crash())
+            tm.that(app_id in u.Web.app_runtimes, eq=False)
+            tm.that(u.Web.apps_registry[app_id]["status"], eq=c.Web.Status.ERROR.value)
+            tm.fail(u.Web.WebAppManager.stop_app(app_id))
+        finally:
+            u.Web.Tests.TestPortManager.release_port(port)
+
+    def test_bulk_records_raising_operations_as_failed(self) -> None:
+        """An operation that raises is reported under ``failed``."""
+
+        async def explode(app_id: str) -> p.Result[t.Web.AppRecord]:
+            await asyncio.sleep(0)
+            msg = f"boom {app_id}"
+            raise RuntimeError(msg)
+
+        outcome = asyncio.run(u.Web.WebAppManager.arun_bulk(explode, ["app-1"]))
+        tm.ok(outcome)
+        tm.that(outcome.value["failed"], eq={"app-1": "boom app-1"})
+        tm.that(outcome.value["succeeded"], length=0)
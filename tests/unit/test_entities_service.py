@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+from threading import Event, Thread
+
 from flext_tests import tm
-from flext_web import FlextWebEntities, m
+from flext_web import FlextWebEntities, FlextWebHealth, c, m, u
+
+CONCURRENT_READS = 200
 
 
 class TestsFlextWebEntities:
@@ -65,3 +69,240 @@ class TestsFlextWebEntities:
         result = service.validate_business_rules()
         tm.ok(result)
         tm.that(result.value is True, eq=True)
+
+    def test_list_page_filters_sorts_and_resumes(self) -> None:
+        """Entity pages honor filters, sorting and the returned cursor."""
+        service = FlextWebEntities()
+        for index, name in enumerate(("beta", "alpha", "api-c", "api-a", "api-b")):
+            tm.ok(
+                service.create(
+                    m.Web.EntityData(
+                        data={"name": name, "status": "on" if index else "off"}
+                    )
+                )
+            )
+        first = service.list_page(
+            m.Web.ListQuery(status="on", name_prefix="api-", sort_by="name", limit=2)
+        )
+        tm.ok(first)
+        tm.that(
+            [item.data["name"] for item in first.value.items], eq=["api-a", "api-b"]
+        )
+        tm.that(first.value.total, eq=3)
+        rest = service.list_page(
+            m.Web.ListQuery(
+                status="on",
+                name_prefix="api-",
+                sort_by="name",
+                limit=2,
+                cursor=first.value.next_cursor,
+            )
+        )
+        tm.ok(rest)
+        tm.that([item.data["name"] for item in rest.value.items], eq=["api-c"])
+        tm.that(rest.value.next_cursor, none=True)
+        insertion = service.list_page(m.Web.ListQuery(limit=10, descending=True))
+        tm.ok(insertion)
+        tm.that(insertion.value.items[0].data["name"], eq="api-b")
+
+    def test_query_uses_hash_and_sorted_indexes(self) -> None:
+        """Indexed and scanned queries agree on equality and range conditions."""
+        service = FlextWebEntities()
+        for index in range(10):
+            tm.ok(
+                service.create(
+                    m.Web.EntityData(
+                        data={
+                            "external_key": f"ext-{index}",
+                            "score": index,
+                            "group": "even" if index % 2 == 0 else "odd",
+                        }
+                    )
+                )
+            )
+        scanned = service.query(group="even", score=m.Web.ValueRange(low=3, high=7))
+        tm.ok(service.create_index("external_key"))
+        tm.ok(service.create_index("score", c.Web.IndexKind.SORTED))
+        tm.fail(service.create_index("score"))
+        by_key = service.query(external_key="ext-4")
+        tm.ok(by_key)
+        tm.that([entity.data["score"] for entity in by_key.value], eq=[4])
+        in_range = service.query(group="even", score=m.Web.ValueRange(low=3, high=7))
+        tm.ok(in_range)
+        tm.that([entity.data["score"] for entity in in_range.value], eq=[4, 6])
+        tm.that(in_range.value, eq=scanned.value)
+        late = service.create(
+            m.Web.EntityData(data={"external_key": "ext-late", "score": 5})
+        )
+        tm.ok(late)
+        tm.that(
+            sorted(
+                str(entity.data["external_key"])
+                for entity in service.query(score=5).value
+            ),
+            eq=["ext-5", "ext-late"],
+        )
+        tm.that(service.query(external_key="missing").value, length=0)
+
+    def test_query_scans_when_an_index_cannot_hold_the_value(self) -> None:
+        """Unhashable conditions on a hash-indexed field fall back to a scan."""
+        service = FlextWebEntities()
+        tm.ok(service.create(m.Web.EntityData(data={"tags": ["a", "b"]})))
+        tm.ok(service.create(m.Web.EntityData(data={"tags": ["c"]})))
+        scanned = service.query(tags=["a", "b"])
+        tm.that(scanned.value, length=1)
+        tm.ok(service.create_index("tags"))
+        indexed = service.query(tags=["a", "b"])
+        tm.ok(indexed)
+        tm.that(indexed.value, eq=scanned.value)
+
+    def test_reads_are_safe_against_concurrent_writers(self) -> None:
+        """Queries and listings never see storage change mid-iteration."""
+        service = FlextWebEntities()
+        tm.ok(service.create_index("group"))
+        tm.ok(service.create_index("rank", c.Web.IndexKind.SORTED))
+        done = Event()
+
+        def churn() -> None:
+            index = 0
+            while not done.is_set():
+                created = service.create(
+                    m.Web.EntityData(data={"group": "g", "rank": index})
+                )
+                if created.success and index % 2:
+                    _ = service.delete(str(created.value.data["id"]))
+                index += 1
+
+        writer = Thread(target=churn)
+        writer.start()
+        try:
+            for _ in range(CONCURRENT_READS):
+                tm.ok(service.query(group="g"))
+                tm.ok(service.query(rank=m.Web.ValueRange(low=0)))
+                tm.ok(service.query(missing_field=None))
+                tm.ok(service.list_page(m.Web.ListQuery(limit=10, sort_by="rank")))
+        finally:
+            done.set()
+            writer.join()
+
+    def test_update_and_delete_enforce_expected_version(self) -> None:
+        """Stale versions are rejected; matching versions apply and bump."""
+        service = FlextWebEntities()
+        created = service.create(m.Web.EntityData(data={"name": "a", "n": 1}))
+        tm.ok(created)
+        entity_id = str(created.value.data["id"])
+        tm.that(created.value.version, eq=1)
+        updated = service.update(entity_id, {"n": 2}, expected_version=1)
+        tm.ok(updated)
+        tm.that(updated.value.data, eq={"id": entity_id, "name": "a", "n": 2})
+        tm.that(updated.value.version, eq=2)
+        tm.fail(service.update(entity_id, {"n": 3}, expected_version=1))
+        tm.ok(service.update(entity_id, {"n": 3}))
+        tm.fail(service.update("missing", {"n": 1}))
+        tm.fail(service.delete(entity_id, expected_version=2))
+        tm.ok(service.delete(entity_id, expected_version=3))
+        tm.fail(service.fetch_entity(entity_id))
+        tm.fail(service.delete(entity_id))
+
+    def test_bulk_create_and_update_are_all_or_nothing(self) -> None:
+        """``update_many`` checks every version before writing anything."""
+        service = FlextWebEntities()
+        tm.ok(service.create_index("group"))
+        created = service.create_many([
+            m.Web.EntityData(data={"group": "a", "n": index}) for index in range(3)
+        ])
+        tm.ok(created)
+        ids = [str(entity.data["id"]) for entity in created.value]
+        conflicting = service.update_many([
+            m.Web.EntityPatch(entity_id=ids[0], patch={"group": "b"}),
+            m.Web.EntityPatch(
+                entity_id=ids[1], patch={"group": "b"}, expected_version=5
+            ),
+        ])
+        tm.fail(conflicting)
+        tm.that(service.query(group="b").value, length=0)
+        updated = service.update_many([
+            m.Web.EntityPatch(
+                entity_id=ids[0], patch={"group": "b"}, expected_version=1
+            ),
+            m.Web.EntityPatch(entity_id=ids[0], patch={"n": 10}, expected_version=2),
+            m.Web.EntityPatch(entity_id=ids[2], patch={"group": "b"}),
+        ])
+        tm.ok(updated)
+        tm.that([entity.version for entity in updated.value], eq=[3, 2])
+        tm.that(
+            [entity.data["n"] for entity in service.query(group="b").value], eq=[10, 2]
+        )
+        tm.that(service.query(group="a").value, length=1)
+
+    def test_limits_evict_lru_and_lfu_and_publish_counters(self) -> None:
+        """Capacity limits evict the coldest entity and count it in metrics."""
+        service = FlextWebEntities()
+        created = service.create_many([
+            m.Web.EntityData(data={"n": index}) for index in range(3)
+        ])
+        tm.ok(created)
+        ids = [str(entity.data["id"]) for entity in created.value]
+        evicted = service.configure_limits(max_entries=2, sweep_interval=0)
+        tm.ok(evicted)
+        tm.that(evicted.value, eq=1)
+        tm.fail(service.fetch_entity(ids[0]))
+        tm.ok(service.fetch_entity(ids[1]))
+        tm.ok(service.create(m.Web.EntityData(data={"n": 3})))
+        tm.ok(service.fetch_entity(ids[1]))
+        tm.fail(service.fetch_entity(ids[2]))
+
+        lfu = FlextWebEntities()
+        tm.ok(
+            lfu.configure_limits(
+                max_entries=2, policy=c.Web.EvictionPolicy.LFU, sweep_interval=0
+            )
+        )
+        hot = lfu.create(m.Web.EntityData(data={"n": 0})).value.data["id"]
+        cold = lfu.create(m.Web.EntityData(data={"n": 1})).value.data["id"]
+        for _ in range(3):
+            tm.ok(lfu.fetch_entity(str(hot)))
+        tm.ok(lfu.create(m.Web.EntityData(data={"n": 2})))
+        tm.ok(lfu.fetch_entity(str(hot)))
+        tm.fail(lfu.fetch_entity(str(cold)))
+
+        tm.that(service.evictions.snapshot(), eq={"evictions": 2, "expirations": 0})
+        tm.that(lfu.evictions.snapshot(), eq={"evictions": 1, "expirations": 0})
+        tm.that(
+            u.Web.entity_evictions.snapshot(), eq={"evictions": 3, "expirations": 0}
+        )
+        metrics = FlextWebHealth().metrics()
+        tm.ok(metrics)
+        tm.that(metrics.value.components, has="entities")
+
+    def test_ttl_expires_lazily_and_by_sweep_with_injected_clock(self) -> None:
+        """Expired entities vanish on access and in bounded sweeps."""
+        now = [100.0]
+        service = FlextWebEntities()
+        tm.fail(service.create(m.Web.EntityData(data={"n": 0}), ttl=1))
+        tm.ok(
+            service.configure_limits(
+                default_ttl=10, clock=lambda: now[0], sweep_interval=0
+            )
+        )
+        short = service.create(m.Web.EntityData(data={"n": 0}), ttl=1)
+        tm.ok(short)
+        short_id = str(short.value.data["id"])
+        tm.ok(
+            service.create_many([
+                m.Web.EntityData(data={"n": index}) for index in range(1, 4)
+            ])
+        )
+        tm.fail(service.create(m.Web.EntityData(data={"n": 0}), ttl=0))
+        now[0] = 101.0
+        tm.fail(service.fetch_entity(short_id))
+        tm.that(service.list_all().value, length=3)
+        tm.ok(service.update(str(service.list_all().value[0].data["id"]), {"n": 9}))
+        now[0] = 110.0
+        swept = service.sweep(limit=2)
+        tm.ok(swept)
+        tm.that(swept.value, eq=2)
+        tm.that(service.query(n=3).value, length=0)
+        tm.that(service.list_all().value, length=0)
+        tm.that(service.evictions.snapshot()["expirations"], eq=4)
+        tm.that(u.Web.entity_evictions.snapshot()["expirations"], eq=4)
@@ -0,0 +1,105 @@
+"""Unit tests for the entity write-ahead journal."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from flext_tests import tm
+from flext_web import FlextWebEntities
+from tests import m, u
+
+
+class TestsFlextWebEntityJournal:
+    """Durability of `u.Web.EntityJournal` and journaled `FlextWebEntities`."""
+
+    def test_entities_survive_restart(self, tmp_path: Path) -> None:
+        """Entities created with a journal are recovered by a new service."""
+        service = FlextWebEntities()
+        tm.that(service.open_journal(tmp_path).value, eq=0)
+        created = [
+            service.create(m.Web.EntityData(data={"name": f"entity-{index}"})).value
+            for index in range(3)
+        ]
+        service.close_journal()
+
+        restored = FlextWebEntities()
+        tm.that(restored.open_journal(tmp_path).value, eq=3)
+        listed = restored.list_all()
+        tm.ok(listed)
+        tm.that(
+            [entity.data["id"] for entity in listed.value],
+            eq=[entity.data["id"] for entity in created],
+        )
+        tm.fail(restored.open_journal(tmp_path))
+        restored.close_journal()
+
+    def test_updates_and_deletes_are_replayed_with_versions(
+        self, tmp_path: Path
+    ) -> None:
+        """Recovered entities keep their latest data and version."""
+        service = FlextWebEntities()
+        tm.ok(service.open_journal(tmp_path))
+        kept, dropped = service.create_many([
+            m.Web.EntityData(data={"name": "kept"}),
+            m.Web.EntityData(data={"name": "dropped"}),
+        ]).value
+        kept_id = str(kept.data["id"])
+        tm.ok(service.update(kept_id, {"name": "renamed"}, expected_version=1))
+        tm.ok(service.delete(str(dropped.data["id"])))
+        service.close_journal()
+
+        restored = FlextWebEntities()
+        tm.that(restored.open_journal(tmp_path).value, eq=1)
+        entity = restored.fetch_entity(kept_id).value
+        tm.that(entity.data["name"], eq="renamed")
+        tm.that(entity.version, eq=2)
+        restored.close_journal()
+
+    def test_compaction_snapshots_and_truncates_the_log(self, tmp_path: Path) -> None:
+        """After compaction the snapshot holds the state and the log is empty."""
+        service = FlextWebEntities()
+        tm.fail(service.compact_journal())
+        tm.ok(service.open_journal(tmp_path, group_commit_ms=0))
+        for index in range(5):
+            tm.ok(service.create(m.Web.EntityData(data={"n": index})))
+        tm.ok(service.compact_journal())
+        tm.ok(service.create(m.Web.EntityData(data={"n": 5})))
+        service.close_journal()
+        journal = u.Web.EntityJournal(tmp_path)
+        tm.that(journal.snapshot_path.stat().st_size > 0, eq=True)
+        recovered = journal.recover()
+        tm.that(len(recovered), eq=6)
+        tm.that(journal.records, eq=1)
+        journal.close()
+
+    def test_recovery_drops_a_torn_tail(self, tmp_path: Path) -> None:
+        """A partially written last line is ignored and truncated away."""
+        journal = u.Web.EntityJournal(tmp_path, group_commit_ms=0)
+        _ = journal.recover()
+        journal.append("put", "a", {"n": 1})
+        journal.append("put", "b", {"n": 2})
+        journal.append("delete", "a")
+        journal.close()
+        intact = journal.log_path.stat().st_size
+        with journal.log_path.open("ab") as handle:
+            _ = handle.write(b'{"op":"put","id":"torn"')
+        reopened = u.Web.EntityJournal(tmp_path)
+        tm.that(reopened.recover(), eq={"b": ({"n": 2}, 1)})
+        tm.that(reopened.log_path.stat().st_size, eq=intact)
+        reopened.close()
+
+    def test_group_commit_batches_fsyncs(self, tmp_path: Path) -> None:
+        """Concurrent appends share fsyncs under group commit."""
+        journal = u.Web.EntityJournal(tmp_path, group_commit_ms=5)
+        _ = journal.recover()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            _ = list(
+                pool.map(
+                    lambda index: journal.append("put", f"e{index}", {"n": index}),
+                    range(200),
+                )
+            )
+        tm.that(journal.records, eq=200)
+        tm.that(journal.syncs < 200, eq=True)
+        journal.close()
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import json
+
+import flask
+
 from flext_tests import tm
-from flext_web import FlextWebHealth, u
-from tests import c
+from flext_web import FlextWebHealth
+from tests import c, u
 
 
 class TestsFlextWebHealth:
@@ -17,7 +21,7 @@ class TestsFlextWebHealth:
             "middleware_configured": False,
             "service_running": False,
         })
-        u.Web.web_metrics.clear()
+        u.Web.request_metrics.clear()
 
     def test_execute_returns_success(self) -> None:
         """Health service execute returns success."""
@@ -37,7 +41,7 @@ class TestsFlextWebHealth:
     def test_metrics_when_operational(self) -> None:
         """Metrics reflect operational service state."""
         u.Web.service_state["service_running"] = True
-        u.Web.web_metrics.update({"requests": 5, "errors": 1})
+        u.Web.request_metrics.record("health-app", "/", 200, 1_000_000)
         health = FlextWebHealth()
         result = health.metrics()
         tm.ok(result)
@@ -74,6 +78,69 @@ class TestsFlextWebHealth:
         finally:
             u.Web.WebMonitoring.web_health_status = original
 
+    def test_health_payload_refreshes_timestamp_once_per_second(self) -> None:
+        """A timestamped body is reused within a second and re-encoded after."""
+        now = [1_000.2]
+        payload = u.Web.HealthPayload(
+            {"status": c.Web.ResponseStatus.HEALTHY.value},
+            timestamped=True,
+            clock=lambda: now[0],
+            stamp=lambda: f"stamp-{now[0]}",
+        )
+        first = payload.body()
+        now[0] = 1_000.9
+        tm.that(payload.body() is first, eq=True)
+        now[0] = 1_001.0
+        second = payload.body()
+        tm.that(second is first, eq=False)
+        tm.that(json.loads(second)["timestamp"], eq="stamp-1001.0")
+
+    def test_health_payload_reencodes_only_on_change(self) -> None:
+        """``update`` keeps the body for equal fields and re-encodes changes."""
+        payload = u.Web.HealthPayload({"app_id": "first"})
+        body = payload.body()
+        payload.update(app_id="first")
+        tm.that(payload.body() is body, eq=True)
+        payload.update(app_id="second")
+        tm.that(payload.body(), eq=b'{"app_id":"second"}')
+
+    def test_protocol_health_serves_pre_encoded_body(self) -> None:
+        """Flask ``/protocol/health`` returns the app's cached JSON bytes."""
+        flask_app = flask.Flask("health-app")
+        u.Web.configure_framework_app_routes(flask_app, "health-app")
+        payload = flask_app.config[c.Web.FLASK_HEALTH_CONFIG_KEY]
+        response = flask_app.test_client().get("/protocol/health")
+        tm.that(response.content_type, eq=c.Web.HTTP_CONTENT_TYPE_JSON)
+        tm.that(response.get_data(), eq=payload.body())
+        tm.that(response.get_json()["app_id"], eq="health-app")
+
+    def test_protocol_health_follows_lifecycle_status(self) -> None:
+        """Status transitions are published to the app's health body."""
+        port = u.Web.Tests.TestPortManager.allocate_port()
+        created = u.Web.WebAppManager.create_app("health-status", port, "localhost")
+        tm.ok(created)
+        app_id = str(created.value["id"])
+        app_instance = u.Web.framework_instances[app_id]
+        payload = getattr(
+            getattr(app_instance, "state", None), "flext_web_health", None
+        )
+        tm.that(payload, is_=u.Web.HealthPayload)
+        try:
+            for previous, status, expected in (
+                (c.Web.Status.STOPPED, c.Web.Status.STARTING, "degraded"),
+                (c.Web.Status.STARTING, c.Web.Status.RUNNING, "healthy"),
+                (c.Web.Status.RUNNING, c.Web.Status.ERROR, "error"),
+            ):
+                tm.ok(
+                    u.Web.WebRepository.compare_and_set_status(
+                        app_id, {previous.value}, status.value
+                    )
+                )
+                if isinstance(payload, u.Web.HealthPayload):
+                    tm.that(json.loads(payload.body())["status"], eq=expected)
+        finally:
+            u.Web.Tests.TestPortManager.release_port(port)
+
     def test_validate_business_rules(self) -> None:
         """Health service business rules validate cleanly."""
         health = FlextWebHealth()
@@ -0,0 +1,107 @@
+"""Unit tests for the OpenMetrics ``/metrics`` exposition."""
+
+from __future__ import annotations
+
+import http.client
+
+import flask
+
+from flext_tests import tm
+from flext_web import FlextWebSettings
+from tests import c, u
+
+
+class TestsFlextWebOpenMetrics:
+    """Local scrapes of ``/metrics`` on real FastAPI and Flask apps."""
+
+    @staticmethod
+    def _flask_app(name: str) -> flask.Flask:
+        flask_app = flask.Flask(name)
+        u.Web.configure_framework_app_routes(flask_app, name)
+        u.Web.configure_framework_app_middleware(flask_app, name)
+        return flask_app
+
+    def test_fastapi_scrape_exposes_requests_apps_and_runtime(self) -> None:
+        """A scrape of a running app reports requests, status gauges and timings."""
+        manager = u.Web.WebAppManager
+        port = u.Web.Tests.TestPortManager.allocate_port()
+        created = manager.create_app("scraped-app", port, "localhost")
+        tm.ok(created)
+        app_id = str(created.value["id"])
+        try:
+            tm.ok(manager.start_app(app_id))
+            conn = http.client.HTTPConnection("localhost", port, timeout=5.0)
+            conn.request("GET", "/protocol/health")
+            _ = conn.getresponse().read()
+            conn.request("GET", c.Web.METRICS_ROUTE)
+            response = conn.getresponse()
+            body = response.read().decode()
+            conn.close()
+        finally:
+            _ = manager.stop_app(app_id)
+            u.Web.Tests.TestPortManager.release_port(port)
+        tm.that(response.status, eq=200)
+        tm.that(str(response.getheader("content-type")), eq=c.Web.METRICS_CONTENT_TYPE)
+        tm.that(body.endswith("# EOF\n"), eq=True)
+        labels = f'app="{app_id}",route="/protocol/health"'
+        tm.that(body, has=f"flext_web_http_requests_total{{{labels}}} 1")
+        tm.that(
+            body,
+            has=f'flext_web_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1',
+        )
+        tm.that(body, has='flext_web_apps{status="running"} 1')
+        tm.that(body, has="flext_web_runtime_threads 1")
+        tm.that(
+            body,
+            has=f'flext_web_runtime_operation_duration_seconds_count{{app="{app_id}",operation="start"}} 1',
+        )
+
+    def test_flask_scrape_is_cached_within_ttl(self) -> None:
+        """Scrapes inside the TTL reuse one pre-rendered body."""
+        client = self._flask_app("cached-flask").test_client()
+        _ = client.get("/protocol/health")
+        first = client.get(c.Web.METRICS_ROUTE)
+        _ = client.get("/protocol/health")
+        second = client.get(c.Web.METRICS_ROUTE)
+        tm.that(first.content_type, eq=c.Web.METRICS_CONTENT_TYPE)
+        tm.that(second.get_data(), eq=first.get_data())
+        tm.that(
+            first.get_data(as_text=True),
+            has='flext_web_http_requests_total{app="cached-flask",route="/protocol/health"} 1',
+        )
+
+    def test_flask_scrape_rerenders_when_ttl_is_zero(self) -> None:
+        """With ``metrics_cache_ttl=0`` every scrape renders fresh counters."""
+        with u.Tests.env_vars_context({"FLEXT_WEB_WEB__METRICS_CACHE_TTL": "0"}):
+            FlextWebSettings.reset_for_testing()
+            client = self._flask_app("fresh-flask").test_client()
+            _ = client.get("/protocol/health")
+            _ = client.get(c.Web.METRICS_ROUTE)
+            _ = client.get("/protocol/health")
+            body = client.get(c.Web.METRICS_ROUTE).get_data(as_text=True)
+        FlextWebSettings.reset_for_testing()
+        tm.that(
+            body,
+            has='flext_web_http_requests_total{app="fresh-flask",route="/protocol/health"} 2',
+        )
+
+    def test_writer_escapes_labels_and_accumulates_buckets(self) -> None:
+        """Label values are escaped and ``le`` buckets are cumulative."""
+        metrics = u.Web.RequestMetrics()
+        for latency_ms in (0.5, 3, 40, 20_000):
+            metrics.record('a"b', "/x\n", 200, int(latency_ms * 1_000_000))
+        writer = u.Web.OpenMetricsWriter()
+        writer.histogram(
+            "latency_seconds",
+            "Latency.",
+            [
+                ({"app": app, "route": route}, snapshot)
+                for app, route, snapshot in metrics.snapshots()
+            ],
+        )
+        body = writer.render().decode()
+        prefix = 'latency_seconds_bucket{app="a\\"b",route="/x\\n"'
+        tm.that(body, has=f'{prefix},le="0.001"}} 1')
+        tm.that(body, has=f'{prefix},le="0.005"}} 2')
+        tm.that(body, has=f'{prefix},le="10.0"}} 3')
+        tm.that(body, has=f'{prefix},le="+Inf"}} 4')
@@ -9,11 +9,18 @@ behavior, and are prohibited.
 
 from __future__ import annotations
 
+import http.client
+import json
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
 import flask
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
 
 from flext_tests import tm
+from flext_web import FlextWebSettings
 from tests import c, u
 
 
@@ -33,12 +40,7 @@ class TestsFlextWebProtocolsUnit:
         u.Web.template_config.clear()
         u.Web.template_filters.clear()
         u.Web.template_globals.clear()
-        u.Web.web_metrics.update({
-            "requests": 0,
-            "errors": 0,
-            "uptime": "0s",
-            "avg_response_time_ms": 0,
-        })
+        u.Web.request_metrics.clear()
 
     @staticmethod
     def _assert_protocol_base_lifecycle() -> None:
@@ -111,6 +113,53 @@ class TestsFlextWebProtocolsUnit:
         tm.ok(list_result)
         tm.that(list_result.value["count"], eq=1)
 
+    def test_handler_list_pages_with_query_parameters(self) -> None:
+        """The list action filters, pages and returns a resumable cursor."""
+        self._reset_protocol_state()
+        handler = u.Web.WebHandler
+        for index in range(3):
+            tm.ok(
+                handler.handle_request({
+                    "action": "create",
+                    "name": f"paged-{index}",
+                    "port": 8090 + index,
+                    "host": "localhost",
+                })
+            )
+        first = handler.handle_request({"action": "list", "limit": 2})
+        tm.ok(first)
+        tm.that(first.value["count"], eq=2)
+        tm.that(first.value["total"], eq=3)
+        second = handler.handle_request({
+            "action": "list",
+            "limit": 2,
+            "cursor": first.value["next_cursor"],
+        })
+        tm.ok(second)
+        tm.that(second.value["count"], eq=1)
+        tm.that(second.value["next_cursor"], none=True)
+        tm.fail(handler.handle_request({"action": "list", "limit": 0}))
+
+    def test_handler_list_without_limit_returns_every_app(self) -> None:
+        """Without ``limit`` or ``cursor`` the list action is not paged."""
+        self._reset_protocol_state()
+        total = c.Web.LIST_DEFAULT_LIMIT + 5
+        _ = u.Web.apps_registry.put_many([
+            {"id": f"app-{index}", "name": f"app-{index}", "status": "stopped"}
+            for index in range(total)
+        ])
+        listed = u.Web.WebHandler.handle_request({"action": "list"})
+        tm.ok(listed)
+        tm.that(listed.value["count"], eq=total)
+        tm.that(listed.value["app_ids"], length=total)
+        tm.that(listed.value["next_cursor"], none=True)
+        filtered = u.Web.WebHandler.handle_request({
+            "action": "list",
+            "status": "stopped",
+        })
+        tm.ok(filtered)
+        tm.that(filtered.value["count"], eq=total)
+
     def test_protocol_app_lifecycle_end_to_end(self) -> None:
         """Create, list, start, and stop transition through real app states."""
         self._reset_protocol_state()
@@ -149,6 +198,65 @@ class TestsFlextWebProtocolsUnit:
             routes = [rule.rule for rule in app_instance.url_map.iter_rules()]
             tm.that(routes, has="/protocol/health")
 
+    def test_apps_share_protocol_routes_and_keep_their_id(self) -> None:
+        """Protocol routes are built once and answer with each app's own id."""
+        self._reset_protocol_state()
+        manager = u.Web.WebAppManager
+        port = u.Web.Tests.TestPortManager.allocate_port()
+        created = [
+            manager.create_app(f"shared-{index}", port, "localhost")
+            for index in range(2)
+        ]
+        app_ids = [str(result.value["id"]) for result in created]
+        first, second = (u.Web.framework_instances[app_id] for app_id in app_ids)
+        tm.that(first, is_=FastAPI)
+        tm.that(second, is_=FastAPI)
+        first_routes = first.routes if isinstance(first, FastAPI) else []
+        second_routes = second.routes if isinstance(second, FastAPI) else []
+        shared = [route for route in first_routes if isinstance(route, APIRoute)]
+        tm.that(shared, length=2)
+        tm.that(
+            all(any(other is route for other in second_routes) for route in shared),
+            eq=True,
+        )
+        try:
+            tm.ok(manager.start_app(app_ids[1]))
+            conn = http.client.HTTPConnection("localhost", port, timeout=5.0)
+            conn.request("GET", "/protocol/health")
+            payload = json.loads(conn.getresponse().read())
+            conn.close()
+            tm.that(payload["app_id"], eq=app_ids[1])
+        finally:
+            _ = manager.stop_app(app_ids[1])
+            u.Web.Tests.TestPortManager.release_port(port)
+
+    def test_openapi_document_answers_conditional_requests(self) -> None:
+        """``/openapi.json`` carries an ETag and revalidates with ``304``."""
+        self._reset_protocol_state()
+        manager = u.Web.WebAppManager
+        port = u.Web.Tests.TestPortManager.allocate_port()
+        created = manager.create_app("openapi-app", port, "localhost")
+        tm.ok(created)
+        app_id = str(created.value["id"])
+        try:
+            tm.ok(manager.start_app(app_id))
+            conn = http.client.HTTPConnection("localhost", port, timeout=5.0)
+            conn.request("GET", c.Web.API_OPENAPI_URL)
+            response = conn.getresponse()
+            document = json.loads(response.read())
+            etag = response.getheader("ETag")
+            tm.that(response.status, eq=c.Web.StatusCode.OK.value)
+            tm.that(document["info"]["title"], eq="openapi-app")
+            tm.that(document["paths"], has="/protocol/health")
+            conn.request("GET", c.Web.API_OPENAPI_URL, headers={"If-None-Match": etag})
+            revalidated = conn.getresponse()
+            tm.that(revalidated.read(), eq=b"")
+            tm.that(revalidated.status, eq=c.Web.StatusCode.NOT_MODIFIED.value)
+            conn.close()
+        finally:
+            _ = manager.stop_app(app_id)
+            u.Web.Tests.TestPortManager.release_port(port)
+
     def test_start_stop_manage_runtime_registry(self) -> None:
         """Runtime metadata persists on start and is cleaned up on stop."""
         self._reset_protocol_state()
@@ -162,3 +270,139 @@ class TestsFlextWebProtocolsUnit:
         stopped = manager.stop_app(app_id)
         tm.ok(stopped)
         tm.that(app_id not in u.Web.app_runtimes, eq=True)
+
+    def test_start_app_is_connectable_on_return(self) -> None:
+        """start_app only returns once the listener accepts connections."""
+        self._reset_protocol_state()
+        manager = u.Web.WebAppManager
+        test_port = u.Web.Tests.TestPortManager.allocate_port()
+        created = manager.create_app("ready-app", test_port, "localhost")
+        tm.ok(created)
+        app_id = str(created.value["id"])
+        try:
+            tm.ok(manager.start_app(app_id))
+            with socket.create_connection(("localhost", test_port), timeout=1.0):
+                pass
+        finally:
+            _ = manager.stop_app(app_id)
+            u.Web.Tests.TestPortManager.release_port(test_port)
+
+    def test_start_app_fails_deterministically_on_bound_port(self) -> None:
+        """A bind failure is reported as a start failure and rolled back."""
+        self._reset_protocol_state()
+        manager = u.Web.WebAppManager
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as blocker:
+            blocker.bind(("localhost", 0))
+            blocker.listen()
+            busy_port = int(blocker.getsockname()[1])
+            created = manager.create_app("busy-app", busy_port, "localhost")
+            tm.ok(created)
+            app_id = str(created.value["id"])
+            tm.fail(manager.start_app(app_id))
+        tm.that(u.Web.apps_registry[app_id]["status"], eq=c.Web.Status.STOPPED.value)
+        tm.that(app_id not in u.Web.app_runtimes, eq=True)
+
+    def test_failed_start_from_error_keeps_error_status(self) -> None:
+        """A failed retry of an app in ``error`` rolls back to ``error``."""
+        self._reset_protocol_state()
+        manager = u.Web.WebAppManager
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as blocker:
+            blocker.bind(("localhost", 0))
+            blocker.listen()
+            busy_port = int(blocker.getsockname()[1])
+            created = manager.create_app("error-app", busy_port, "localhost")
+            tm.ok(created)
+            app_id = str(created.value["id"])
+            _ = u.Web.apps_registry.update(app_id, {"status": c.Web.Status.ERROR.value})
+            tm.fail(manager.start_app(app_id))
+        tm.that(u.Web.apps_registry[app_id]["status"], eq=c.Web.Status.ERROR.value)
+
+    def test_wsgi_pool_runner_serves_concurrent_keep_alive_requests(self) -> None:
+        """The wsgi-pool runner serves concurrent HTTP/1.1 clients and stops."""
+        self._reset_protocol_state()
+        flask_app = flask.Flask("pool-app")
+        flask_app.add_url_rule("/ping", "ping", lambda: "pong")
+        test_port = u.Web.Tests.TestPortManager.allocate_port()
+        app_data = {"host": "localhost", "port": test_port, "interface": "wsgi"}
+
+        def fetch_twice(_: int) -> list[bytes]:
+            conn = http.client.HTTPConnection("localhost", test_port, timeout=2.0)
+            try:
+                bodies: list[bytes] = []
+                for _ in range(2):
+                    conn.request("GET", "/ping")
+                    bodies.append(conn.getresponse().read())
+                return bodies
+            finally:
+                conn.close()
+
+        with u.Tests.env_vars_context({"FLEXT_WEB_WEB__WSGI_RUNNER": "wsgi-pool"}):
+            FlextWebSettings.reset_for_testing()
+            try:
+                started = u.Web.start_app_runtime("pool-app", app_data, flask_app)
+                tm.ok(started)
+                runtime = started.value
+                tm.that(runtime.runner, eq=c.Web.FRAMEWORK_RUNNER_WSGI_POOL)
+                with ThreadPoolExecutor(max_workers=4) as pool:
+                    bodies = [
+                        body
+                        for pair in pool.map(fetch_twice, range(4))
+                        for body in pair
+                    ]
+                tm.that(bodies, eq=[b"pong"] * 8)
+                tm.ok(u.Web.stop_app_runtime("pool-app", runtime))
+            finally:
+                FlextWebSettings.reset_for_testing()
+                u.Web.Tests.TestPortManager.release_port(test_port)
+
+    @staticmethod
+    def _closed(client: socket.socket) -> bool:
+        """Return whether the server closed ``client`` without answering."""
+        try:
+            return client.recv(64) == b""
+        except ConnectionResetError:
+            return True
+
+    def test_wsgi_pool_close_releases_queued_connections(self) -> None:
+        """Connections still queued when the pool closes are closed, not leaked."""
+        self._reset_protocol_state()
+        release = Event()
+        entered = Event()
+        flask_app = flask.Flask("pool-close-app")
+
+        def blocked() -> str:
+            entered.set()
+            _ = release.wait(5.0)
+            return "done"
+
+        flask_app.add_url_rule("/blocked", "blocked", blocked)
+        test_port = u.Web.Tests.TestPortManager.allocate_port()
+        app_data = {"host": "localhost", "port": test_port, "interface": "wsgi"}
+        request = b"GET /blocked HTTP/1.1\r\nHost: localhost\r\n\r\n"
+        clients: list[socket.socket] = []
+        with u.Tests.env_vars_context({
+            "FLEXT_WEB_WEB__WSGI_RUNNER": "wsgi-pool",
+            "FLEXT_WEB_WEB__WSGI_WORKERS": "1",
+            "FLEXT_WEB_WEB__DRAIN_TIMEOUT": "0.1",
+        }):
+            FlextWebSettings.reset_for_testing()
+            try:
+                started = u.Web.start_app_runtime("pool-close-app", app_data, flask_app)
+                tm.ok(started)
+                runtime = started.value
+                for _ in range(3):
+                    client = socket.create_connection(("localhost", test_port), 2.0)
+                    client.sendall(request)
+                    clients.append(client)
+                    _ = entered.wait(2.0)
+                tm.ok(u.Web.stop_app_runtime("pool-close-app", runtime))
+                tm.that([self._closed(client) for client in clients[1:]], eq=[True] * 2)
+                release.set()
+                drain = getattr(runtime.server, "drain", None)
+                tm.that(drain is not None and drain(2.0), eq=True)
+            finally:
+                release.set()
+                for client in clients:
+                    client.close()
+                FlextWebSettings.reset_for_testing()
+                u.Web.Tests.TestPortManager.release_port(test_port)
@@ -0,0 +1,228 @@
+"""Unit tests for the copy-on-write application registry."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from flext_tests import tm
+from tests import c, m, u
+
+
+class TestsFlextWebRegistry:
+    """Behavior of `u.Web.AppRegistry` and the registry-backed protocols."""
+
+    @staticmethod
+    def _record(app_id: str, **overrides: str | int) -> dict[str, str | int]:
+        record: dict[str, str | int] = {
+            "id": app_id,
+            "name": f"app-{app_id}",
+            "host": "localhost",
+            "port": 9000,
+            "status": c.Web.Status.STOPPED.value,
+        }
+        record.update(overrides)
+        return record
+
+    def test_put_returns_read_only_snapshot(self) -> None:
+        """Snapshots cannot be mutated by readers."""
+        registry = u.Web.AppRegistry()
+        snapshot = registry.put(self._record("a1"))
+        with pytest.raises(TypeError):
+            snapshot["status"] = c.Web.Status.RUNNING.value  # type: ignore[index]
+        tm.that(registry["a1"]["status"], eq=c.Web.Status.STOPPED.value)
+
+    def test_entries_pack_status_and_intern_shared_strings(self) -> None:
+        """Entries keep standard fields in slots and convert back losslessly."""
+        registry = u.Web.AppRegistry()
+        first = registry.put(
+            self._record("a1", host="LOCALHOST".lower(), framework="flask")
+        )
+        second = registry.put(self._record("a2", framework="flask"))
+        tm.that(isinstance(first, u.Web.AppEntry), eq=True)
+        tm.that(first["host"] is second["host"], eq=True)
+        tm.that(registry["a1"]["status"], eq=c.Web.Status.STOPPED.value)
+        tm.that(registry["a1"].state, eq=c.Web.AppState.STOPPED)
+        custom = registry.put({**self._record("a3", status="paused"), "tags": ["x"]})
+        tm.that(custom["status"], eq="paused")
+        tm.that(custom["tags"], eq=("x",))
+        tm.that(registry["a3"].state, none=True)
+        restored = registry.update("a3", {"status": c.Web.Status.RUNNING.value})
+        tm.that(restored, none=False)
+        tm.that(
+            registry["a3"].as_dict(),
+            eq={
+                **self._record("a3", status=c.Web.Status.RUNNING.value),
+                "tags": ("x",),
+            },
+        )
+        tm.that(registry.count("status", c.Web.Status.RUNNING.value), eq=1)
+
+    def test_update_is_copy_on_write(self) -> None:
+        """Updates replace the snapshot and leave earlier ones untouched."""
+        registry = u.Web.AppRegistry()
+        before = registry.put(self._record("a1"))
+        version = registry.version
+        after = registry.update("a1", {"status": c.Web.Status.RUNNING.value})
+        tm.that(after, none=False)
+        tm.that(before["status"], eq=c.Web.Status.STOPPED.value)
+        tm.that(registry["a1"]["status"], eq=c.Web.Status.RUNNING.value)
+        tm.that(registry.version > version, eq=True)
+        tm.that(registry.update("missing", {"status": "x"}), none=True)
+
+    def test_values_cached_until_write(self) -> None:
+        """values() reuses the same tuple until the registry changes."""
+        registry = u.Web.AppRegistry()
+        _ = registry.put(self._record("a1"))
+        first = registry.values()
+        tm.that(registry.values() is first, eq=True)
+        _ = registry.put(self._record("a2"))
+        tm.that(registry.values() is first, eq=False)
+        tm.that(len(registry.values()), eq=2)
+
+    def test_find_uses_indexes_and_tracks_updates(self) -> None:
+        """Indexed lookups follow status transitions and removals."""
+        registry = u.Web.AppRegistry()
+        _ = registry.put(self._record("a1", host="10.0.0.1"))
+        _ = registry.put(self._record("a2", port=9001))
+        _ = registry.update("a2", {"status": c.Web.Status.RUNNING.value})
+        running = registry.find({"status": c.Web.Status.RUNNING.value})
+        tm.that([record["id"] for record in running], eq=["a2"])
+        tm.that(len(registry.find({"host": "localhost", "port": 9000})), eq=0)
+        tm.that(len(registry.find({"host": "10.0.0.1", "port": 9000})), eq=1)
+        tm.that(len(registry.find({"status": c.Web.Status.STOPPED.value})), eq=1)
+        _ = registry.pop("a1")
+        tm.that(registry.find({"status": c.Web.Status.STOPPED.value}), eq=())
+        tm.that(registry.find({"host": "10.0.0.1"}), eq=())
+
+    def test_find_with_unindexed_field_scans_candidates(self) -> None:
+        """Criteria on non-indexed fields are still honored."""
+        registry = u.Web.AppRegistry()
+        _ = registry.put(self._record("a1", framework="fastapi"))
+        _ = registry.put(self._record("a2", framework="flask"))
+        matches = registry.find({"framework": "flask"})
+        tm.that([record["id"] for record in matches], eq=["a2"])
+
+    def test_compare_and_set_status_has_single_winner(self) -> None:
+        """Only one of many concurrent claimers wins the transition."""
+        registry = u.Web.AppRegistry()
+        _ = registry.put(self._record("a1"))
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            outcomes = list(
+                pool.map(
+                    lambda _: registry.compare_and_set_status(
+                        "a1", c.Web.STARTABLE_STATUSES, c.Web.Status.STARTING.value
+                    ),
+                    range(64),
+                )
+            )
+        tm.that(sum(1 for outcome in outcomes if outcome is not None), eq=1)
+        tm.that(registry["a1"]["status"], eq=c.Web.Status.STARTING.value)
+        tm.that(
+            registry.compare_and_set_status("missing", {"stopped"}, "running"),
+            none=True,
+        )
+
+    def test_stripe_lock_serializes_only_its_own_app(self) -> None:
+        """Holding one app's stripe blocks its writers, not other apps'."""
+        registry = u.Web.AppRegistry()
+        other = next(
+            f"b{index}"
+            for index in range(256)
+            if registry.lock_for(f"b{index}") is not registry.lock_for("a1")
+        )
+        _ = registry.put(self._record("a1"))
+        _ = registry.put(self._record(other))
+
+        def claim(app_id: str) -> bool:
+            return (
+                registry.compare_and_set_status(
+                    app_id, c.Web.STARTABLE_STATUSES, c.Web.Status.STARTING.value
+                )
+                is not None
+            )
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            with registry.lock_for("a1"):
+                blocked = pool.submit(claim, "a1")
+                tm.that(pool.submit(claim, other).result(timeout=5.0), eq=True)
+                tm.that(blocked.done(), eq=False)
+            tm.that(blocked.result(timeout=5.0), eq=True)
+
+    def test_lock_stripes_are_stable_per_key(self) -> None:
+        """The same key always maps to the same stripe lock."""
+        stripes = u.Web.LockStripes(8)
+        tm.that(len(stripes), eq=8)
+        tm.that(stripes.lock_for("app-1") is stripes.lock_for("app-1"), eq=True)
+
+    def test_repository_save_and_fetch_share_snapshot(self) -> None:
+        """The repository hands out the stored snapshot without copying."""
+        saved = u.Web.WebRepository.save(self._record("repo-1"))
+        tm.ok(saved)
+        fetched = u.Web.WebRepository.fetch_by_id("repo-1")
+        tm.ok(fetched)
+        tm.that(fetched.value is saved.value, eq=True)
+        tm.fail(u.Web.WebRepository.save({"name": "no-id"}))
+
+    def test_page_walks_insertion_order_with_stable_cursor(self) -> None:
+        """Cursors resume after the last item even when earlier items go away."""
+        registry = u.Web.AppRegistry()
+        for index in range(7):
+            _ = registry.put(self._record(f"p{index}"))
+        first, total, cursor = registry.page(
+            {}, name_prefix=None, sort_by=None, descending=False, after=None, limit=3
+        )
+        tm.that([record["id"] for record in first], eq=["p0", "p1", "p2"])
+        tm.that(total, eq=7)
+        tm.that(cursor, none=False)
+        assert cursor is not None
+        _ = registry.pop("p1")
+        second, _, cursor = registry.page(
+            {},
+            name_prefix=None,
+            sort_by=None,
+            descending=False,
+            after=u.Web.decode_cursor(cursor),
+            limit=3,
+        )
+        tm.that([record["id"] for record in second], eq=["p3", "p4", "p5"])
+        assert cursor is not None
+        last, _, cursor = registry.page(
+            {},
+            name_prefix=None,
+            sort_by=None,
+            descending=False,
+            after=u.Web.decode_cursor(cursor),
+            limit=3,
+        )
+        tm.that([record["id"] for record in last], eq=["p6"])
+        tm.that(cursor, none=True)
+
+    def test_repository_page_filters_and_sorts(self) -> None:
+        """find_page pushes status/host/port/prefix filters and sorting down."""
+        for index, port in enumerate((9003, 9001, 9002, 9004)):
+            _ = u.Web.apps_registry.put(
+                self._record(
+                    f"r{index}",
+                    name="api-x" if index < 3 else "web-x",
+                    port=port,
+                    status=c.Web.Status.RUNNING.value
+                    if index != 1
+                    else c.Web.Status.STOPPED.value,
+                )
+            )
+        page = u.Web.WebRepository.find_page(
+            m.Web.ListQuery(
+                status=c.Web.Status.RUNNING.value,
+                name_prefix="api-",
+                sort_by="port",
+                descending=True,
+            )
+        )
+        tm.ok(page)
+        records, total, cursor = page.value
+        tm.that([record["id"] for record in records], eq=["r0", "r2"])
+        tm.that(total, eq=2)
+        tm.that(cursor, none=True)
+        tm.fail(u.Web.WebRepository.find_page(m.Web.ListQuery(cursor="not-a-cursor")))
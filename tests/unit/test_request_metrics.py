@@ -0,0 +1,125 @@
+"""Unit tests for per-request latency histograms."""
+
+from __future__ import annotations
+
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
+
+import flask
+
+from flext_tests import tm
+from tests import c, t, u
+
+
+class TestsFlextWebRequestMetrics:
+    """Histogram accuracy and middleware recording through `u.Web`."""
+
+    @staticmethod
+    def _routes(app_id: str) -> t.Web.ResponseDict:
+        apps = u.Web.WebMonitoring.web_metrics()["apps"]
+        assert isinstance(apps, dict)
+        app_summary = apps[app_id]
+        assert isinstance(app_summary, dict)
+        routes = app_summary["routes"]
+        assert isinstance(routes, dict)
+        return routes
+
+    def test_bucket_value_bounds_relative_error(self) -> None:
+        """Every value maps to a bucket whose upper bound is within 1/64."""
+        histogram = u.Web.LatencyHistogram
+        for value in (*range(300), 1_000, 65_537, 999_999, 3_600_000_000):
+            upper = histogram.bucket_value(histogram.bucket_index(value))
+            tm.that(upper >= value, eq=True)
+            tm.that(upper - value <= value // 64 + 1, eq=True)
+
+    def test_percentiles_and_error_rate(self) -> None:
+        """Percentiles, error rate and counters come from recorded requests."""
+        metrics = u.Web.RequestMetrics()
+        for latency_ms in range(1, 1001):
+            status = 500 if latency_ms % 100 == 0 else 200
+            metrics.record("app", "/items", status, latency_ms * 1_000_000)
+        summary = metrics.summary()
+        tm.that(summary["requests"], eq=1000)
+        tm.that(summary["errors"], eq=10)
+        tm.that(summary["error_rate"], eq=0.01)
+        for label, expected_ms in (("p50_ms", 500), ("p99_ms", 990)):
+            observed = summary[label]
+            assert isinstance(observed, float)
+            tm.that(abs(observed - expected_ms) <= expected_ms / 64, eq=True)
+        tm.that(summary["p999_ms"], eq=1000.0)
+
+    def test_concurrent_recording_loses_no_samples(self) -> None:
+        """Per-thread shards keep every sample under concurrent writers."""
+        metrics = u.Web.RequestMetrics()
+
+        def record_many(_: int) -> None:
+            for _ in range(5_000):
+                metrics.record("app", "/hot", 200, 250_000)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            _ = list(pool.map(record_many, range(8)))
+        tm.that(metrics.summary()["requests"], eq=40_000)
+
+    def test_exited_thread_shards_are_folded(self) -> None:
+        """Shards of exited threads are merged, so churn keeps every sample."""
+        histogram = u.Web.LatencyHistogram()
+
+        def record_once() -> None:
+            histogram.record(250, error=False)
+
+        for _ in range(50):
+            worker = Thread(target=record_once)
+            worker.start()
+            worker.join()
+        histogram.record(500, error=True)
+        snapshot = histogram.snapshot()
+        tm.that(snapshot.total, eq=51)
+        tm.that(snapshot.errors, eq=1)
+        tm.that(histogram.shard_count, eq=1)
+
+    def test_fastapi_middleware_records_route_status_and_latency(self) -> None:
+        """A running FastAPI app records real status codes per route template."""
+        manager = u.Web.WebAppManager
+        port = u.Web.Tests.TestPortManager.allocate_port()
+        created = manager.create_app("metrics-app", port, "localhost")
+        tm.ok(created)
+        app_id = str(created.value["id"])
+        try:
+            tm.ok(manager.start_app(app_id))
+            conn = http.client.HTTPConnection("localhost", port, timeout=5.0)
+            for path in ("/protocol/health", "/protocol/health", "/missing"):
+                conn.request("GET", path)
+                _ = conn.getresponse().read()
+            conn.close()
+        finally:
+            _ = manager.stop_app(app_id)
+            u.Web.Tests.TestPortManager.release_port(port)
+        routes = self._routes(app_id)
+        health = routes["/protocol/health"]
+        assert isinstance(health, dict)
+        tm.that(health["requests"], eq=2)
+        tm.that(health["errors"], eq=0)
+        tm.that(health["max_ms"] > 0, eq=True)
+        unmatched = routes[c.Web.METRICS_UNMATCHED_ROUTE]
+        assert isinstance(unmatched, dict)
+        tm.that(unmatched["errors"], eq=1)
+
+    def test_flask_middleware_records_rule_and_status(self) -> None:
+        """Flask requests are labelled by URL rule with the response status."""
+        flask_app = flask.Flask("metrics-flask")
+        flask_app.add_url_rule(
+            "/items/<int:item_id>", "item", lambda item_id: f"item {item_id}"
+        )
+        flask_app.add_url_rule("/down", "down", lambda: flask.abort(503))
+        u.Web.configure_framework_app_middleware(flask_app, "metrics-flask")
+        client = flask_app.test_client()
+        for path in ("/items/1", "/items/2", "/down"):
+            _ = client.get(path)
+        routes = self._routes("metrics-flask")
+        items = routes["/items/<int:item_id>"]
+        down = routes["/down"]
+        assert isinstance(items, dict)
+        assert isinstance(down, dict)
+        tm.that(items["requests"], eq=2)
+        tm.that(down["error_rate"], eq=1.0)
@@ -0,0 +1,66 @@
+"""Stress tests for concurrent application start/stop through `u.Web`."""
+
+from __future__ import annotations
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+import pytest
+
+from flext_tests import tm
+from tests import c, u
+
+APP_COUNT = 6
+WORKERS = 16
+OPERATIONS_PER_WORKER = 12
+
+
+@pytest.mark.stress
+class TestsFlextWebRuntimeConcurrency:
+    """Hammer start/stop from many threads and check runtime invariants."""
+
+    def test_parallel_start_stop_keeps_invariants(self) -> None:
+        """Concurrent start/stop never double-starts or loses a status update."""
+        manager = u.Web.WebAppManager
+        ports = [u.Web.Tests.TestPortManager.allocate_port() for _ in range(APP_COUNT)]
+        app_ids: list[str] = []
+        net_starts: Counter[str] = Counter()
+        net_lock = Lock()
+        try:
+            for index, port in enumerate(ports):
+                created = manager.create_app(f"stress-{index}", port, "localhost")
+                tm.ok(created)
+                app_ids.append(str(created.value["id"]))
+
+            def worker(seed: int) -> None:
+                for step in range(OPERATIONS_PER_WORKER):
+                    app_id = app_ids[(seed * 7 + step) % APP_COUNT]
+                    if (seed + step) % 2 == 0:
+                        delta = 1 if manager.start_app(app_id).success else 0
+                    else:
+                        delta = -1 if manager.stop_app(app_id).success else 0
+                    with net_lock:
+                        net_starts[app_id] += delta
+
+            with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+                list(pool.map(worker, range(WORKERS)))
+
+            for app_id in app_ids:
+                status = u.Web.apps_registry[app_id]["status"]
+                tm.that(
+                    [c.Web.Status.RUNNING.value, c.Web.Status.STOPPED.value], has=status
+                )
+                running = status == c.Web.Status.RUNNING.value
+                tm.that(net_starts[app_id], eq=1 if running else 0)
+                tm.that(app_id in u.Web.app_runtimes, eq=running)
+            tm.that(
+                len(u.Web.apps_registry.find({"status": c.Web.Status.RUNNING.value})),
+                eq=len(u.Web.app_runtimes),
+            )
+        finally:
+            for app_id in app_ids:
+                if app_id in u.Web.app_runtimes:
+                    _ = manager.stop_app(app_id)
+            for port in ports:
+                u.Web.Tests.TestPortManager.release_port(port)
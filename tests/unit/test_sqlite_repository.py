@@ -0,0 +1,133 @@
+"""Unit tests for the SQLite-backed application repository."""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+from flext_tests import tm
+from flext_web import FlextWebSettings
+from tests import c, m, p, u
+
+
+class TestsFlextWebSqliteRepository:
+    """Persistence, warm-loading and read-through of `u.Web.SqliteWebRepository`."""
+
+    @staticmethod
+    def _record(app_id: str, **overrides: str | int) -> dict[str, str | int]:
+        record: dict[str, str | int] = {
+            "id": app_id,
+            "name": f"app-{app_id}",
+            "host": "localhost",
+            "port": 9000,
+            "status": c.Web.Status.STOPPED.value,
+        }
+        record.update(overrides)
+        return record
+
+    def test_store_uses_wal_and_indexes(self, tmp_path: Path) -> None:
+        """The database runs in WAL mode and status lookups use an index."""
+        path = tmp_path / "apps.db"
+        store = u.Web.SqliteAppStore(path)
+        tm.that(store.journal_mode, eq="wal")
+        with closing(sqlite3.connect(path)) as connection:
+            plan = connection.execute(
+                f"EXPLAIN QUERY PLAN {store.SELECT_BY['status']}", ("running",)
+            ).fetchall()
+        tm.that(str(plan), has="apps_status")
+        store.close()
+
+    def test_records_survive_restart_via_warm_load(self, tmp_path: Path) -> None:
+        """A new repository on the same file restores every record in order."""
+        path = tmp_path / "apps.db"
+        repository = u.Web.SqliteWebRepository(path)
+        tm.that(isinstance(repository, p.Web.WebRepository), eq=True)
+        saved = repository.save_many([
+            self._record(f"app-{index}", port=9000 + index) for index in range(5)
+        ])
+        tm.ok(saved)
+        tm.ok(repository.save(self._record("app-2", status="running")))
+        tm.ok(repository.delete("app-4"))
+        tm.fail(repository.delete("missing"))
+        repository.close()
+
+        registry = u.Web.AppRegistry()
+        restored = u.Web.SqliteWebRepository(path, registry)
+        tm.that(len(registry), eq=4)
+        listed = restored.find_all()
+        tm.ok(listed)
+        tm.that(
+            [record["id"] for record in listed.value],
+            eq=["app-0", "app-1", "app-2", "app-3"],
+        )
+        tm.that(restored.count({"status": "running"}).value, eq=1)
+        page = restored.find_page(m.Web.ListQuery(limit=2))
+        tm.ok(page)
+        tm.that(page.value[1], eq=4)
+        restored.close()
+
+    def test_cold_repository_reads_through(self, tmp_path: Path) -> None:
+        """Without warm-load, reads hit SQLite and populate the cache."""
+        path = tmp_path / "apps.db"
+        writer = u.Web.SqliteWebRepository(path)
+        tm.ok(
+            writer.save_many([
+                self._record("a", host="alpha"),
+                self._record("b", host="beta", port=9001),
+            ])
+        )
+        writer.close()
+
+        cold = u.Web.SqliteWebRepository(path, warm_load=False)
+        tm.that(len(cold.cache), eq=0)
+        tm.that(cold.count({}).value, eq=2)
+        tm.that(cold.count({"host": "beta"}).value, eq=1)
+        fetched = cold.fetch_by_id("a")
+        tm.ok(fetched)
+        tm.that(fetched.value["host"], eq="alpha")
+        tm.that(len(cold.cache), eq=1)
+        found = cold.find_by_criteria({"port": 9001, "host": "beta"})
+        tm.ok(found)
+        tm.that([record["id"] for record in found.value], eq=["b"])
+        tm.fail(cold.fetch_by_id("missing"))
+        cold.close()
+
+    def test_save_rejects_records_without_id(self, tmp_path: Path) -> None:
+        """Invalid batches fail without writing anything."""
+        repository = u.Web.SqliteWebRepository(tmp_path / "apps.db")
+        tm.fail(repository.save_many([self._record("ok"), {"name": "no-id"}]))
+        tm.that(repository.store.count(), eq=0)
+        repository.close()
+
+    def test_manager_apps_survive_registry_rebuild(self, tmp_path: Path) -> None:
+        """Apps created through the manager are restored from ``registry_path``."""
+        path = tmp_path / "apps.db"
+        with u.Tests.env_vars_context({"FLEXT_WEB_WEB__REGISTRY_PATH": str(path)}):
+            FlextWebSettings.reset_for_testing()
+            tm.ok(u.Web.WebService.restore_registry())
+            created = u.Web.WebAppManager.create_app("durable-app", 9100, "localhost")
+            tm.ok(created)
+            app_id = str(created.value["id"])
+            tm.ok(
+                u.Web.WebRepository.compare_and_set_status(
+                    app_id, c.Web.STARTABLE_STATUSES, c.Web.Status.STARTING.value
+                )
+            )
+            u.Web.WebRepository.close_store()
+            u.Web.apps_registry.clear()
+            u.Web.framework_instances.clear()
+
+            restored = u.Web.WebService.restore_registry()
+        FlextWebSettings.reset_for_testing()
+        tm.ok(restored)
+        tm.that(restored.value, eq=1)
+        fetched = u.Web.WebRepository.fetch_by_id(app_id)
+        tm.ok(fetched)
+        tm.that(fetched.value["name"], eq="durable-app")
+        tm.that(fetched.value["status"], eq=c.Web.Status.STOPPED.value)
+        tm.that(app_id in u.Web.framework_instances, eq=True)
+        tm.ok(u.Web.WebRepository.delete(app_id))
+        store = u.Web.SqliteAppStore(path)
+        tm.that(store.fetch(app_id), none=True)
+        store.close()
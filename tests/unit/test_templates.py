@@ -0,0 +1,201 @@
+"""Unit tests for the compiled template engine."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import flask
+
+from flext_tests import tm
+from tests import c, u
+
+
+class TestsFlextWebTemplates:
+    """Rendering and compiled-template caching through `u.Web`."""
+
+    @staticmethod
+    def _reset_template_state() -> None:
+        u.Web.template_config.clear()
+        u.Web.template_filters.clear()
+        u.Web.template_globals.clear()
+        u.Web.template_cache.clear()
+
+    def test_render_resolves_context_globals_and_filters(self) -> None:
+        """Context overrides globals and filters apply per placeholder."""
+        self._reset_template_state()
+        engine = u.Web.WebTemplateEngine()
+        engine.add_global("site", value="flext")
+        engine.add_global("user", value="global-user")
+        engine.add_filter("upper", str.upper)
+        engine.add_filter("exclaim", lambda text: f"{text}!")
+        rendered = u.Web.WebTemplateEngine.render(
+            "{{site|upper}} / {{ user }} / {{user|upper|exclaim}} / {{count}}",
+            {"user": "ana", "count": 3},
+        )
+        tm.ok(rendered)
+        tm.that(rendered.value, eq="FLEXT / ana / ANA! / 3")
+
+    def test_filters_transform_only_their_placeholder(self) -> None:
+        """A filter changes its own slot, never the surrounding output."""
+        self._reset_template_state()
+        engine = u.Web.WebTemplateEngine()
+        engine.add_filter("upper", str.upper)
+        rendered = u.Web.WebTemplateEngine.render(
+            "hello {{name|upper}} and {{name}}", {"name": "ana"}
+        )
+        tm.ok(rendered)
+        tm.that(rendered.value, eq="hello ANA and ana")
+
+    def test_non_scalar_values_render_with_str(self) -> None:
+        """Values other than str, int and bool render as ``str(value)``."""
+        self._reset_template_state()
+        rendered = u.Web.WebTemplateEngine.render(
+            "{{ratio}} {{items}} {{nothing}} {{meta}}",
+            {"ratio": 0.5, "items": ["a", 1], "nothing": None, "meta": {"k": "v"}},
+        )
+        tm.ok(rendered)
+        tm.that(rendered.value, eq="0.5 ['a', 1] None {'k': 'v'}")
+
+    def test_unknown_names_and_filters_render_verbatim(self) -> None:
+        """Unresolved placeholders are kept as written."""
+        self._reset_template_state()
+        rendered = u.Web.WebTemplateEngine.render(
+            "{{missing}} {{name|nope}} {{}} {{name}}", {"name": "x"}
+        )
+        tm.ok(rendered)
+        tm.that(rendered.value, eq="{{missing}} {{name|nope}} {{}} x")
+
+    def test_templates_compile_once_unless_cache_disabled(self) -> None:
+        """Cached templates are reused; ``cache_enabled=False`` bypasses the LRU."""
+        self._reset_template_state()
+        engine = u.Web.WebTemplateEngine
+        first = engine.compiled("<p>{{a}}</p>")
+        tm.that(engine.compiled("<p>{{a}}</p>") is first, eq=True)
+        tm.that(len(u.Web.template_cache), eq=1)
+        tm.ok(engine.load_template_config({"cache_enabled": False}))
+        tm.that(len(u.Web.template_cache), eq=0)
+        tm.that(engine.compiled("<p>{{a}}</p>") is first, eq=False)
+        tm.that(len(u.Web.template_cache), eq=0)
+        tm.that(engine.render("<p>{{a}}</p>", {"a": 1}).value, eq="<p>1</p>")
+
+    def test_template_cache_evicts_least_recently_used(self) -> None:
+        """The LRU keeps the most recently fetched templates."""
+        cache = u.Web.TemplateCache(maxsize=2)
+        first_a = cache.fetch("a", lambda: u.Web.CompiledTemplate("a"))
+        first_b = cache.fetch("b", lambda: u.Web.CompiledTemplate("b"))
+        _ = cache.fetch("a", lambda: u.Web.CompiledTemplate("a"))
+        _ = cache.fetch("c", lambda: u.Web.CompiledTemplate("c"))
+        tm.that(len(cache), eq=2)
+        tm.that(
+            cache.fetch("a", lambda: u.Web.CompiledTemplate("a")) is first_a, eq=True
+        )
+        tm.that(
+            cache.fetch("b", lambda: u.Web.CompiledTemplate("b")) is first_b, eq=False
+        )
+
+    def test_render_file_reloads_changed_templates(self, tmp_path: Path) -> None:
+        """File templates are cached by stamp and recompiled when edited."""
+        self._reset_template_state()
+        page = tmp_path / "page.html"
+        page.write_text("<h1>{{title}}</h1>", encoding="utf-8")
+        engine = u.Web.WebTemplateEngine
+        tm.ok(engine.load_template_config({"template_dir": str(tmp_path)}))
+        tm.that(engine.render_file("page.html", {"title": "a"}).value, eq="<h1>a</h1>")
+        tm.that(len(u.Web.template_cache), eq=1)
+        page.write_text("<h2>{{title}}</h2>!", encoding="utf-8")
+        tm.that(engine.render_file("page.html", {"title": "b"}).value, eq="<h2>b</h2>!")
+        tm.that(len(u.Web.template_cache), eq=1)
+
+    def test_render_file_polls_within_reload_interval(self, tmp_path: Path) -> None:
+        """Inside ``reload_interval`` the known stamp is reused without stat."""
+        self._reset_template_state()
+        page = tmp_path / "page.html"
+        page.write_text("v1 {{x}}", encoding="utf-8")
+        engine = u.Web.WebTemplateEngine
+        tm.ok(
+            engine.load_template_config({
+                "template_dir": str(tmp_path),
+                "reload_interval": 3600,
+            })
+        )
+        tm.that(engine.render_file("page.html", {"x": 1}).value, eq="v1 1")
+        page.write_text("version2 {{x}}", encoding="utf-8")
+        tm.that(engine.render_file("page.html", {"x": 2}).value, eq="v1 2")
+
+    def test_render_file_maps_large_templates(self, tmp_path: Path) -> None:
+        """Templates above the mmap threshold render identically."""
+        self._reset_template_state()
+        body = "é" * c.Web.TEMPLATE_MMAP_THRESHOLD_BYTES
+        (tmp_path / "large.html").write_text(f"{body}{{{{x}}}}", encoding="utf-8")
+        tm.ok(
+            u.Web.WebTemplateEngine.load_template_config({
+                "template_dir": str(tmp_path)
+            })
+        )
+        rendered = u.Web.WebTemplateEngine.render_file("large.html", {"x": "end"})
+        tm.ok(rendered)
+        tm.that(rendered.value, eq=f"{body}end")
+
+    def test_render_file_rejects_missing_and_escaping_names(
+        self, tmp_path: Path
+    ) -> None:
+        """Unknown files, paths outside ``template_dir`` and no directory fail."""
+        self._reset_template_state()
+        engine = u.Web.WebTemplateEngine
+        tm.fail(engine.render_file("page.html", {}))
+        (tmp_path / "secret.txt").write_text("secret", encoding="utf-8")
+        root = tmp_path / "templates"
+        root.mkdir()
+        tm.ok(engine.load_template_config({"template_dir": str(root)}))
+        tm.fail(engine.render_file("missing.html", {}))
+        tm.fail(engine.render_file("../secret.txt", {}))
+
+    def test_autoescape_applies_to_variables_only(self) -> None:
+        """Literal markup is kept; resolved values are HTML-escaped."""
+        self._reset_template_state()
+        engine = u.Web.WebTemplateEngine
+        tm.ok(engine.load_template_config({"autoescape": True}))
+        rendered = engine.render(
+            "<b>{{name}}</b> <i>{{safe}}</i>",
+            {"name": "<script>&\"'", "safe": "plain text"},
+        )
+        tm.ok(rendered)
+        tm.that(
+            rendered.value,
+            eq="<b>&lt;script&gt;&amp;&quot;&#x27;</b> <i>plain text</i>",
+        )
+        text = "nothing to escape"
+        tm.that(u.Web.CompiledTemplate.escape_html(text) is text, eq=True)
+
+    def test_render_stream_chunks_match_render(self) -> None:
+        """Streamed chunks are bounded and concatenate to the full render."""
+        self._reset_template_state()
+        template = "<li>{{item}}</li>\n" * 20_000
+        streamed = u.Web.WebTemplateEngine.render_stream(template, {"item": "x"})
+        tm.ok(streamed)
+        chunks = list(streamed.value)
+        tm.that(len(chunks) > 1, eq=True)
+        tm.that(
+            max(len(chunk) for chunk in chunks[:-1])
+            < c.Web.TEMPLATE_STREAM_CHUNK_CHARS * 2,
+            eq=True,
+        )
+        expected = u.Web.WebTemplateEngine.render(template, {"item": "x"})
+        tm.that("".join(chunks), eq=expected.value)
+
+    def test_render_stream_feeds_flask_streamed_response(self) -> None:
+        """A Flask view can return the stream as a streamed response."""
+        self._reset_template_state()
+        flask_app = flask.Flask("template-stream")
+
+        @flask_app.get("/page")
+        def page() -> flask.Response:
+            streamed = u.Web.WebTemplateEngine.render_stream(
+                "<p>{{n}}</p>" * 10_000, {"n": 7}
+            )
+            return flask.Response(streamed.value, mimetype="text/html")
+
+        response = flask_app.test_client().get("/page")
+        tm.that(response.status_code, eq=200)
+        tm.that(response.is_streamed, eq=True)
+        tm.that(response.get_data(as_text=True), eq="<p>7</p>" * 10_000)
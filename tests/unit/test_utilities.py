@@ -8,8 +8,10 @@ from __future__ import annotations
 import contextlib
 
 import pytest
+from fastapi import FastAPI
 
 from flext_tests import tm
+from flext_web import FlextWebSettings
 from tests import m, u
 
 
@@ -83,3 +85,14 @@ class TestsFlextWebUtilitiesUnit:
         """Reject an application name containing only control whitespace."""
         with pytest.raises(ValueError, match="Text cannot be empty"):
             _ = u.format_app_id("\t\n")
+
+    @pytest.mark.parametrize(("drain", "expected"), [("0", 0), ("2.5", 3)])
+    def test_uvicorn_graceful_shutdown_follows_drain_timeout(
+        self, drain: str, expected: int
+    ) -> None:
+        """A zero drain stays zero; fractional drains round up to seconds."""
+        with u.Tests.env_vars_context({"FLEXT_WEB_WEB__DRAIN_TIMEOUT": drain}):
+            FlextWebSettings.reset_for_testing()
+            config = u.Web.uvicorn_config(FastAPI(), "localhost", 8080)
+        FlextWebSettings.reset_for_testing()
+        tm.that(config.timeout_graceful_shutdown, eq=expected)
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from threading import Event
+
 from flext_tests import tm
-from flext_web import FlextWebServices, FlextWebSettings, u
+from flext_web import FlextWebServices, FlextWebSettings, r
+from tests import c, m, t, u
 
 
 class TestsFlextWebServicesDirect:
@@ -20,7 +23,7 @@ class TestsFlextWebServicesDirect:
             "middleware_configured": False,
             "service_running": False,
         })
-        u.Web.web_metrics.clear()
+        u.Web.request_metrics.clear()
 
     def test_create_service_with_settings(self) -> None:
         """create_service accepts settings overrides."""
@@ -29,6 +32,22 @@ class TestsFlextWebServicesDirect:
         tm.ok(result)
         tm.that(result.value.settings.Web.app_name, eq="direct-test")
 
+    def test_settings_snapshot_is_cached_until_reconfigured(self) -> None:
+        """Reads reuse one validated snapshot; in-place reconfiguration rebuilds it."""
+        settings = FlextWebSettings().clone(Web={"app_name": "cached"})
+        service = FlextWebServices.create_service(settings).value
+        first = service.settings
+        tm.that(service.settings is first, eq=True)
+        FlextWebSettings().clone(Web={"app_name": "other"}).Web.app_name = "elsewhere"
+        tm.that(service.settings is first, eq=True)
+        settings.Web.app_name = "reconfigured"
+        rebuilt = service.settings
+        tm.that(rebuilt is first, eq=False)
+        tm.that(rebuilt.Web.app_name, eq="reconfigured")
+        child = service.health_status()
+        tm.ok(child)
+        tm.that(service.settings is rebuilt, eq=True)
+
     def test_create_service_without_settings(self) -> None:
         """create_service works without settings."""
         result = FlextWebServices.create_service()
@@ -115,3 +134,93 @@ class TestsFlextWebServicesDirect:
         result = service.validate_business_rules()
         tm.fail(result)
         tm.that(result.error, none=False)
+
+    def test_start_and_stop_apps_in_bulk(self) -> None:
+        """Bulk start/stop aggregates per-app outcomes in request order."""
+        service = FlextWebServices()
+        ports = [u.Web.Tests.TestPortManager.allocate_port() for _ in range(3)]
+        app_ids: list[str] = []
+        try:
+            for index, port in enumerate(ports):
+                created = service.create_app(
+                    m.Web.AppData(name=f"bulk-{index}", host="localhost", port=port)
+                )
+                tm.ok(created)
+                app_ids.append(created.value.id)
+            started = service.start_apps([*app_ids, app_ids[0], "missing-app"])
+            tm.ok(started)
+            tm.that(list(started.value.succeeded), eq=app_ids)
+            tm.that(started.value.failed, has="missing-app")
+            tm.that(started.value.complete, eq=False)
+            stopped = service.stop_apps(app_ids)
+            tm.ok(stopped)
+            tm.that(stopped.value.complete, eq=True)
+            tm.that(len(u.Web.app_runtimes), eq=0)
+        finally:
+            for app_id in app_ids:
+                if app_id in u.Web.app_runtimes:
+                    _ = service.stop_app(app_id)
+            for port in ports:
+                u.Web.Tests.TestPortManager.release_port(port)
+
+    def test_bulk_deadline_separates_in_flight_from_cancelled(self) -> None:
+        """At the deadline in-flight work is pending and queued work failed."""
+        release = Event()
+
+        def blocked(app_id: str) -> r[t.Web.AppRecord]:
+            _ = release.wait(5.0)
+            return r[t.Web.AppRecord].ok({"id": app_id})
+
+        with u.Tests.env_vars_context({
+            "FLEXT_WEB_WEB__BULK_MAX_WORKERS": "1",
+            "FLEXT_WEB_WEB__BULK_TIMEOUT": "0.05",
+        }):
+            FlextWebSettings.reset_for_testing()
+            try:
+                outcome = u.Web.WebAppManager.run_bulk(
+                    blocked, ["first", "second", "third"]
+                )
+            finally:
+                release.set()
+        FlextWebSettings.reset_for_testing()
+        tm.ok(outcome)
+        tm.that(outcome.value["pending"], eq=["first"])
+        tm.that(sorted(outcome.value["failed"]), eq=["second", "third"])
+        tm.that(outcome.value["succeeded"], length=0)
+
+    def test_stop_service_stops_running_apps(self) -> None:
+        """stop_service drains every running app before stopping."""
+        service = FlextWebServices()
+        port = u.Web.Tests.TestPortManager.allocate_port()
+        try:
+            tm.ok(service.start_service(host="localhost", port=port))
+            tm.that(len(u.Web.app_runtimes), eq=1)
+            tm.ok(service.stop_service())
+            tm.that(len(u.Web.app_runtimes), eq=0)
+            tm.that(u.Web.service_state["service_running"], eq=False)
+        finally:
+            u.Web.Tests.TestPortManager.release_port(port)
+
+    def test_dashboard_counts_and_batched_listing(self) -> None:
+        """Dashboard totals come from counters; listing projects one batch."""
+        service = FlextWebServices()
+        for index in range(5):
+            _ = u.Web.apps_registry.put({
+                "id": f"dash-{index}",
+                "name": f"dash-app-{index}",
+                "host": "localhost",
+                "port": 9000 + index,
+                "status": c.Web.Status.RUNNING.value
+                if index < 2
+                else c.Web.Status.STOPPED.value,
+                "created_at": "2025-01-01T00:00:00Z",
+            })
+        dashboard = service.dashboard()
+        tm.ok(dashboard)
+        tm.that(dashboard.value.total_applications, eq=5)
+        tm.that(dashboard.value.running_applications, eq=2)
+        listed = service.list_apps()
+        tm.ok(listed)
+        tm.that([app.id for app in listed.value], eq=[f"dash-{i}" for i in range(5)])
+        _ = u.Web.apps_registry.update("dash-4", {"port": "not-a-port"})
+        tm.fail(service.list_apps())
@@ -0,0 +1,164 @@
+"""Unit tests for the pre-fork worker supervisor."""
+
+from __future__ import annotations
+
+import os
+import signal
+import socket
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from flask import Flask
+
+from flext_tests import tm
+from tests import c, t, u
+
+WORKERS = 3
+SLOW_SECONDS = 1.0
+
+
+class TestsFlextWebWorkers:
+    """Real worker processes sharing one listener through the supervisor."""
+
+    @staticmethod
+    def _echo_pid(listener: socket.socket) -> None:
+        """Worker target: answer every connection with the worker pid."""
+        while True:
+            conn, _ = listener.accept()
+            with conn:
+                _ = conn.recv(16)
+                conn.sendall(str(os.getpid()).encode())
+
+    @staticmethod
+    def _serve_slow_app(framework: str, marker: str, listener: socket.socket) -> None:
+        """Worker target: serve a registered app whose ``/slow`` route lingers."""
+
+        def slow() -> str:
+            Path(marker).touch()
+            time.sleep(SLOW_SECONDS)
+            return "done"
+
+        port = int(listener.getsockname()[1])
+        created = u.Web.WebAppManager.create_app("worker-app", port, "localhost")
+        app_id = str(created.value["id"])
+        app: t.Web.FrameworkApp
+        if framework == c.Web.FRAMEWORK_FLASK:
+            app = Flask("worker-app")
+            app.add_url_rule("/slow", "slow", slow)
+        else:
+            app = FastAPI()
+            app.add_api_route("/slow", slow)
+        u.Web.framework_instances[app_id] = app
+        _ = u.Web.serve_app_on_socket(app_id, listener)
+
+    @staticmethod
+    def _ask(port: int) -> str:
+        with socket.create_connection(("localhost", port), timeout=5.0) as conn:
+            conn.sendall(b"pid")
+            return conn.recv(16).decode()
+
+    @staticmethod
+    def _pids(health: t.Web.ResponseDict) -> list[int]:
+        pids = health["pids"]
+        assert isinstance(pids, list)
+        return [int(pid) for pid in pids]
+
+    @classmethod
+    def _first_pid(cls, health: t.Web.ResponseDict) -> int:
+        return cls._pids(health)[0]
+
+    @staticmethod
+    def _wait_for(predicate: Callable[[], bool], timeout: float = 10.0) -> None:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if predicate():
+                return
+            time.sleep(0.02)
+        pytest.fail("condition not reached before timeout")
+
+    def test_workers_share_listener_and_restart_after_crash(self) -> None:
+        """Workers accept on one socket; a killed worker is replaced."""
+        listener = u.Web.WorkerSupervisor.bind("localhost", 0)
+        port = int(listener.getsockname()[1])
+        supervisor = u.Web.WorkerSupervisor(
+            self._echo_pid, listener, WORKERS, restart_delay=0.0
+        )
+        try:
+            tm.that(supervisor.supervise(), eq=WORKERS)
+            self._wait_for(lambda: supervisor.health()["alive"] == WORKERS)
+            served_by = {self._ask(port) for _ in range(WORKERS * 20)}
+            tm.that(served_by <= set(supervisor.health()["pids"]), eq=True)
+            health = supervisor.health()
+            tm.that(health["status"], eq=c.Web.ResponseStatus.HEALTHY.value)
+            victim = self._first_pid(health)
+            os.kill(victim, signal.SIGKILL)
+            self._wait_for(lambda: supervisor.health()["alive"] == WORKERS - 1)
+            tm.that(
+                supervisor.health()["status"], eq=c.Web.ResponseStatus.DEGRADED.value
+            )
+            tm.that(supervisor.supervise(), eq=1)
+            tm.that(supervisor.restarts, eq=1)
+            self._wait_for(lambda: supervisor.health()["alive"] == WORKERS)
+            tm.that(str(victim) not in supervisor.health()["pids"], eq=True)
+            tm.that(self._ask(port).isdigit(), eq=True)
+        finally:
+            supervisor.terminate(timeout=5.0)
+            listener.close()
+        tm.that(supervisor.health()["status"], eq=c.Web.ResponseStatus.ERROR.value)
+
+    def test_restart_waits_for_restart_delay(self) -> None:
+        """A crashed worker slot is not respawned before ``restart_delay``."""
+        listener = u.Web.WorkerSupervisor.bind("localhost", 0)
+        supervisor = u.Web.WorkerSupervisor(
+            self._echo_pid, listener, 1, restart_delay=60.0
+        )
+        try:
+            tm.that(supervisor.supervise(), eq=1)
+            self._wait_for(lambda: supervisor.health()["alive"] == 1)
+            os.kill(self._first_pid(supervisor.health()), signal.SIGKILL)
+            self._wait_for(lambda: supervisor.health()["alive"] == 0)
+            tm.that(supervisor.supervise(), eq=0)
+            tm.that(supervisor.restarts, eq=1)
+        finally:
+            supervisor.terminate(timeout=5.0)
+            listener.close()
+
+    @pytest.mark.parametrize(
+        "framework", [c.Web.FRAMEWORK_FASTAPI, c.Web.FRAMEWORK_FLASK]
+    )
+    def test_sigterm_drains_in_flight_request(
+        self, framework: str, tmp_path: Path
+    ) -> None:
+        """Workers serving an app on the inherited socket finish a request on SIGTERM."""
+        listener = u.Web.WorkerSupervisor.bind("localhost", 0)
+        port = int(listener.getsockname()[1])
+        marker = tmp_path / "in-flight"
+        supervisor = u.Web.WorkerSupervisor(
+            partial(self._serve_slow_app, framework, str(marker)),
+            listener,
+            2,
+            restart_delay=60.0,
+        )
+        try:
+            tm.that(supervisor.supervise(), eq=2)
+            with socket.create_connection(("localhost", port), timeout=30.0) as conn:
+                conn.sendall(
+                    b"GET /slow HTTP/1.1\r\nHost: localhost\r\n"
+                    b"Connection: close\r\n\r\n"
+                )
+                self._wait_for(marker.exists, timeout=20.0)
+                for pid in self._pids(supervisor.health()):
+                    os.kill(pid, signal.SIGTERM)
+                response = b""
+                while chunk := conn.recv(4096):
+                    response += chunk
+            self._wait_for(lambda: supervisor.health()["alive"] == 0)
+        finally:
+            supervisor.terminate(timeout=5.0)
+            listener.close()
+        tm.that(response, has=b"HTTP/1.1 200 OK")
+        tm.that(response.rstrip(b'"').endswith(b"done"), eq=True)
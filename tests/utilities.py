@@ -20,6 +20,8 @@ from tests import c, m, t
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from pytest_benchmark.fixture import BenchmarkFixture
+
     from tests import p
 
 
@@ -53,6 +55,18 @@ class TestsFlextWebUtilities(FlextTestsUtilities, FlextWebUtilities):
                     return float(value)
                 return None
 
+            @staticmethod
+            def benchmark_size(
+                benchmark: BenchmarkFixture, full: int, smoke: int
+            ) -> int:
+                """Return the workload size of a benchmark for this run.
+
+                Under the default ``--benchmark-disable`` benchmarks still run
+                once as tests within ``--timeout``, so they use the ``smoke``
+                size; ``full`` is only used with ``--benchmark-enable``.
+                """
+                return smoke if benchmark.disabled else full
+
             class TestPortManager:
                 """Thread-safe port allocation manager for test services."""
 